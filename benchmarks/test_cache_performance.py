@@ -6,6 +6,7 @@ Tests bottleneck operations:
 2. TaxonomyIndex.remove_page_from_all_tags() - O(t×p) linear scan
 3. QueryIndex._remove_page_from_key() - O(p) list.remove()
 4. FileTrackingMixin.get_affected_pages() - O(n) iteration
+5. Hot store load (parsed_content/rendered_output) - JSON vs mapped segments
 
 Run with:
     pytest benchmarks/test_cache_performance.py -v --benchmark-only
@@ -16,7 +17,10 @@ This establishes baseline measurements before optimization.
 
 from __future__ import annotations
 
+import gc
+import json
 import time
+import tracemalloc
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -574,6 +578,110 @@ class TestFileTrackingGetAffectedPages:
         assert result_current == result_optimized, "Results should be identical"
 
 
+# ---------------------------------------------------------------------------
+# Benchmark: hot store load (BuildCache._load_external_stores)
+# Previous: whole-map JSON decode on every warm build
+# Current: key index + zstd-framed records read through mmap on demand
+# ---------------------------------------------------------------------------
+
+
+def generate_rendered_output(num_pages: int = 4000, html_kb: int = 8) -> dict[str, dict[str, Any]]:
+    """Generate rendered_output-shaped entries with ~html_kb of HTML each."""
+    paragraph = "<p>" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 16 + "</p>"
+    html = paragraph * max(1, (html_kb * 1024) // len(paragraph))
+    return {
+        f"content/section-{p % 40}/post-{p:05d}.md": {
+            "html": html,
+            "template": "doc/single.html",
+            "metadata_hash": f"{p:032x}",
+            "size_bytes": len(html),
+        }
+        for p in range(num_pages)
+    }
+
+
+def _measure(func: Any) -> tuple[float, float]:
+    """Return (elapsed_ms, peak_traced_mb) for one call."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        func()
+    finally:
+        elapsed = time.perf_counter() - start
+        _current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed * 1000, peak / (1024 * 1024)
+
+
+@pytest.mark.benchmark
+@pytest.mark.slow
+class TestHotStoreLoad:
+    """Compare single-file JSON hot stores with mapped segment stores."""
+
+    NUM_PAGES = 4000
+
+    @pytest.fixture(scope="class")
+    def stores(self, tmp_path_factory):
+        from bengal.cache.segment_store import SegmentStore
+
+        root = tmp_path_factory.mktemp("hot_stores")
+        records = generate_rendered_output(self.NUM_PAGES)
+        json_path = root / "rendered_output.json"
+        json_path.write_text(json.dumps(records, separators=(",", ":")), encoding="utf-8")
+        segment_store = SegmentStore(root / "rendered_output")
+        segment_store.save(records)
+        return json_path, segment_store, sorted(records)
+
+    def test_cold_full_load(self, stores):
+        """Decode every record: previous behaviour vs materializing a mapped store."""
+        json_path, segment_store, _keys = stores
+
+        json_ms, json_mb = _measure(lambda: json.loads(json_path.read_bytes()))
+        segment_ms, segment_mb = _measure(lambda: segment_store.load())
+
+        print(f"\n📊 Hot store full load ({self.NUM_PAGES} pages):")
+        print(f"   JSON file:      {json_ms:8.1f}ms  peak {json_mb:7.1f}MB")
+        print(f"   Segment store:  {segment_ms:8.1f}ms  peak {segment_mb:7.1f}MB")
+
+    def test_warm_single_page_load(self, stores):
+        """Warm build touching one page: open the store and read one record."""
+        json_path, segment_store, keys = stores
+        key = keys[len(keys) // 2]
+
+        def json_single() -> Any:
+            return json.loads(json_path.read_bytes())[key]
+
+        def segment_single() -> Any:
+            lazy = segment_store.open()
+            assert lazy is not None
+            return lazy[key]
+
+        assert json_single() == segment_single()
+        json_ms, json_mb = _measure(json_single)
+        segment_ms, segment_mb = _measure(segment_single)
+        speedup = json_ms / segment_ms if segment_ms > 0 else float("inf")
+
+        print(f"\n📊 Hot store warm single-page load ({self.NUM_PAGES} pages):")
+        print(f"   JSON file:      {json_ms:8.2f}ms  peak {json_mb:7.1f}MB")
+        print(f"   Segment store:  {segment_ms:8.2f}ms  peak {segment_mb:7.1f}MB")
+        print(f"   Speedup: {speedup:.1f}x")
+
+        # Peak traced memory must follow the change set, not the corpus
+        assert segment_mb < json_mb
+
+    def test_on_disk_size(self, stores):
+        """Per-record zstd frames vs the uncompressed JSON document."""
+        json_path, segment_store, _keys = stores
+        segment_bytes = sum(p.stat().st_size for p in segment_store.root.glob("seg-*.log"))
+        index_bytes = segment_store.index_path.stat().st_size
+
+        print(f"\n📊 Hot store on-disk size ({self.NUM_PAGES} pages):")
+        print(f"   JSON file:      {json_path.stat().st_size / 1024:10.1f}KB")
+        print(f"   Segments:       {segment_bytes / 1024:10.1f}KB")
+        print(f"   Key index:      {index_bytes / 1024:10.1f}KB")
+
+
 # ---------------------------------------------------------------------------
 # Summary Report
 # ---------------------------------------------------------------------------
@@ -604,10 +712,15 @@ Operations benchmarked:
    Current: O(n) iteration over all pages
    Target:  O(1) reverse dependency lookup
 
+5. BuildCache hot store load
+   Previous: O(corpus) JSON decode of parsed_content/rendered_output
+   Current:  O(change set) mmap + per-record zstd decode
+
 Run individual benchmark classes for detailed timings:
     pytest benchmarks/test_cache_performance.py::TestTaxonomyGetTagsForPage -v
     pytest benchmarks/test_cache_performance.py::TestTaxonomyRemovePageFromAllTags -v
     pytest benchmarks/test_cache_performance.py::TestQueryIndexRemovePageFromKey -v
     pytest benchmarks/test_cache_performance.py::TestFileTrackingGetAffectedPages -v
+    pytest benchmarks/test_cache_performance.py::TestHotStoreLoad -v
 """)
     print("=" * 70)
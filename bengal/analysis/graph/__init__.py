@@ -8,6 +8,7 @@ community detection.
 Components:
 KnowledgeGraph: Central graph representation of page connections
 GraphBuilder: Constructs knowledge graphs from site pages
+CSRGraph: Integer-indexed adjacency used by the analysis kernels
 GraphAnalyzer: Structural analysis (hubs, leaves, orphans, layers)
 GraphMetrics: Connectivity metrics and PageConnectivity dataclass
 GraphReporter: Human-readable insights and recommendations
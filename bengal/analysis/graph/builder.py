@@ -22,6 +22,7 @@ import threading
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any, cast
 
+from bengal.analysis.graph.csr import CSRGraph
 from bengal.analysis.links.types import LinkMetrics, LinkType
 from bengal.core.section.utils import get_page_section
 from bengal.errors import BengalGraphError, ErrorCode, record_error
@@ -116,6 +117,10 @@ class GraphBuilder:
         # RFC: rfc-analysis-algorithm-optimization
         self.incoming_edges: dict[PageLike, list[PageLike]] = defaultdict(list)
 
+        # Integer-indexed (CSR) copy of the adjacency above, packed once at the
+        # end of build() for the array-based analysis kernels
+        self.csr: CSRGraph | None = None
+
         # Thread-safe lock for merge phase
         self._lock = threading.Lock()
 
@@ -182,6 +187,10 @@ class GraphBuilder:
         # Build link metrics for each page (always sequential - final aggregation)
         self._build_link_metrics()
 
+        self.csr = CSRGraph.build(
+            self.get_analysis_pages(), self.outgoing_refs, self.incoming_edges
+        )
+
     def _build_sequential(self) -> None:
         """
         Build graph sequentially (original implementation).
@@ -43,8 +43,9 @@ See Also:
 import random
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from bengal.analysis.graph.csr import CSRGraph
 from bengal.analysis.utils.pages import get_content_pages, stable_page_id
 from bengal.utils.observability.logger import get_logger
 
@@ -191,11 +192,24 @@ class LouvainCommunityDetector:
 
         logger.info("community_detection_start", total_pages=len(pages), resolution=self.resolution)
 
+        # With the builder's CSR view, Louvain runs over integer node positions
+        # (index into ``pages``) instead of page objects: no Page.__hash__ per
+        # edge visit. Edge order, shuffle order and every float operation match
+        # the page-keyed path, so the resulting partition is identical.
+        csr = getattr(self.graph, "csr", None)
+        member_ids = csr.ids(pages) if isinstance(csr, CSRGraph) else None
+        nodes: Sequence[Any]
+        if isinstance(csr, CSRGraph) and member_ids is not None:
+            nodes = range(len(pages))
+            edge_weights = self._build_edge_weights_csr(csr, member_ids)
+        else:
+            nodes = pages
+            edge_weights = self._build_edge_weights(pages)
+
         # Initialize: each page in its own community
-        page_to_community: dict[PageLike, int] = {page: i for i, page in enumerate(pages)}
+        page_to_community: dict[Any, int] = {node: i for i, node in enumerate(nodes)}
 
         # Build edge weights (use bidirectional edges for undirected graph)
-        edge_weights = self._build_edge_weights(pages)
         total_weight = sum(edge_weights.values())
 
         if total_weight == 0:
@@ -205,7 +219,7 @@ class LouvainCommunityDetector:
             return CommunityDetectionResults(communities=communities, modularity=0.0, iterations=0)
 
         # Compute node degrees
-        node_degrees = self._compute_node_degrees(pages, edge_weights)
+        node_degrees = self._compute_node_degrees(nodes, edge_weights)
 
         # Adjacency index (page -> [(neighbor, weight), ...]) and per-community
         # total degree, both maintained so each modularity-gain evaluation is
@@ -213,7 +227,7 @@ class LouvainCommunityDetector:
         # O(N^2 * degree * iterations): fine on tiny test graphs but tens of
         # minutes on a real docs site (1000+ pages) — and community detection is
         # now wired into every build, so this is load-bearing for build time.
-        adjacency: dict[PageLike, list[tuple[PageLike, float]]] = {p: [] for p in pages}
+        adjacency: dict[Any, list[tuple[Any, float]]] = {node: [] for node in nodes}
         for edge, weight in edge_weights.items():
             members = list(edge)
             if len(members) == 2:
@@ -222,8 +236,8 @@ class LouvainCommunityDetector:
                 adjacency[b].append((a, weight))
 
         comm_degree: dict[int, float] = defaultdict(float)
-        for p in pages:
-            comm_degree[page_to_community[p]] += node_degrees.get(p, 0.0)
+        for node in nodes:
+            comm_degree[page_to_community[node]] += node_degrees.get(node, 0.0)
 
         # Louvain algorithm main loop
         iteration = 0
@@ -235,7 +249,7 @@ class LouvainCommunityDetector:
             iteration += 1
 
             # Randomize order to avoid bias (deterministic: local seeded PRNG).
-            shuffled_pages = list(pages)
+            shuffled_pages = list(nodes)
             self._rng.shuffle(shuffled_pages)
 
             # Phase 1: Move nodes to optimize modularity
@@ -292,8 +306,8 @@ class LouvainCommunityDetector:
 
         # Convert to Community objects
         community_map: dict[int, set[PageLike]] = defaultdict(set)
-        for page, community_id in page_to_community.items():
-            community_map[community_id].add(page)
+        for node, community_id in page_to_community.items():
+            community_map[community_id].add(node if nodes is pages else pages[node])
 
         # Renumber communities by a build-stable rank: largest first, ties broken
         # by the smallest member node-id. The internal community labels are
@@ -330,21 +344,44 @@ class LouvainCommunityDetector:
         Uses frozenset to represent undirected edges.
         """
         edge_weights: dict[frozenset[PageLike], float] = defaultdict(float)
+        page_set = set(pages)
 
         for page in pages:
             outgoing = self.graph.outgoing_refs.get(page, set())
             for target in outgoing:
-                if target in pages:  # Only consider pages in our set
+                if target in page_set:  # Only consider pages in our set
                     edge = frozenset([page, target])
                     edge_weights[edge] += 1.0
 
         return edge_weights
 
-    def _compute_node_degrees(
-        self, pages: Sequence[PageLike], edge_weights: dict[frozenset[PageLike], float]
-    ) -> dict[PageLike, float]:
+    def _build_edge_weights_csr(
+        self, csr: CSRGraph, member_ids: list[int]
+    ) -> dict[frozenset[int], float]:
+        """
+        Build edge weights keyed by node position from the CSR view.
+
+        Visits edges in the same order as _build_edge_weights so insertion
+        order (and with it every downstream summation order) is unchanged.
+        """
+        position = [-1] * csr.num_nodes
+        for k, node_id in enumerate(member_ids):
+            position[node_id] = k
+
+        out_lists = csr.out_lists()
+        edge_weights: dict[frozenset[int], float] = defaultdict(float)
+        for k, node_id in enumerate(member_ids):
+            for target in out_lists[node_id]:
+                j = position[target]
+                if j >= 0:
+                    edge_weights[frozenset((k, j))] += 1.0
+        return edge_weights
+
+    def _compute_node_degrees[K](
+        self, pages: Sequence[K], edge_weights: dict[frozenset[K], float]
+    ) -> dict[K, float]:
         """Compute weighted degree for each node."""
-        node_degrees: dict[PageLike, float] = defaultdict(float)
+        node_degrees: dict[K, float] = defaultdict(float)
 
         for edge, weight in edge_weights.items():
             edge_list = list(edge)
@@ -358,11 +395,11 @@ class LouvainCommunityDetector:
 
         return node_degrees
 
-    def _compute_modularity(
+    def _compute_modularity[K](
         self,
-        page_to_community: dict[PageLike, int],
-        edge_weights: dict[frozenset[PageLike], float],
-        node_degrees: dict[PageLike, float],
+        page_to_community: dict[K, int],
+        edge_weights: dict[frozenset[K], float],
+        node_degrees: dict[K, float],
         total_weight: float,
     ) -> float:
         """Compute Newman's modularity Q."""
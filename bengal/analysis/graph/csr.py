@@ -0,0 +1,258 @@
+"""
+Compressed sparse row (CSR) view of the knowledge graph.
+
+GraphBuilder assigns every analysis page a dense integer id (its position in
+``get_analysis_pages()``) and packs both adjacency directions into flat
+integer arrays once the graph is built. The analysis kernels below (PageRank,
+Brandes betweenness, BFS distances) walk these arrays with list indexing
+instead of dicts keyed by page objects, so an edge visit no longer costs a
+``Page.__hash__`` (which hashes the source path) plus a dict probe.
+
+Parity:
+    Neighbor order in the arrays is the iteration order of the dict adjacency
+    they were built from (``outgoing_refs`` sets, ``incoming_edges`` lists,
+    duplicates included). The kernels therefore perform the same
+    floating-point operations in the same order as the dict-based
+    implementations they replace and return identical scores; the dict code
+    paths remain as the fallback for graphs without a CSR view.
+
+Classes:
+CSRGraph: Integer-indexed adjacency built by GraphBuilder
+
+Functions:
+csr_pagerank: Power-iteration PageRank over incoming edges
+csr_bfs_predecessors: BFS for Brandes' betweenness accumulation
+csr_bfs_distances: Hop distances from one source
+
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from bengal.protocols import PageLike
+
+
+@dataclass(frozen=True, slots=True)
+class CSRGraph:
+    """
+    Integer-indexed adjacency of the analysis pages.
+
+    Node ``i`` is ``nodes[i]``. The out-neighbors of ``i`` are
+    ``out_indices[out_indptr[i]:out_indptr[i + 1]]``; in-edges (sources,
+    one entry per incoming_edges entry) use the ``in_*`` arrays the same
+    way. Edges to or from pages outside ``nodes`` are dropped.
+
+    Attributes:
+        nodes: Pages in node-id order
+        index: Page -> node id
+        out_indptr: Row offsets into out_indices (length num_nodes + 1)
+        out_indices: Concatenated out-neighbor ids
+        in_indptr: Row offsets into in_indices (length num_nodes + 1)
+        in_indices: Concatenated in-edge source ids
+        edge_out_degree: incoming_edges entries per source node, counting
+            targets outside ``nodes`` too (PageRank's out-degree)
+
+    """
+
+    nodes: tuple[PageLike, ...]
+    index: dict[PageLike, int]
+    out_indptr: array[int]
+    out_indices: array[int]
+    in_indptr: array[int]
+    in_indices: array[int]
+    edge_out_degree: array[int]
+
+    @classmethod
+    def build(
+        cls,
+        pages: Sequence[PageLike],
+        outgoing_refs: Mapping[PageLike, set[PageLike]],
+        incoming_edges: Mapping[PageLike, list[PageLike]],
+    ) -> CSRGraph:
+        """
+        Pack dict adjacency into CSR arrays.
+
+        Args:
+            pages: Analysis pages; their order defines node ids
+            outgoing_refs: Page -> set of link targets
+            incoming_edges: Page -> list of link sources (may repeat)
+        """
+        index = {page: i for i, page in enumerate(pages)}
+
+        def pack(
+            adjacency: Mapping[PageLike, Sequence[PageLike] | set[PageLike]],
+        ) -> tuple[array[int], array[int]]:
+            indptr = array("q", [0])
+            indices = array("q")
+            for page in pages:
+                for neighbor in adjacency.get(page, ()):
+                    j = index.get(neighbor)
+                    if j is not None:
+                        indices.append(j)
+                indptr.append(len(indices))
+            return indptr, indices
+
+        out_indptr, out_indices = pack(outgoing_refs)
+        in_indptr, in_indices = pack(incoming_edges)
+
+        edge_out_degree = array("q", [0]) * len(index)
+        for sources in incoming_edges.values():
+            for source in sources:
+                i = index.get(source)
+                if i is not None:
+                    edge_out_degree[i] += 1
+        return cls(
+            nodes=tuple(pages),
+            index=index,
+            out_indptr=out_indptr,
+            out_indices=out_indices,
+            in_indptr=in_indptr,
+            in_indices=in_indices,
+            edge_out_degree=edge_out_degree,
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of distinct outgoing edges."""
+        return len(self.out_indices)
+
+    def ids(self, pages: Sequence[PageLike]) -> list[int] | None:
+        """Node ids for ``pages``, or None if any page is not in the graph."""
+        index = self.index
+        try:
+            return [index[page] for page in pages]
+        except KeyError:
+            return None
+
+    def out_lists(self) -> list[list[int]]:
+        """Out-neighbor lists per node (list indexing beats array slicing in loops)."""
+        indptr = self.out_indptr.tolist()
+        indices = self.out_indices.tolist()
+        return [indices[indptr[i] : indptr[i + 1]] for i in range(self.num_nodes)]
+
+
+def csr_pagerank(
+    graph: CSRGraph,
+    members: Sequence[int],
+    base: Sequence[float],
+    damping: float,
+    max_iterations: int,
+    threshold: float,
+) -> tuple[list[float], int, bool, float]:
+    """
+    PageRank power iteration over in-edges.
+
+    Mirrors PageRankCalculator's dict implementation: every source's score is
+    split across all of its ``incoming_edges`` entries (edge_out_degree), only ``members`` are scored, and iteration stops once the
+    largest per-node change drops below ``threshold``.
+
+    Args:
+        graph: CSR graph
+        members: Node ids to score, in scoring order
+        base: Random-jump term per member, already multiplied by (1 - damping)
+        damping: Link-following probability
+        max_iterations: Iteration cap
+        threshold: Convergence threshold on the max score change
+
+    Returns:
+        (scores aligned with members, iterations run, converged, last max diff)
+    """
+    n = graph.num_nodes
+    in_indptr = graph.in_indptr.tolist()
+    in_indices = graph.in_indices.tolist()
+
+    out_degree = graph.edge_out_degree.tolist()
+
+    scores = [0.0] * n
+    initial = 1.0 / len(members)
+    for i in members:
+        scores[i] = initial
+
+    rows = [in_indices[in_indptr[i] : in_indptr[i + 1]] for i in members]
+    iterations = 0
+    converged = False
+    max_diff = 0.0
+    for iteration in range(max_iterations):
+        # Per-source share for this iteration, one pass over all nodes
+        shares = [s / d if d else 0.0 for s, d in zip(scores, out_degree, strict=True)]
+        new_scores = [0.0] * n
+        max_diff = 0.0
+        for k, i in enumerate(members):
+            link_score = 0.0
+            for source in rows[k]:
+                link_score += shares[source]
+            new_score = base[k] + damping * link_score
+            new_scores[i] = new_score
+            diff = abs(new_score - scores[i])
+            if diff > max_diff:
+                max_diff = diff
+        scores = new_scores
+        iterations = iteration + 1
+        if max_diff < threshold:
+            converged = True
+            break
+
+    return [scores[i] for i in members], iterations, converged, max_diff
+
+
+def csr_bfs_predecessors(
+    out_lists: Sequence[Sequence[int]], source: int, member: Sequence[bool]
+) -> tuple[list[list[int]], list[int], list[int]]:
+    """
+    BFS from ``source`` restricted to ``member`` nodes, for Brandes' algorithm.
+
+    Integer counterpart of bengal.analysis.utils.traversal.bfs_predecessors.
+
+    Returns:
+        (predecessors, sigma, stack) indexed by node id
+    """
+    n = len(out_lists)
+    predecessors: list[list[int]] = [[] for _ in range(n)]
+    sigma = [0] * n
+    distance = [-1] * n
+    sigma[source] = 1
+    distance[source] = 0
+    stack: list[int] = []
+    queue: deque[int] = deque([source])
+    while queue:
+        current = queue.popleft()
+        stack.append(current)
+        next_distance = distance[current] + 1
+        for neighbor in out_lists[current]:
+            if not member[neighbor]:
+                continue
+            if distance[neighbor] < 0:
+                queue.append(neighbor)
+                distance[neighbor] = next_distance
+            if distance[neighbor] == next_distance:
+                sigma[neighbor] += sigma[current]
+                predecessors[neighbor].append(current)
+    return predecessors, sigma, stack
+
+
+def csr_bfs_distances(
+    out_lists: Sequence[Sequence[int]], source: int, member: Sequence[bool]
+) -> list[int]:
+    """Hop distances from ``source`` to every node (-1 = unreachable or not a member)."""
+    distance = [-1] * len(out_lists)
+    distance[source] = 0
+    queue: deque[int] = deque([source])
+    while queue:
+        current = queue.popleft()
+        next_distance = distance[current] + 1
+        for neighbor in out_lists[current]:
+            if member[neighbor] and distance[neighbor] < 0:
+                distance[neighbor] = next_distance
+                queue.append(neighbor)
+    return distance
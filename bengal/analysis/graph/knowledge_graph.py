@@ -64,6 +64,7 @@ from bengal.utils.observability.logger import get_logger
 if TYPE_CHECKING:
     from bengal.analysis.graph.analyzer import GraphAnalyzer
     from bengal.analysis.graph.community_detection import CommunityDetectionResults
+    from bengal.analysis.graph.csr import CSRGraph
     from bengal.analysis.graph.page_rank import PageRankResults
     from bengal.analysis.graph.reporter import GraphReporter
     from bengal.analysis.links.suggestions import LinkSuggestionResults
@@ -132,6 +133,9 @@ class KnowledgeGraph:
         # Maps each page to the list of pages that link TO it
         # RFC: rfc-analysis-algorithm-optimization
         self.incoming_edges: dict[PageLike, list[PageLike]] = {}
+        # Integer-indexed adjacency for the array-based analysis kernels
+        # (PageRank, Louvain, path analysis); None until build()
+        self.csr: CSRGraph | None = None
 
         # Analysis results
         self.metrics: GraphMetrics | None = None
@@ -199,6 +203,7 @@ class KnowledgeGraph:
         self.link_types = dict(self._builder.link_types)
         # Copy reverse adjacency list for O(E) PageRank
         self.incoming_edges = dict(self._builder.incoming_edges)
+        self.csr = self._builder.csr
 
         # Initialize metrics calculator
         self._metrics_calculator = MetricsCalculator(
@@ -48,6 +48,7 @@ See Also:
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from bengal.analysis.graph.csr import CSRGraph, csr_pagerank
 from bengal.analysis.utils.pages import get_content_pages
 from bengal.analysis.utils.scoring import items_above_percentile, top_n_by_score
 from bengal.errors import BengalGraphError, ErrorCode
@@ -194,6 +195,65 @@ class PageRankCalculator:
             "pagerank_start", total_pages=N, damping=self.damping, personalized=personalized
         )
 
+        csr = getattr(self.graph, "csr", None)
+        member_ids = csr.ids(pages) if isinstance(csr, CSRGraph) else None
+        if isinstance(csr, CSRGraph) and member_ids is not None:
+            scores, iterations_run, converged = self._compute_csr(
+                csr, member_ids, pages, seed_pages, personalized
+            )
+        else:
+            scores, iterations_run, converged = self._compute_dict(pages, seed_pages, personalized)
+
+        logger.info(
+            "pagerank_complete",
+            iterations=iterations_run,
+            converged=converged,
+            top_score=max(scores.values()) if scores else 0,
+        )
+
+        return PageRankResults(
+            scores=scores,
+            iterations=iterations_run,
+            converged=converged,
+            damping_factor=self.damping,
+        )
+
+    def _compute_csr(
+        self,
+        csr: CSRGraph,
+        member_ids: list[int],
+        pages: list[PageLike],
+        seed_pages: set[PageLike] | None,
+        personalized: bool,
+    ) -> tuple[dict[PageLike, float], int, bool]:
+        """Power iteration over the builder's CSR arrays (same results as _compute_dict)."""
+        N = len(pages)
+        if personalized and seed_pages:
+            seed_share = 1.0 / len(seed_pages)
+            base = [
+                (1 - self.damping) * (seed_share if page in seed_pages else 0.0) for page in pages
+            ]
+        else:
+            base = [(1 - self.damping) / N] * N
+
+        values, iterations_run, converged, max_diff = csr_pagerank(
+            csr, member_ids, base, self.damping, self.max_iterations, self.threshold
+        )
+        if converged:
+            logger.info("pagerank_converged", iterations=iterations_run, max_diff=max_diff)
+        else:
+            logger.warning("pagerank_max_iterations", iterations=iterations_run, max_diff=max_diff)
+        return dict(zip(pages, values, strict=True)), iterations_run, converged
+
+    def _compute_dict(
+        self,
+        pages: list[PageLike],
+        seed_pages: set[PageLike] | None,
+        personalized: bool,
+    ) -> tuple[dict[PageLike, float], int, bool]:
+        """Power iteration over the dict adjacency (graphs built without a CSR view)."""
+        N = len(pages)
+
         # Initialize: equal probability for all pages
         scores = dict.fromkeys(pages, 1.0 / N)
 
@@ -265,19 +325,7 @@ class PageRankCalculator:
         if not converged:
             logger.warning("pagerank_max_iterations", iterations=iterations_run, max_diff=max_diff)
 
-        logger.info(
-            "pagerank_complete",
-            iterations=iterations_run,
-            converged=converged,
-            top_score=max(scores.values()) if scores else 0,
-        )
-
-        return PageRankResults(
-            scores=scores,
-            iterations=iterations_run,
-            converged=converged,
-            damping_factor=self.damping,
-        )
+        return scores, iterations_run, converged
 
     def compute_personalized(self, seed_pages: set[PageLike]) -> PageRankResults:
         """
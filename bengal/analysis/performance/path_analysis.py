@@ -54,6 +54,7 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from bengal.analysis.graph.csr import CSRGraph, csr_bfs_distances, csr_bfs_predecessors
 from bengal.analysis.utils.pages import get_content_pages
 from bengal.analysis.utils.scoring import top_n_by_score
 from bengal.analysis.utils.traversal import bfs_distances as _bfs_distances_util
@@ -314,23 +315,52 @@ class PathAnalyzer:
         Returns:
             Dictionary mapping pages to betweenness centrality scores
         """
-        betweenness: dict[PageLike, float] = dict.fromkeys(pages, 0.0)
-
-        # Select sources (all pages for exact, k pivots for approximate)
+        # Select source positions (all pages for exact, k pivots for approximate).
+        # sample() draws positions, so the pivots match sampling ``pages`` directly.
+        n = len(pages)
         if use_approximate:
             rng = random.Random(self.seed)
-            sources = rng.sample(pages, min(self.k_pivots, len(pages)))
+            sources = rng.sample(range(n), min(self.k_pivots, n))
+        else:
+            sources = list(range(n))
+
+        view = self._csr_view(pages)
+        if view is not None:
+            betweenness = self._brandes_csr(pages, view, sources, progress_callback)
         else:
-            sources = pages
+            betweenness = self._brandes_dict(pages, sources, progress_callback)
+
+        # Normalize
+        if n > 2:
+            if use_approximate:
+                # Scale by ratio of total pages to pivots, then normalize
+                scale = n / len(sources)
+                normalization = (n - 1) * (n - 2)
+                betweenness = {p: (c * scale) / normalization for p, c in betweenness.items()}
+            else:
+                # Standard normalization for directed graphs
+                normalization = (n - 1) * (n - 2)
+                betweenness = {p: c / normalization for p, c in betweenness.items()}
 
+        return betweenness
+
+    def _brandes_dict(
+        self,
+        pages: Sequence[PageLike],
+        sources: Sequence[int],
+        progress_callback: ProgressCallback | None,
+    ) -> dict[PageLike, float]:
+        """Unnormalized Brandes accumulation over the page-keyed adjacency."""
+        betweenness: dict[PageLike, float] = dict.fromkeys(pages, 0.0)
         total_sources = len(sources)
 
         # For each selected source
         pages_set = set(pages)
-        for i, source in enumerate(sources):
+        for i, position in enumerate(sources):
             if progress_callback:
                 progress_callback(i + 1, total_sources, "betweenness")
 
+            source = pages[position]
             # Use centralized BFS traversal utility
             predecessors, sigma, _distance, stack = bfs_predecessors(
                 self.graph.outgoing_refs, source, pages_set
@@ -348,21 +378,46 @@ class PathAnalyzer:
                 if current != source:
                     betweenness[current] += delta[current]
 
-        # Normalize
-        n = len(pages)
-        if n > 2:
-            if use_approximate:
-                # Scale by ratio of total pages to pivots, then normalize
-                scale = n / len(sources)
-                normalization = (n - 1) * (n - 2)
-                betweenness = {p: (c * scale) / normalization for p, c in betweenness.items()}
-            else:
-                # Standard normalization for directed graphs
-                normalization = (n - 1) * (n - 2)
-                betweenness = {p: c / normalization for p, c in betweenness.items()}
-
         return betweenness
 
+    def _brandes_csr(
+        self,
+        pages: Sequence[PageLike],
+        view: tuple[list[list[int]], list[int], list[bool]],
+        sources: Sequence[int],
+        progress_callback: ProgressCallback | None,
+    ) -> dict[PageLike, float]:
+        """
+        Unnormalized Brandes accumulation over the CSR view.
+
+        Same traversal and accumulation order as _brandes_dict (CSR neighbor
+        order is the outgoing_refs iteration order), so scores are identical.
+        """
+        out_lists, ids, member = view
+        size = len(out_lists)
+        scores = [0.0] * size
+        total_sources = len(sources)
+
+        for i, position in enumerate(sources):
+            if progress_callback:
+                progress_callback(i + 1, total_sources, "betweenness")
+
+            source = ids[position]
+            predecessors, sigma, stack = csr_bfs_predecessors(out_lists, source, member)
+
+            delta = [0.0] * size
+            while stack:
+                current = stack.pop()
+                sigma_current = sigma[current]
+                for pred in predecessors[current]:
+                    if sigma_current > 0:
+                        delta[pred] += (sigma[pred] / sigma_current) * (1 + delta[current])
+
+                if current != source:
+                    scores[current] += delta[current]
+
+        return {page: scores[node_id] for page, node_id in zip(pages, ids, strict=True)}
+
     def _compute_closeness_centrality(
         self,
         pages: Sequence[PageLike],
@@ -386,40 +441,52 @@ class PathAnalyzer:
         Returns:
             Tuple of (closeness_dict, avg_path_length, diameter)
         """
-        # Select sample pages (all for exact, k pivots for approximate)
+        n = len(pages)
+        view = self._csr_view(pages)
+        if view is not None:
+            out_lists, ids, member = view
+
+            def distances_from(position: int) -> list[int]:
+                distance = csr_bfs_distances(out_lists, ids[position], member)
+                return [distance[node_id] for node_id in ids]
+
+        else:
+
+            def distances_from(position: int) -> list[int]:
+                distance = self._bfs_distances(pages[position], pages)
+                return [distance[page] for page in pages]
+
+        # Select sample positions (all for exact, k pivots for approximate)
         if use_approximate:
             rng = random.Random(self.seed + 1)  # Different seed from betweenness
-            sample_pages = rng.sample(pages, min(self.k_pivots, len(pages)))
+            sample_positions: Sequence[int] = rng.sample(range(n), min(self.k_pivots, n))
         else:
-            sample_pages = pages
+            sample_positions = range(n)
 
-        total_samples = len(sample_pages)
+        total_samples = len(sample_positions)
 
         # For approximate mode, we compute distances FROM pivots TO all nodes
         # Then estimate closeness based on average distance from pivots
         all_distances: list[int] = []
         max_distance = 0
+        closeness: dict[PageLike, float] = {}
 
         if use_approximate:
-            # Compute distances from each pivot to all nodes
-            pivot_distances: dict[PageLike, list[int]] = {page: [] for page in pages}
+            # Compute distances from each pivot to all nodes (aligned with pages)
+            pivot_distances: list[list[int]] = [[] for _ in range(n)]
 
-            for i, pivot in enumerate(sample_pages):
+            for i, pivot in enumerate(sample_positions):
                 if progress_callback:
                     progress_callback(i + 1, total_samples, "closeness")
 
-                distances = self._bfs_distances(pivot, pages)
-
-                for page, dist in distances.items():
+                for position, dist in enumerate(distances_from(pivot)):
                     if dist > 0:
-                        pivot_distances[page].append(dist)
+                        pivot_distances[position].append(dist)
                         all_distances.append(dist)
                         max_distance = max(max_distance, dist)
 
             # Estimate closeness: 1 / average distance from pivots
-            closeness: dict[PageLike, float] = {}
-            for page in pages:
-                dists = pivot_distances[page]
+            for page, dists in zip(pages, pivot_distances, strict=True):
                 if dists:
                     avg_distance = sum(dists) / len(dists)
                     closeness[page] = 1.0 / avg_distance
@@ -427,17 +494,12 @@ class PathAnalyzer:
                     closeness[page] = 0.0
         else:
             # Exact computation: distances from each node to all others
-            closeness = {}
-
             for i, page in enumerate(pages):
                 if progress_callback:
                     progress_callback(i + 1, total_samples, "closeness")
 
-                # BFS from this page to compute distances
-                distances = self._bfs_distances(page, pages)
-
                 # Closeness = 1 / (average distance to all reachable pages)
-                reachable_distances = [d for d in distances.values() if d > 0]
+                reachable_distances = [d for d in distances_from(i) if d > 0]
 
                 if reachable_distances:
                     avg_distance = sum(reachable_distances) / len(reachable_distances)
@@ -454,6 +516,26 @@ class PathAnalyzer:
 
         return closeness, avg_path_length, diameter
 
+    def _csr_view(
+        self, pages: Sequence[PageLike]
+    ) -> tuple[list[list[int]], list[int], list[bool]] | None:
+        """
+        (out-neighbor lists, node id per page, membership mask) from the graph's CSR.
+
+        None when the graph has no CSR view or it does not cover ``pages``,
+        in which case the page-keyed traversal is used.
+        """
+        csr = getattr(self.graph, "csr", None)
+        if not isinstance(csr, CSRGraph):
+            return None
+        ids = csr.ids(pages)
+        if ids is None:
+            return None
+        member = [False] * csr.num_nodes
+        for node_id in ids:
+            member[node_id] = True
+        return csr.out_lists(), ids, member
+
     def _bfs_distances(self, source: PageLike, pages: Sequence[PageLike]) -> dict[PageLike, int]:
         """Compute shortest path distances from source to all other pages."""
         return _bfs_distances_util(self.graph.outgoing_refs, source, pages)
@@ -0,0 +1,462 @@
+"""
+Unused-selector purge for CSS entry points, driven by the rendered HTML.
+
+The default theme's stylesheet carries rules for every component, layout and
+content type; a given site uses a fraction of them. With ``purge_css`` enabled,
+CSS entry points are minified with a :class:`~bengal.css.SelectorInventory`
+so that rules whose selectors provably match nothing on the site are dropped
+(see ``bengal/css/purge.py`` for the matching rules and cascade guard).
+
+Flow:
+    1. Assets phase: entry points are purged against the *pinned* inventory
+       stored by the last build (``.bengal/selector_inventory.json``). Without
+       a pin they ship in full.
+    2. Render: each page's HTML is harvested into name tokens as it leaves the
+       pipeline (``BuildContext.accumulate_selectors``); special pages and
+       isolated render workers feed the same accumulator. There is no second
+       pass over the output tree.
+    3. Post-process, before precompression: the inventory required by this
+       build (harvested tokens + words from the site's scripts + safelist) is
+       compared with the pin. If it is not covered, entry points are purged
+       again, written under their new fingerprint, and HTML references to the
+       old file are rewritten in the pages that reference it (from the asset
+       dependency map) and in non-page HTML this build wrote.
+
+Incremental builds only harvest the pages they render; the pin covers every
+other page, so it only grows. Full builds re-pin to exactly what the site uses,
+which is how removed classes eventually leave the stylesheet. An incremental
+build with no pin yet leaves CSS unpurged until the next full build.
+
+Scripts and safelist:
+    Every identifier-like word in the site's JavaScript assets and inline
+    ``<script>`` blocks (and in event-handler / ``data-*`` attribute values)
+    counts as a possible class, id, element or attribute name, so names
+    toggled by scripts survive. Words ending in ``-`` or ``_`` keep every name
+    with that prefix (for ``"is-" + state``). Names built any other way need
+    the safelist.
+
+Configuration (``[assets.purge_css]``)::
+
+    assets:
+      purge_css:
+        enabled: true
+        safelist:
+          - is-open        # any class/id/element/attribute with this name
+          - .menu-open     # class only
+          - "#modal"       # id only
+          - "toast-*"      # every name with this prefix
+
+Related:
+- bengal/css/purge.py: selector matching and guard
+- bengal/orchestration/asset.py: purges CSS entries, reprocesses them on re-pin
+- bengal/orchestration/postprocess.py: runs :meth:`CSSPurger.reconcile`
+
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import html
+import json
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from bengal.utils.io.atomic_write import atomic_write_text
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from bengal.core.output import OutputCollector
+    from bengal.css import SelectorInventory
+    from bengal.orchestration.asset import AssetOrchestrator
+    from bengal.orchestration.build_context import BuildContext
+
+logger = get_logger(__name__)
+
+# Bump when the token encoding or harvest rules change (drops existing pins).
+INVENTORY_VERSION = 1
+
+# Start tags with their attribute text; quoted values may contain ">".
+_TAG_RE = re.compile(r"<([A-Za-z][^\s/>]*)((?:[^>\"']|\"[^\"]*\"|'[^']*')*)>")
+_ATTR_RE = re.compile(r"([^\s\"'>/=]+)(?:\s*=\s*(\"[^\"]*\"|'[^']*'|[^\s\"'>]+))?")
+_SCRIPT_RE = re.compile(r"<script\b[^>]*>(.*?)</script\s*>", re.IGNORECASE | re.DOTALL)
+_WORD_RE = re.compile(r"[A-Za-z_][\w-]*")
+
+# Attributes whose values scripts read as names (handlers, framework bindings, data-*)
+_SCRIPTED_ATTR_PREFIXES = ("on", ":", "@", "x-", "v-", "hx-", "data-")
+
+_KINDS = {"c": "classes", "i": "ids", "e": "elements", "a": "attributes"}
+
+
+@dataclass(frozen=True, slots=True)
+class PurgeCSSConfig:
+    """Parsed ``[assets.purge_css]`` settings."""
+
+    enabled: bool = False
+    safelist: tuple[str, ...] = ()
+
+
+def parse_purge_css_config(assets_config: Any) -> PurgeCSSConfig:
+    """
+    Parse purge settings from the ``assets`` config section.
+
+    Accepts ``purge_css: true`` as shorthand for an empty safelist.
+    """
+    raw = assets_config.get("purge_css", False) if assets_config else False
+    if isinstance(raw, bool):
+        return PurgeCSSConfig(enabled=raw)
+    if not isinstance(raw, dict):
+        return PurgeCSSConfig()
+    safelist = raw.get("safelist") or ()
+    if isinstance(safelist, str):
+        safelist = (safelist,)
+    return PurgeCSSConfig(
+        enabled=bool(raw.get("enabled", True)),
+        safelist=tuple(str(entry).strip() for entry in safelist if str(entry).strip()),
+    )
+
+
+# =============================================================================
+# Harvesting
+# =============================================================================
+# Tokens are "<kind>:<lowercase name>": c (class), i (id), e (element),
+# a (attribute), w (word: any of the four), p (prefix: any name starting with it).
+
+
+def _script_words(source: str, tokens: set[str]) -> None:
+    for word in set(_WORD_RE.findall(source)):
+        word = word.lower()
+        tokens.add("w:" + word)
+        if word[-1] in "-_":
+            tokens.add("p:" + word)
+
+
+def harvest_html(markup: str) -> set[str]:
+    """
+    Collect the class, id, element and attribute names used by ``markup``.
+
+    Regex-based and deliberately generous: comments, ``<template>`` contents and
+    tags inside script strings are harvested too, which can only keep more CSS.
+    """
+    tokens: set[str] = set()
+    for match in _TAG_RE.finditer(markup):
+        tokens.add("e:" + match.group(1).lower())
+        attrs = match.group(2)
+        if not attrs:
+            continue
+        for name, raw in _ATTR_RE.findall(attrs):
+            name = name.lower()
+            tokens.add("a:" + name)
+            if not raw:
+                continue
+            value = raw[1:-1] if raw[0] in "\"'" else raw
+            if "&" in value:
+                value = html.unescape(value)
+            if name == "class":
+                tokens.update("c:" + cls.lower() for cls in value.split())
+            elif name == "id":
+                tokens.add("i:" + value.strip().lower())
+            elif name.startswith(_SCRIPTED_ATTR_PREFIXES):
+                _script_words(value, tokens)
+    if "<script" in markup or "<SCRIPT" in markup:
+        for body in _SCRIPT_RE.findall(markup):
+            _script_words(body, tokens)
+    return tokens
+
+
+def safelist_tokens(safelist: Iterable[str]) -> set[str]:
+    """Tokens for safelist entries (``name``, ``.class``, ``#id``, ``prefix*``)."""
+    tokens: set[str] = set()
+    for entry in safelist:
+        entry = entry.lower()
+        if entry.endswith("*"):
+            tokens.add("p:" + entry[:-1].lstrip(".#"))
+        elif entry.startswith("."):
+            tokens.add("c:" + entry[1:])
+        elif entry.startswith("#"):
+            tokens.add("i:" + entry[1:])
+        else:
+            tokens.add("w:" + entry)
+    return tokens
+
+
+def inventory_from_tokens(tokens: Iterable[str]) -> SelectorInventory:
+    """Build the engine's inventory from harvested tokens."""
+    from bengal.css import SelectorInventory
+
+    names: dict[str, set[str]] = {kind_name: set() for kind_name in _KINDS.values()}
+    words: set[str] = set()
+    prefixes: set[str] = set()
+    for token in tokens:
+        kind, _, name = token.partition(":")
+        if kind == "w":
+            words.add(name)
+        elif kind == "p":
+            if name:
+                prefixes.add(name)
+        elif kind in _KINDS:
+            names[_KINDS[kind]].add(name)
+    return SelectorInventory(
+        classes=frozenset(names["classes"] | words),
+        ids=frozenset(names["ids"] | words),
+        elements=frozenset(names["elements"] | words),
+        attributes=frozenset(names["attributes"] | words),
+        prefixes=tuple(sorted(prefixes)),
+    )
+
+
+# =============================================================================
+# Pinned inventory store
+# =============================================================================
+
+
+def load_pinned_tokens(path: Path) -> frozenset[str] | None:
+    """Tokens the current stylesheet was purged against, or None if unknown."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
+        if path.exists():
+            logger.debug("css_purge_inventory_load_failed", path=str(path), error=str(e))
+        return None
+    if not isinstance(data, dict) or data.get("version") != INVENTORY_VERSION:
+        return None
+    tokens = data.get("tokens")
+    if not isinstance(tokens, list):
+        return None
+    return frozenset(str(token) for token in tokens)
+
+
+def save_pinned_tokens(path: Path, tokens: frozenset[str]) -> None:
+    payload = {"version": INVENTORY_VERSION, "tokens": sorted(tokens)}
+    atomic_write_text(path, json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+
+
+def _digest(tokens: frozenset[str]) -> str:
+    hasher = hashlib.sha256()
+    for token in sorted(tokens):
+        hasher.update(token.encode("utf-8", "surrogatepass"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:16]
+
+
+def referencing_html(
+    site: Any,
+    moved: list[tuple[str, str]],
+    collector: OutputCollector | None = None,
+) -> list[Path] | None:
+    """
+    HTML outputs that may reference the moved stylesheets.
+
+    Uses the asset dependency map persisted by the render phase: a page is a
+    candidate when its tracked assets include a moved entry's logical path,
+    or when it has no tracked assets at all. HTML that is not a page output
+    (special pages) is taken from ``collector``.
+
+    Returns:
+        Candidate paths, or None when there is no dependency data or
+        collector, in which case every HTML file must be considered
+    """
+    from bengal.assets.manifest import AssetManifest
+    from bengal.cache.asset_dependency_map import AssetDependencyMap
+    from bengal.core.output import OutputType
+
+    output_dir = site.output_dir
+    dependency_map = AssetDependencyMap(site.config_service.paths.asset_cache)
+    manifest = AssetManifest.load(output_dir / "asset-manifest.json")
+    if collector is None or not dependency_map.pages or manifest is None:
+        return None
+
+    new_paths = {new for _, new in moved}
+    logical = {key for key, entry in manifest.entries.items() if entry.output_path in new_paths}
+
+    candidates: set[Path] = set()
+    page_outputs: set[Path] = set()
+    for page in getattr(site, "pages", None) or ():
+        output_path = getattr(page, "output_path", None)
+        if output_path is None:
+            continue
+        page_outputs.add(output_path)
+        assets = dependency_map.get_page_assets(page.source_path)
+        if assets is None or not assets.isdisjoint(logical):
+            candidates.add(output_path)
+    for record in collector.get_outputs(OutputType.HTML):
+        path = output_dir / record.path
+        if path not in page_outputs:
+            candidates.add(path)
+    return sorted(candidates)
+
+
+def rewrite_html_references(
+    output_dir: Path,
+    moved: list[tuple[str, str]],
+    collector: OutputCollector | None = None,
+    candidates: Iterable[Path] | None = None,
+) -> int:
+    """
+    Point HTML files at re-fingerprinted stylesheets.
+
+    Args:
+        output_dir: Site output directory
+        moved: ``(old, new)`` output paths relative to ``output_dir``
+        collector: Optional output collector for hot reload tracking
+        candidates: HTML files to check (see :func:`referencing_html`);
+            every HTML file under ``output_dir`` when None
+
+    Returns:
+        Number of HTML files rewritten
+    """
+    if not moved:
+        return 0
+    rewritten = 0
+    for path in output_dir.rglob("*.html") if candidates is None else candidates:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError, UnicodeDecodeError:
+            continue
+        updated = text
+        for old, new in moved:
+            if old in updated:
+                updated = updated.replace(old, new)
+        if updated == text:
+            continue
+        atomic_write_text(path, updated, encoding="utf-8")
+        rewritten += 1
+        if collector is not None:
+            collector.record(path, phase="postprocess")
+    return rewritten
+
+
+# =============================================================================
+# Build integration
+# =============================================================================
+
+
+class CSSPurger:
+    """
+    Per-build purge state shared by the assets, render and post-process phases.
+
+    Created by AssetOrchestrator.process() when ``assets.purge_css`` is enabled
+    and handed to the render BuildContext, which harvests into it.
+
+    Thread-safety: :meth:`purge` only reads the pin and may run from parallel
+    asset workers; :meth:`reconcile` runs once, after rendering.
+    """
+
+    def __init__(
+        self,
+        site: Any,
+        config: PurgeCSSConfig,
+        store_path: Path,
+        assets: AssetOrchestrator,
+    ) -> None:
+        self.site = site
+        self.config = config
+        self.store_path = store_path
+        self._assets = assets
+        self._pinned = load_pinned_tokens(store_path)
+        self._inventory: tuple[SelectorInventory, str] | None = None
+
+    @classmethod
+    def for_site(cls, site: Any, assets: AssetOrchestrator) -> CSSPurger | None:
+        """Purger for ``site``, or None when ``assets.purge_css`` is disabled."""
+        config = parse_purge_css_config(site.config_service.assets_config)
+        if not config.enabled:
+            return None
+        return cls(site, config, site.config_service.paths.selector_inventory, assets)
+
+    @property
+    def pinned(self) -> frozenset[str] | None:
+        return self._pinned
+
+    def _pinned_inventory(self) -> tuple[SelectorInventory, str] | None:
+        if self._pinned is None:
+            return None
+        if self._inventory is None:
+            self._inventory = (inventory_from_tokens(self._pinned), _digest(self._pinned))
+        return self._inventory
+
+    def purge(self, css: str) -> str | None:
+        """
+        Minify and purge ``css`` against the pinned inventory.
+
+        Returns:
+            Purged CSS, or None when nothing is pinned yet (ship it in full)
+        """
+        pinned = self._pinned_inventory()
+        if pinned is None:
+            return None
+        inventory, digest = pinned
+
+        from bengal.cache.minify_cache import cached_minify
+        from bengal.css import minify_css
+
+        return cached_minify(
+            "css",
+            css,
+            functools.partial(minify_css, used_selectors=inventory),
+            options=f"level=safe;purge={digest}",
+        )
+
+    def _script_tokens(self) -> set[str]:
+        tokens: set[str] = set()
+        for asset in getattr(self.site, "assets", None) or ():
+            if asset.source_path.suffix.lower() not in (".js", ".mjs"):
+                continue
+            try:
+                source = asset.source_path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            _script_words(source, tokens)
+        return tokens
+
+    def required_tokens(
+        self, build_context: BuildContext | Any, *, incremental: bool
+    ) -> frozenset[str]:
+        """Inventory this build needs: harvest + scripts + safelist (+ pin when incremental)."""
+        tokens = set(build_context.get_accumulated_selectors())
+        tokens |= self._script_tokens()
+        tokens |= safelist_tokens(self.config.safelist)
+        if incremental and self._pinned is not None:
+            tokens |= self._pinned
+        return frozenset(tokens)
+
+    def reconcile(
+        self,
+        build_context: BuildContext | Any,
+        *,
+        incremental: bool,
+        collector: OutputCollector | None = None,
+    ) -> None:
+        """
+        Re-pin and re-purge when this build's pages need selectors the pin lacks.
+
+        Incremental builds without a pin are skipped: only a full build has
+        harvested every page.
+        """
+        if incremental and self._pinned is None:
+            logger.info("css_purge_deferred", reason="no_inventory_until_full_build")
+            return
+        required = self.required_tokens(build_context, incremental=incremental)
+        if required == self._pinned:
+            return
+
+        self._pinned = required
+        self._inventory = None
+        moved = self._assets.reprocess_css_entries(collector=collector)
+        candidates = referencing_html(self.site, moved, collector) if moved else None
+        rewritten = rewrite_html_references(
+            self.site.output_dir, moved, collector, candidates=candidates
+        )
+        save_pinned_tokens(self.store_path, required)
+        logger.info(
+            "css_purge_inventory_updated",
+            tokens=len(required),
+            entries_moved=len(moved),
+            html_rewritten=rewritten,
+            html_scanned="all" if candidates is None else len(candidates),
+            incremental=incremental,
+        )
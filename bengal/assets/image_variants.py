@@ -0,0 +1,655 @@
+"""
+Responsive image variants generated ahead of render.
+
+Encodes resized WebP/AVIF/JPEG/PNG variants of every raster image asset so
+templates can emit real ``srcset`` URLs with intrinsic dimensions instead of
+``hero.jpg?w=400`` placeholders that nothing serves.
+
+Pipeline (runs in the assets phase, after fingerprinting, before render):
+    1. Hash each raster image's content (not mtime, so CI checkouts stay warm)
+    2. Plan one job per (width, format) below the intrinsic width
+    3. Skip jobs whose content-addressed cache file already exists
+    4. Encode the rest in a spawn process pool: every worker owns its own
+       Pillow state, so encoding never contends on the asset ``_pil_lock``
+    5. Hardlink (or copy) cached variants into the output tree under
+       fingerprinted names, e.g. ``images/hero.1a2b3c4d.800w.webp``, and
+       report each to the output collector as written or unchanged
+    6. Persist a variant index that template helpers read during render
+    7. Delete published variants the new index no longer lists (removed
+       sources, widths or formats)
+
+Cache Structure:
+.bengal/image-variants/
+├── index.json                          # logical path → intrinsic size + variants
+└── 1a/
+    └── v2_1a2b…_800w_q80.webp          # v{schema}_{sha256}_{width}w_q{quality}.{ext}
+
+Configuration (``[assets.responsive_images]``)::
+
+    assets:
+      responsive_images:
+        enabled: true
+        widths: [400, 800, 1200, 1600]
+        formats: [webp]        # in addition to the image's own format
+        quality: 80
+        max_workers: null      # auto
+
+Related:
+- bengal/rendering/template_functions/images.py: image_srcset / image_variants
+- bengal/orchestration/build/rendering.py: phase_assets schedules this stage
+- bengal/core/resources/processor.py: per-page resource transforms
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from bengal.core.asset import Asset
+    from bengal.protocols import OutputCollector
+
+logger = get_logger(__name__)
+
+# Bump when encoder settings or cache naming change.
+VARIANT_SCHEMA_VERSION = 2
+
+DEFAULT_WIDTHS: tuple[int, ...] = (400, 800, 1200, 1600)
+DEFAULT_FORMATS: tuple[str, ...] = ("webp",)
+DEFAULT_QUALITY = 80
+
+# Source suffixes that get variants. GIF (animation) and SVG (vector) are skipped.
+RASTER_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".webp"})
+
+# Below this many encodes, spawning worker processes costs more than it saves.
+MIN_JOBS_FOR_POOL = 4
+
+_INDEX_NAME = "index.json"
+
+# EXIF orientation tag; values 5-8 rotate by 90 degrees (width and height swap)
+_EXIF_ORIENTATION = 0x0112
+_SWAPPED_ORIENTATIONS = frozenset({5, 6, 7, 8})
+_EXTENSIONS = {"jpeg": "jpg", "png": "png", "webp": "webp", "avif": "avif"}
+_MIME_TYPES = {
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+    "avif": "image/avif",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ResponsiveImagesConfig:
+    """Parsed ``[assets.responsive_images]`` settings."""
+
+    enabled: bool = False
+    widths: tuple[int, ...] = DEFAULT_WIDTHS
+    formats: tuple[str, ...] = DEFAULT_FORMATS
+    quality: int = DEFAULT_QUALITY
+    max_workers: int | None = None
+
+
+def parse_responsive_images_config(assets_config: Any) -> ResponsiveImagesConfig:
+    """
+    Parse responsive image settings from the ``assets`` config section.
+
+    Accepts ``responsive_images: true`` as shorthand for the defaults.
+    Unknown formats are dropped; widths are de-duplicated and sorted.
+    """
+    raw = assets_config.get("responsive_images", False) if assets_config else False
+    if isinstance(raw, bool):
+        return ResponsiveImagesConfig(enabled=raw)
+    if not isinstance(raw, dict):
+        return ResponsiveImagesConfig()
+
+    widths = tuple(sorted({int(w) for w in raw.get("widths", DEFAULT_WIDTHS) if int(w) > 0}))
+    formats: list[str] = []
+    for fmt in raw.get("formats", DEFAULT_FORMATS):
+        name = _normalize_format(str(fmt))
+        if name is None:
+            logger.warning("responsive_images_unknown_format", format=fmt)
+        elif name not in formats:
+            formats.append(name)
+    quality = int(raw.get("quality", DEFAULT_QUALITY))
+    if not 1 <= quality <= 100:
+        quality = DEFAULT_QUALITY
+    max_workers = raw.get("max_workers")
+    return ResponsiveImagesConfig(
+        enabled=bool(raw.get("enabled", True)),
+        widths=widths or DEFAULT_WIDTHS,
+        formats=tuple(formats),
+        quality=quality,
+        max_workers=int(max_workers) if max_workers else None,
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class ImageVariant:
+    """One generated variant, addressed by its site-relative URL."""
+
+    url: str
+    width: int
+    height: int
+    format: str
+
+    @property
+    def mime_type(self) -> str:
+        return _MIME_TYPES[self.format]
+
+
+@dataclass(frozen=True, slots=True)
+class ResponsiveImage:
+    """
+    An image with its intrinsic size and generated variants.
+
+    ``src`` is the fingerprinted original. Variants of the original's format
+    feed ``srcset``; other formats are exposed through ``sources()`` for
+    ``<picture>`` elements.
+    """
+
+    src: str
+    width: int
+    height: int
+    format: str
+    variants: tuple[ImageVariant, ...] = ()
+
+    def srcset(self, image_format: str | None = None, widths: Iterable[int] | None = None) -> str:
+        """
+        Return a ``srcset`` value for one format (default: the original's).
+
+        ``widths`` restricts the resized candidates; the original is always
+        listed so the largest size stays available.
+        """
+        fmt = _normalize_format(image_format) if image_format else self.format
+        wanted = set(widths) if widths is not None else None
+        candidates = [
+            v for v in self.variants if v.format == fmt and (wanted is None or v.width in wanted)
+        ]
+        if fmt == self.format:
+            candidates.append(ImageVariant(self.src, self.width, self.height, self.format))
+        candidates.sort(key=lambda v: v.width)
+        return ", ".join(f"{v.url} {v.width}w" for v in candidates)
+
+    def url_for_width(self, width: int) -> str:
+        """Return the smallest original-format URL at least ``width`` pixels wide."""
+        fitting = [v for v in self.variants if v.format == self.format and v.width >= width]
+        return min(fitting, key=lambda v: v.width).url if fitting else self.src
+
+    def sources(self) -> list[dict[str, str]]:
+        """Return ``<source>`` descriptors (type + srcset) for non-original formats."""
+        formats = sorted({v.format for v in self.variants if v.format != self.format})
+        return [{"type": _MIME_TYPES[fmt], "srcset": self.srcset(fmt)} for fmt in formats]
+
+    def with_baseurl(self, baseurl: str) -> ResponsiveImage:
+        """Return a copy with ``baseurl`` prefixed to every URL."""
+        prefix = baseurl.rstrip("/")
+        if not prefix:
+            return self
+        return ResponsiveImage(
+            src=prefix + self.src,
+            width=self.width,
+            height=self.height,
+            format=self.format,
+            variants=tuple(
+                ImageVariant(prefix + v.url, v.width, v.height, v.format) for v in self.variants
+            ),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "src": self.src,
+            "width": self.width,
+            "height": self.height,
+            "format": self.format,
+            "variants": [
+                {"url": v.url, "width": v.width, "height": v.height, "format": v.format}
+                for v in self.variants
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ResponsiveImage:
+        return cls(
+            src=data["src"],
+            width=int(data["width"]),
+            height=int(data["height"]),
+            format=data["format"],
+            variants=tuple(
+                ImageVariant(v["url"], int(v["width"]), int(v["height"]), v["format"])
+                for v in data.get("variants", ())
+            ),
+        )
+
+
+# =============================================================================
+# Worker side (must stay picklable and import-light)
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class VariantJob:
+    """A single encode, shipped to a worker process."""
+
+    source: str
+    cache_path: str
+    width: int
+    height: int
+    format: str
+    quality: int
+
+
+def encode_variant(job: VariantJob) -> str | None:
+    """
+    Encode one variant into the cache. Runs in a worker process.
+
+    Returns:
+        None on success, otherwise an error message.
+    """
+    try:
+        from PIL import Image, ImageOps
+
+        cache_path = Path(job.cache_path)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with Image.open(job.source) as img:
+            # JPEG decoders can downscale while decoding (much cheaper than full
+            # decode); job sizes are upright, the stored pixels may be rotated
+            if _orientation(img) in _SWAPPED_ORIENTATIONS:
+                img.draft("RGB", (job.height, job.width))
+            else:
+                img.draft("RGB", (job.width, job.height))
+            # Apply EXIF orientation so rotated photos are not resized sideways
+            frame: Image.Image = ImageOps.exif_transpose(img)
+            if job.format == "jpeg" and frame.mode not in ("RGB", "L"):
+                frame = frame.convert("RGB")
+            elif frame.mode == "P":
+                frame = frame.convert("RGBA")
+            if frame.size != (job.width, job.height):
+                frame = frame.resize((job.width, job.height), Image.Resampling.LANCZOS)
+
+            save_kwargs: dict[str, Any] = {}
+            if job.format in ("jpeg", "webp", "avif"):
+                save_kwargs["quality"] = job.quality
+            if job.format == "jpeg":
+                save_kwargs["optimize"] = True
+                save_kwargs["progressive"] = True
+            elif job.format == "webp":
+                save_kwargs["method"] = 4
+            elif job.format == "png":
+                save_kwargs["optimize"] = True
+
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".variant_")
+            os.close(fd)
+            try:
+                frame.save(tmp_path, format=job.format.upper(), **save_kwargs)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                with contextlib.suppress(OSError):  # silent: best-effort temp file cleanup
+                    os.unlink(tmp_path)
+                raise
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
+
+# =============================================================================
+# Pipeline
+# =============================================================================
+
+
+@dataclass
+class VariantRunStats:
+    """Counters for one pipeline run."""
+
+    images: int = 0
+    variants: int = 0
+    encoded: int = 0
+    cache_hits: int = 0
+    failed: int = 0
+    pruned: int = 0
+    errors: list[str] = field(default_factory=list)
+
+
+class ImageVariantPipeline:
+    """
+    Generate and publish responsive variants for raster image assets.
+
+    Not thread-safe: run once per build from the assets phase.
+    """
+
+    def __init__(self, site: Any, config: ResponsiveImagesConfig) -> None:
+        self.site = site
+        self.config = config
+        self.cache_dir: Path = site.config_service.paths.image_variants_dir
+        self.output_dir: Path = site.output_dir
+
+    def run(
+        self,
+        assets: Iterable[Asset],
+        *,
+        full: bool = True,
+        collector: OutputCollector | None = None,
+    ) -> VariantRunStats:
+        """
+        Generate variants for the given assets and update the variant index.
+
+        Args:
+            assets: Processed assets (``output_path`` is the fingerprinted output)
+            full: When True the index is rebuilt from these assets only; when
+                False (incremental) entries for other images that still exist
+                in ``site.assets`` are kept.
+            collector: Output collector told about every published variant
+        """
+        from bengal.cache.output_gate import record_write
+        from bengal.utils.io.file_io import link_or_copy
+        from bengal.utils.primitives.hashing import hash_file
+
+        stats = VariantRunStats()
+        previous = load_variant_index(self.cache_dir)
+        index = {} if full else self._surviving_entries(previous)
+
+        planned: list[tuple[str, ResponsiveImage, list[tuple[VariantJob, Path]]]] = []
+        for asset in assets:
+            if asset.source_path.suffix.lower() not in RASTER_SUFFIXES:
+                continue
+            final_path = asset.output_path
+            if not isinstance(final_path, Path) or not final_path.is_absolute():
+                continue
+            try:
+                digest = hash_file(asset.source_path)
+                intrinsic = _read_size(asset.source_path)
+            except OSError as e:
+                stats.errors.append(f"{asset.source_path}: {e}")
+                continue
+            if intrinsic is None:
+                continue
+            logical = (asset.logical_path or Path(asset.source_path.name)).as_posix()
+            planned.append((logical, *self._plan(asset, final_path, digest, intrinsic)))
+            stats.images += 1
+
+        jobs = [
+            job for _, _, pairs in planned for job, _ in pairs if not Path(job.cache_path).exists()
+        ]
+        stats.variants = sum(len(pairs) for _, _, pairs in planned)
+        stats.cache_hits = stats.variants - len(jobs)
+        failed = self._encode(jobs, stats)
+
+        for logical, image, pairs in planned:
+            published: list[ImageVariant] = []
+            for (job, out_path), variant in zip(pairs, image.variants, strict=True):
+                if job.cache_path in failed:
+                    continue
+                try:
+                    written = not _is_published(out_path, Path(job.cache_path))
+                    if written:
+                        link_or_copy(Path(job.cache_path), out_path)
+                except OSError as e:
+                    stats.errors.append(f"{out_path}: {e}")
+                    continue
+                record_write(collector, out_path, written, phase="asset")
+                published.append(variant)
+            index[logical] = ResponsiveImage(
+                src=image.src,
+                width=image.width,
+                height=image.height,
+                format=image.format,
+                variants=tuple(published),
+            )
+
+        save_variant_index(self.cache_dir, index)
+        stats.pruned = self._prune_outputs(previous, index, stats)
+        logger.info(
+            "image_variants_complete",
+            images=stats.images,
+            variants=stats.variants,
+            encoded=stats.encoded,
+            cache_hits=stats.cache_hits,
+            failed=stats.failed,
+            pruned=stats.pruned,
+        )
+        for error in stats.errors[:5]:
+            logger.warning("image_variant_failed", error=error)
+        return stats
+
+    def _surviving_entries(
+        self, previous: dict[str, ResponsiveImage]
+    ) -> dict[str, ResponsiveImage]:
+        """Previous index entries whose source image is still a site asset."""
+        site_assets = getattr(self.site, "assets", None)
+        if not site_assets:
+            return dict(previous)
+        live = {
+            (asset.logical_path or Path(asset.source_path.name)).as_posix() for asset in site_assets
+        }
+        return {logical: image for logical, image in previous.items() if logical in live}
+
+    def _prune_outputs(
+        self,
+        previous: dict[str, ResponsiveImage],
+        index: dict[str, ResponsiveImage],
+        stats: VariantRunStats,
+    ) -> int:
+        """Delete variants published by an earlier run that ``index`` no longer lists."""
+        keep = {variant.url for image in index.values() for variant in image.variants}
+        removed = 0
+        for image in previous.values():
+            for variant in image.variants:
+                if variant.url in keep:
+                    continue
+                path = self.output_dir / variant.url.lstrip("/")
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    stats.errors.append(f"{path}: {e}")
+                    continue
+                removed += 1
+        return removed
+
+    def _plan(
+        self,
+        asset: Asset,
+        final_path: Path,
+        digest: str,
+        intrinsic: tuple[int, int, str],
+    ) -> tuple[ResponsiveImage, list[tuple[VariantJob, Path]]]:
+        """Plan variant jobs and output paths for one image."""
+        width, height, own_format = intrinsic
+        src = "/" + final_path.relative_to(self.output_dir).as_posix()
+        formats = [own_format, *(f for f in self.config.formats if f != own_format)]
+
+        pairs: list[tuple[VariantJob, Path]] = []
+        variants: list[ImageVariant] = []
+        stem = asset.source_path.stem
+        for fmt in formats:
+            for target in self.config.widths:
+                if target > width or (target == width and fmt == own_format):
+                    # Never upscale; the original already serves its own width
+                    continue
+                target_height = max(1, round(height * target / width))
+                ext = _EXTENSIONS[fmt]
+                cache_path = (
+                    self.cache_dir
+                    / digest[:2]
+                    / f"v{VARIANT_SCHEMA_VERSION}_{digest}_{target}w_q{self.config.quality}.{ext}"
+                )
+                out_path = final_path.parent / f"{stem}.{digest[:8]}.{target}w.{ext}"
+                pairs.append(
+                    (
+                        VariantJob(
+                            source=str(asset.source_path),
+                            cache_path=str(cache_path),
+                            width=target,
+                            height=target_height,
+                            format=fmt,
+                            quality=self.config.quality,
+                        ),
+                        out_path,
+                    )
+                )
+                variants.append(
+                    ImageVariant(
+                        url="/" + out_path.relative_to(self.output_dir).as_posix(),
+                        width=target,
+                        height=target_height,
+                        format=fmt,
+                    )
+                )
+        image = ResponsiveImage(
+            src=src, width=width, height=height, format=own_format, variants=tuple(variants)
+        )
+        return image, pairs
+
+    def _encode(self, jobs: list[VariantJob], stats: VariantRunStats) -> set[str]:
+        """Encode cache misses, in a process pool when worthwhile. Returns failed cache paths."""
+        failed: set[str] = set()
+        if not jobs:
+            return failed
+
+        def _record(job: VariantJob, error: str | None) -> None:
+            if error is None:
+                stats.encoded += 1
+            else:
+                stats.failed += 1
+                failed.add(job.cache_path)
+                stats.errors.append(f"{job.source} ({job.width}w {job.format}): {error}")
+
+        workers = self._worker_count(len(jobs))
+        if workers <= 1 or len(jobs) < MIN_JOBS_FOR_POOL:
+            for job in jobs:
+                _record(job, encode_variant(job))
+            return failed
+
+        from bengal.utils.concurrency.executor import managed_process_pool
+
+        # Largest sources first so the pool's tail is short
+        ordered = sorted(jobs, key=lambda j: j.width * j.height, reverse=True)
+        with managed_process_pool(workers) as pool:
+            for job, error in zip(
+                ordered, pool.map(encode_variant, ordered, chunksize=4), strict=True
+            ):
+                _record(job, error)
+        return failed
+
+    def _worker_count(self, job_count: int) -> int:
+        from bengal.utils.concurrency.workers import WorkloadType, get_optimal_workers
+
+        return get_optimal_workers(
+            job_count,
+            workload_type=WorkloadType.CPU_BOUND,
+            config_override=self.config.max_workers,
+        )
+
+
+# =============================================================================
+# Variant index
+# =============================================================================
+
+
+def load_variant_index(cache_dir: Path) -> dict[str, ResponsiveImage]:
+    """Load the persisted variant index; missing or invalid data yields {}."""
+    from bengal.utils.io import json_compat
+
+    try:
+        data = json_compat.load(cache_dir / _INDEX_NAME)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning("image_variant_index_load_failed", error=str(e), action="rebuilding")
+        return {}
+    if not isinstance(data, dict) or data.get("version") != VARIANT_SCHEMA_VERSION:
+        return {}
+    images: dict[str, ResponsiveImage] = {}
+    for logical, entry in (data.get("images") or {}).items():
+        with contextlib.suppress(KeyError, TypeError, ValueError):
+            images[logical] = ResponsiveImage.from_dict(entry)
+    return images
+
+
+def save_variant_index(cache_dir: Path, index: dict[str, ResponsiveImage]) -> None:
+    """Persist the variant index atomically."""
+    from bengal.utils.io import json_compat
+
+    json_compat.dump(
+        {
+            "version": VARIANT_SCHEMA_VERSION,
+            "images": {logical: image.to_dict() for logical, image in index.items()},
+        },
+        cache_dir / _INDEX_NAME,
+        indent=None,
+    )
+
+
+def _normalize_format(name: str | None) -> str | None:
+    """Map a user/Pillow format name onto a supported variant format."""
+    if not name:
+        return None
+    name = name.lower()
+    if name == "jpg":
+        name = "jpeg"
+    return name if name in _EXTENSIONS else None
+
+
+def _is_published(out_path: Path, cache_path: Path) -> bool:
+    """Whether ``out_path`` already holds ``cache_path`` (same inode or size).
+
+    Output names carry no quality setting, so a re-encode at another quality
+    lands on an existing name and must replace it.
+    """
+    try:
+        out_st = out_path.stat()
+        cache_st = cache_path.stat()
+    except OSError:
+        return False
+    if (out_st.st_dev, out_st.st_ino) == (cache_st.st_dev, cache_st.st_ino):
+        return True
+    return out_st.st_size == cache_st.st_size
+
+
+def _orientation(img: Any) -> int:
+    """EXIF orientation of an open image (1 when absent or unreadable)."""
+    try:
+        return int(img.getexif().get(_EXIF_ORIENTATION, 1))
+    except Exception:
+        return 1
+
+
+def _read_size(path: Path) -> tuple[int, int, str] | None:
+    """Read intrinsic (width, height, format) from the image header only.
+
+    The size is as displayed: EXIF orientations that rotate by 90 degrees
+    swap the stored width and height.
+    """
+    try:
+        from PIL import Image
+
+        with Image.open(path) as img:
+            fmt = _normalize_format(img.format)
+            if fmt is None:
+                return None
+            if _orientation(img) in _SWAPPED_ORIENTATIONS:
+                return img.height, img.width, fmt
+            return img.width, img.height, fmt
+    except ImportError:
+        logger.warning(
+            "pillow_not_available",
+            detail="Pillow library not installed, responsive image variants disabled",
+        )
+        return None
+    except Exception as e:
+        logger.warning(
+            "image_header_read_failed",
+            path=str(path),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        return None
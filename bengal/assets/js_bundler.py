@@ -92,7 +92,9 @@ def bundle_js_files(
         try:
             from jsmin import jsmin
 
-            bundled = jsmin(bundled)
+            from bengal.cache.minify_cache import cached_minify
+
+            bundled = cached_minify("js", bundled, jsmin)
         except ImportError:
             logger.warning("jsmin_unavailable_for_bundle")
 
@@ -170,6 +172,7 @@ def get_theme_js_excluded() -> set[str]:
         "mermaid-toolbar.js",
         # Feature-specific (loaded conditionally)
         "enhancements/lightbox.js",
+        "core/search/native.js",
     }
 
 
@@ -127,13 +127,18 @@ def missing_postprocess_artifacts(site: SiteLike) -> tuple[Path, ...]:
     if site.config.get("generate_rss", True):
         expected.append(site_output_path(site, "rss.xml", uses_i18n_output_path=True))
 
-    # search-index.json (prebuilt Lunr index) lives alongside index.json. It can only
-    # be regenerated when (a) the search backend is enabled + prebuilt, (b) index_json
-    # is a configured site-wide output format, and (c) the optional `lunr` package is
-    # importable. Without the lunr guard a warm build would perpetually believe an
-    # un-creatable file is missing and never reach the no-op fast path.
+    # The search backend's entry artifact (search-index.json for Lunr,
+    # search/manifest.json for the native index) lives alongside index.json. It can
+    # only be regenerated when (a) the search backend is enabled + prebuilt, (b)
+    # index_json is a configured site-wide output format, and (c) for Lunr, the
+    # optional `lunr` package is importable. Without the lunr guard a warm build
+    # would perpetually believe an un-creatable file is missing and never reach the
+    # no-op fast path.
     if search_index_repairable(site):
-        expected.append(site_output_path(site, "search-index.json", uses_i18n_output_path=True))
+        from bengal.postprocess.search_backends import resolve_search_backend_config
+
+        artifact = resolve_search_backend_config(site.config.get("search", {})).artifact_name
+        expected.append(site_output_path(site, artifact, uses_i18n_output_path=True))
 
     missing: list[Path] = []
     seen: set[Path] = set()
@@ -150,12 +155,13 @@ def missing_postprocess_artifacts(site: SiteLike) -> tuple[Path, ...]:
 
 
 def search_index_repairable(site: SiteLike) -> bool:
-    """Return whether a missing search-index.json could actually be regenerated.
+    """Return whether a missing search backend artifact could actually be regenerated.
 
     Mirrors the gates in ``OutputFormatsGenerator``: the search backend must be
     enabled with prebuilt artifacts, ``index_json`` must be a configured site-wide
-    output format (search-index.json is written alongside index.json), and the
-    optional ``lunr`` package must be importable. Imports are kept function-local
+    output format (search artifacts are written alongside index.json), and for the
+    Lunr backend the optional ``lunr`` package must be importable. The native
+    backend has no optional dependency. Imports are kept function-local
     to avoid new module-level import cycles (see project memory on circular imports).
     """
     if "index_json" not in configured_site_wide_output_formats(site):
@@ -166,6 +172,8 @@ def search_index_repairable(site: SiteLike) -> bool:
     search_config = resolve_search_backend_config(site.config.get("search", {}))
     if not search_config.enabled or not search_config.prebuilt_enabled:
         return False
+    if search_config.backend == "native":
+        return True
 
     import importlib.util
 
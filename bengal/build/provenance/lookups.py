@@ -20,6 +20,12 @@ logger = get_logger(__name__)
 # Stable tokens for live-filter fallback INFO logs. Do not paraphrase.
 FALLBACK_INDEX_INCOMPLETE = "index_incomplete"
 FALLBACK_TEMPLATE_DEPS_MISSING = "template_deps_missing"
+FALLBACK_STRUCTURAL_NON_CONTENT = "structural_non_content"
+FALLBACK_STRUCTURAL_ROOT_PAGE = "structural_root_page"
+FALLBACK_STRUCTURAL_SECTION = "structural_section"
+FALLBACK_STRUCTURAL_MENU = "structural_menu"
+FALLBACK_STRUCTURAL_MULTI_TREE = "structural_multi_tree"
+FALLBACK_STRUCTURAL_TERM_REMOVED = "structural_term_removed"
 
 INDEX_DEPENDENCY_KINDS: tuple[str, ...] = (
     "generated",
@@ -0,0 +1,258 @@
+"""Scoped rebuilds for page creation, deletion, and renames.
+
+A page that appears or disappears changes more than its own output: the
+navigation and list pages of its section, the prev/next links of its
+neighbours, the home page, and the term pages of its tags. Discovery still
+runs in full, so sections, registries and the nav tree are rebuilt from the
+new file set; what this module scopes is which existing outputs are
+re-rendered.
+
+``structural_fallback_reason`` decides from paths alone whether a change can
+be scoped (the dev-server gate and the build both use it).
+``apply_structural_cascade`` adds the affected pages to a provenance filter
+result, or returns a named fallback reason when the scope cannot be proven.
+
+Scope for a page in top-level section ``S``:
+- every page under ``S`` (docs nav, section list pages, in-section prev/next)
+- every page outside a section (home and root-level pages show the full nav)
+- the pages either side of ``S`` in ``site.pages`` (site-wide prev/next)
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bengal.build.contracts.keys import content_key
+from bengal.build.provenance.filter import ProvenanceFilterResult
+from bengal.build.provenance.lookups import (
+    FALLBACK_STRUCTURAL_MENU,
+    FALLBACK_STRUCTURAL_MULTI_TREE,
+    FALLBACK_STRUCTURAL_NON_CONTENT,
+    FALLBACK_STRUCTURAL_ROOT_PAGE,
+    FALLBACK_STRUCTURAL_SECTION,
+    FALLBACK_STRUCTURAL_TERM_REMOVED,
+)
+from bengal.content.utils.constants import CONTENT_EXTENSIONS
+from bengal.core.section.utils import get_page_section
+from bengal.utils.observability.logger import get_logger
+from bengal.utils.primitives.text import normalize_taxonomy_slug
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+
+    from bengal.build.provenance.store import ProvenanceCache
+    from bengal.cache.build_cache import BuildCache
+    from bengal.protocols import SiteLike
+    from bengal.protocols.core import PageLike
+
+logger = get_logger(__name__)
+
+_SECTION_INDEX_STEMS = frozenset({"_index", "index"})
+
+
+def is_multi_tree_site(site: SiteLike) -> bool:
+    """True for versioned or i18n sites, where one file can appear in several trees."""
+    if getattr(site, "versioning_enabled", False):
+        return True
+    from bengal.orchestration.utils.i18n import get_i18n_config
+
+    return get_i18n_config(site.config).is_enabled
+
+
+def structural_fallback_reason(
+    paths: Iterable[Path],
+    content_dir: Path,
+    *,
+    multi_tree: bool = False,
+) -> str | None:
+    """
+    Named fallback for created/deleted/moved ``paths``, or None when scopable.
+
+    Only regular content pages inside a section can be scoped. Anything else
+    (directories, templates, data, section indexes, root-level pages) can
+    change navigation or cascade for an unbounded set of pages.
+    """
+    if multi_tree:
+        return FALLBACK_STRUCTURAL_MULTI_TREE
+    content_root = content_dir.resolve()
+    for path in paths:
+        if path.suffix.lower() not in CONTENT_EXTENSIONS:
+            return FALLBACK_STRUCTURAL_NON_CONTENT
+        try:
+            relative = path.resolve().relative_to(content_root)
+        except ValueError:
+            return FALLBACK_STRUCTURAL_NON_CONTENT
+        if len(relative.parts) == 1:
+            return FALLBACK_STRUCTURAL_ROOT_PAGE
+        if path.stem in _SECTION_INDEX_STEMS:
+            return FALLBACK_STRUCTURAL_SECTION
+    return None
+
+
+def _top_level(section: Any) -> Any:
+    """Outermost ancestor (the docs-nav tree of a ``nav_root`` still lists it)."""
+    while getattr(section, "parent", None) is not None:
+        section = section.parent
+    return section
+
+
+def _section_chain(section: Any) -> Iterable[str]:
+    """Section paths from ``section`` up to its top-level ancestor."""
+    current: Any = section
+    while current is not None:
+        path = getattr(current, "path", None)
+        if path is not None:
+            yield str(path)
+        current = getattr(current, "parent", None)
+
+
+def apply_structural_cascade(
+    result: ProvenanceFilterResult,
+    site: SiteLike,
+    pages_list: Sequence[PageLike],
+    provenance_cache: ProvenanceCache,
+    cache: BuildCache,
+    deleted_sources: Mapping[str, set[str]],
+    dependency_reasons: dict[str, list[str]],
+) -> tuple[ProvenanceFilterResult, str | None]:
+    """
+    Add the pages affected by created and deleted content pages.
+
+    Created pages are content pages being built without stored provenance;
+    deleted pages come from ``deleted_sources`` (cache key -> previous tags,
+    recorded by deleted-file cleanup).
+
+    Returns:
+        ``(result, None)`` when the change was scoped (or there was none), or
+        ``(result, reason)`` with a stable fallback token when the caller must
+        rebuild everything.
+    """
+    root = site.root_path
+    content_dir = root / "content"
+
+    created = [
+        page
+        for page in result.pages_to_build
+        if not getattr(page, "virtual", False)
+        and provenance_cache.get_stored_hash(content_key(page.source_path, root)) is None
+    ]
+    deleted = {
+        key: root / key
+        for key in deleted_sources
+        if Path(key).suffix.lower() in CONTENT_EXTENSIONS
+        and (root / key).resolve().is_relative_to(content_dir.resolve())
+    }
+    if not created and not deleted:
+        return result, None
+
+    reason = structural_fallback_reason(
+        [page.source_path for page in created] + list(deleted.values()),
+        content_dir,
+        multi_tree=is_multi_tree_site(site),
+    )
+    if reason is not None:
+        return result, reason
+
+    # Menus render on every page. A created page's frontmatter is known; a
+    # deleted page's is not, so any frontmatter-driven menu is unprovable.
+    if any("menu" in page.metadata for page in created) or (
+        deleted and any("menu" in page.metadata for page in pages_list)
+    ):
+        return result, FALLBACK_STRUCTURAL_MENU
+
+    sections_by_path = {
+        section.path.resolve(): section
+        for top in site.sections
+        for section in top.walk()
+        if section.path is not None
+    }
+
+    changed_sections: list[Any] = []
+    for page in created:
+        section = get_page_section(page)
+        if section is None:
+            return result, FALLBACK_STRUCTURAL_ROOT_PAGE
+        # A section with no previously built pages is new: parent list pages
+        # and every nav tree gain an entry.
+        if not any(
+            provenance_cache.get_stored_hash(content_key(member.source_path, root)) is not None
+            for member in section.pages
+        ):
+            return result, FALLBACK_STRUCTURAL_SECTION
+        changed_sections.append(section)
+    for path in deleted.values():
+        section = sections_by_path.get(path.parent.resolve())
+        if section is None:
+            # The whole directory went away with the page
+            return result, FALLBACK_STRUCTURAL_SECTION
+        changed_sections.append(section)
+
+    # Tags whose last member was deleted leave a term page nothing rebuilds
+    deleted_tags = {tag for key in deleted for tag in deleted_sources[key] if tag is not None}
+    created_slugs = {
+        normalize_taxonomy_slug(tag) for page in created for tag in (page.tags or ()) if tag
+    }
+    for tag in deleted_tags:
+        slug = normalize_taxonomy_slug(tag)
+        remaining = cache.taxonomy_index.get_pages_for_tag(slug) - set(deleted)
+        if not remaining and slug not in created_slugs:
+            return result, FALLBACK_STRUCTURAL_TERM_REMOVED
+
+    top_levels = {id(_top_level(section)) for section in changed_sections}
+    affected_sections = set(result.affected_sections)
+    for section in changed_sections:
+        affected_sections.update(_section_chain(section))
+
+    in_scope: list[int] = []
+    span: list[int] = []
+    for position, page in enumerate(pages_list):
+        section = get_page_section(page)
+        if section is None:
+            in_scope.append(position)
+        elif id(_top_level(section)) in top_levels:
+            in_scope.append(position)
+            span.append(position)
+    if span:
+        in_scope.extend(
+            position for position in (span[0] - 1, span[-1] + 1) if 0 <= position < len(pages_list)
+        )
+
+    changed_names = [page.source_path.name for page in created] + [
+        path.name for path in deleted.values()
+    ]
+    trigger = changed_names[0] if len(changed_names) == 1 else f"{len(changed_names)} files"
+    building = {page.source_path for page in result.pages_to_build}
+    added: list[PageLike] = []
+    for position in sorted(set(in_scope)):
+        page = pages_list[position]
+        if page.source_path in building:
+            continue
+        building.add(page.source_path)
+        added.append(page)
+        dependency_reasons.setdefault(str(page.source_path), []).append(
+            f"structural_cascade:{trigger}"
+        )
+
+    new_pages_to_build = list(result.pages_to_build) + added
+    added_ids = {id(page) for page in added}
+    new_pages_skipped = [p for p in result.pages_skipped if id(p) not in added_ids]
+    cascaded = ProvenanceFilterResult(
+        pages_to_build=new_pages_to_build,
+        assets_to_process=result.assets_to_process,
+        pages_skipped=new_pages_skipped,
+        total_pages=result.total_pages,
+        cache_hits=len(new_pages_skipped),
+        cache_misses=len(new_pages_to_build),
+        affected_tags=result.affected_tags | deleted_tags,
+        affected_sections=affected_sections,
+        changed_page_paths=result.changed_page_paths,
+    )
+
+    logger.info(
+        "structural_cascade_triggered",
+        created=len(created),
+        deleted=len(deleted),
+        pages_added=len(added),
+    )
+    return cascaded, None
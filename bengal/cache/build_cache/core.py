@@ -42,11 +42,13 @@ from bengal.cache.build_cache.parsed_content_cache import ParsedContentCacheMixi
 from bengal.cache.build_cache.rendered_output_cache import RenderedOutputCacheMixin
 from bengal.cache.build_cache.taxonomy_index_mixin import BuildTaxonomyIndex
 from bengal.cache.build_cache.validation_cache import ValidationCacheMixin
+from bengal.cache.segment_store import SegmentStore, TrackedStore, compact_in_background
 from bengal.utils.io import json_compat
 from bengal.utils.observability.logger import get_logger
 from bengal.utils.paths.normalize import to_posix
 
 if TYPE_CHECKING:
+    import threading
     from pathlib import Path
 
 logger = get_logger(__name__)
@@ -117,6 +119,9 @@ class BuildCache(
     # True when load() had to fall back to a fresh cache after a read/parse failure.
     _recovered_from_error: bool = field(default=False, repr=False)
 
+    # Background hot-store compaction started by the last save (not serialized)
+    _compaction_thread: threading.Thread | None = field(default=None, repr=False, compare=False)
+
     # file_fingerprints for fast mtime+size change detection
     # Structure: {CacheKey(path): {mtime: float, size: int, hash: str | None}}
     # Use get_file_fingerprint/set_file_fingerprint or _cache_key for lookups
@@ -201,9 +206,11 @@ class BuildCache(
             k: frozenset(v) if isinstance(v, list) else v
             for k, v in self.template_dependencies.items()
         }
-        # Parsed content is already in dict format (no conversion needed)
-        # Synthetic pages is already in dict format (no conversion needed)
-        # Validation results are already in dict format (no conversion needed)
+        # Hot stores track dirty keys so save() appends only changed entries
+        for field_name in HOT_STORE_FIELDS:
+            store = getattr(self, field_name)
+            if not isinstance(store, TrackedStore):
+                setattr(self, field_name, TrackedStore(store))
 
     @classmethod
     def load(
@@ -297,7 +304,7 @@ class BuildCache(
                 )
                 return cls()
 
-            cls._load_external_stores(cache_path, data)
+            store_generations = cls._load_external_stores(cache_path, data)
 
             # Convert lists back to sets in dependencies
             if "dependencies" in data:
@@ -454,7 +461,11 @@ class BuildCache(
                 data["version"] = cls.VERSION
             data.pop("external_stores", None)
 
-            return cls(**data)
+            cache = cls(**data)
+            # Bind hot stores to the on-disk generation they were read from
+            for field_name, generation in store_generations.items():
+                getattr(cache, field_name).generation = generation
+            return cache
         except (json.JSONDecodeError, KeyError, TypeError) as e:
             from bengal.errors import ErrorCode
 
@@ -517,11 +528,22 @@ class BuildCache(
         return None
 
     @classmethod
-    def _load_external_stores(cls, cache_path: Path, data: dict[str, Any]) -> None:
-        """Load split hot cache stores referenced by the main cache payload."""
+    def _load_external_stores(cls, cache_path: Path, data: dict[str, Any]) -> dict[str, str]:
+        """
+        Load split hot cache stores referenced by the main cache payload.
+
+        Segment store directories are memory-mapped and only their key index
+        is parsed here; each value is decompressed on first lookup. Legacy
+        single-file JSON stores are still accepted and rewritten as segment
+        stores on the next save.
+
+        Returns:
+            Mapping of field name to the segment store generation that was loaded.
+        """
+        generations: dict[str, str] = {}
         external_stores = data.get("external_stores")
         if not isinstance(external_stores, dict):
-            return
+            return generations
 
         for field_name, relative_path in external_stores.items():
             if field_name not in HOT_STORE_FIELDS or not isinstance(relative_path, str):
@@ -536,6 +558,15 @@ class BuildCache(
                 )
                 data.setdefault(field_name, {})
                 continue
+            if store_path.is_dir():
+                lazy_store = SegmentStore(store_path).open()
+                if lazy_store is None:
+                    data[field_name] = {}
+                    continue
+                data[field_name] = lazy_store
+                if lazy_store.generation is not None:
+                    generations[field_name] = lazy_store.generation
+                continue
             try:
                 store_data = json_compat.load(store_path)
             except Exception as e:
@@ -550,6 +581,7 @@ class BuildCache(
                 continue
             if isinstance(store_data, dict):
                 data[field_name] = store_data
+        return generations
 
     def save(self, cache_path: Path, use_lock: bool = True) -> bool:
         """
@@ -560,6 +592,9 @@ class BuildCache(
           on crash/interruption.
         - File locking: Acquires exclusive lock to prevent concurrent writes.
         - Combined safety: Lock + atomic write ensures complete consistency.
+        - Hot stores: Only dirty entries are appended to their segment stores;
+          stores with too many dead bytes are compacted afterwards (on a
+          background thread holding the same lock when locking is enabled).
 
         Args:
             cache_path: Path to cache file
@@ -581,6 +616,7 @@ class BuildCache(
                     self._save_to_file(cache_path)
             else:
                 self._save_to_file(cache_path)
+            self._compact_external_stores(cache_path, use_lock=use_lock)
             return True
 
         except Exception as e:
@@ -708,20 +744,43 @@ class BuildCache(
     def _save_external_stores(self, cache_path: Path) -> dict[str, str]:
         """Save hot cache maps outside the compressed monolithic cache payload."""
         stores_dir = cache_path.parent / "stores"
-        stores_dir.mkdir(parents=True, exist_ok=True)
-        stores = {
-            "parsed_content": self.parsed_content,
-            "rendered_output": self.rendered_output,
-            "validation_results": self.validation_results,
-            "synthetic_pages": self.synthetic_pages,
-        }
         relative_paths: dict[str, str] = {}
-        for field_name, payload in stores.items():
-            store_path = stores_dir / f"{field_name}.json"
-            json_compat.dump(payload, store_path, indent=None)
-            relative_paths[field_name] = str(store_path.relative_to(cache_path.parent))
+        for field_name in sorted(HOT_STORE_FIELDS):
+            payload = getattr(self, field_name)
+            store = SegmentStore(stores_dir / field_name)
+            if isinstance(payload, TrackedStore):
+                dirty_keys, deleted_keys = payload.pending_changes()
+                generation = store.save(
+                    payload,
+                    dirty_keys=dirty_keys,
+                    deleted_keys=deleted_keys,
+                    generation=payload.generation,
+                )
+                payload.mark_clean(generation)
+            else:
+                # Replaced with a plain dict by a caller: no dirty tracking, rewrite
+                store.save(payload)
+            # Drop the pre-segment single-file store once migrated
+            (stores_dir / f"{field_name}.json").unlink(missing_ok=True)
+            relative_paths[field_name] = str(store.root.relative_to(cache_path.parent))
         return relative_paths
 
+    def _compact_external_stores(self, cache_path: Path, use_lock: bool) -> None:
+        """Compact hot stores whose segments are mostly dead bytes."""
+        stores_dir = cache_path.parent / "stores"
+        stores = [
+            store
+            for store in (SegmentStore(stores_dir / name) for name in sorted(HOT_STORE_FIELDS))
+            if store.needs_compaction()
+        ]
+        if not stores:
+            return
+        if use_lock:
+            self._compaction_thread = compact_in_background(stores, cache_path)
+        else:
+            for store in stores:
+                store.compact()
+
     def clear(self) -> None:
         """Clear all cache data."""
         self.file_fingerprints.clear()
@@ -97,9 +97,8 @@ class ValidationCacheMixin:
         """
         file_key = self._cache_key(file_path)
 
-        # Ensure file entry exists
-        if file_key not in self.validation_results:
-            self.validation_results[file_key] = {}
+        # Copy the file entry and reassign it below so the hot store marks it dirty
+        entry = dict(self.validation_results.get(file_key) or {})
 
         # Serialize CheckResult objects to dicts
         from bengal.health.report import CheckResult
@@ -118,12 +117,13 @@ class ValidationCacheMixin:
                 )
 
         if cache_context is None:
-            self.validation_results[file_key][validator_name] = serialized_results
+            entry[validator_name] = serialized_results
         else:
-            self.validation_results[file_key][validator_name] = {
+            entry[validator_name] = {
                 "context": dict(cache_context),
                 "results": serialized_results,
             }
+        self.validation_results[file_key] = entry
 
     def invalidate_validation_results(self, file_path: Path | None = None) -> None:
         """
@@ -80,6 +80,8 @@ class ContentHashRegistry:
         version: Format version for compatibility checking
         source_hashes: Source file → content hash mapping
         output_hashes: Output file → content hash mapping
+        output_stamps: Output file → ``"size:mtime_ns"`` at the time its hash
+            was recorded (skip-unchanged writes, see bengal.cache.output_gate)
         output_types: Output file → OutputType name mapping
         generated_dependencies: Generated page → list of source paths
 
@@ -99,6 +101,9 @@ class ContentHashRegistry:
     # Output file → content hash (for all outputs)
     output_hashes: dict[str, str] = field(default_factory=dict)
 
+    # Output file → "size:mtime_ns" the file had when its hash was recorded
+    output_stamps: dict[str, str] = field(default_factory=dict)
+
     # Output file → OutputType name (string for serialization)
     output_types: dict[str, str] = field(default_factory=dict)
 
@@ -126,9 +131,10 @@ class ContentHashRegistry:
 
     def update_output(
         self,
-        output_path: Path,
+        output_path: Path | str,
         content_hash: str,
         output_type: OutputType | str,
+        stamp: str | None = None,
     ) -> None:
         """
         Update hash for an output file.
@@ -137,6 +143,8 @@ class ContentHashRegistry:
             output_path: Path to output file
             content_hash: Hash of rendered content
             output_type: OutputType enum or name string
+            stamp: ``"size:mtime_ns"`` of the file holding that content; a
+                previous stamp is dropped when None
 
         """
         key = str(output_path)
@@ -145,6 +153,10 @@ class ContentHashRegistry:
         with self._lock:
             self.output_hashes[key] = content_hash
             self.output_types[key] = type_name
+            if stamp is None:
+                self.output_stamps.pop(key, None)
+            else:
+                self.output_stamps[key] = stamp
             self._dirty = True
 
     def update_generated_deps(
@@ -169,11 +181,25 @@ class ContentHashRegistry:
         with self._lock:
             return self.source_hashes.get(str(source_path))
 
-    def get_output_hash(self, output_path: Path) -> str | None:
+    def get_output_hash(self, output_path: Path | str) -> str | None:
         """Get content hash for an output file."""
         with self._lock:
             return self.output_hashes.get(str(output_path))
 
+    def get_output_stamp(self, output_path: Path | str) -> str | None:
+        """Get the ``"size:mtime_ns"`` stamp recorded with an output's hash."""
+        with self._lock:
+            return self.output_stamps.get(str(output_path))
+
+    def remove_output(self, output_path: Path | str) -> None:
+        """Forget an output file (e.g. after it was deleted)."""
+        key = str(output_path)
+        with self._lock:
+            if self.output_hashes.pop(key, None) is not None:
+                self.output_types.pop(key, None)
+                self.output_stamps.pop(key, None)
+                self._dirty = True
+
     def get_member_hashes(self, generated_path: Path) -> dict[str, str]:
         """
         Get content hashes for all members of generated page.
@@ -204,7 +230,7 @@ class ContentHashRegistry:
         combined = "|".join(sorted(member_hashes.values()))
         return hash_str(combined, truncate=16)
 
-    def has_changed(self, output_path: Path, current_hash: str) -> bool:
+    def has_changed(self, output_path: Path | str, current_hash: str) -> bool:
         """
         Check if output has changed from registered hash.
 
@@ -241,6 +267,7 @@ class ContentHashRegistry:
                     "version": REGISTRY_FORMAT_VERSION,
                     "source_hashes": self.source_hashes,
                     "output_hashes": self.output_hashes,
+                    "output_stamps": self.output_stamps,
                     "output_types": self.output_types,
                     "generated_dependencies": self.generated_dependencies,
                 }
@@ -310,6 +337,7 @@ class ContentHashRegistry:
                 version=file_version,
                 source_hashes=data.get("source_hashes", {}),
                 output_hashes=data.get("output_hashes", {}),
+                output_stamps=data.get("output_stamps", {}),
                 output_types=data.get("output_types", {}),
                 generated_dependencies=data.get("generated_dependencies", {}),
             )
@@ -398,6 +426,7 @@ class ContentHashRegistry:
         with self._lock:
             self.source_hashes.clear()
             self.output_hashes.clear()
+            self.output_stamps.clear()
             self.output_types.clear()
             self.generated_dependencies.clear()
             self._dirty = True
@@ -4,6 +4,15 @@ Directive content caching for performance optimization.
 Caches parsed directive content by content hash to avoid expensive
 re-parsing of identical directive blocks.
 
+Persistent tier (opt-in: ``build.directive_cache_persistent``): rendered
+directive HTML is also written to a content-addressed on-disk store, so cold
+builds and dev-server restarts reuse it. The store is the machine-level
+shared cache when ``build.shared_cache`` is on, else ``.bengal/directives/``;
+both shard entries by key prefix, evict least recently used entries past a
+size limit, and are read without locks (entries are immutable, written by
+atomic rename). Keys include a context fingerprint (Bengal version, config
+hash, directive template overrides) so edits to any of those miss cleanly.
+
 Thread Safety (Free-Threading / PEP 703):
     DirectiveCache uses LRUCache internally which is already thread-safe.
     configure_cache() uses a lock to protect the global instance replacement.
@@ -12,11 +21,20 @@ Thread Safety (Free-Threading / PEP 703):
 from __future__ import annotations
 
 import threading
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from bengal.utils.primitives.hashing import hash_str
+from bengal.cache.shared_artifacts import artifact_key
 from bengal.utils.primitives.lru_cache import LRUCache
 
+if TYPE_CHECKING:
+    from bengal.cache.shared_artifacts import SharedArtifactCache
+
+# Namespace for rendered directive HTML in the on-disk store
+PERSISTENT_NAMESPACE = "directive-html"
+
+# Size limit for the per-site store (.bengal/directives/)
+SITE_STORE_MAX_BYTES = 256 * 1024 * 1024
+
 
 class DirectiveCache:
     """
@@ -31,17 +49,30 @@ class DirectiveCache:
 
     """
 
-    def __init__(self, max_size: int = 1000):
+    def __init__(
+        self,
+        max_size: int = 1000,
+        persistent: SharedArtifactCache | None = None,
+        context: str = "",
+    ):
         """
         Initialize directive cache.
 
         Args:
             max_size: Maximum number of cached items (default 1000)
+            persistent: Optional on-disk store backing string entries
+            context: Fingerprint of build inputs folded into every key
         """
         self._cache: LRUCache[str, Any] = LRUCache(
             maxsize=max_size,
             name="directive",
         )
+        self.persistent = persistent
+        self.context = context
+
+    def _digest(self, directive_type: str, content: str) -> str:
+        """Full SHA-256 over directive type, context fingerprint and content."""
+        return artifact_key(directive_type, self.context, content)
 
     def _make_key(self, directive_type: str, content: str) -> str:
         """
@@ -56,13 +87,14 @@ class DirectiveCache:
         Returns:
             Cache key string
         """
-        combined = f"{directive_type}:{content}"
-        return f"{directive_type}:{hash_str(combined, truncate=16)}"
+        return f"{directive_type}:{self._digest(directive_type, content)[:16]}"
 
     def get(self, directive_type: str, content: str) -> Any | None:
         """
         Get cached parsed content.
 
+        Falls back to the persistent tier on a memory miss and promotes hits.
+
         Args:
             directive_type: Type of directive
             content: Directive content
@@ -70,18 +102,33 @@ class DirectiveCache:
         Returns:
             Cached parsed result or None if not found
         """
-        return self._cache.get(self._make_key(directive_type, content))
+        digest = self._digest(directive_type, content)
+        key = f"{directive_type}:{digest[:16]}"
+        value = self._cache.get(key)
+        persistent = self.persistent
+        if value is None and persistent is not None and self._cache.enabled:
+            data = persistent.get(PERSISTENT_NAMESPACE, digest)
+            if data is not None:
+                value = data.decode("utf-8", "surrogatepass")
+                self._cache.set(key, value)
+        return value
 
     def put(self, directive_type: str, content: str, parsed: Any) -> None:
         """
         Cache parsed content.
 
+        String results are also written to the persistent tier.
+
         Args:
             directive_type: Type of directive
             content: Directive content
             parsed: Parsed result to cache
         """
-        self._cache.set(self._make_key(directive_type, content), parsed)
+        digest = self._digest(directive_type, content)
+        self._cache.set(f"{directive_type}:{digest[:16]}", parsed)
+        persistent = self.persistent
+        if persistent is not None and self._cache.enabled and isinstance(parsed, str):
+            persistent.put(PERSISTENT_NAMESPACE, digest, parsed.encode("utf-8", "surrogatepass"))
 
     def clear(self) -> None:
         """Clear the cache."""
@@ -107,8 +154,11 @@ class DirectiveCache:
             - size: Current cache size
             - max_size: Maximum cache size
             - enabled: Whether caching is enabled
+            - persistent: Whether an on-disk tier backs the cache
         """
-        return self._cache.stats()
+        stats = self._cache.stats()
+        stats["persistent"] = self.persistent is not None
+        return stats
 
     def reset_stats(self) -> None:
         """Reset hit/miss statistics without clearing cache."""
@@ -143,7 +193,11 @@ class DirectiveCacheHolder:
         with self._lock:
             if max_size is not None:
                 was_enabled = self._cache._cache.enabled
-                self._cache = DirectiveCache(max_size=max_size)
+                self._cache = DirectiveCache(
+                    max_size=max_size,
+                    persistent=self._cache.persistent,
+                    context=self._cache.context,
+                )
                 if not was_enabled:
                     self._cache.disable()
             if enabled is not None:
@@ -152,6 +206,12 @@ class DirectiveCacheHolder:
                 else:
                     self._cache.disable()
 
+    def configure_persistent(self, persistent: SharedArtifactCache | None, context: str) -> None:
+        """Attach (or detach, with None) the on-disk tier and set the key context."""
+        with self._lock:
+            self._cache.persistent = persistent
+            self._cache.context = context
+
     def reset_for_testing(self) -> None:
         """Reset cache for tests (clears entries, use between isolated tests)."""
         with self._lock:
@@ -219,7 +279,8 @@ def configure_for_site(site: Any) -> None:
     directive blocks appear across multiple versions. Cache provides
     3-5x speedup for repeated directive content.
 
-    Single-version sites skip caching (no benefit, adds overhead).
+    Single-version sites skip caching (no benefit, adds overhead) unless the
+    persistent tier is enabled, which makes the cache worthwhile across builds.
 
     Args:
         site: Site instance with version_config and config attributes
@@ -229,14 +290,21 @@ def configure_for_site(site: Any) -> None:
 
     logger = get_logger(__name__)
 
+    build_config = site.config.get("build", {}) or {}
+    if not isinstance(build_config, dict):
+        build_config = {}
+    cache_override = build_config.get("directive_cache")
+    persistent = (
+        bool(build_config.get("directive_cache_persistent", False)) and cache_override is not False
+    )
+    _configure_persistent_tier(site, persistent)
+
     version_config = getattr(site, "version_config", None)
     if not version_config:
+        if persistent:
+            configure_cache(enabled=True)
         return
 
-    # Check for explicit config override
-    build_config = site.config.get("build", {}) or {}
-    cache_override = build_config.get("directive_cache")
-
     if cache_override is not None:
         # Explicit config: respect user preference
         configure_cache(enabled=bool(cache_override))
@@ -255,6 +323,71 @@ def configure_for_site(site: Any) -> None:
             versions=len(version_config.versions),
             reason="multiple_versions_detected",
         )
+    elif persistent:
+        configure_cache(enabled=True)
     else:
         # Single version or no versioning: disable (avoid overhead)
         configure_cache(enabled=False)
+
+
+_site_stores: dict[str, SharedArtifactCache] = {}
+_site_stores_lock = threading.Lock()
+
+
+def _configure_persistent_tier(site: Any, enabled: bool) -> None:
+    """Attach the on-disk tier for *site* (shared cache if on, else per-site)."""
+    if not enabled:
+        _holder.configure_persistent(None, "")
+        return
+
+    from bengal.cache.shared_artifacts import SharedArtifactCache, configure_shared_cache
+
+    store = configure_shared_cache(site.config)
+    if store is None:
+        root = site.config_service.paths.directive_cache_dir
+        with _site_stores_lock:
+            store = _site_stores.get(str(root))
+            if store is None:
+                store = _site_stores[str(root)] = SharedArtifactCache(root, SITE_STORE_MAX_BYTES)
+    _holder.configure_persistent(store, _context_fingerprint(site))
+
+
+def _context_fingerprint(site: Any) -> str:
+    """
+    Fingerprint of build inputs every directive render may depend on.
+
+    Bengal version, the site config hash (baseurl, theme, icon settings,
+    ...) and the stat signature of directive template overrides
+    (``directives/*.html`` across the template search path).
+    """
+    from bengal import __version__
+
+    parts: list[str] = [__version__, _config_hash(site)]
+    try:
+        from bengal.rendering.template_engine.environment import resolve_template_dirs
+
+        template_dirs = resolve_template_dirs(site)
+    except Exception:
+        template_dirs = []
+    for template_dir in template_dirs:
+        directives_dir = template_dir / "directives"
+        try:
+            templates = sorted(directives_dir.glob("*.html"))
+        except OSError:
+            continue
+        for template in templates:
+            try:
+                st = template.stat()
+            except OSError:
+                continue
+            parts.append(f"{template}:{st.st_mtime_ns}:{st.st_size}")
+    return artifact_key(*parts)[:16]
+
+
+def _config_hash(site: Any) -> str:
+    config_hash = getattr(getattr(site, "config_service", None), "config_hash", None)
+    if isinstance(config_hash, str):
+        return config_hash
+    from bengal.config.hash import compute_config_hash
+
+    return compute_config_hash(site.config)
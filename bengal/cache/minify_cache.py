@@ -0,0 +1,235 @@
+"""
+Persistent content-addressed cache for CSS/JS minification results.
+
+``minify_css`` proves every transform by re-parsing its own output, and
+``jsmin`` walks the whole script; both are pure functions of their input.
+Theme stylesheets and scripts are byte-identical from build to build and
+across sites using the same theme, so the results are stored on disk keyed
+by a hash of:
+
+- the asset kind (``css`` / ``js``) and minifier options (level, flags),
+- the minifier version (a hash of the ``bengal.css`` sources for CSS, the
+  installed ``jsmin`` version for JS),
+- the exact input text (for CSS entry points this is the bundled
+  ``@import``/``@layer`` output plus the directive base CSS).
+
+A hit returns the proven output without running the guarded pipeline.
+
+Location:
+    The cache lives in a user-level directory shared by every site on the
+    machine: ``$BENGAL_CACHE_DIR/minify`` if set, otherwise the platform
+    cache directory (``$XDG_CACHE_HOME`` or ``~/.cache`` on Linux,
+    ``~/Library/Caches`` on macOS, ``%LOCALAPPDATA%`` on Windows) under
+    ``bengal/minify``. Set ``BENGAL_NO_MINIFY_CACHE=1`` to disable it.
+
+Entries are written atomically and never modified, so concurrent builds can
+share the directory. Any read or write error degrades to minifying normally.
+
+Size:
+    Bounded by the LRU pruning of the shared artifact cache (least recently
+    used by mtime, hits refresh it at most hourly) to
+    ``$BENGAL_MINIFY_CACHE_MAX_MB`` (default 256 MB).
+
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from bengal.cache.shared_artifacts import maybe_prune_lru, prune_lru, touch_entry
+from bengal.utils.io.atomic_write import atomic_write_text
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger(__name__)
+
+# Bump to invalidate every entry (e.g. if the key layout changes)
+MINIFY_CACHE_VERSION = 1
+
+_DISABLE_ENV = "BENGAL_NO_MINIFY_CACHE"
+_MAX_MB_ENV = "BENGAL_MINIFY_CACHE_MAX_MB"
+
+DEFAULT_MAX_MB = 256
+
+# Evict once this fraction of the limit has been written (matches the 80%
+# pruning target, so a full cache is pruned about once per refill)
+_PRUNE_WRITE_FRACTION = 0.2
+
+
+def user_cache_dir() -> Path:
+    """Platform user cache directory for Bengal (``BENGAL_CACHE_DIR`` overrides)."""
+    override = os.environ.get("BENGAL_CACHE_DIR")
+    if override:
+        return Path(override).expanduser()
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        xdg_cache = os.environ.get("XDG_CACHE_HOME")
+        base = Path(xdg_cache) if xdg_cache else Path.home() / ".cache"
+    return base / "bengal"
+
+
+@functools.cache
+def _css_engine_version() -> str:
+    """Hash of the bengal.css sources, so engine changes invalidate cached CSS."""
+    import bengal.css
+
+    hasher = hashlib.sha256()
+    for source in sorted(Path(bengal.css.__file__).parent.glob("*.py")):
+        hasher.update(source.name.encode())
+        hasher.update(source.read_bytes())
+    return hasher.hexdigest()[:16]
+
+
+@functools.cache
+def _jsmin_version() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("jsmin")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _engine_version(kind: str) -> str:
+    return _css_engine_version() if kind == "css" else _jsmin_version()
+
+
+class MinifyCache:
+    """
+    Content-addressed store of minified CSS/JS text.
+
+    Entries live at ``<root>/<key[:2]>/<key>.<kind>`` and are immutable.
+    Least recently used entries are evicted once ``root`` exceeds
+    ``max_bytes``.
+
+    Thread-safe: entries are written atomically; hit/miss counters are
+    updated under a lock.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._written_since_prune = 0
+        self._lock = threading.Lock()
+
+    def key(self, kind: str, content: str, options: str = "") -> str:
+        """Cache key for minifying ``content`` as ``kind`` with ``options``."""
+        hasher = hashlib.sha256()
+        header = f"{MINIFY_CACHE_VERSION}\0{kind}\0{_engine_version(kind)}\0{options}\0"
+        hasher.update(header.encode())
+        hasher.update(content.encode("utf-8", "surrogatepass"))
+        return hasher.hexdigest()
+
+    def _entry_path(self, key: str, kind: str) -> Path:
+        return self.root / key[:2] / f"{key}.{kind}"
+
+    def get_or_compute(
+        self,
+        kind: str,
+        content: str,
+        compute: Callable[[str], str],
+        *,
+        options: str = "",
+    ) -> str:
+        """
+        Return the cached result for ``content``, computing and storing it on a miss.
+
+        Args:
+            kind: ``"css"`` or ``"js"``
+            content: Text to minify
+            compute: Minifier to run on a miss
+            options: Minifier options that affect the output (e.g. ``"level=safe"``)
+
+        Returns:
+            Minified text, identical to ``compute(content)``
+        """
+        key = self.key(kind, content, options)
+        path = self._entry_path(key, kind)
+        try:
+            cached = path.read_text(encoding="utf-8")
+        except OSError, UnicodeDecodeError:
+            cached = None
+        if cached is not None:
+            touch_entry(path)
+            with self._lock:
+                self.hits += 1
+            return cached
+
+        result = compute(content)
+        with self._lock:
+            self.misses += 1
+        try:
+            atomic_write_text(path, result)
+        except (OSError, UnicodeError) as e:
+            logger.debug("minify_cache_write_failed", path=str(path), error=str(e))
+            return result
+        with self._lock:
+            self._written_since_prune += len(result)
+            due = self._written_since_prune > self.max_bytes * _PRUNE_WRITE_FRACTION
+            if due:
+                self._written_since_prune = 0
+        if due:
+            self.prune()
+        return result
+
+    def prune(self) -> int:
+        """Evict least recently used entries until the cache is within ``max_bytes``."""
+        return prune_lru(self.root, self.max_bytes)
+
+
+def _max_bytes() -> int:
+    try:
+        max_mb = float(os.environ.get(_MAX_MB_ENV, DEFAULT_MAX_MB))
+    except ValueError:
+        max_mb = DEFAULT_MAX_MB
+    return int(max(max_mb, 1) * 1024 * 1024)
+
+
+_caches: dict[tuple[Path, int], MinifyCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_minify_cache() -> MinifyCache | None:
+    """The shared minification cache, or None when disabled via ``BENGAL_NO_MINIFY_CACHE``."""
+    if os.environ.get(_DISABLE_ENV, "").lower() in ("1", "true", "yes"):
+        return None
+    root = user_cache_dir() / "minify"
+    max_bytes = _max_bytes()
+    with _caches_lock:
+        cache = _caches.get((root, max_bytes))
+        created = cache is None
+        if cache is None:
+            cache = _caches[(root, max_bytes)] = MinifyCache(root, max_bytes)
+    if created:
+        # Builds that write little never reach the write-volume trigger
+        maybe_prune_lru(root, max_bytes)
+    return cache
+
+
+def cached_minify(
+    kind: str, content: str, compute: Callable[[str], str], *, options: str = ""
+) -> str:
+    """
+    Minify ``content`` through the shared cache (or directly when it is disabled).
+
+    Example:
+        >>> from bengal.css import minify_css
+        >>> cached_minify("css", css_text, minify_css, options="level=safe")
+    """
+    cache = get_minify_cache()
+    if cache is None or not content:
+        return compute(content)
+    return cache.get_or_compute(kind, content, compute, options=options)
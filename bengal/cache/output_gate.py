@@ -0,0 +1,271 @@
+"""
+Skip-unchanged output writes, backed by the ContentHashRegistry.
+
+Most outputs of a rebuild are byte-identical to what is already in
+``public/``. Rewriting them bumps every mtime, which defeats rsync/CDN delta
+uploads, makes the dev server diff more files, and burns SSD writes on CI.
+
+With ``build.skip_unchanged_outputs`` (opt-in) writers route their
+bytes through :class:`OutputWriteGate`. The gate keeps, per output path, the
+content hash (``ContentHashRegistry.output_hashes``) and the size and mtime
+the file had right after it was written (``output_stamps``), in
+``.bengal/content_hashes.json``. A write whose hash matches, for a file that
+still carries that stamp, is dropped; the file keeps its mtime. A file
+touched by anything else since (manual edit, HTML rewrite, deleted output
+dir) no longer matches its stamp and is rewritten.
+
+Gated writers: rendered pages, per-page and site-wide output formats
+(including ``index.json``), sitemaps, feeds, and assets written by
+``Asset.copy_to_output`` (minified CSS/JS, optimized images, plain copies).
+Writers tell the output collector which files they left alone via
+``record_unchanged``, so the changed-file list stays exact.
+
+Usage:
+    gate = get_output_gate(site)
+    if gate is not None:
+        written = gate.write_text(path, html)
+    else:
+        atomic_write_text(path, html)
+        written = True
+
+Related:
+- bengal/rendering/pipeline/write_behind.py: parallel page writes
+- bengal/orchestration/build/finalization.py: saves the registry after postprocess
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+from bengal.cache.content_hash_registry import ContentHashRegistry
+from bengal.utils.io.atomic_write import atomic_write_bytes
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from bengal.core.output import OutputCollector
+    from bengal.core.output.types import OutputType
+
+
+def content_hash(data: bytes | memoryview) -> str:
+    """Hash recorded for output bytes (hex SHA-256)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_stamp(st: os.stat_result) -> str:
+    """``"size:mtime_ns"`` stamp recorded next to an output's hash."""
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+class OutputWriteGate:
+    """
+    Drops writes of bytes an output file already holds.
+
+    Thread-safe: the registry has its own lock; counters are updated under
+    the gate's lock.
+    """
+
+    def __init__(self, registry: ContentHashRegistry, registry_path: Path | None = None) -> None:
+        self.registry = registry
+        self.registry_path = registry_path
+        self.written = 0
+        self.unchanged = 0
+        self.bytes_saved = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, registry_path: Path) -> OutputWriteGate:
+        return cls(ContentHashRegistry.load(registry_path), registry_path)
+
+    def current_hash(self, path: Path) -> str | None:
+        """Recorded hash for ``path`` if the file still carries its recorded stamp."""
+        stamp = self.registry.get_output_stamp(path)
+        if stamp is None:
+            return None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if stamp != file_stamp(st):
+            return None
+        return self.registry.get_output_hash(path)
+
+    def is_unchanged(self, path: Path, digest: str, size: int) -> bool:
+        """Whether ``path`` already holds the ``size`` bytes hashing to ``digest``.
+
+        Counts the skip when it is.
+        """
+        if self.current_hash(path) != digest:
+            return False
+        self._count_unchanged(size)
+        return True
+
+    def _count_unchanged(self, size: int) -> None:
+        with self._lock:
+            self.unchanged += 1
+            self.bytes_saved += size
+
+    def record(self, path: Path, digest: str, *, counted: bool = True) -> None:
+        """Remember ``path`` as just written with content hashing to ``digest``."""
+        from bengal.orchestration.build.output_types import classify_output
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            self.registry.remove_output(path)
+            return
+        self.registry.update_output(path, digest, classify_output(path), stamp=file_stamp(st))
+        if counted:
+            with self._lock:
+                self.written += 1
+
+    @staticmethod
+    def _matches_on_disk(path: Path, data: bytes) -> bool:
+        try:
+            if os.stat(path).st_size != len(data):
+                return False
+            with open(path, "rb") as f:
+                return f.read() == data
+        except OSError:
+            return False
+
+    def write_bytes(self, path: Path, data: bytes) -> bool:
+        """
+        Atomically write ``data`` unless ``path`` already holds it.
+
+        A file without a recorded stamp (first build with the registry, or a
+        registry that was cleared) is compared byte-for-byte when its size
+        matches, so existing identical outputs are adopted rather than rewritten.
+
+        Returns:
+            True if the file was written, False if it was left untouched
+        """
+        digest = content_hash(data)
+        if self.is_unchanged(path, digest, len(data)):
+            return False
+        if self._matches_on_disk(path, data):
+            self.record(path, digest, counted=False)
+            self._count_unchanged(len(data))
+            return False
+        atomic_write_bytes(path, data)
+        self.record(path, digest)
+        return True
+
+    def write_text(self, path: Path, content: str) -> bool:
+        """UTF-8 variant of :meth:`write_bytes`."""
+        return self.write_bytes(path, content.encode("utf-8"))
+
+    def save(self) -> None:
+        """Persist the registry (no-op when nothing changed)."""
+        if self.registry_path is not None:
+            self.registry.save(self.registry_path)
+
+
+class _UnchangedOutput(Exception):
+    """Streamed content matches the existing file; abandon the temp file."""
+
+
+def write_streamed(
+    path: Path,
+    chunks: Iterable[bytes],
+    gate: OutputWriteGate | None = None,
+    *,
+    previous: str | None = None,
+) -> tuple[bool, str]:
+    """
+    Stream ``chunks`` into ``path`` atomically, hashing as they are written.
+
+    For outputs too large to hold in memory. The previous hash comes from the
+    ``gate`` stamp, else ``previous`` (e.g. a sidecar), else by hashing the
+    existing file in blocks. When the streamed hash matches it, the temp file
+    is discarded and ``path`` keeps its mtime.
+
+    Returns:
+        ``(written, digest)``; ``written`` is False when the content matched
+    """
+    from bengal.utils.io.atomic_write import AtomicFile
+
+    expected = gate.current_hash(path) if gate is not None else None
+    if expected is None:
+        expected = previous
+    if expected is None and path.exists():
+        from bengal.utils.primitives.hashing import hash_file
+
+        try:
+            expected = hash_file(path)
+        except OSError:
+            expected = None
+
+    hasher = hashlib.sha256()
+    size = 0
+    try:
+        with AtomicFile(path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                hasher.update(chunk)
+                size += len(chunk)
+            if hasher.hexdigest() == expected:
+                raise _UnchangedOutput
+    except _UnchangedOutput:
+        if gate is not None:
+            gate.record(path, hasher.hexdigest(), counted=False)
+            gate._count_unchanged(size)
+        return False, hasher.hexdigest()
+    if gate is not None:
+        gate.record(path, hasher.hexdigest())
+    return True, hasher.hexdigest()
+
+
+def skip_unchanged_enabled(config: Any) -> bool:
+    """Whether ``build.skip_unchanged_outputs`` is on (default: False)."""
+    build_cfg = config.get("build", {}) if config else {}
+    if not isinstance(build_cfg, dict):
+        return False
+    return bool(build_cfg.get("skip_unchanged_outputs", False))
+
+
+def get_output_gate(site: Any) -> OutputWriteGate | None:
+    """
+    The current build's gate, created on first use.
+
+    Returns None when the mode is off or there is no build in progress (the
+    gate lives on ``site.build_state``, so it never outlives a build).
+    """
+    from bengal.orchestration.build_state import BuildState
+
+    build_state = getattr(site, "build_state", None)
+    if not isinstance(build_state, BuildState):
+        return None
+    gate = build_state.output_gate
+    if gate is not None:
+        return gate
+    if not skip_unchanged_enabled(getattr(site, "config", None)):
+        return None
+    with build_state.get_lock("output_gate"):
+        if build_state.output_gate is None:
+            build_state.output_gate = OutputWriteGate.load(
+                site.config_service.paths.content_hash_registry
+            )
+        return build_state.output_gate
+
+
+def record_write(
+    collector: OutputCollector | None,
+    path: Path,
+    written: bool,
+    output_type: OutputType | None = None,
+    phase: Any = "postprocess",
+) -> None:
+    """Report a gated write to ``collector`` as written or unchanged."""
+    if collector is None:
+        return
+    if written:
+        collector.record(path, output_type, phase=phase)
+        return
+    record_unchanged = getattr(collector, "record_unchanged", None)
+    if record_unchanged is not None:
+        record_unchanged(path, output_type, phase=phase)
@@ -20,8 +20,18 @@ Directory Structure:
 ├── build_history.json   # Build history for delta analysis
 ├── server.pid           # Dev server PID
 ├── asset-manifest.json  # Asset manifest
+├── precompress_hashes.json.zst # Output hashes behind .gz/.br/.zst sidecars
+├── git_lastmod.json     # Path -> last commit date index, keyed by HEAD
+├── directory_manifest.json # Content directory listings for discovery
+├── search_doc_ids.json  # Native search index objectID -> doc id map
+├── selector_inventory.json # Selectors the purged theme CSS was built against
+├── deploy/              # Deploy manifest + delta (bengal build --emit-deploy-manifest)
 ├── indexes/             # Query indexes (section, author, etc.)
 ├── templates/           # Template bytecode cache
+├── highlight/           # Persistent syntax-highlight cache (segment store)
+├── directives/          # Persistent rendered-directive HTML (opt-in)
+├── image-variants/      # Responsive image variant cache + index
+├── social-cards/        # Rendered social cards keyed by content hash
 ├── content_cache/       # Remote content cache
 ├── logs/                # Build/serve logs
 ├── metrics/             # Performance metrics
@@ -155,10 +165,75 @@ class BengalPaths:
         """Template bytecode cache directory (.bengal/templates/)."""
         return self.state_dir / "templates"
 
+    @property
+    def highlight_cache_dir(self) -> Path:
+        """Persistent syntax-highlight cache directory (.bengal/highlight/)."""
+        return self.state_dir / "highlight"
+
+    @property
+    def directive_cache_dir(self) -> Path:
+        """Persistent rendered-directive cache directory (.bengal/directives/)."""
+        return self.state_dir / "directives"
+
+    @property
+    def image_variants_dir(self) -> Path:
+        """Responsive image variant cache directory (.bengal/image-variants/)."""
+        return self.state_dir / "image-variants"
+
+    @property
+    def social_cards_dir(self) -> Path:
+        """Rendered social card cache directory (.bengal/social-cards/)."""
+        return self.state_dir / "social-cards"
+
     # =========================================================================
     # CONTENT
     # =========================================================================
 
+    @property
+    def precompress_registry(self) -> Path:
+        """Output hashes at last sidecar compression (.bengal/precompress_hashes.json or .json.zst)."""
+        return self.state_dir / "precompress_hashes.json"
+
+    @property
+    def git_lastmod_index(self) -> Path:
+        """Incrementally updated git last-modified index (.bengal/git_lastmod.json)."""
+        return self.state_dir / "git_lastmod.json"
+
+    @property
+    def directory_manifest(self) -> Path:
+        """Content directory listings reused by discovery (.bengal/directory_manifest.json)."""
+        return self.state_dir / "directory_manifest.json"
+
+    @property
+    def search_doc_ids(self) -> Path:
+        """Stable native search document ids (.bengal/search_doc_ids.json)."""
+        return self.state_dir / "search_doc_ids.json"
+
+    @property
+    def selector_inventory(self) -> Path:
+        """Inventory the purged CSS was built against (.bengal/selector_inventory.json)."""
+        return self.state_dir / "selector_inventory.json"
+
+    @property
+    def deploy_dir(self) -> Path:
+        """Deploy manifest directory (.bengal/deploy/)."""
+        return self.state_dir / "deploy"
+
+    @property
+    def deploy_manifest(self) -> Path:
+        """Output files at the last manifest emit (.bengal/deploy/manifest.json)."""
+        return self.deploy_dir / "manifest.json"
+
+    @property
+    def deploy_deployed(self) -> Path:
+        """Output files at the last successful deploy sync (.bengal/deploy/deployed.json)."""
+        return self.deploy_dir / "deployed.json"
+
+    @property
+    def deploy_delta(self) -> Path:
+        """Changes against the last deployed manifest (.bengal/deploy/delta.json)."""
+        return self.deploy_dir / "delta.json"
+
     @property
     def content_dir(self) -> Path:
         """Remote content cache directory (.bengal/content_cache/)."""
@@ -47,7 +47,7 @@ from typing import TYPE_CHECKING, Any
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
     from bengal.cache.build_cache import BuildCache
     from bengal.cache.query_index import QueryIndex
@@ -223,6 +223,32 @@ class QueryIndexRegistry:
 
         return affected_by_index
 
+    def remove_pages(self, page_paths: Iterable[str]) -> dict[str, set[str]]:
+        """
+        Remove deleted pages from every index.
+
+        Args:
+            page_paths: Source paths of pages that no longer exist
+
+        Returns:
+            Dict mapping index_name → affected_keys
+        """
+        self._ensure_initialized()
+
+        paths = list(page_paths)
+        affected_by_index: dict[str, set[str]] = {}
+
+        for name, index in self.indexes.items():
+            affected_keys: set[str] = set()
+            for page_path in paths:
+                affected_keys.update(index.remove_page(page_path))
+
+            affected_by_index[name] = affected_keys
+            if affected_keys:
+                index.save_to_disk()
+
+        return affected_by_index
+
     def get(self, index_name: str) -> QueryIndex | None:
         """
         Get index by name.
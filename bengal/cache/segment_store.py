@@ -0,0 +1,645 @@
+"""
+Log-structured persistence for hot BuildCache maps.
+
+The parsed-content, rendered-output, validation and synthetic-page maps are the
+largest parts of the build cache, yet an incremental build typically touches a
+handful of their entries. Rewriting them as whole JSON documents made cache
+save time scale with the site rather than with the change set.
+
+SegmentStore keeps each map as a directory of append-only segment files plus a
+small on-disk key index::
+
+    stores/parsed_content/
+    ├── index.json       # key → [segment, offset, length], live bytes per segment
+    ├── seg-000001.log   # zstd-framed JSON values, newline-separated
+    └── seg-000002.log
+
+Saves append only dirty entries to the active segment and rewrite the index.
+Overwritten and deleted records become dead bytes; once dead bytes dominate,
+``compact()`` rewrites the live records into a fresh segment (typically from a
+background thread holding the cache file lock).
+
+Each record is an independent zstd frame, so a single value can be decoded
+without touching its neighbours. ``open()`` memory-maps the segments and
+returns a LazyStore whose values are decompressed on first access: warm-build
+startup cost and resident memory follow the pages a build actually reads, not
+the size of the corpus.
+
+TrackedStore is the in-memory counterpart: a ``dict`` that records which keys
+were set or removed since the last save, and which on-disk generation it was
+loaded from. A store that is not bound to the current generation (fresh cache,
+``clear()``, or a plain dict assigned by callers) is written in full.
+
+Related:
+- bengal/cache/build_cache/core.py: BuildCache save/load integration
+- bengal/cache/page_artifact_store.py: Sharded dirty-key persistence for page artifacts
+
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import threading
+import uuid
+from collections.abc import ItemsView, ValuesView
+from compression import zstd
+from typing import TYPE_CHECKING, Any
+
+from bengal.utils.io import json_compat
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+# On-disk format version for index.json. Unknown versions are treated as missing.
+# Version 1 stored plain JSON records; version 2 stores one zstd frame per record.
+SEGMENT_STORE_VERSION = 2
+
+# Record codec per index version. Appends to an older codec force a rewrite.
+_CODECS = {1: "json", 2: "zstd"}
+_CODEC = _CODECS[SEGMENT_STORE_VERSION]
+
+# Per-record compression level; records are small, so favour speed.
+RECORD_COMPRESSION_LEVEL = 3
+
+_INDEX_NAME = "index.json"
+
+# Roll over to a new segment once the active one grows past this size.
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+
+# Compact once dead bytes exceed both the floor and the live/dead ratio.
+COMPACT_MIN_DEAD_BYTES = 8 * 1024 * 1024
+COMPACT_DEAD_RATIO = 1.0
+
+
+class TrackedStore(dict[str, Any]):
+    """
+    Dict that records keys set or removed since the last save.
+
+    Only top-level writes are tracked. Callers that mutate a nested value in
+    place must reassign the key (``store[key] = value``) to mark it dirty.
+
+    Attributes:
+        generation: On-disk store generation these contents were loaded from
+            or last saved to; ``None`` forces a full rewrite on save.
+    """
+
+    __slots__ = ("_deleted", "_dirty", "generation")
+
+    def __init__(self, *args: Any, generation: str | None = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._dirty: set[str] = set()
+        self._deleted: set[str] = set()
+        self.generation = generation
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._dirty.add(key)
+        self._deleted.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._dirty.discard(key)
+        self._deleted.add(key)
+
+    def __ior__(self, other: Any) -> TrackedStore:
+        self.update(other)
+        return self
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            self._dirty.discard(key)
+            self._deleted.add(key)
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        key, value = super().popitem()
+        self._dirty.discard(key)
+        self._deleted.add(key)
+        return key, value
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self._dirty.clear()
+        self._deleted.clear()
+        self.generation = None
+
+    def pending_changes(self) -> tuple[set[str], set[str]]:
+        """Return copies of the (dirty, deleted) key sets since the last save."""
+        return set(self._dirty), set(self._deleted)
+
+    def mark_clean(self, generation: str) -> None:
+        """Record a successful save to the given on-disk generation."""
+        self._dirty.clear()
+        self._deleted.clear()
+        self.generation = generation
+
+
+class _Unloaded:
+    """Placeholder for a LazyStore value that has not been decoded yet."""
+
+    __slots__ = ("location",)
+
+    def __init__(self, location: tuple[int, int, int]) -> None:
+        self.location = location
+
+    def __repr__(self) -> str:
+        return "<unloaded>"
+
+
+class LazyStore(TrackedStore):
+    """
+    TrackedStore whose values are decoded from mapped segments on first access.
+
+    Every key is present from the start (so ``in``, ``len`` and iteration never
+    touch disk); values are decompressed by ``store[key]`` / ``store.get(key)``
+    and then kept in the dict. ``items()`` and ``values()`` decode lazily as
+    they are iterated.
+    """
+
+    __slots__ = ("_reader",)
+
+    def __init__(
+        self,
+        reader: SegmentReader,
+        entries: Mapping[str, Iterable[int]],
+        *,
+        generation: str | None = None,
+    ) -> None:
+        super().__init__(generation=generation)
+        self._reader = reader
+        # dict.update bypasses TrackedStore.__setitem__: placeholders are not dirty
+        dict.update(self, {key: _Unloaded(tuple(loc)) for key, loc in entries.items()})
+
+    def __getitem__(self, key: str) -> Any:
+        value = super().__getitem__(key)
+        if isinstance(value, _Unloaded):
+            value = self._reader.read(*value.location)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        # Overriding __iter__ makes dict(store) and {**store} go through
+        # keys()/__getitem__ instead of copying placeholders.
+        return super().__iter__()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, dict):
+            return NotImplemented
+        if len(self) != len(other) or self.keys() != other.keys():
+            return False
+        return all(self[key] == other[key] for key in self)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self:
+            return self[key]
+        return default
+
+    def items(self) -> ItemsView[str, Any]:  # type: ignore[override]
+        return ItemsView(self)
+
+    def values(self) -> ValuesView[Any]:  # type: ignore[override]
+        return ValuesView(self)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self:
+            value = self[key]
+            super().pop(key)
+            return value
+        return super().pop(key, *default)
+
+    def popitem(self) -> tuple[str, Any]:
+        key = next(reversed(self))
+        return key, self.pop(key)
+
+    def copy(self) -> dict[str, Any]:  # type: ignore[override]
+        return {key: self[key] for key in self}
+
+    def unloaded_count(self) -> int:
+        """Return how many values are still only on disk."""
+        return sum(1 for value in dict.values(self) if isinstance(value, _Unloaded))
+
+    def materialize(self) -> None:
+        """Decode every remaining value and release the segment mappings."""
+        for key in self:
+            self[key]
+        self._reader.close()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle (e.g. for process workers) as a plain dict of decoded values
+        return (dict, (self.copy(),))
+
+
+class SegmentReader:
+    """
+    Read-only memory maps over a store's segment files.
+
+    Segments are mapped once when the reader is created, so records stay
+    readable even if a later compaction replaces the files on disk (POSIX
+    keeps unlinked mappings alive; on Windows the mapped file cannot be
+    deleted and is left for the next compaction). Safe to share between
+    threads: mapped reads are slice copies and decoding is stateless.
+    """
+
+    def __init__(self, root: Path, segments: Iterable[int], codec: str) -> None:
+        self.root = root
+        self.codec = codec
+        self._maps: dict[int, mmap.mmap | bytes] = {}
+        for segment in segments:
+            segment_path = root / f"seg-{segment:06d}.log"
+            try:
+                with open(segment_path, "rb") as f:
+                    if segment_path.stat().st_size == 0:
+                        self._maps[segment] = b""
+                    else:
+                        self._maps[segment] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    "segment_store_segment_map_failed",
+                    path=str(segment_path),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    action="dropping_segment_records",
+                )
+
+    def read(self, segment: int, offset: int, length: int) -> Any:
+        """
+        Decode one record, returning None if its segment is unavailable.
+
+        A None value reads as a cache miss for every hot store consumer.
+        """
+        mapped = self._maps.get(segment)
+        if mapped is None:
+            return None
+        try:
+            return _decode(mapped[offset : offset + length], self.codec)
+        except (ValueError, zstd.ZstdError) as e:
+            logger.warning(
+                "segment_store_record_decode_failed",
+                path=str(self.root),
+                segment=segment,
+                offset=offset,
+                error=str(e),
+                action="treating_as_cache_miss",
+            )
+            return None
+
+    def close(self) -> None:
+        """Release all mappings."""
+        for mapped in self._maps.values():
+            if isinstance(mapped, mmap.mmap):
+                mapped.close()
+        self._maps.clear()
+
+
+class SegmentStore:
+    """
+    Append-only segment files with a key index for one hot cache map.
+
+    Not thread-safe on its own: callers serialize access with the build cache
+    ``file_lock`` (or run single-threaded with locking disabled).
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / _INDEX_NAME
+
+    def exists(self) -> bool:
+        """Return True when an index is present on disk."""
+        return self.index_path.exists()
+
+    def open(self, keys: Iterable[str] | None = None) -> LazyStore | None:
+        """
+        Map the store for on-demand reads, optionally limited to selected keys.
+
+        Only the key index is parsed; values are decompressed when first
+        accessed. Segments that hold none of the selected keys are not mapped.
+
+        Returns:
+            LazyStore bound to the on-disk generation, or None when the store
+            is missing or unreadable.
+        """
+        index = self._load_index()
+        if index is None:
+            return None
+
+        entries: dict[str, list[int]] = index["keys"]
+        if keys is not None:
+            entries = {key: entries[key] for key in keys if key in entries}
+        reader = SegmentReader(
+            self.root,
+            sorted({location[0] for location in entries.values()}),
+            index["codec"],
+        )
+        return LazyStore(reader, entries, generation=index["generation"])
+
+    def load(self, keys: Iterable[str] | None = None) -> tuple[dict[str, Any], str | None]:
+        """
+        Read and decode live records, optionally limited to selected keys.
+
+        Returns:
+            Tuple of (records, generation). Generation is None when the store
+            is missing or unreadable.
+        """
+        store = self.open(keys)
+        if store is None:
+            return {}, None
+        records = store.copy()
+        store._reader.close()
+        return records, store.generation
+
+    def save(
+        self,
+        records: Mapping[str, Any],
+        *,
+        dirty_keys: set[str] | None = None,
+        deleted_keys: set[str] | None = None,
+        generation: str | None = None,
+    ) -> str:
+        """
+        Persist records, appending only dirty entries when possible.
+
+        A full rewrite happens when no dirty-key information is given, when
+        ``generation`` does not match the on-disk store, or when no store
+        exists yet.
+
+        Returns:
+            The generation the on-disk store now holds.
+        """
+        index = self._load_index()
+        if (
+            index is None
+            or dirty_keys is None
+            or generation is None
+            or generation != index["generation"]
+            or index["codec"] != _CODEC
+        ):
+            return self._rewrite(records, generation=uuid.uuid4().hex)
+
+        entries: dict[str, list[Any]] = index["keys"]
+        live: dict[int, int] = index["segments"]
+
+        def _drop(key: str) -> None:
+            old = entries.pop(key, None)
+            if old is not None:
+                live[old[0]] = live.get(old[0], 0) - old[2]
+
+        for key in deleted_keys or ():
+            _drop(key)
+
+        appended = 0
+        active = index["active"]
+        if dirty_keys:
+            active_path = self._segment_path(active)
+            if active_path.exists() and active_path.stat().st_size >= SEGMENT_MAX_BYTES:
+                active = index["next_id"]
+                index["next_id"] = active + 1
+                active_path = self._segment_path(active)
+            self.root.mkdir(parents=True, exist_ok=True)
+            with open(active_path, "ab") as f:
+                offset = f.tell()
+                for key in sorted(dirty_keys):
+                    if key not in records:
+                        _drop(key)
+                        continue
+                    payload = _encode(records[key])
+                    f.write(payload)
+                    f.write(b"\n")
+                    _drop(key)
+                    entries[key] = [active, offset, len(payload)]
+                    live[active] = live.get(active, 0) + len(payload)
+                    offset += len(payload) + 1
+                    appended += 1
+
+        index["version"] = SEGMENT_STORE_VERSION
+        index["active"] = active
+        index["segments"] = {segment: size for segment, size in live.items() if size > 0}
+        index["segments"].setdefault(active, 0)
+        self._save_index(index)
+
+        logger.debug(
+            "segment_store_appended",
+            path=str(self.root),
+            appended=appended,
+            deleted=len(deleted_keys or ()),
+            records=len(entries),
+        )
+        return str(index["generation"])
+
+    def dead_bytes(self) -> int:
+        """Return bytes in segment files not referenced by the index."""
+        index = self._load_index()
+        if index is None:
+            return 0
+        total = 0
+        for segment_path in self.root.glob("seg-*.log"):
+            try:
+                total += segment_path.stat().st_size
+            except OSError:
+                continue
+        # Each record is followed by a newline that is not counted as live.
+        live_bytes = sum(index["segments"].values()) + len(index["keys"])
+        return max(0, total - live_bytes)
+
+    def needs_compaction(self) -> bool:
+        """Return True when dead bytes outweigh live bytes past the floor."""
+        index = self._load_index()
+        if index is None:
+            return False
+        dead = self.dead_bytes()
+        return dead >= COMPACT_MIN_DEAD_BYTES and dead >= (
+            sum(index["segments"].values()) * COMPACT_DEAD_RATIO
+        )
+
+    def compact(self) -> None:
+        """Rewrite live records into a fresh segment, keeping the generation."""
+        index = self._load_index()
+        if index is None:
+            return
+        store = self.open()
+        if store is None:
+            return
+        before = self.dead_bytes()
+        try:
+            # Closes the store's mappings before the old segments are deleted
+            self._rewrite(store, generation=index["generation"], next_id=index["next_id"])
+        finally:
+            store._reader.close()
+        logger.debug(
+            "segment_store_compacted",
+            path=str(self.root),
+            records=len(store),
+            reclaimed_bytes=before,
+        )
+
+    def _rewrite(
+        self,
+        records: Mapping[str, Any],
+        *,
+        generation: str,
+        next_id: int | None = None,
+    ) -> str:
+        """Write every record into a new segment and drop all older segments."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        if next_id is None:
+            existing = self._load_index()
+            next_id = existing["next_id"] if existing is not None else 1
+        segment = next_id
+        segment_path = self._segment_path(segment)
+
+        entries: dict[str, list[Any]] = {}
+        live = 0
+        with open(segment_path, "wb") as f:
+            offset = 0
+            for key in sorted(records):
+                payload = _encode(records[key])
+                f.write(payload)
+                f.write(b"\n")
+                entries[str(key)] = [segment, offset, len(payload)]
+                offset += len(payload) + 1
+                live += len(payload)
+
+        self._save_index(
+            {
+                "version": SEGMENT_STORE_VERSION,
+                "generation": generation,
+                "active": segment,
+                "next_id": segment + 1,
+                "segments": {segment: live},
+                "keys": entries,
+            }
+        )
+
+        if isinstance(records, LazyStore):
+            # Every value was decoded above; drop the mappings of the old
+            # segments so they can be deleted (Windows refuses mapped files)
+            records.materialize()
+        self._remove_stale_segments(segment_path)
+        return generation
+
+    def _remove_stale_segments(self, keep: Path) -> None:
+        """Delete every segment but ``keep``; segments still in use wait for compaction."""
+        for stale_path in self.root.glob("seg-*.log"):
+            if stale_path == keep:
+                continue
+            try:
+                stale_path.unlink(missing_ok=True)
+            except OSError as e:
+                # Mapped by another live reader (PermissionError on Windows).
+                # It is unreferenced, so dead_bytes() counts it and the next
+                # compaction deletes it.
+                logger.debug(
+                    "segment_store_stale_segment_kept",
+                    path=str(stale_path),
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.root / f"seg-{segment:06d}.log"
+
+    def _load_index(self) -> dict[str, Any] | None:
+        """Load the key index, returning None for missing or invalid data."""
+        try:
+            data = json_compat.load(self.index_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(
+                "segment_store_index_load_failed",
+                path=str(self.index_path),
+                error=str(e),
+                action="treating_store_as_empty",
+            )
+            return None
+
+        if not isinstance(data, dict) or data.get("version") not in _CODECS:
+            return None
+        keys = data.get("keys")
+        segments = data.get("segments")
+        if not isinstance(keys, dict) or not isinstance(segments, dict):
+            return None
+        try:
+            data["segments"] = {int(segment): int(size) for segment, size in segments.items()}
+            data["active"] = int(data["active"])
+            data["next_id"] = int(data["next_id"])
+        except KeyError, TypeError, ValueError:
+            return None
+        data["codec"] = _CODECS[data["version"]]
+        return data
+
+    def _save_index(self, index: dict[str, Any]) -> None:
+        index = {key: value for key, value in index.items() if key != "codec"}
+        json_compat.dump(
+            {**index, "segments": {str(k): v for k, v in index["segments"].items()}},
+            self.index_path,
+            indent=None,
+        )
+
+
+def _encode(value: Any) -> bytes:
+    """Serialize one record value as a zstd frame of compact JSON."""
+    from bengal.utils.serialization import to_jsonable
+
+    payload = json.dumps(
+        value, separators=(",", ":"), ensure_ascii=False, default=to_jsonable
+    ).encode("utf-8")
+    return zstd.compress(payload, level=RECORD_COMPRESSION_LEVEL)
+
+
+def _decode(blob: bytes, codec: str) -> Any:
+    """Deserialize one record written with the given codec."""
+    if codec == "zstd":
+        blob = zstd.decompress(blob)
+    return json.loads(blob)
+
+
+def compact_in_background(stores: list[SegmentStore], lock_path: Path | None) -> threading.Thread:
+    """
+    Compact stores on a daemon thread, holding the cache file lock if given.
+
+    Compaction writes a new segment and swaps the index atomically before
+    deleting old segments, so an interrupted compaction only leaves an
+    unreferenced segment behind for the next compaction to remove.
+    """
+
+    def _run() -> None:
+        try:
+            if lock_path is not None:
+                from bengal.utils.io.file_lock import file_lock
+
+                with file_lock(lock_path, exclusive=True):
+                    for store in stores:
+                        store.compact()
+            else:
+                for store in stores:
+                    store.compact()
+        except Exception as e:
+            logger.warning(
+                "segment_store_compaction_failed",
+                error=str(e),
+                error_type=type(e).__name__,
+                action="will_retry_next_save",
+            )
+
+    thread = threading.Thread(target=_run, name="bengal-cache-compaction", daemon=True)
+    thread.start()
+    return thread
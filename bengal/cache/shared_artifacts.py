@@ -0,0 +1,309 @@
+"""
+Machine-level content-addressed artifact cache, shared across sites (opt-in).
+
+Monorepos build many sites on the same theme, and git worktrees build the
+same site several times. Each keeps its own ``.bengal/`` caches, so
+identical theme templates and shared include snippets are compiled and
+parsed once per site. With the shared cache enabled, those artifacts are
+stored once per machine:
+
+- Kida template bytecode (``kida/<compile options hash>/``, managed by
+  Kida's ``BytecodeCache``, which keys entries by template source hash)
+- parsed include ASTs (``include-ast/``)
+
+Entries are keyed by a hash of their source plus the engine/parser version
+and any option that changes the result, so they never need invalidating;
+stale entries simply stop being looked up and age out.
+
+Concurrency: entries are written atomically (temp file + rename) and never
+modified, so any number of builds can read and write concurrently. Size is
+bounded by LRU eviction (least recently used by mtime; hits refresh the
+mtime at most hourly) down to 80% of the limit, done by one process at a
+time under a file lock and skipped when another process holds it.
+
+Configuration:
+    ```toml
+    [build]
+    shared_cache = true          # or BENGAL_SHARED_CACHE=1
+    shared_cache_max_mb = 1024
+    ```
+
+Location: ``user_cache_dir()/artifacts`` (``$BENGAL_CACHE_DIR`` overrides;
+see bengal.cache.minify_cache).
+
+Related:
+- bengal/cache/minify_cache.py: always-on shared cache for minified CSS/JS
+  (bounded with the same LRU pruning)
+- bengal/rendering/engines/kida/__init__.py: bytecode cache location
+- bengal/parsing/backends/patitas/include_cache.py: include AST tier
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from bengal.utils.io.atomic_write import atomic_write_bytes
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+# Bump to invalidate every entry (e.g. if the key layout changes)
+SHARED_CACHE_VERSION = 1
+
+DEFAULT_MAX_MB = 1024
+
+_ENABLE_ENV = "BENGAL_SHARED_CACHE"
+
+# Hits refresh an entry's mtime (its LRU position) at most this often
+_TOUCH_INTERVAL_S = 3600.0
+
+# Evict down to this fraction of the limit so pruning is not run on every write
+_PRUNE_TARGET = 0.8
+
+
+def artifact_key(*parts: str | bytes) -> str:
+    """Content-addressed key over ``parts`` (hex SHA-256, parts are length-prefixed)."""
+    hasher = hashlib.sha256(f"{SHARED_CACHE_VERSION}\0".encode())
+    for part in parts:
+        data = part.encode("utf-8", "surrogatepass") if isinstance(part, str) else part
+        hasher.update(f"{len(data)}:".encode())
+        hasher.update(data)
+    return hasher.hexdigest()
+
+
+class SharedArtifactCache:
+    """
+    Content-addressed byte store under ``root``.
+
+    Entries live at ``<root>/<namespace>/<key[:2]>/<key>`` and are immutable.
+
+    Thread-safe: writes are atomic renames; counters are updated under a lock.
+    """
+
+    def __init__(self, root: Path, max_bytes: int) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._written_since_prune = 0
+        self._lock = threading.Lock()
+
+    def namespace_dir(self, namespace: str) -> Path:
+        """Directory for ``namespace`` (for tools that manage their own files)."""
+        return self.root / namespace
+
+    def _entry_path(self, namespace: str, key: str) -> Path:
+        return self.root / namespace / key[:2] / key
+
+    def _read(self, namespace: str, key: str) -> bytes | None:
+        path = self._entry_path(namespace, key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        touch_entry(path)
+        return data
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, namespace: str, key: str) -> bytes | None:
+        """Entry bytes, or None on a miss."""
+        data = self._read(namespace, key)
+        self._count(data is not None)
+        return data
+
+    def put(self, namespace: str, key: str, data: bytes) -> None:
+        """Store ``data``; errors are logged and ignored."""
+        path = self._entry_path(namespace, key)
+        try:
+            atomic_write_bytes(path, data)
+        except OSError as e:
+            logger.debug("shared_cache_write_failed", path=str(path), error=str(e))
+            return
+        with self._lock:
+            self._written_since_prune += len(data)
+            due = self._written_since_prune > self.max_bytes * (1 - _PRUNE_TARGET)
+            if due:
+                self._written_since_prune = 0
+        if due:
+            self.prune()
+
+    def get_object(self, namespace: str, key: str) -> Any | None:
+        """Unpickled entry, or None on a miss or an unreadable entry."""
+        data = self._read(namespace, key)
+        value = None
+        if data is not None:
+            try:
+                value = pickle.loads(data)
+            except Exception:
+                # Classes changed under an unchanged key (e.g. editable install)
+                value = None
+        self._count(value is not None)
+        return value
+
+    def put_object(self, namespace: str, key: str, value: Any) -> None:
+        """Pickle and store ``value``; unpicklable values are skipped."""
+        try:
+            data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug("shared_cache_pickle_failed", namespace=namespace, error=str(e))
+            return
+        self.put(namespace, key, data)
+
+    def prune(self) -> int:
+        """
+        Evict least recently used entries until the cache is within its limit.
+
+        Returns:
+            Number of entries removed (0 when another process is pruning)
+        """
+        return prune_lru(self.root, self.max_bytes)
+
+    def maybe_prune(self) -> None:
+        """Prune if no process has pruned within the last hour (many small writers)."""
+        maybe_prune_lru(self.root, self.max_bytes)
+
+
+def touch_entry(path: Path) -> None:
+    """Refresh ``path``'s LRU position (its mtime), at most once per hour."""
+    try:
+        if time.time() - path.stat().st_mtime > _TOUCH_INTERVAL_S:
+            os.utime(path)
+    except OSError:
+        pass
+
+
+def prune_lru(root: Path, max_bytes: int) -> int:
+    """
+    Evict the least recently used files under ``root`` down to 80% of ``max_bytes``.
+
+    Runs only when ``root`` is over ``max_bytes``, under a ``prune.lock`` file
+    lock; skipped when another process holds it. Also used by the minify cache.
+
+    Returns:
+        Number of files removed (0 when another process is pruning)
+    """
+    from bengal.utils.io.file_lock import LockAcquisitionError, file_lock
+
+    try:
+        with file_lock(root / "prune", exclusive=True, timeout=0):
+            return _prune_locked(root, max_bytes)
+    except LockAcquisitionError:
+        return 0
+    except OSError as e:
+        logger.debug("shared_cache_prune_failed", root=str(root), error=str(e))
+        return 0
+
+
+def maybe_prune_lru(root: Path, max_bytes: int) -> None:
+    """:func:`prune_lru` if no process has pruned ``root`` within the last hour."""
+    try:
+        last = (root / "prune.lock").stat().st_mtime
+    except OSError:
+        last = 0.0
+    if time.time() - last > _TOUCH_INTERVAL_S:
+        prune_lru(root, max_bytes)
+
+
+def _prune_locked(root: Path, max_bytes: int) -> int:
+    os.utime(root / "prune.lock")
+    entries: list[tuple[float, int, str]] = []
+    total = 0
+    for directory, _dirs, files in os.walk(root):
+        for name in files:
+            if name.endswith(".lock"):
+                continue
+            path = os.path.join(directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+    if total <= max_bytes:
+        return 0
+
+    target = int(max_bytes * _PRUNE_TARGET)
+    removed = 0
+    for _mtime, size, path in sorted(entries):
+        if total <= target:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+        removed += 1
+    logger.debug("shared_cache_pruned", root=str(root), removed=removed, bytes=total)
+    return removed
+
+
+def shared_cache_settings(config: Any) -> tuple[bool, int]:
+    """``(enabled, max_bytes)`` from ``build.shared_cache*`` and ``BENGAL_SHARED_CACHE``."""
+    build_cfg = (config.get("build", {}) if config else {}) or {}
+    if not isinstance(build_cfg, dict):
+        build_cfg = {}
+    env = os.environ.get(_ENABLE_ENV, "").lower()
+    if env in ("1", "true", "yes"):
+        enabled = True
+    elif env in ("0", "false", "no"):
+        enabled = False
+    else:
+        enabled = bool(build_cfg.get("shared_cache", False))
+    try:
+        max_mb = float(build_cfg.get("shared_cache_max_mb", DEFAULT_MAX_MB))
+    except TypeError, ValueError:
+        max_mb = DEFAULT_MAX_MB
+    return enabled, int(max(max_mb, 1) * 1024 * 1024)
+
+
+_caches: dict[tuple[Path, int], SharedArtifactCache] = {}
+_current: SharedArtifactCache | None = None
+_caches_lock = threading.Lock()
+
+
+def configure_shared_cache(config: Any) -> SharedArtifactCache | None:
+    """
+    Select the shared cache for the current process from site config.
+
+    Idempotent; returns the cache (None when disabled). Parsing code reads
+    the selection via :func:`get_shared_cache`.
+    """
+    global _current
+
+    enabled, max_bytes = shared_cache_settings(config)
+    if not enabled:
+        with _caches_lock:
+            _current = None
+        return None
+
+    from bengal.cache.minify_cache import user_cache_dir
+
+    root = user_cache_dir() / "artifacts"
+    with _caches_lock:
+        cache = _caches.get((root, max_bytes))
+        created = cache is None
+        if cache is None:
+            cache = _caches[(root, max_bytes)] = SharedArtifactCache(root, max_bytes)
+        _current = cache
+    if created:
+        cache.maybe_prune()
+    return cache
+
+
+def get_shared_cache() -> SharedArtifactCache | None:
+    """The shared cache selected by the last :func:`configure_shared_cache` call."""
+    return _current
@@ -105,6 +105,27 @@ def build(
     all_versions: Annotated[
         bool, Description("[Versioning] Build all versions in parallel (git mode)")
     ] = False,
+    emit_deploy_manifest: Annotated[
+        bool,
+        Description(
+            "[Deploy] Write .bengal/deploy/manifest.json and a delta against the last "
+            "deployed manifest"
+        ),
+    ] = False,
+    deploy_manifest_base: Annotated[
+        str,
+        Description(
+            "[Deploy] Manifest to diff against instead of .bengal/deploy/deployed.json "
+            "(implies --emit-deploy-manifest)"
+        ),
+    ] = "",
+    deploy_sync_dir: Annotated[
+        str,
+        Description(
+            "[Deploy] Hardlink changed outputs into a local directory, keeping its manifest "
+            "in DIR/.bengal-deploy.json; marks the build deployed (implies --emit-deploy-manifest)"
+        ),
+    ] = "",
     yes: Annotated[
         bool, Description("Skip free-threading confirmation (for CI/automation)")
     ] = False,
@@ -409,6 +430,15 @@ def build(
                     for line in format_profile_report(report, top_n=20).splitlines():
                         cli.info(line)
 
+        if (emit_deploy_manifest or deploy_sync_dir or deploy_manifest_base) and not dry_run:
+            _emit_deploy_manifest(
+                site,
+                cli,
+                sync_dir=deploy_sync_dir or None,
+                base=deploy_manifest_base or None,
+                quiet=quiet,
+            )
+
         # JSON error format short-circuits the human-readable display.
         # (Sprint A4.2) Emits {"errors": [...]} for editor integrations.
         if error_format_val == "json":
@@ -1075,6 +1105,38 @@ def _print_errors_json(stats, cli) -> None:
     cli.render_write("json_output.kida", data=json.dumps(output, indent=2))
 
 
+def _emit_deploy_manifest(
+    site, cli, *, sync_dir: str | None, base: str | None, quiet: bool
+) -> None:
+    """Write the deploy manifest and delta; optionally sync a local directory."""
+    from pathlib import Path
+
+    from bengal.postprocess.deploy_manifest import (
+        emit_deploy_manifest,
+        mark_deployed,
+        sync_directory,
+    )
+
+    result = emit_deploy_manifest(site, Path(base) if base else None)
+    delta = result.delta
+    if not quiet:
+        cli.info(
+            f"Deploy manifest: {len(result.manifest.files)} files, "
+            f"{len(delta.added)} added, {len(delta.changed)} changed, "
+            f"{len(delta.removed)} removed ({result.hashed} hashed)"
+        )
+        cli.path(str(result.delta_path), label="Delta")
+
+    if sync_dir:
+        report = sync_directory(Path(site.output_dir), Path(sync_dir), result.manifest)
+        mark_deployed(site, result.manifest)
+        if not quiet:
+            cli.info(
+                f"Synced {sync_dir}: {report.linked} linked, {report.copied} copied, "
+                f"{report.removed} removed"
+            )
+
+
 def _print_explain_json(stats, *, dry_run: bool = False) -> None:
     """Print incremental build decision as JSON."""
     import json
@@ -145,6 +145,22 @@ DEFAULTS: dict[str, Any] = {
         "transform_links": True,
         "fast_writes": False,
         "fast_mode": False,
+        # Leave outputs whose bytes did not change untouched (keeps mtimes for
+        # rsync/CDN deltas). Hashes live in .bengal/content_hashes.json.
+        "skip_unchanged_outputs": False,
+        # Machine-level cache shared by every site (Kida bytecode, include
+        # ASTs); for monorepos and worktrees. BENGAL_SHARED_CACHE=1 also enables.
+        "shared_cache": False,
+        "shared_cache_max_mb": 1024,
+        # Persist rendered directive HTML across builds (.bengal/directives/,
+        # or the shared cache when enabled) for cold builds and server restarts
+        "directive_cache_persistent": False,
+        # Source text kept from discovery for health-check validators; files
+        # past the budget are re-read from disk when validated
+        "source_cache_max_mb": 128,
+        # Read only frontmatter at discovery; page bodies load on first access
+        # and are released after render
+        "defer_page_bodies": False,
         "stable_section_references": True,
         "min_page_size": 1000,
         "track_dependency_ordering": True,  # Render track items before track pages
@@ -181,6 +197,14 @@ DEFAULTS: dict[str, Any] = {
         "collapse_blank_lines": True,
     },
     # -------------------------------------------------------------------------
+    # Precompressed sidecars (.gz/.br/.zst next to text outputs)
+    # -------------------------------------------------------------------------
+    "precompress": {
+        "enabled": False,
+        "formats": ["gzip", "br", "zstd"],  # br needs the optional brotli package
+        "min_bytes": 1024,
+    },
+    # -------------------------------------------------------------------------
     # Assets
     # -------------------------------------------------------------------------
     "assets": {
@@ -188,6 +212,18 @@ DEFAULTS: dict[str, Any] = {
         "optimize": True,
         "fingerprint": True,
         "pipeline": False,
+        # Build-time srcset variants (see bengal/assets/image_variants.py)
+        "responsive_images": {
+            "enabled": False,
+            "widths": [400, 800, 1200, 1600],
+            "formats": ["webp"],
+            "quality": 80,
+        },
+        # Drop theme CSS selectors no rendered page uses (see bengal/assets/css_purge.py)
+        "purge_css": {
+            "enabled": False,
+            "safelist": [],
+        },
     },
     # -------------------------------------------------------------------------
     # Theme
@@ -540,6 +540,12 @@ class SiteConfig(TypedDict, total=False):
     cache_templates: bool
     fast_writes: bool
     fast_mode: bool
+    skip_unchanged_outputs: bool
+    shared_cache: bool
+    shared_cache_max_mb: int
+    directive_cache_persistent: bool
+    source_cache_max_mb: int
+    defer_page_bodies: bool
     stable_section_references: bool
     min_page_size: int
     render_isolation: str  # #350 off|auto|fork|spawn
@@ -180,6 +180,10 @@ class ConfigValidator:
         "transform_links",
         "fast_writes",
         "fast_mode",
+        "skip_unchanged_outputs",
+        "shared_cache",
+        "directive_cache_persistent",
+        "defer_page_bodies",
         "stable_section_references",
         "drafts",  # build.drafts — render draft pages for local preview (#488)
         # Assets (after flattening from assets.*)
@@ -203,6 +207,8 @@ class ConfigValidator:
         "port",
         "render_isolation_threshold",  # #350 isolated render crossover
         "render_isolation_workers",  # #350 isolated render worker count
+        "shared_cache_max_mb",
+        "source_cache_max_mb",
     }
 
     STRING_FIELDS: ClassVar[set[str]] = {
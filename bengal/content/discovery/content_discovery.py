@@ -43,6 +43,8 @@ from typing import TYPE_CHECKING, Any, cast
 
 from bengal.cache.parsed_output import apply_parsed_page_to_page
 from bengal.content.discovery.content_parser import ContentParser
+from bengal.content.discovery.deferred_body import defer_page_bodies
+from bengal.content.discovery.directory_manifest import directory_manifest_for
 from bengal.content.discovery.directory_walker import DirectoryWalker
 from bengal.content.discovery.page_adapter import page_from_source_page
 from bengal.content.discovery.section_builder import SectionBuilder
@@ -55,6 +57,7 @@ logger = get_logger(__name__)
 
 if TYPE_CHECKING:
     from bengal.collections import CollectionConfig
+    from bengal.content.discovery.deferred_body import FrontmatterHead
     from bengal.core.records import SourcePage
     from bengal.orchestration.build_context import BuildContext
     from bengal.protocols.core import PageLike, SectionLike
@@ -130,18 +133,24 @@ class ContentDiscovery:
         self._build_context = build_context
 
         # Initialize helper components (composition)
-        self._walker = DirectoryWalker(content_dir, site)
+        self._walker = DirectoryWalker(
+            content_dir, site, manifest=directory_manifest_for(site, content_dir)
+        )
         self._parser = ContentParser(
             content_dir,
             collections=collections,
             strict_validation=strict_validation,
             build_context=build_context,
+            defer_bodies=defer_page_bodies(getattr(site, "config", None)),
         )
         self._section_builder = SectionBuilder(site)
 
         # Thread pool for parallel processing (initialized during discovery)
         self._executor: Any = None  # ThreadPoolExecutor from managed_executor
 
+        # (changed_sources, resolved) for the current build options
+        self._resolved_changed: tuple[Any, frozenset[Path]] | None = None
+
     @property
     def _validation_errors(self) -> list[tuple[Path, str, list[Any]]]:
         """Get validation errors from parser (backward compatibility)."""
@@ -222,13 +231,13 @@ class ContentDiscovery:
             self._executor = executor
             try:
                 # Walk top-level items
-                for item in sorted(self.content_dir.iterdir()):
+                for item, _ in self._scan_top_level(self.content_dir):
                     if self._walker.should_skip_item(item):
                         continue
 
                     # Detect language-root directories for i18n
                     if self._is_language_root(item, i18n_config):
-                        for sub in sorted(item.iterdir()):
+                        for sub, _ in self._scan_top_level(item):
                             self._process_top_level_item_surgical(
                                 sub, cache, current_lang=item.name
                             )
@@ -244,6 +253,8 @@ class ContentDiscovery:
                 self._executor = None
                 self._build_cache = None
 
+        self._walker.finish()
+
         # Sort sections
         self._section_builder.sort_all_sections()
 
@@ -306,18 +317,16 @@ class ContentDiscovery:
         current_lang: str | None = None,
     ) -> None:
         """Recursively walk a directory surgically using cache."""
-        if not directory.exists():
-            return
-
-        if self._walker.check_symlink_loop(directory):
+        entries = self._walker.scan_directory(directory)
+        if entries is None:
             return
 
         file_futures = []
-        for item in self._walker.list_directory(directory):
+        for item, is_dir in entries:
             if self._walker.should_skip_item(item):
                 continue
 
-            if item.is_file() and self._walker.is_content_file(item):
+            if not is_dir and self._walker.is_content_file(item):
                 # Try to load from cache immediately (no thread overhead for cache hits)
                 page = self._create_page_surgical(
                     item, cache, current_lang=current_lang, section=parent_section
@@ -342,7 +351,7 @@ class ContentDiscovery:
                     parent_section.add_page(full_page)
                     self._section_builder.pages.append(full_page)
 
-            elif item.is_dir():
+            elif is_dir:
                 section = self._section_builder.create_section(item)
                 self._walk_directory_surgical(item, section, cache, current_lang=current_lang)
                 if section.pages or section.subsections:
@@ -379,21 +388,7 @@ class ContentDiscovery:
 
         if cached_metadata:
             try:
-                # Check if this file is explicitly marked as changed in the orchestrator
-                options = getattr(self.site, "_last_build_options", None) if self.site else None
-                changed_sources = getattr(options, "changed_sources", None)
-
-                is_explicitly_changed = False
-                if changed_sources:
-                    try:
-                        resolved_file = file_path.resolve()
-                        is_explicitly_changed = any(
-                            s.resolve() == resolved_file for s in changed_sources
-                        )
-                    except OSError, ValueError:
-                        is_explicitly_changed = file_path in changed_sources
-
-                if not is_explicitly_changed:
+                if not self._is_explicitly_changed(file_path):
                     # CACHE HIT: Reconstruct full Page from cache (Sprint 5)
                     build_cache = getattr(self, "_build_cache", None)
                     if build_cache is not None and build_cache.is_changed(file_path):
@@ -417,6 +412,29 @@ class ContentDiscovery:
         # CACHE MISS or CHANGE: Return None to signal caller should parse
         return None
 
+    def _is_explicitly_changed(self, file_path: Path) -> bool:
+        """True when the build options name ``file_path`` as changed (dev server)."""
+        options = getattr(self.site, "_last_build_options", None) if self.site else None
+        changed_sources = getattr(options, "changed_sources", None)
+        if not changed_sources:
+            return False
+        if file_path in changed_sources:
+            return True
+
+        # Resolve the changed set once per build rather than once per page
+        if self._resolved_changed is None or self._resolved_changed[0] is not changed_sources:
+            resolved: set[Path] = set()
+            for source in changed_sources:
+                try:
+                    resolved.add(source.resolve())
+                except OSError, ValueError:
+                    resolved.add(source)
+            self._resolved_changed = (changed_sources, frozenset(resolved))
+        try:
+            return file_path.resolve() in self._resolved_changed[1]
+        except OSError, ValueError:
+            return False
+
     def _create_page_from_cache(
         self,
         file_path: Path,
@@ -522,13 +540,13 @@ class ContentDiscovery:
             self._executor = executor
             try:
                 # Walk top-level items
-                for item in sorted(self.content_dir.iterdir()):
+                for item, _ in self._scan_top_level(self.content_dir):
                     if self._walker.should_skip_item(item):
                         continue
 
                     # Detect language-root directories for i18n
                     if self._is_language_root(item, i18n_config):
-                        for sub in sorted(item.iterdir()):
+                        for sub, _ in self._scan_top_level(item):
                             self._process_top_level_item(sub, current_lang=item.name)
                         continue
 
@@ -541,6 +559,8 @@ class ContentDiscovery:
             finally:
                 self._executor = None
 
+        self._walker.finish()
+
         # Sort sections
         self._section_builder.sort_all_sections()
 
@@ -562,6 +582,10 @@ class ContentDiscovery:
 
         return self.sections, self.pages
 
+    def _scan_top_level(self, directory: Path) -> list[tuple[Path, bool]]:
+        """List the content root (or a language root) without loop tracking."""
+        return self._walker.scan_directory(directory, check_loop=False) or []
+
     def _check_yaml_extensions(self) -> None:
         """Check for PyYAML C extensions (performance hint)."""
         try:
@@ -652,18 +676,16 @@ class ContentDiscovery:
         self, directory: Path, parent_section: SectionLike, current_lang: str | None = None
     ) -> None:
         """Recursively walk a directory to discover content."""
-        if not directory.exists():
-            return
-
-        if self._walker.check_symlink_loop(directory):
+        entries = self._walker.scan_directory(directory)
+        if entries is None:
             return
 
         file_futures = []
-        for item in self._walker.list_directory(directory):
+        for item, is_dir in entries:
             if self._walker.should_skip_item(item):
                 continue
 
-            if item.is_file() and self._walker.is_content_file(item):
+            if not is_dir and self._walker.is_content_file(item):
                 if self._executor:
                     ctx = contextvars.copy_context()
                     file_futures.append(
@@ -678,7 +700,7 @@ class ContentDiscovery:
                     parent_section.add_page(page)
                     self._section_builder.pages.append(page)
 
-            elif item.is_dir():
+            elif is_dir:
                 section = self._section_builder.create_section(item)
                 self._walk_directory(item, section, current_lang=current_lang)
                 if section.pages or section.subsections:
@@ -720,14 +742,20 @@ class ContentDiscovery:
     ) -> PageLike:
         """Create a Page object from a file with robust error handling."""
         try:
-            content, metadata = self._parser.parse_file(file_path)
+            parsed_head = self._parser.parse_head(file_path) if self._parser.defer_bodies else None
+            if parsed_head is None:
+                content, metadata = self._parser.parse_file(file_path)
+                head = None
+            else:
+                metadata, head = parsed_head
+                content = ""
             metadata = self._parser.validate_against_collection(file_path, metadata)
             metadata = self._metadata_with_i18n(file_path, current_lang, metadata)
 
             # Build the immutable discovery record first, then adapt it into
             # the remaining Page compatibility object for downstream callers.
             source_page = self._build_source_page(
-                file_path, content, metadata, current_lang, section
+                file_path, content, metadata, current_lang, section, head=head
             )
 
             page = page_from_source_page(source_page, site=self.site, section=section)
@@ -820,7 +848,13 @@ class ContentDiscovery:
         source_paths = [
             page.source_path for page in self.pages if getattr(page, "source_path", None)
         ]
-        git_dates = batch_git_last_modified(source_paths)
+        # Persisted index: later builds only read commits made since the last one
+        paths = getattr(getattr(self.site, "config_service", None), "paths", None)
+        index_path = getattr(paths, "git_lastmod_index", None)
+        git_dates = batch_git_last_modified(
+            source_paths,
+            index_path=index_path if isinstance(index_path, Path) else None,
+        )
         if git_dates:
             self.site.git_lastmod_by_source = git_dates
 
@@ -831,22 +865,27 @@ class ContentDiscovery:
         metadata: dict[str, Any],
         current_lang: str | None,
         section: SectionLike | None,
+        head: FrontmatterHead | None = None,
     ) -> SourcePage:
         """Build an immutable SourcePage record from parsed file data.
 
         Uses the canonical record adapter so discovery and Page compatibility
-        construction share the same field migration rules.
+        construction share the same field migration rules. ``head`` carries
+        the hashes and body offset of a deferred (frontmatter-only) read.
         """
         from bengal.core.records import build_source_page
         from bengal.utils.primitives.hashing import hash_file, hash_str
 
         # content_hash covers the frontmatter-stripped body. file_hash covers
         # the full source file so frontmatter-only edits still invalidate cache.
-        content_hash = hash_str(content)
-        try:
-            file_hash = hash_file(file_path) if file_path.exists() else content_hash
-        except OSError:
-            file_hash = content_hash
+        if head is not None:
+            content_hash, file_hash = head.content_hash, head.file_hash
+        else:
+            content_hash = hash_str(content)
+            try:
+                file_hash = hash_file(file_path) if file_path.exists() else content_hash
+            except OSError:
+                file_hash = content_hash
 
         return build_source_page(
             source_path=file_path,
@@ -857,6 +896,7 @@ class ContentDiscovery:
             content_hash=content_hash,
             file_hash=file_hash,
             is_virtual=False,
+            body_offset=head.body_offset if head is not None else None,
         )
 
     def _enrich_page_versioning(self, page: PageLike, file_path: Path) -> None:
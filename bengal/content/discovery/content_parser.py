@@ -22,6 +22,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
     from bengal.collections import CollectionConfig
+    from bengal.content.discovery.deferred_body import FrontmatterHead
     from bengal.orchestration.build_context import BuildContext
 
 logger = get_logger(__name__)
@@ -43,6 +44,7 @@ class ContentParser:
         collections: Optional dict of collection configs for validation
         strict_validation: Whether to raise on validation failure
         build_context: Optional BuildContext for content caching
+        defer_bodies: Read only frontmatter where possible (``parse_head``)
 
     Example:
             >>> parser = ContentParser(Path("content"), collections=collections)
@@ -56,6 +58,7 @@ class ContentParser:
         collections: dict[str, CollectionConfig[Any]] | None = None,
         strict_validation: bool = True,
         build_context: BuildContext | None = None,
+        defer_bodies: bool = False,
     ):
         """
         Initialize the content parser.
@@ -65,11 +68,14 @@ class ContentParser:
             collections: Optional dict of collection configs for schema validation
             strict_validation: If True, raise errors on validation failure
             build_context: Optional BuildContext for caching content
+            defer_bodies: If True, discovery uses ``parse_head`` and loads
+                page bodies on first access
         """
         self.content_dir = content_dir
         self._collections = collections or {}
         self._strict_validation = strict_validation
         self._build_context = build_context
+        self.defer_bodies = defer_bodies
         self._validation_errors: list[tuple[Path, str, list[Any]]] = []
 
     @property
@@ -112,6 +118,33 @@ class ContentParser:
         metadata, content = patitas.parse_frontmatter(file_content)
         return content, metadata
 
+    def parse_head(self, file_path: Path) -> tuple[dict[str, Any], FrontmatterHead] | None:
+        """
+        Parse only the frontmatter of a content file (bounded read).
+
+        The body is hashed but not kept; validators read the file from disk
+        through the BuildContext. Returns None when the file cannot be
+        deferred (notebooks, no ``---`` frontmatter, oversized block); use
+        ``parse_file`` then.
+
+        Raises:
+            IOError: If file cannot be read
+        """
+        if file_path.suffix.lower() == ".ipynb":
+            return None
+
+        from bengal.content.discovery.deferred_body import read_frontmatter
+
+        head = read_frontmatter(file_path)
+        if head is None:
+            return None
+
+        if self._build_context is not None:
+            self._build_context.note_content_source(file_path)
+
+        metadata, _ = patitas.parse_frontmatter(head.text)
+        return metadata, head
+
     def _parse_notebook(self, file_path: Path) -> tuple[str, dict[str, Any]]:
         """Parse a Jupyter notebook (.ipynb) file."""
         from bengal.utils.io.file_io import read_text_file
@@ -0,0 +1,199 @@
+"""
+Deferred page bodies for content discovery.
+
+By default discovery reads every source file in full and each page holds its
+markdown body for the rest of the build. With ``build.defer_page_bodies``
+enabled, discovery reads only the frontmatter block (a bounded read up to the
+closing ``---``), streams the rest of the file through the content and file
+hashes without keeping it, and records the body's byte offset. The body is
+loaded with a positioned read on first access, served from a small bounded
+cache, and released once the page has been rendered.
+
+Files without ``---`` frontmatter, notebooks, files that are not valid
+UTF-8, and frontmatter blocks larger than ``FRONTMATTER_READ_LIMIT`` are read
+eagerly as before, so ``read_text_file`` picks one encoding for the whole file.
+
+The deferred body is the text after the closing delimiter line, decoded as
+UTF-8 with universal newlines. Its ``content_hash`` covers the body bytes as
+stored.
+
+Related:
+- bengal/content/discovery/content_parser.py: ``parse_head``
+- bengal/core/page/runtime.py: ``RuntimePage._raw_content`` loads through here
+- bengal/rendering/pipeline/core.py: releases bodies after render
+"""
+
+from __future__ import annotations
+
+import codecs
+import hashlib
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+# Frontmatter blocks larger than this are read eagerly
+FRONTMATTER_READ_LIMIT = 256 * 1024
+
+# Loaded bodies kept for repeated access before release (bytes of text)
+BODY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+_HASH_CHUNK = 1 << 16
+_BOM = b"\xef\xbb\xbf"
+
+
+@dataclass(frozen=True, slots=True)
+class FrontmatterHead:
+    """
+    Result of a frontmatter-only read.
+
+    Attributes:
+        text: Frontmatter block including both delimiter lines, decoded
+        body_offset: Byte offset where the body starts
+        content_hash: SHA-256 of the body bytes
+        file_hash: SHA-256 of the whole file (same as ``hash_file``)
+    """
+
+    text: str
+    body_offset: int
+    content_hash: str
+    file_hash: str
+
+
+def defer_page_bodies(config: Any) -> bool:
+    """True when ``build.defer_page_bodies`` is enabled."""
+    build_cfg = (config.get("build", {}) if config else {}) or {}
+    if not isinstance(build_cfg, dict):
+        return False
+    return bool(build_cfg.get("defer_page_bodies", False))
+
+
+def _decode(data: bytes) -> str:
+    # Discovery only defers files that decoded as UTF-8 in full; a file edited
+    # into another encoding since then is replaced, not re-guessed per part.
+    text = data.decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_frontmatter(file_path: Path) -> FrontmatterHead | None:
+    """
+    Read ``file_path`` up to the end of its ``---`` frontmatter block.
+
+    Returns None when the file does not start with ``---``, the block is
+    not closed within ``FRONTMATTER_READ_LIMIT``, or the file is not valid
+    UTF-8; the caller reads eagerly.
+
+    Raises:
+        OSError: The file could not be read
+    """
+    file_hasher = hashlib.sha256()
+    with file_path.open("rb") as f:
+        first = f.readline(FRONTMATTER_READ_LIMIT)
+        if first.removeprefix(_BOM).rstrip() != b"---":
+            return None
+        head = [first]
+        size = len(first)
+        while True:
+            line = f.readline(FRONTMATTER_READ_LIMIT - size + 1)
+            if not line or size + len(line) > FRONTMATTER_READ_LIMIT:
+                return None
+            head.append(line)
+            size += len(line)
+            if line.rstrip() == b"---":
+                break
+
+        head_bytes = b"".join(head)
+        file_hasher.update(head_bytes)
+        body_hasher = hashlib.sha256()
+        utf8 = codecs.getincrementaldecoder("utf-8")()
+        try:
+            utf8.decode(head_bytes)
+            while chunk := f.read(_HASH_CHUNK):
+                file_hasher.update(chunk)
+                body_hasher.update(chunk)
+                utf8.decode(chunk)
+            utf8.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return None
+
+    return FrontmatterHead(
+        text=_decode(head_bytes.removeprefix(_BOM)),
+        body_offset=size,
+        content_hash=body_hasher.hexdigest(),
+        file_hash=file_hasher.hexdigest(),
+    )
+
+
+class _BodyCache:
+    """Bounded, oldest-first cache of loaded bodies keyed by source path."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._bodies: dict[str, str] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            return self._bodies.get(key)
+
+    def put(self, key: str, body: str) -> None:
+        with self._lock:
+            self._drop(key)
+            if len(body) > self.max_bytes:
+                return
+            self._bodies[key] = body
+            self._size += len(body)
+            while self._size > self.max_bytes:
+                self._drop(next(iter(self._bodies)))
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bodies.clear()
+            self._size = 0
+
+    def _drop(self, key: str) -> None:
+        body = self._bodies.pop(key, None)
+        if body is not None:
+            self._size -= len(body)
+
+
+_cache = _BodyCache(BODY_CACHE_MAX_BYTES)
+
+
+def load_body(file_path: Path, offset: int) -> str:
+    """Body of ``file_path`` from byte ``offset`` (cached until released)."""
+    key = str(file_path)
+    body = _cache.get(key)
+    if body is not None:
+        return body
+    try:
+        with file_path.open("rb") as f:
+            f.seek(offset)
+            body = _decode(f.read())
+    except OSError as e:
+        logger.warning("deferred_body_load_failed", path=key, error=str(e))
+        return ""
+    _cache.put(key, body)
+    return body
+
+
+def release_page_body(page: Any) -> None:
+    """Drop a rendered page's deferred body; a later access reads it again."""
+    if getattr(page, "_body_offset", None) is not None:
+        _cache.release(str(page.source_path))
+
+
+def clear_body_cache() -> None:
+    """Drop every loaded body (end of build, tests)."""
+    _cache.clear()
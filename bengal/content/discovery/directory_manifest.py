@@ -0,0 +1,222 @@
+"""
+Persisted directory listings for content discovery.
+
+Discovery lists every directory under ``content/`` on every build and checks
+each entry with ``is_file()``/``is_dir()``. On wide trees and network
+filesystems the listing alone is significant, although a warm build almost
+always sees the same directories as the last one.
+
+``DirectoryManifest`` records, per directory, its ``(mtime_ns, ctime_ns)``,
+its ``(st_dev, st_ino)`` (for symlink-loop detection) and its sorted entries
+as ``(name, is_dir)``. A directory whose times match the record is not listed
+again and its entries need no type checks: one ``stat`` per directory instead
+of a listing plus up to two stats per entry. Adding, removing or renaming an
+entry updates the directory's mtime. Editing a file does not; file changes
+stay with the build cache's per-file fingerprints.
+
+Every directory is stat'ed on every pass, also under ``bengal serve``. The
+dev-server watcher is not a complete change feed for ``content/``: its
+ignore filter drops events under names such as ``build/``, ``dist/`` or
+``env/``, including the event for creating such a directory, so records
+are never trusted on watcher events alone.
+
+Persisted at ``.bengal/directory_manifest.json``.
+
+Related:
+- bengal/content/discovery/directory_walker.py: consumes ``scan``
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from bengal.utils.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when the record layout changes
+DIRECTORY_MANIFEST_VERSION = 1
+
+# On coarse-timestamp filesystems a directory can change again within the
+# same mtime tick as our listing; listings that young are not recorded.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class _DirRecord:
+    mtime_ns: int
+    ctime_ns: int
+    inode: tuple[int, int]
+    entries: tuple[tuple[str, bool], ...]
+
+
+class DirectoryManifest:
+    """
+    Directory listings for one content root, validated by directory times.
+
+    Call ``begin()`` before a discovery pass, ``scan()`` for each directory,
+    and ``finish()`` after a completed pass (drops directories that were not
+    visited and saves).
+
+    Attributes:
+        content_dir: Content root the records belong to
+        path: Persisted manifest file, or None for an in-memory manifest
+        listed: Directories listed from disk in the current pass
+        reused: Directories served from records in the current pass
+    """
+
+    def __init__(self, content_dir: Path, path: Path | None = None) -> None:
+        self.content_dir = content_dir
+        self.path = path
+        self.listed = 0
+        self.reused = 0
+        self._records: dict[str, _DirRecord] = {}
+        self._loaded = False
+        self._dirty = False
+        self._visited: set[str] = set()
+
+    def begin(self) -> None:
+        """Start a discovery pass."""
+        if not self._loaded:
+            self._load()
+        self._visited = set()
+        self.listed = 0
+        self.reused = 0
+
+    def finish(self) -> None:
+        """Complete a pass: forget unvisited directories and save."""
+        stale = self._records.keys() - self._visited
+        for key in stale:
+            del self._records[key]
+        self._dirty = self._dirty or bool(stale)
+        if self._dirty:
+            self._save()
+        logger.debug("directory_manifest_pass", listed=self.listed, reused=self.reused)
+
+    def scan(self, directory: Path) -> tuple[tuple[int, int], list[tuple[Path, bool]]] | None:
+        """
+        Return ``(inode, entries)`` for a directory, or None when it is missing.
+
+        Entries are ``(path, is_dir)`` sorted by name; entries that are
+        neither files nor directories are omitted.
+
+        Raises:
+            OSError: The directory could not be stat'ed or listed
+        """
+        key = str(directory)
+        self._visited.add(key)
+        record = self._records.get(key)
+        try:
+            stat = os.stat(directory)
+        except FileNotFoundError:
+            return None
+        inode = (stat.st_dev, stat.st_ino)
+        if (
+            record is not None
+            and record.inode == inode
+            and (record.mtime_ns, record.ctime_ns) == (stat.st_mtime_ns, stat.st_ctime_ns)
+        ):
+            self.reused += 1
+            return inode, self._entries(directory, record)
+
+        names: list[tuple[str, bool]] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        names.append((entry.name, True))
+                    elif entry.is_file():
+                        names.append((entry.name, False))
+                except OSError:
+                    continue
+        names.sort()
+        self.listed += 1
+        self._dirty = True
+        if time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS:
+            self._records[key] = _DirRecord(stat.st_mtime_ns, stat.st_ctime_ns, inode, tuple(names))
+        else:
+            self._records.pop(key, None)
+        return inode, [(directory / name, is_dir) for name, is_dir in names]
+
+    @staticmethod
+    def _entries(directory: Path, record: _DirRecord) -> list[tuple[Path, bool]]:
+        return [(directory / name, is_dir) for name, is_dir in record.entries]
+
+    def _load(self) -> None:
+        from bengal.utils.io import json_compat
+
+        self._loaded = True
+        if self.path is None:
+            return
+        try:
+            state = json_compat.load(self.path)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.debug("directory_manifest_load_failed", path=str(self.path), error=str(e))
+            return
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != DIRECTORY_MANIFEST_VERSION
+            or state.get("content_dir") != str(self.content_dir)
+            or not isinstance(state.get("dirs"), dict)
+        ):
+            return
+        try:
+            for key, (mtime_ns, ctime_ns, dev, ino, entries) in state["dirs"].items():
+                self._records[key] = _DirRecord(
+                    mtime_ns,
+                    ctime_ns,
+                    (dev, ino),
+                    tuple((name, bool(is_dir)) for name, is_dir in entries),
+                )
+        except TypeError, ValueError:
+            self._records.clear()
+
+    def _save(self) -> None:
+        from bengal.utils.io import json_compat
+
+        self._dirty = False
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            json_compat.dump(
+                {
+                    "version": DIRECTORY_MANIFEST_VERSION,
+                    "content_dir": str(self.content_dir),
+                    "dirs": {
+                        key: [r.mtime_ns, r.ctime_ns, *r.inode, r.entries]
+                        for key, r in self._records.items()
+                    },
+                },
+                self.path,
+                indent=None,
+            )
+        except OSError as e:
+            logger.debug("directory_manifest_save_failed", path=str(self.path), error=str(e))
+
+
+# One manifest per content root per process, so the dev server's warm builds
+# reuse the loaded records between discoveries
+_live: dict[Path, DirectoryManifest] = {}
+_live_lock = threading.Lock()
+
+
+def directory_manifest_for(site: Any, content_dir: Path) -> DirectoryManifest:
+    """Return the process-wide manifest for ``content_dir``."""
+    paths = getattr(getattr(site, "config_service", None), "paths", None)
+    manifest_path = getattr(paths, "directory_manifest", None)
+    if not isinstance(manifest_path, Path):
+        manifest_path = None
+    with _live_lock:
+        manifest = _live.get(content_dir)
+        if manifest is None or manifest_path not in (None, manifest.path):
+            manifest = DirectoryManifest(content_dir, manifest_path)
+            _live[content_dir] = manifest
+    return manifest
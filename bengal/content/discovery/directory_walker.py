@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
     from pathlib import Path
 
+    from bengal.content.discovery.directory_manifest import DirectoryManifest
     from bengal.protocols import SectionLike
 
 logger = get_logger(__name__)
@@ -37,6 +38,7 @@ class DirectoryWalker:
         content_dir: Root content directory
         site: Optional Site reference for configuration
         visited_inodes: Set of visited (device, inode) pairs for loop detection
+        manifest: Optional DirectoryManifest serving unchanged directory listings
 
     Example:
             >>> walker = DirectoryWalker(Path("content"), site=site)
@@ -46,21 +48,35 @@ class DirectoryWalker:
 
     """
 
-    def __init__(self, content_dir: Path, site: Any | None = None):
+    def __init__(
+        self,
+        content_dir: Path,
+        site: Any | None = None,
+        manifest: DirectoryManifest | None = None,
+    ):
         """
         Initialize the directory walker.
 
         Args:
             content_dir: Root content directory
             site: Optional Site reference for versioning config
+            manifest: Optional DirectoryManifest for ``scan_directory``
         """
         self.content_dir = content_dir
         self.site = site
+        self.manifest = manifest
         self.visited_inodes: set[tuple[int, int]] = set()
 
     def reset(self) -> None:
         """Reset visited inodes for a new discovery pass."""
         self.visited_inodes.clear()
+        if self.manifest is not None:
+            self.manifest.begin()
+
+    def finish(self) -> None:
+        """Complete a discovery pass (persists the manifest, if any)."""
+        if self.manifest is not None:
+            self.manifest.finish()
 
     def is_content_file(self, file_path: Path) -> bool:
         """
@@ -117,7 +133,7 @@ class DirectoryWalker:
         """
         return item_path.name in ("_versions", "_shared") and self._uses_folder_versioning()
 
-    def check_symlink_loop(self, directory: Path) -> bool:
+    def check_symlink_loop(self, directory: Path, inode_key: tuple[int, int] | None = None) -> bool:
         """
         Check if a directory would create a symlink loop.
 
@@ -126,13 +142,15 @@ class DirectoryWalker:
 
         Args:
             directory: Directory to check
+            inode_key: Known (device, inode) pair; skips the stat when given
 
         Returns:
             True if this is a loop (should skip), False if safe to enter
         """
         try:
-            stat = directory.stat()
-            inode_key = (stat.st_dev, stat.st_ino)
+            if inode_key is None:
+                stat = directory.stat()
+                inode_key = (stat.st_dev, stat.st_ino)
 
             if inode_key in self.visited_inodes:
                 from bengal.errors import BengalDiscoveryError, ErrorCode, record_error
@@ -155,26 +173,29 @@ class DirectoryWalker:
             self.visited_inodes.add(inode_key)
             return False
         except (OSError, PermissionError) as e:
-            from bengal.errors import BengalDiscoveryError, ErrorCode, record_error
-
-            error = BengalDiscoveryError(
-                f"Failed to stat directory: {directory}",
-                code=ErrorCode.D007,
-                file_path=directory,
-                suggestion="Check directory permissions or exclude from discovery",
-                original_error=e,
-            )
-            record_error(error, file_path=str(directory))
-            logger.warning(
-                "directory_stat_failed",
-                path=str(directory),
-                error=str(e),
-                error_type=type(e).__name__,
-                action="skipping",
-                code="D007",
-            )
+            self._report_stat_failed(directory, e)
             return True
 
+    def _report_stat_failed(self, directory: Path, e: OSError) -> None:
+        from bengal.errors import BengalDiscoveryError, ErrorCode, record_error
+
+        error = BengalDiscoveryError(
+            f"Failed to stat directory: {directory}",
+            code=ErrorCode.D007,
+            file_path=directory,
+            suggestion="Check directory permissions or exclude from discovery",
+            original_error=e,
+        )
+        record_error(error, file_path=str(directory))
+        logger.warning(
+            "directory_stat_failed",
+            path=str(directory),
+            error=str(e),
+            error_type=type(e).__name__,
+            action="skipping",
+            code="D007",
+        )
+
     def list_directory(self, directory: Path) -> list[Path]:
         """
         List items in a directory, sorted alphabetically.
@@ -188,25 +209,74 @@ class DirectoryWalker:
         try:
             return sorted(directory.iterdir())
         except PermissionError as e:
-            from bengal.errors import BengalDiscoveryError, ErrorCode, record_error
-
-            error = BengalDiscoveryError(
-                f"Permission denied reading directory: {directory}",
-                code=ErrorCode.D007,
-                file_path=directory,
-                suggestion="Check directory permissions or exclude from discovery",
-                original_error=e,
-            )
-            record_error(error, file_path=str(directory))
-            logger.warning(
-                "directory_permission_denied",
-                path=str(directory),
-                error=str(e),
-                action="skipping",
-                code="D007",
-            )
+            self._report_permission_denied(directory, e)
             return []
 
+    def _report_permission_denied(self, directory: Path, e: OSError) -> None:
+        from bengal.errors import BengalDiscoveryError, ErrorCode, record_error
+
+        error = BengalDiscoveryError(
+            f"Permission denied reading directory: {directory}",
+            code=ErrorCode.D007,
+            file_path=directory,
+            suggestion="Check directory permissions or exclude from discovery",
+            original_error=e,
+        )
+        record_error(error, file_path=str(directory))
+        logger.warning(
+            "directory_permission_denied",
+            path=str(directory),
+            error=str(e),
+            action="skipping",
+            code="D007",
+        )
+
+    def scan_directory(
+        self, directory: Path, *, check_loop: bool = True
+    ) -> list[tuple[Path, bool]] | None:
+        """
+        List a directory as sorted ``(path, is_dir)`` pairs.
+
+        Combines the existence check, symlink-loop check and listing. Entries
+        that are neither files nor directories are omitted. With a manifest,
+        unchanged directories cost one ``stat`` and their entries none.
+
+        Args:
+            directory: Directory to list
+            check_loop: Record and check the directory's inode for loops
+
+        Returns:
+            Entries, an empty list when unreadable, or None when the
+            directory is missing or a loop
+        """
+        if self.manifest is None:
+            if not directory.exists():
+                return None
+            if check_loop and self.check_symlink_loop(directory):
+                return None
+            entries: list[tuple[Path, bool]] = []
+            for item in self.list_directory(directory):
+                if item.is_file():
+                    entries.append((item, False))
+                elif item.is_dir():
+                    entries.append((item, True))
+            return entries
+
+        try:
+            scanned = self.manifest.scan(directory)
+        except PermissionError as e:
+            self._report_permission_denied(directory, e)
+            return []
+        except OSError as e:
+            self._report_stat_failed(directory, e)
+            return None
+        if scanned is None:
+            return None
+        inode_key, entries = scanned
+        if check_loop and self.check_symlink_loop(directory, inode_key):
+            return None
+        return entries
+
     def walk_directory(
         self,
         directory: Path,
@@ -225,17 +295,11 @@ class DirectoryWalker:
         Yields:
             Tuples of (item_path, is_file)
         """
-        if not directory.exists():
-            return
-
-        if self.check_symlink_loop(directory):
-            return
-
-        for item in self.list_directory(directory):
+        for item, is_dir in self.scan_directory(directory) or ():
             if self.should_skip_item(item):
                 continue
 
-            if item.is_file() and self.is_content_file(item):
-                yield item, True
-            elif item.is_dir():
+            if is_dir:
                 yield item, False
+            elif self.is_content_file(item):
+                yield item, True
@@ -54,6 +54,7 @@ if TYPE_CHECKING:
     from PIL.Image import Image as PILImage
 
     from bengal.assets.manifest import AssetManifest
+    from bengal.cache.output_gate import OutputWriteGate
 
 # Pillow C extensions are not thread-safe under free-threading (3.14t);
 # serialise all PIL operations with this lock so worker threads don't race.
@@ -93,6 +94,8 @@ class Asset:
     _optimized_image: Any = None  # Optimized PIL Image (type deferred to avoid PIL import)
     _site: Any | None = field(default=None, repr=False)
     _diagnostics: Any | None = field(default=None, repr=False)
+    # False when the last copy_to_output() left an identical file untouched
+    _output_written: bool = field(default=True, repr=False)
 
     def __post_init__(self) -> None:
         """Determine asset type from file extension."""
@@ -413,9 +416,13 @@ class Asset:
                 css_content = f.read()
 
         try:
+            from bengal.cache.minify_cache import cached_minify
             from bengal.css import minify_css
 
-            self._minified_content = minify_css(css_content)
+            # Theme CSS is byte-identical across builds and sites: reuse proven output
+            self._minified_content = cached_minify(
+                "css", css_content, minify_css, options="level=safe"
+            )
         except Exception as e:
             emit_diagnostic(
                 self,
@@ -437,10 +444,12 @@ class Asset:
         try:
             from jsmin import jsmin
 
+            from bengal.cache.minify_cache import cached_minify
+
             with open(self.source_path, encoding="utf-8") as f:
                 js_content = f.read()
 
-            minified_content = jsmin(js_content)
+            minified_content = cached_minify("js", js_content, jsmin)
             self._minified_content = minified_content
         except ImportError:
             emit_diagnostic(self, "warning", "jsmin_unavailable", source=str(self.source_path))
@@ -529,17 +538,25 @@ class Asset:
                 error_type=type(e).__name__,
             )
 
-    def copy_to_output(self, output_dir: Path, use_fingerprint: bool = True) -> Path:
+    def copy_to_output(
+        self,
+        output_dir: Path,
+        use_fingerprint: bool = True,
+        gate: OutputWriteGate | None = None,
+    ) -> Path:
         """
         Copy the asset to the output directory.
 
         Args:
             output_dir: Output directory path
             use_fingerprint: Whether to include fingerprint in filename
+            gate: Skip-unchanged gate; an output that already holds the same
+                bytes is left untouched and ``_output_written`` is set False
 
         Returns:
             Path where the asset was copied
         """
+        self._output_written = True
         # Only generate fingerprint if explicitly requested
         if use_fingerprint:
             if not self.fingerprint:
@@ -565,7 +582,9 @@ class Asset:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Copy or write optimized/minified content atomically
-        if self._minified_content is not None:
+        if self._minified_content is not None and gate is not None:
+            self._output_written = gate.write_text(output_path, self._minified_content)
+        elif self._minified_content is not None:
             # Write minified content atomically (crash-safe)
             from bengal.utils.io.atomic_write import atomic_write_text
 
@@ -575,6 +594,12 @@ class Asset:
                 encoding="utf-8",
                 ensure_parent=False,  # parent dir already ensured above
             )
+        elif (
+            self._optimized_image is not None
+            and gate is not None
+            and (encoded := self._encode_optimized_image()) is not None
+        ):
+            self._output_written = gate.write_bytes(output_path, encoded)
         elif self._optimized_image is not None:
             # Save optimized image atomically using unique temp file to prevent race conditions
             import os
@@ -611,6 +636,8 @@ class Asset:
                 )
                 tmp_path.unlink(missing_ok=True)
                 raise
+        elif gate is not None and self._copy_unchanged(output_path, gate):
+            self._output_written = False
         else:
             # Atomic copy using temporary file and rename (crash-safe)
             import os
@@ -636,10 +663,40 @@ class Asset:
                 )
                 tmp_path.unlink(missing_ok=True)
                 raise
+            if gate is not None:
+                from bengal.utils.primitives.hashing import hash_file
+
+                gate.record(output_path, hash_file(output_path))
 
         self.output_path = output_path
         return output_path
 
+    def _encode_optimized_image(self) -> bytes | None:
+        """Optimized image encoded for a gated write; None for formats saved by name."""
+        import io
+
+        suffix = self.source_path.suffix.upper().lstrip(".")
+        if suffix not in ("JPG", "JPEG", "PNG", "GIF", "WEBP"):
+            return None
+        img_format = "JPEG" if suffix in ("JPG", "JPEG") else suffix
+        buffer = io.BytesIO()
+        with _pil_lock:
+            self._optimized_image.save(buffer, format=img_format, optimize=True, quality=85)
+        return buffer.getvalue()
+
+    def _copy_unchanged(self, output_path: Path, gate: OutputWriteGate) -> bool:
+        """Whether ``output_path`` already holds the source bytes (counted by the gate)."""
+        recorded = gate.current_hash(output_path)
+        if recorded is None:
+            return False
+        from bengal.utils.primitives.hashing import hash_file
+
+        try:
+            digest = hash_file(self.source_path)
+        except OSError:
+            return False
+        return gate.is_unchanged(output_path, digest, self.source_path.stat().st_size)
+
     def _cleanup_old_fingerprints_prepare(self, output_dir: Path) -> None:
         """
         Remove outdated fingerprinted siblings before writing the new file.
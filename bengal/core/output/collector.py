@@ -54,6 +54,7 @@ class BuildOutputCollector:
         self._output_dir = output_dir
         self._outputs: list[OutputRecord] = []
         self._counts_by_type: dict[OutputType, int] = {}
+        self._unchanged: list[OutputRecord] = []
         self._lock = Lock()
         self._logger = get_logger(__name__)
 
@@ -72,6 +73,41 @@ class BuildOutputCollector:
             output_type: Type of output; auto-detected from extension if None
             phase: Build phase that produced this output
         """
+        record = self._make_record(path, output_type, phase)
+
+        with self._lock:
+            self._outputs.append(record)
+            self._counts_by_type[record.output_type] = (
+                self._counts_by_type.get(record.output_type, 0) + 1
+            )
+
+    def record_unchanged(
+        self,
+        path: Path,
+        output_type: OutputType | None = None,
+        phase: Literal["render", "asset", "postprocess"] = "render",
+    ) -> None:
+        """Record an output that was produced but left untouched on disk.
+
+        Used in skip-unchanged mode (``build.skip_unchanged_outputs``): the
+        file already held the same bytes, so it is not a changed output and
+        is kept out of :meth:`get_outputs`.
+
+        Args:
+            path: Path to the output file (absolute or relative to output_dir)
+            output_type: Type of output; auto-detected from extension if None
+            phase: Build phase that produced this output
+        """
+        record = self._make_record(path, output_type, phase)
+        with self._lock:
+            self._unchanged.append(record)
+
+    def _make_record(
+        self,
+        path: Path,
+        output_type: OutputType | None,
+        phase: Literal["render", "asset", "postprocess"],
+    ) -> OutputRecord:
         # Make path relative to output_dir if absolute
         if self._output_dir and path.is_absolute():
             with suppress(ValueError):
@@ -79,15 +115,8 @@ class BuildOutputCollector:
 
         # Create record, auto-detecting type if not provided
         if output_type is None:
-            record = OutputRecord.from_path(path, phase=phase)
-        else:
-            record = OutputRecord(path=path, output_type=output_type, phase=phase)
-
-        with self._lock:
-            self._outputs.append(record)
-            self._counts_by_type[record.output_type] = (
-                self._counts_by_type.get(record.output_type, 0) + 1
-            )
+            return OutputRecord.from_path(path, phase=phase)
+        return OutputRecord(path=path, output_type=output_type, phase=phase)
 
     def get_outputs(
         self,
@@ -124,6 +153,11 @@ class BuildOutputCollector:
         """
         return [str(o.path) for o in self.get_outputs(output_type)]
 
+    def get_unchanged(self) -> list[OutputRecord]:
+        """Get outputs recorded via :meth:`record_unchanged` (copy)."""
+        with self._lock:
+            return list(self._unchanged)
+
     def css_only(self) -> bool:
         """Check if all recorded outputs are CSS files.
 
@@ -144,6 +178,7 @@ class BuildOutputCollector:
         with self._lock:
             self._outputs.clear()
             self._counts_by_type.clear()
+            self._unchanged.clear()
 
     def validate(self, changed_sources: list[str] | None = None) -> None:
         """Validate tracking integrity and emit diagnostics.
@@ -155,7 +190,7 @@ class BuildOutputCollector:
             changed_sources: List of source files that changed (for comparison)
         """
         with self._lock:
-            if changed_sources and not self._outputs:
+            if changed_sources and not self._outputs and not self._unchanged:
                 emit(
                     self,
                     "warning",
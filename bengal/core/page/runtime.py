@@ -62,7 +62,8 @@ class RuntimePage:
 
     source_page: SourcePage
     source_path: Path
-    _raw_content: str
+    # Markdown body; None while a deferred body (see _body_offset) is unread
+    _body: str | None
     _raw_metadata: dict[str, Any]
     core: PageCore
     html_content: str | None = None
@@ -108,6 +109,7 @@ class RuntimePage:
     _complexity_score: int | None = field(default=None, repr=False, init=False)
     _cascade_invalidated: bool = field(default=False, repr=False, init=False)
     _from_cache: bool = False
+    _body_offset: int | None = field(default=None, repr=False)
 
     _global_missing_section_warnings: ClassVar[dict[str, int]] = {}
     _warnings_lock: ClassVar[threading.Lock] = threading.Lock()
@@ -134,7 +136,7 @@ class RuntimePage:
         page = cls(
             source_page=source_page,
             source_path=Path(source_page.source_path),
-            _raw_content=source_page.raw_content,
+            _body=None if source_page.body_offset is not None else source_page.raw_content,
             _raw_metadata=source_page.raw_metadata_dict(),
             core=source_page.core,
             rendered_html=rendered_html or "",
@@ -143,6 +145,7 @@ class RuntimePage:
             translation_key=source_page.translation_key,
             virtual=source_page.is_virtual,
             _from_cache=from_cache,
+            _body_offset=source_page.body_offset,
         )
         if rendered_html is not None:
             page.prerendered_html = rendered_html
@@ -635,6 +638,21 @@ class RuntimePage:
 
         return get_resources(self.source_path, getattr(self, "url", "/"))
 
+    @property
+    def _raw_content(self) -> str:
+        if self._body is not None:
+            return self._body
+        if self._body_offset is None:
+            return ""
+        from bengal.content.discovery.deferred_body import load_body
+
+        return load_body(self.source_path, self._body_offset)
+
+    @_raw_content.setter
+    def _raw_content(self, value: str) -> None:
+        self._body = value
+        self._body_offset = None
+
     @property
     def _source(self) -> str:
         return self._raw_content
@@ -119,6 +119,17 @@ class PageCacheManager:
             self._listable_token = token
         return self._listable
 
+    def is_cached_view(self, pages: object) -> bool:
+        """
+        Whether ``pages`` is one of the filtered view lists built so far.
+
+        Identity check only; does not recompute view tokens, so it is cheap
+        enough to call from template filters on every invocation.
+        """
+        return pages is not None and (
+            pages is self._regular or pages is self._generated or pages is self._listable
+        )
+
     def get_page_path_map(self) -> dict[str, PageLike]:
         """
         Cached string-keyed page lookup map for O(1) resolution.
@@ -281,6 +281,10 @@ class SourcePage:
     lang: str | None = None
     translation_key: str | None = None
 
+    # Byte offset of the body in the source file when discovery deferred
+    # reading it (build.defer_page_bodies); raw_content is then empty
+    body_offset: int | None = None
+
     def __post_init__(self) -> None:
         object.__setattr__(self, "core", _freeze_page_core(self.core))
         object.__setattr__(self, "raw_metadata", _deep_freeze(dict(self.raw_metadata)))
@@ -407,12 +411,14 @@ def build_source_page(
     content_hash: str | None = None,
     file_hash: str | None = None,
     is_virtual: bool = False,
+    body_offset: int | None = None,
 ) -> SourcePage:
     """Build an immutable ``SourcePage`` without requiring a mutable ``Page``.
 
     ``content_hash`` is the hash of the frontmatter-stripped body. ``file_hash``
     is the full source file hash for real files. Both values are computed by
     discovery/orchestration boundaries and passed in so core remains passive.
+    ``body_offset`` marks a body discovery did not read (``raw_content`` empty).
     """
     meta = dict(metadata or {})
 
@@ -432,6 +438,7 @@ def build_source_page(
         is_virtual=is_virtual,
         lang=lang or core.lang,
         translation_key=meta.get("translation_key"),
+        body_offset=body_offset,
     )
 
 
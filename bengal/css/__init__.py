@@ -12,12 +12,14 @@ can be extracted into a standalone package later by swapping :mod:`bengal.css.er
 Public API:
     minify_css(css, *, level="safe" | "optimize" | "aggressive") -> str
     MinifyLevel
+    SelectorInventory (for ``minify_css(..., used_selectors=...)``)
     tokenize(css) -> list[Token]
 """
 
 from bengal.css.config import MinifyLevel
 from bengal.css.minify import minify_css
+from bengal.css.purge import SelectorInventory
 from bengal.css.tokenizer import tokenize
 from bengal.css.tokens import Token, TokenType
 
-__all__ = ["MinifyLevel", "Token", "TokenType", "minify_css", "tokenize"]
+__all__ = ["MinifyLevel", "SelectorInventory", "Token", "TokenType", "minify_css", "tokenize"]
@@ -19,12 +19,14 @@ from bengal.css.errors import warn
 from bengal.css.nesting import flatten_nesting_tree, has_nested_rules
 from bengal.css.optimize import optimize_tree
 from bengal.css.parser import parse_stylesheet
+from bengal.css.purge import has_unmatched_selectors, purge_guard_ok, purge_unused_tree
 from bengal.css.serializer import serialize
 from bengal.css.structural import structural_optimize
 from bengal.css.tokenizer import tokenize
 
 if TYPE_CHECKING:
     from bengal.css.nodes import Node
+    from bengal.css.purge import SelectorInventory
 
 
 def _parse(css: str) -> tuple[Node, ...]:
@@ -37,6 +39,7 @@ def minify_css(
     level: MinifyLevel | str = MinifyLevel.SAFE,
     flatten_nesting: bool = False,
     remove_dead_code: bool = False,
+    used_selectors: SelectorInventory | None = None,
 ) -> str:
     """Minify CSS text.
 
@@ -51,6 +54,10 @@ def minify_css(
         remove_dead_code: When ``True``, drop unreferenced ``@keyframes``,
             ``@font-face``, and custom-property definitions provable within the
             stylesheet (opt-in; default preserves all definitions).
+        used_selectors: When given, drop selectors that cannot match any
+            document described by this inventory (classes, ids, elements and
+            attributes harvested from rendered HTML). Runs before dead-code
+            removal so keyframes/fonts used only by purged rules go too.
 
     Returns:
         Minified CSS, guaranteed to be meaning-preserving. Returns the input
@@ -86,6 +93,18 @@ def minify_css(
             else:
                 warn("css_minifier_nesting_guard_failed", input_length=len(css))
 
+        if used_selectors is not None and has_unmatched_selectors(pipeline_tree, used_selectors):
+            purged_tree = purge_unused_tree(pipeline_tree, used_selectors)
+            purged_out = serialize(purged_tree)
+            reparsed = _parse(purged_out)
+            if purge_guard_ok(pipeline_tree, purged_tree, used_selectors) and purge_guard_ok(
+                pipeline_tree, reparsed, used_selectors
+            ):
+                best = purged_out
+                pipeline_tree = purged_tree
+            else:
+                warn("css_minifier_purge_guard_failed", input_length=len(css))
+
         if remove_dead_code and has_removable_dead_code(pipeline_tree):
             pruned_tree = remove_dead_code_tree(pipeline_tree)
             pruned_out = serialize(pruned_tree)
@@ -0,0 +1,243 @@
+"""HTML-aware unused-selector purge (opt-in).
+
+Drops selectors that provably match nothing in a document inventory: the
+classes, ids, element names and attribute names that occur in the rendered
+site (plus a safelist). A selector is dropped only when one of its compounds
+requires a class, id, type or attribute that is missing from the inventory.
+Anything the check does not model — pseudo-class arguments (``:is()``,
+``:not()``, ``:has()``), namespaces, escapes, the nesting selector ``&`` —
+counts as a possible match, so a selector is kept unless it is provably dead.
+
+Only qualified rules at the top level, nested in other rules, or inside
+grouping at-rules (``@media``, ``@supports``, ``@layer``, ``@container``,
+``@scope``, ``@starting-style``, ``@document``) are considered; ``@keyframes``,
+``@font-face``, ``@page`` and friends are never touched. Guarded at runtime by
+:func:`purge_guard_ok`.
+"""
+
+from dataclasses import dataclass
+
+from bengal.css.cascade import _WS_MARKER, _split_selectors, resolve, selector_sig
+from bengal.css.nodes import AtRule, Declaration, Node, QualifiedRule
+from bengal.css.tokens import Token, TokenType
+
+_COMBINATORS = frozenset({">", "+", "~"})
+
+_GROUPING_AT_RULES = frozenset(
+    {
+        "@media",
+        "@supports",
+        "@layer",
+        "@container",
+        "@scope",
+        "@starting-style",
+        "@document",
+        "@-moz-document",
+    }
+)
+
+# Elements the HTML parser inserts even when the markup omits them.
+_IMPLICIT_ELEMENTS = frozenset({"html", "head", "body", "tbody", "colgroup"})
+
+_COMMA = Token(TokenType.COMMA, ",")
+
+
+@dataclass(frozen=True, slots=True)
+class SelectorInventory:
+    """Names that occur in the documents a stylesheet is served to.
+
+    All names are lowercase; matching is case-insensitive, which is what quirks
+    mode does for classes and ids and never drops more than standards mode.
+    ``prefixes`` keeps any class, id, element or attribute name starting with one
+    of them (for names scripts build at runtime, e.g. ``"is-" + state``).
+    """
+
+    classes: frozenset[str] = frozenset()
+    ids: frozenset[str] = frozenset()
+    elements: frozenset[str] = frozenset()
+    attributes: frozenset[str] = frozenset()
+    prefixes: tuple[str, ...] = ()
+
+    def _has(self, names: frozenset[str], name: str) -> bool:
+        if "\\" in name:  # escaped identifier: not decoded, assume present
+            return True
+        name = name.lower()
+        return name in names or name.startswith(self.prefixes)
+
+    def has_class(self, name: str) -> bool:
+        return self._has(self.classes, name)
+
+    def has_id(self, name: str) -> bool:
+        return self._has(self.ids, name)
+
+    def has_element(self, name: str) -> bool:
+        return name.lower() in _IMPLICIT_ELEMENTS or self._has(self.elements, name)
+
+    def has_attribute(self, name: str) -> bool:
+        return self._has(self.attributes, name)
+
+
+def _attribute_may_match(inner: list[tuple[object, ...]], inventory: SelectorInventory) -> bool:
+    # [attr], [attr=v], [attr|=v]; anything namespaced ([ns|attr], [*|attr]) is kept
+    if not inner or inner[0][0] is not TokenType.IDENT:
+        return True
+    if len(inner) > 2 and inner[1] == (TokenType.DELIM, "|") and inner[2] != (TokenType.DELIM, "="):
+        return True
+    return inventory.has_attribute(str(inner[0][1]))
+
+
+def selector_may_match(sig: tuple[object, ...], inventory: SelectorInventory) -> bool:
+    """Whether a selector (given as :func:`~bengal.css.cascade.selector_sig`) can match.
+
+    Returns ``False`` only if some compound requires a name that is absent from
+    ``inventory``.
+    """
+    items = list(sig)
+    count = len(items)
+    compound_start = True
+    i = 0
+    while i < count:
+        item = items[i]
+        i += 1
+        if item == _WS_MARKER:
+            compound_start = True
+            continue
+        kind, value = item  # type: ignore[misc]
+        nxt = items[i] if i < count else None
+
+        if kind is TokenType.DELIM:
+            if value in _COMBINATORS:
+                compound_start = True
+                continue
+            if value == "*" and nxt != (TokenType.DELIM, "|"):
+                compound_start = False
+                continue
+            if value == "." and nxt is not None and nxt[0] is TokenType.IDENT:
+                if not inventory.has_class(str(nxt[1])):
+                    return False
+                i += 1
+                compound_start = False
+                continue
+            return True  # "&", namespaces, anything unexpected
+        if kind is TokenType.HASH:
+            if not inventory.has_id(str(value)[1:]):
+                return False
+            compound_start = False
+            continue
+        if kind is TokenType.IDENT and compound_start:
+            if nxt == (TokenType.DELIM, "|"):
+                return True
+            if not inventory.has_element(str(value)):
+                return False
+            compound_start = False
+            continue
+        if kind is TokenType.LBRACKET:
+            inner: list[tuple[object, ...]] = []
+            while i < count and items[i] != (TokenType.RBRACKET, "]"):
+                if items[i] != _WS_MARKER:
+                    inner.append(items[i])  # type: ignore[arg-type]
+                i += 1
+            i += 1
+            if not _attribute_may_match(inner, inventory):
+                return False
+            compound_start = False
+            continue
+        if kind is TokenType.COLON:
+            # Pseudo-classes/elements never require a name; skip their arguments
+            while i < count and items[i] == (TokenType.COLON, ":"):
+                i += 1
+            if i < count and items[i][0] is TokenType.FUNCTION:
+                depth = 1
+                i += 1
+                while i < count and depth:
+                    if items[i][0] in (TokenType.FUNCTION, TokenType.LPAREN):
+                        depth += 1
+                    elif items[i][0] is TokenType.RPAREN:
+                        depth -= 1
+                    i += 1
+            elif i < count and items[i][0] is TokenType.IDENT:
+                i += 1
+            else:
+                return True
+            compound_start = False
+            continue
+        return True
+    return True
+
+
+def _purge_block(nodes: tuple[Node, ...], inventory: SelectorInventory) -> tuple[Node, ...]:
+    out: list[Node] = []
+    for node in nodes:
+        if isinstance(node, Declaration):
+            out.append(node)
+        elif isinstance(node, QualifiedRule):
+            selectors = _split_selectors(node.prelude)
+            kept = [sel for sel in selectors if selector_may_match(selector_sig(sel), inventory)]
+            if not kept:
+                continue
+            prelude = node.prelude
+            if len(kept) != len(selectors):
+                joined: list[Token] = list(kept[0])
+                for sel in kept[1:]:
+                    joined.append(_COMMA)
+                    joined.extend(sel)
+                prelude = tuple(joined)
+            out.append(QualifiedRule(prelude, _purge_block(node.block, inventory)))
+        elif node.block is not None and node.name.lower() in _GROUPING_AT_RULES:
+            block = _purge_block(node.block, inventory)
+            # An emptied @layer block still fixes the layer order; keep it
+            if block or not node.block or node.name.lower() == "@layer":
+                out.append(AtRule(node.name, node.prelude, block))
+        else:
+            out.append(node)
+    return tuple(out)
+
+
+def purge_unused_tree(nodes: tuple[Node, ...], inventory: SelectorInventory) -> tuple[Node, ...]:
+    """Drop selectors (and emptied rules) that cannot match ``inventory``."""
+    return _purge_block(nodes, inventory)
+
+
+def has_unmatched_selectors(nodes: tuple[Node, ...], inventory: SelectorInventory) -> bool:
+    """Cheap pre-check: whether :func:`purge_unused_tree` would drop anything."""
+    for node in nodes:
+        if isinstance(node, QualifiedRule):
+            for sel in _split_selectors(node.prelude):
+                if not selector_may_match(selector_sig(sel), inventory):
+                    return True
+            if has_unmatched_selectors(node.block, inventory):
+                return True
+        elif (
+            isinstance(node, AtRule)
+            and node.block is not None
+            and node.name.lower() in _GROUPING_AT_RULES
+            and has_unmatched_selectors(node.block, inventory)
+        ):
+            return True
+    return False
+
+
+def _key_may_match(key: object, inventory: SelectorInventory) -> bool:
+    # resolve() keys: (at_ctx, sel_path) or ("__stmt__", at_ctx, sel_path)
+    if not isinstance(key, tuple) or len(key) != 2:
+        return True
+    at_ctx, sel_path = key
+    if any(name not in _GROUPING_AT_RULES for name, _prelude in at_ctx):
+        return True
+    return all(selector_may_match(sig, inventory) for sig in sel_path)
+
+
+def purge_guard_ok(
+    before: tuple[Node, ...], after: tuple[Node, ...], inventory: SelectorInventory
+) -> bool:
+    """True if ``after`` only drops cascade entries whose selectors cannot match.
+
+    Every ``(at-context, selector path)`` that may match must resolve to exactly
+    the same declarations, and ``after`` may not introduce or alter anything.
+    """
+    before_r = resolve(before, normalize=False)
+    after_r = resolve(after, normalize=False)
+    for key, decls in after_r.items():
+        if before_r.get(key) != decls:
+            return False
+    return all(key in after_r or not _key_may_match(key, inventory) for key in before_r)
@@ -187,8 +187,8 @@ class BlockDiffService:
     ) -> DiffResult:
         """Analyze content changes."""
         # Check if only frontmatter changed
-        old_content = self._extract_body(old_page.content)
-        new_content = self._extract_body(new_page.content)
+        old_content = self._extract_body(old_page.load_content())
+        new_content = self._extract_body(new_page.load_content())
 
         if old_content == new_content:
             return DiffResult(
@@ -29,6 +29,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from bengal.assets.manifest import AssetManifest
+from bengal.cache.output_gate import get_output_gate, record_write
 from bengal.orchestration.utils.errors import is_shutdown_error
 from bengal.orchestration.utils.parallel import BatchProgressUpdater
 from bengal.utils.concurrency.workers import WorkloadType, get_optimal_workers
@@ -38,6 +39,7 @@ from bengal.utils.paths.normalize import to_posix
 logger = get_logger(__name__)
 
 if TYPE_CHECKING:
+    from bengal.assets.css_purge import CSSPurger
     from bengal.core.asset import Asset
     from bengal.core.output import OutputCollector
     from bengal.core.site import Site
@@ -95,6 +97,8 @@ class AssetOrchestrator:
         self._cached_assets_len: int | None = None
         # Output collector for hot reload tracking (set during process())
         self._collector: OutputCollector | None = None
+        # Unused-selector purge for CSS entries (set during process() when enabled)
+        self.css_purger: CSSPurger | None = None
 
     def _get_site_css_entries_cached(self) -> list[Asset]:
         """
@@ -158,8 +162,13 @@ class AssetOrchestrator:
         if not isinstance(output_path, Path):
             return
 
-        # Record using auto-detection from extension
-        self._collector.record(output_path, phase="asset")
+        # Record using auto-detection from extension; untouched outputs as unchanged
+        record_write(
+            self._collector,
+            output_path,
+            getattr(asset, "_output_written", True),
+            phase="asset",
+        )
 
     def process(
         self,
@@ -184,6 +193,10 @@ class AssetOrchestrator:
         # Store collector for use by _process_* methods
         self._collector = collector
 
+        from bengal.assets.css_purge import CSSPurger
+
+        self.css_purger = CSSPurger.for_site(self.site, self)
+
         # Optional Node-based pipeline: compile SCSS/PostCSS and bundle JS/TS first
         try:
             from bengal.assets.pipeline import from_site as pipeline_from_site
@@ -765,15 +778,20 @@ class AssetOrchestrator:
             # Store bundled content for minification
             css_entry._bundled_content = bundled_css
 
-            # Step 2: Minify (if enabled)
-            if minify:
+            # Step 2: Minify (if enabled); purging also minifies
+            purged = self.css_purger.purge(bundled_css) if self.css_purger is not None else None
+            if purged is not None:
+                css_entry._minified_content = purged
+            elif minify:
                 css_entry.minify()
             else:
                 # Use bundled content as-is
                 css_entry._minified_content = bundled_css
 
             # Step 3: Output to public directory
-            css_entry.copy_to_output(assets_output, use_fingerprint=fingerprint)
+            css_entry.copy_to_output(
+                assets_output, use_fingerprint=fingerprint, gate=get_output_gate(self.site)
+            )
 
             # Record output for hot reload tracking
             self._record_asset_output(css_entry)
@@ -818,7 +836,9 @@ class AssetOrchestrator:
             if optimize and asset.asset_type == "image":
                 asset.optimize()
 
-            asset.copy_to_output(assets_output, use_fingerprint=fingerprint)
+            asset.copy_to_output(
+                assets_output, use_fingerprint=fingerprint, gate=get_output_gate(self.site)
+            )
 
             # Record output for hot reload tracking
             self._record_asset_output(asset)
@@ -872,32 +892,81 @@ class AssetOrchestrator:
                         manifest.add_entry(entry)
 
         for asset in assets:
-            final_path = getattr(asset, "output_path", None)
-            if not isinstance(final_path, Path):
-                continue
-            if not final_path.is_absolute():
-                continue
-            if not final_path.exists():
-                continue
-            try:
-                relative_output = final_path.relative_to(self.site.output_dir)
-            except ValueError:
-                continue
+            self._set_manifest_entry(manifest, asset)
 
-            logical = asset.logical_path or Path(asset.source_path.name)
-            logical_str = (
-                logical.as_posix() if isinstance(logical, Path) else Path(str(logical)).as_posix()
-            )
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        manifest.write(manifest_path)
 
-            stat = final_path.stat()
-            manifest.set_entry(
-                logical_path=logical_str,
-                output_path=relative_output.as_posix(),
-                fingerprint=asset.fingerprint,
-                size_bytes=stat.st_size,
-                updated_at=stat.st_mtime,
-                provenance=asset.manifest_provenance,
-            )
+    def _set_manifest_entry(self, manifest: AssetManifest, asset: Asset) -> str | None:
+        """Record ``asset``'s written output in ``manifest``; returns its relative path."""
+        final_path = getattr(asset, "output_path", None)
+        if not isinstance(final_path, Path):
+            return None
+        if not final_path.is_absolute():
+            return None
+        if not final_path.exists():
+            return None
+        try:
+            relative_output = final_path.relative_to(self.site.output_dir)
+        except ValueError:
+            return None
+
+        logical = asset.logical_path or Path(asset.source_path.name)
+        logical_str = (
+            logical.as_posix() if isinstance(logical, Path) else Path(str(logical)).as_posix()
+        )
+
+        stat = final_path.stat()
+        manifest.set_entry(
+            logical_path=logical_str,
+            output_path=relative_output.as_posix(),
+            fingerprint=asset.fingerprint,
+            size_bytes=stat.st_size,
+            updated_at=stat.st_mtime,
+            provenance=asset.manifest_provenance,
+        )
+        return relative_output.as_posix()
+
+    def reprocess_css_entries(
+        self, collector: OutputCollector | None = None
+    ) -> list[tuple[str, str]]:
+        """
+        Re-bundle every CSS entry point after the purge inventory changed.
+
+        Runs after rendering, so the manifest is updated in place (not rebuilt
+        from the entries alone) and each superseded fingerprinted file removed.
+
+        Args:
+            collector: Optional output collector for hot reload tracking
+
+        Returns:
+            ``(old, new)`` output paths, relative to the output directory, for
+            entries whose filename changed
+        """
+        assets_cfg = self.site.config_service.assets_config
+        minify = assets_cfg.get("minify", self.site.config.get("minify_assets", True))
+        fingerprint = assets_cfg.get(
+            "fingerprint", self.site.config.get("fingerprint_assets", True)
+        )
+        manifest_path = self.site.output_dir / "asset-manifest.json"
+        manifest = AssetManifest.load(manifest_path) or AssetManifest()
+
+        moved: list[tuple[str, str]] = []
+        self._collector = collector
+        try:
+            for entry in self._get_site_css_entries_cached():
+                logical = entry.logical_path or Path(entry.source_path.name)
+                previous = manifest.get(to_posix(logical))
+                entry.fingerprint = None
+                self._process_css_entry(entry, minify, False, fingerprint)
+                current = self._set_manifest_entry(manifest, entry)
+                if previous is None or current is None or previous.output_path == current:
+                    continue
+                moved.append((previous.output_path, current))
+                (self.site.output_dir / previous.output_path).unlink(missing_ok=True)
+        finally:
+            self._collector = None
 
         manifest_path.parent.mkdir(parents=True, exist_ok=True)
         manifest.write(manifest_path)
+        return moved
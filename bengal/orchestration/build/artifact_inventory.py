@@ -60,9 +60,12 @@ def populate_artifact_inventory(site: Any, build_context: Any | None) -> None:
         _record_output_format_artifacts(site, collector, output_config, seen)
 
     output_dir = site.output_dir
-    _record_existing(
-        collector, site, output_dir / "sitemap.xml", OutputType.XML, "postprocess", seen
-    )
+    for path in (
+        output_dir / "sitemap.xml",
+        output_dir / "sitemap_index.xml",
+        *sorted(output_dir.glob("sitemap-*.xml")),
+    ):
+        _record_existing(collector, site, path, OutputType.XML, "postprocess", seen)
     _record_existing(
         collector, site, output_dir / "robots.txt", OutputType.ASSET, "postprocess", seen
     )
@@ -80,6 +80,11 @@ def phase_sections(
             orchestrator.logger.info("section_finalization_skipped", reason="no_affected_sections")
 
 
+def _deleted_sources(orchestrator: BuildOrchestrator) -> dict[str, set[str]]:
+    """Cache key -> previous tags for sources deleted since the last build."""
+    return getattr(orchestrator.incremental, "deleted_sources", None) or {}
+
+
 def phase_taxonomies(
     orchestrator: BuildOrchestrator,
     cache: BuildCache,
@@ -122,6 +127,18 @@ def phase_taxonomies(
                 pages_to_build, cache
             )
 
+            # Deleted pages are not in pages_to_build; the term pages that
+            # listed them still need to drop them
+            deleted_tags = {
+                normalize_taxonomy_slug(tag)
+                for tags in _deleted_sources(orchestrator).values()
+                for tag in tags
+                if tag is not None
+            } - affected_tags
+            if deleted_tags:
+                orchestrator.taxonomy.regenerate_tags_from_cache(deleted_tags, cache)
+                affected_tags |= deleted_tags
+
             # RFC: rfc-incremental-build-dependency-gaps - Phase 2
             # METADATA CASCADE: When a page's metadata (title, date, summary) changes,
             # taxonomy pages that list it must be rebuilt even if tags didn't change.
@@ -382,6 +399,13 @@ def phase_query_indexes(
         query_indexes_start = time.time()
 
         if incremental and pages_to_build:
+            deleted_paths = [
+                str((orchestrator.site.root_path / key).resolve())
+                for key in _deleted_sources(orchestrator)
+            ]
+            if deleted_paths:
+                orchestrator.site.indexes.remove_pages(deleted_paths)
+
             # Incremental: only update affected indexes
             affected_keys = orchestrator.site.indexes.update_incremental(
                 pages_to_build,
@@ -419,11 +443,13 @@ def phase_update_pages_list(
     pages_to_build: list[Any],
     affected_tags: set[str],
     generated_page_cache: GeneratedPageCache | None = None,
+    affected_sections: set[str] | None = None,
 ) -> list[Any]:
     """
     Phase 12: Update Pages List.
 
-    Updates the pages_to_build list to include newly generated taxonomy pages.
+    Updates the pages_to_build list to include newly generated taxonomy pages
+    and the generated list pages of affected sections.
 
     Handles metadata cascade: when a page's title/date/summary changes, taxonomy
     pages that list it must be rebuilt to show updated content.
@@ -438,6 +464,8 @@ def phase_update_pages_list(
         pages_to_build: Current list of pages to build
         affected_tags: Set of affected tag slugs
         generated_page_cache: GeneratedPageCache for skipping unchanged tag pages
+        affected_sections: Section paths affected by changes (incremental); their
+            generated list pages are rebuilt
 
     Returns:
         Updated pages_to_build list including generated taxonomy pages
@@ -545,6 +573,12 @@ def phase_update_pages_list(
                     )
                 elif cache and hasattr(cache, "invalidate_rendered_output"):
                     cache.invalidate_rendered_output(page.source_path)
+        elif incremental and affected_sections and page.metadata.get("_section") is not None:
+            # Generated section list pages (and their pagination) list the
+            # section's pages; rebuild them when that section was affected
+            section_path = getattr(page.metadata["_section"], "path", None)
+            if section_path is not None and str(section_path) in affected_sections:
+                pages_to_build_set.add(page)
 
     # Log cache effectiveness
     if skipped_by_cache > 0:
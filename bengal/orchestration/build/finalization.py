@@ -64,6 +64,18 @@ def phase_postprocess(
 
         orchestrator.stats.postprocess_time_ms = (time.time() - postprocess_start) * 1000
 
+        # Persist output hashes for skip-unchanged writes (render + postprocess done)
+        build_state = orchestrator.site.build_state
+        gate = build_state.output_gate if build_state is not None else None
+        if gate is not None:
+            gate.save()
+            orchestrator.logger.debug(
+                "unchanged_outputs_skipped",
+                written=gate.written,
+                unchanged=gate.unchanged,
+                bytes_saved=gate.bytes_saved,
+            )
+
         # Phase 3: Drain asset fallback aggregator (render + postprocess complete)
         from bengal.rendering.assets import drain_asset_fallback_aggregator
 
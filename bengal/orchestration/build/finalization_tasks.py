@@ -67,7 +67,7 @@ def default_finalization_task_specs() -> tuple[FinalizationTaskSpec, ...]:
             blocks_complete=True,
             blocks_serve_ready=False,
             failure_policy=FinalizationFailurePolicy.WARN,
-            outputs=("sitemap.xml",),
+            outputs=("sitemap.xml", "sitemap_index.xml"),
         ),
         FinalizationTaskSpec(
             name="robots",
@@ -162,6 +162,7 @@ def _run_content_group(session: BuildSession) -> None:
         pages_to_build,
         session.affected_tags,
         generated_page_cache=session.generated_page_cache,
+        affected_sections=session.affected_sections,
     )
 
     # Phase 12.25: Variant filter (params.edition for multi-variant builds)
@@ -75,6 +75,7 @@ class OutputType(Enum):
 OUTPUT_PATTERNS: dict[str, OutputType] = {
     # Aggregates (always regenerate, but hash content)
     "sitemap.xml": OutputType.AGGREGATE_FEED,
+    "sitemap_index.xml": OutputType.AGGREGATE_FEED,
     "rss.xml": OutputType.AGGREGATE_FEED,
     "atom.xml": OutputType.AGGREGATE_FEED,
     "index.json": OutputType.AGGREGATE_INDEX,
@@ -135,6 +136,10 @@ def classify_output(path: Path, metadata: dict[str, Any] | None = None) -> Outpu
     if name in OUTPUT_PATTERNS:
         return OUTPUT_PATTERNS[name]
 
+    # Sitemap shards (sitemap-<section>-N.xml) written for large sites
+    if name.startswith("sitemap-") and name.endswith(".xml"):
+        return OutputType.AGGREGATE_FEED
+
     # Check metadata for generated pages
     if metadata and metadata.get("_generated"):
         return OutputType.GENERATED_PAGE
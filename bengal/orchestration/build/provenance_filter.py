@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import os
 import time
+from dataclasses import replace
 from typing import TYPE_CHECKING, cast
 
 from bengal.build.provenance import ProvenanceCache, ProvenanceFilter
@@ -46,6 +47,10 @@ from bengal.build.provenance.lookups import (
 from bengal.build.provenance.lookups import (
     get_taxonomy_term_pages_for_member as _get_taxonomy_term_pages_for_member,
 )
+from bengal.build.provenance.lookups import (
+    log_incremental_fallback,
+)
+from bengal.build.provenance.structural import apply_structural_cascade
 from bengal.orchestration.build.results import (
     FilterResult,
     IncrementalDecision,
@@ -350,6 +355,36 @@ def phase_incremental_filter_provenance(
 
         result = apply_taxonomy_cascade(result, pages_list, incremental, dependency_reasons)
 
+        if incremental:
+            result, structural_fallback = apply_structural_cascade(
+                result,
+                site_like,
+                pages_list,
+                provenance_cache,
+                cache,
+                orchestrator.incremental.deleted_sources,
+                dependency_reasons,
+            )
+            if structural_fallback is not None:
+                log_incremental_fallback(structural_fallback, kind="structural")
+                # Every section is affected: keep finalization (new section
+                # archives) and generated list pages in the rebuild
+                result = replace(
+                    provenance_filter.filter(
+                        pages=list(site.pages),
+                        assets=list(site.assets),
+                        incremental=False,
+                    ),
+                    affected_tags=result.affected_tags,
+                    affected_sections={
+                        str(section.path)
+                        for top in site.sections
+                        for section in top.walk()
+                        if section.path is not None
+                    },
+                    changed_page_paths=result.changed_page_paths,
+                )
+
         if site.sections and len(site.cascade) == 0:
             logger.warning(
                 "cascade_snapshot_empty_after_discovery",
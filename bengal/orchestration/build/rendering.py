@@ -217,6 +217,48 @@ def _optimize_css(
         )
 
 
+def _generate_image_variants(
+    orchestrator: BuildOrchestrator,
+    assets: list[Asset],
+    incremental: bool,
+    collector: OutputCollector | None = None,
+) -> None:
+    """
+    Generate responsive image variants for processed raster assets.
+
+    Opt-in via ``assets.responsive_images``. Failures are logged and leave
+    templates falling back to the original image.
+
+    Args:
+        orchestrator: Build orchestrator instance
+        assets: Assets processed this build (fingerprinted output paths set)
+        incremental: Whether this is an incremental build (keeps index entries
+            for images that were not reprocessed)
+        collector: Optional output collector; variants are recorded as
+            written or unchanged
+
+    """
+    from bengal.assets.image_variants import (
+        ImageVariantPipeline,
+        parse_responsive_images_config,
+    )
+
+    site = orchestrator.site
+    config = parse_responsive_images_config(site.config_service.assets_config)
+    if not config.enabled:
+        return
+
+    try:
+        ImageVariantPipeline(site, config).run(assets, full=not incremental, collector=collector)
+    except Exception as e:
+        orchestrator.logger.warning(
+            "image_variants_failed",
+            error=str(e),
+            error_type=type(e).__name__,
+            action="using_original_images",
+        )
+
+
 def _rewrite_fonts_css_urls(orchestrator: BuildOrchestrator) -> None:
     """
     Rewrite fonts.css to use fingerprinted font filenames.
@@ -322,6 +364,9 @@ def phase_assets(
             assets_to_process, parallel=parallel, progress_manager=None, collector=collector
         )
 
+        # Responsive image variants need fingerprinted outputs and must exist before render
+        _generate_image_variants(orchestrator, assets_to_process, incremental, collector)
+
         # Rewrite fonts.css to use fingerprinted font filenames
         # This must happen after asset fingerprinting is complete
         if "fonts" in orchestrator.site.config:
@@ -600,12 +645,16 @@ def phase_render(
                 # Transfer cached content from early context (build-integrated validation)
                 if early_context and early_context.has_cached_content:
                     ctx._page_contents = early_context._page_contents
+                    ctx._page_content_sources = early_context._page_content_sources
+                    ctx._page_content_bytes = early_context._page_content_bytes
+                    ctx.content_cache_max_bytes = early_context.content_cache_max_bytes
                 # Transfer incremental state (changed pages) for validators.
                 if early_context is not None:
                     ctx.changed_page_paths = set(
                         getattr(early_context, "changed_page_paths", set())
                     )
                 ctx.asset_manifest_ctx = asset_ctx  # For postprocess (special pages)
+                ctx.css_purger = getattr(orchestrator.assets, "css_purger", None)
                 # Compute parallel mode: use should_parallelize() unless force_sequential=True
                 from bengal.utils.concurrency.workers import WorkloadType, should_parallelize
 
@@ -640,6 +689,9 @@ def phase_render(
                 # Transfer cached content from early context (build-integrated validation)
                 if early_context and early_context.has_cached_content:
                     ctx._page_contents = early_context._page_contents
+                    ctx._page_content_sources = early_context._page_content_sources
+                    ctx._page_content_bytes = early_context._page_content_bytes
+                    ctx.content_cache_max_bytes = early_context.content_cache_max_bytes
                 # Transfer incremental state (changed pages) for validators.
                 if early_context is not None:
                     ctx.changed_page_paths = set(
@@ -650,6 +702,7 @@ def phase_render(
                     ctx.snapshot = early_context.snapshot
 
                 ctx.asset_manifest_ctx = asset_ctx  # For postprocess (special pages)
+                ctx.css_purger = getattr(orchestrator.assets, "css_purger", None)
 
                 # Compute parallel mode: use should_parallelize() unless force_sequential=True
                 from bengal.utils.concurrency.workers import WorkloadType, should_parallelize
@@ -704,9 +757,16 @@ def phase_render(
                     block_cache = create_and_warm_block_cache(orchestrator.site)
 
                     # Create write-behind collector for async I/O (RFC: rfc-path-to-200-pgs)
+                    from bengal.cache.output_gate import get_output_gate
                     from bengal.rendering.pipeline.write_behind import WriteBehindCollector
 
-                    write_behind = WriteBehindCollector() if use_parallel else None
+                    write_behind = (
+                        WriteBehindCollector(
+                            site=orchestrator.site, gate=get_output_gate(orchestrator.site)
+                        )
+                        if use_parallel
+                        else None
+                    )
                     ctx.write_behind = write_behind
 
                     scheduler = WaveScheduler(
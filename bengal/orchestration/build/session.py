@@ -304,13 +304,14 @@ def prepare_build_session(
     orchestrator.site._cache = orchestrator.incremental.cache
     orchestrator._last_build_options = options
 
-    from bengal.orchestration.build_context import BuildContext
+    from bengal.orchestration.build_context import BuildContext, source_cache_max_bytes
     from bengal.utils.concurrency.executor import CancellationToken
 
     early_ctx = BuildContext(
         site=orchestrator.site,
         stats=orchestrator.stats,
         cancellation_token=CancellationToken(timeout=300.0),
+        content_cache_max_bytes=source_cache_max_bytes(orchestrator.site.config),
     )
     early_ctx.cache = orchestrator.incremental.cache
 
@@ -32,7 +32,7 @@ from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from pathlib import Path
 
     from bengal.analysis.graph.knowledge_graph import KnowledgeGraph
@@ -56,6 +56,22 @@ if TYPE_CHECKING:
     from bengal.utils.observability.cli_progress import LiveProgressManager
     from bengal.utils.observability.profile import BuildProfile
 
+# Default budget for discovery-time source text kept for validators
+DEFAULT_SOURCE_CACHE_MAX_MB = 128
+
+
+def source_cache_max_bytes(config: Any) -> int:
+    """Budget for ``BuildContext.cache_content`` from ``build.source_cache_max_mb``."""
+    build_cfg = (config.get("build", {}) if config else {}) or {}
+    if not isinstance(build_cfg, dict):
+        build_cfg = {}
+    try:
+        max_mb = float(build_cfg.get("source_cache_max_mb", DEFAULT_SOURCE_CACHE_MAX_MB))
+    except TypeError, ValueError:
+        max_mb = DEFAULT_SOURCE_CACHE_MAX_MB
+    # 0 keeps nothing resident: validators re-read every file
+    return int(max(max_mb, 0) * 1024 * 1024)
+
 
 @dataclass
 class AccumulatedPageData:
@@ -235,6 +251,14 @@ class BuildContext:
     # Set during phase_render bootstrap, reused in postprocess (Plan: asset-manifest-context-refactor)
     asset_manifest_ctx: AssetManifestContext | None = None
 
+    # An engine created by a render pipeline this build, kept for post-render
+    # template queries (incremental template deps) so they need no second engine
+    render_template_engine: Any = None
+
+    # Unused-selector purge state (bengal.assets.css_purge.CSSPurger) when
+    # assets.purge_css is enabled; render harvests selectors into this context
+    css_purger: Any = None
+
     # Services — instantiated from snapshot after creation (RFC: bengal-v2-architecture)
     # These provide O(1) lookups on immutable data for thread-safe rendering.
     query_service: QueryService | None = None
@@ -269,8 +293,13 @@ class BuildContext:
     # Content cache - populated during discovery, shared by validators
     # Eliminates redundant disk I/O during health checks (4s+ → <100ms)
     # See: plan/active/rfc-build-integrated-validation.md
+    # Bounded by content_cache_max_bytes: the oldest entries are evicted and
+    # re-read from disk on demand, so a large site's text is not held twice
     _page_contents: dict[str, str] = field(default_factory=dict, repr=False)
+    _page_content_sources: set[str] = field(default_factory=set, repr=False)
+    _page_content_bytes: int = field(default=0, repr=False)
     _content_cache_lock: Lock = field(default_factory=Lock, repr=False)
+    content_cache_max_bytes: int = DEFAULT_SOURCE_CACHE_MAX_MB * 1024 * 1024
 
     # Accumulated Asset Dependencies (Inline Asset Extraction)
     # Eliminates double iteration in phase_track_assets (saves ~5-6s on large sites)
@@ -278,6 +307,10 @@ class BuildContext:
     _accumulated_assets: list[tuple[Path, set[str]]] = field(default_factory=list, repr=False)
     _accumulated_assets_lock: Lock = field(default_factory=Lock, repr=False)
 
+    # Selector tokens harvested from rendered HTML (only when css_purger is set)
+    _accumulated_selectors: set[str] = field(default_factory=set, repr=False)
+    _accumulated_selectors_lock: Lock = field(default_factory=Lock, repr=False)
+
     # Unified Page Data Accumulation
     # Populated during rendering, consumed by PageJSONGenerator and SiteIndexGenerator
     # Eliminates redundant computation and double page iteration (~350ms savings)
@@ -355,6 +388,7 @@ class BuildContext:
         self._knowledge_graph = None
         self.clear_content_cache()
         self.clear_accumulated_assets()
+        self.clear_accumulated_selectors()
         self.clear_accumulated_page_data()
         self.clear_build_scoped_cache()
 
@@ -547,18 +581,43 @@ class BuildContext:
             if build_context:
                 build_context.cache_content(file_path, content)
         """
+        key = str(source_path)
+        size = len(content)
         with self._content_cache_lock:
-            self._page_contents[str(source_path)] = content
+            self._page_content_sources.add(key)
+            previous = self._page_contents.pop(key, None)
+            if previous is not None:
+                self._page_content_bytes -= len(previous)
+            if size > self.content_cache_max_bytes:
+                return
+            self._page_contents[key] = content
+            self._page_content_bytes += size
+            # Oldest first; dicts keep insertion order
+            while self._page_content_bytes > self.content_cache_max_bytes:
+                oldest = next(iter(self._page_contents))
+                self._page_content_bytes -= len(self._page_contents.pop(oldest))
+
+    def note_content_source(self, source_path: Path) -> None:
+        """
+        Record a discovered file whose text was not read (deferred bodies).
+
+        ``get_content`` reads it from disk on demand.
+        """
+        with self._content_cache_lock:
+            self._page_content_sources.add(str(source_path))
 
     def get_content(self, source_path: Path) -> str | None:
         """
-        Get cached content without disk I/O.
+        Get content cached during discovery.
+
+        Files evicted to stay within ``content_cache_max_bytes`` are re-read
+        from disk (and not re-cached); validators see no difference.
 
         Args:
             source_path: Path to source file
 
         Returns:
-            Cached content string, or None if not cached
+            Content string, or None if the file was never cached (or is gone)
 
         Example:
             # In validator
@@ -566,14 +625,27 @@ class BuildContext:
             if content is None:
                 content = page.source_path.read_text()  # Fallback
         """
+        key = str(source_path)
         with self._content_cache_lock:
-            return self._page_contents.get(str(source_path))
+            content = self._page_contents.get(key)
+            if content is not None or key not in self._page_content_sources:
+                return content
+
+        from bengal.utils.io.file_io import read_text_file
+
+        try:
+            return read_text_file(
+                key, fallback_encoding="latin-1", on_error="raise", caller="build_context"
+            )
+        except OSError:
+            return None
 
     def get_all_cached_contents(self) -> dict[str, str]:
         """
-        Get a copy of all cached contents for batch processing.
+        Get a copy of all resident cached contents for batch processing.
 
-        Returns a copy to avoid thread safety issues when iterating.
+        Returns a copy to avoid thread safety issues when iterating. Evicted
+        files are not included; use ``get_content`` for those.
 
         Returns:
             Dictionary mapping source path strings to content
@@ -596,14 +668,20 @@ class BuildContext:
         """
         with self._content_cache_lock:
             self._page_contents.clear()
+            self._page_content_sources.clear()
+            self._page_content_bytes = 0
+
+        from bengal.content.discovery.deferred_body import clear_body_cache
+
+        clear_body_cache()
 
     @property
     def content_cache_size(self) -> int:
         """
-        Get number of cached content entries.
+        Get number of resident cached content entries.
 
         Returns:
-            Number of files with cached content
+            Number of files whose content is held in memory
         """
         with self._content_cache_lock:
             return len(self._page_contents)
@@ -616,10 +694,10 @@ class BuildContext:
         Validators can use this to decide whether to use cache or fallback.
 
         Returns:
-            True if cache has content
+            True if cache has content (resident or evicted)
         """
         with self._content_cache_lock:
-            return len(self._page_contents) > 0
+            return bool(self._page_contents or self._page_content_sources)
 
     # =========================================================================
     # Accumulated Asset Dependencies (Inline Asset Extraction)
@@ -669,6 +747,21 @@ class BuildContext:
         with self._accumulated_assets_lock:
             self._accumulated_assets.clear()
 
+    def accumulate_selectors(self, tokens: Iterable[str]) -> None:
+        """Add selector tokens harvested from rendered HTML (thread-safe)."""
+        with self._accumulated_selectors_lock:
+            self._accumulated_selectors.update(tokens)
+
+    def get_accumulated_selectors(self) -> frozenset[str]:
+        """Selector tokens harvested so far this build."""
+        with self._accumulated_selectors_lock:
+            return frozenset(self._accumulated_selectors)
+
+    def clear_accumulated_selectors(self) -> None:
+        """Clear harvested selector tokens."""
+        with self._accumulated_selectors_lock:
+            self._accumulated_selectors.clear()
+
     # =========================================================================
     # Unified Page Data Accumulation (JSON + Index)
     # =========================================================================
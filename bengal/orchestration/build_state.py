@@ -79,6 +79,7 @@ class BuildState:
         template_metadata_cache: Cached template metadata
         asset_manifest_previous: Previous manifest for incremental comparison
         asset_manifest_fallbacks: Set of fallback warnings already emitted
+        output_gate: Skip-unchanged output gate (see bengal.cache.output_gate)
 
     """
 
@@ -115,6 +116,10 @@ class BuildState:
     asset_manifest_previous: Any = None
     asset_manifest_fallbacks: set[str] = field(default_factory=set)
 
+    # Skip-unchanged output writes: one OutputWriteGate per build, created on
+    # first use by get_output_gate() and saved after postprocess
+    output_gate: Any = None
+
     # Thread-safe locks - guarded by _locks_guard for atomic creation
     _locks: dict[str, Lock] = field(default_factory=dict)
     _locks_guard: Lock = field(default_factory=Lock)
@@ -363,11 +363,15 @@ class CacheManager:
         pages_built: Sequence[PageLike],
         build_context: Any | None,
     ) -> None:
-        """Record primary template (+ engine chain) for incremental invalidation.
+        """Record each page's template chain for incremental invalidation.
 
         Uses ``PagePlan.template_name`` as the cache key when
         ``build_context.build_plan`` contains this page. Leftover
         ``determine_template(page)`` still runs when there is no plan.
+
+        The recorded set is transitive (extends/includes/imports of every
+        template in the chain), so editing a partial nested several includes
+        deep maps back to exactly the pages that render it.
         """
         if not self.cache:
             return
@@ -375,29 +379,66 @@ class CacheManager:
         from bengal.rendering.pipeline.output import determine_template
 
         plan = getattr(build_context, "build_plan", None) if build_context is not None else None
+        chains: dict[str, frozenset[str]] = {}
+        engine: Any = None
 
         for page in pages_built:
             try:
                 primary_template = determine_template(page, build_plan=plan)
-                template_names: set[str] = {primary_template}
-
-                try:
-                    from bengal.rendering.template_engine import get_engine
-
-                    engine = get_engine(self.site)
-                    if hasattr(engine, "_env"):
-                        tpl = engine._env.get_template(primary_template)
-                        if hasattr(tpl, "dependencies"):
-                            deps = tpl.dependencies()
-                            for key in ("extends", "includes", "embeds", "imports"):
-                                template_names.update(deps.get(key, []))
-                except Exception:
-                    logger.debug("template_deps_engine_query_failed", page=str(page.source_path))
-
-                self.cache.record_page_templates(str(page.source_path), frozenset(template_names))
+                template_names = chains.get(primary_template)
+                if template_names is None:
+                    if engine is None:
+                        engine = self._template_engine_for_deps(build_context)
+                    template_names = self._template_chain(engine, primary_template)
+                    chains[primary_template] = template_names
+
+                self.cache.record_page_templates(str(page.source_path), template_names)
             except Exception:
                 logger.debug("template_deps_resolution_failed", page=str(page.source_path))
 
+    def _template_engine_for_deps(self, build_context: Any | None) -> Any:
+        """Template engine used to resolve template chains (False when unavailable).
+
+        Reuses the render phase's engine. Only when no pipeline rendered in
+        this process (isolated render workers) is a new one created, and the
+        directive renderer it registers on the site is put back.
+        """
+        for name in ("template_engine", "render_template_engine"):
+            engine = getattr(build_context, name, None) if build_context is not None else None
+            if engine is not None:
+                return engine
+        previous = getattr(self.site, "_directive_template_renderer", None)
+        try:
+            from bengal.rendering.engines import create_engine
+
+            return create_engine(self.site)
+        except Exception:
+            logger.debug("template_deps_engine_unavailable")
+            return False
+        finally:
+            if previous is not None:
+                self.site._directive_template_renderer = previous
+
+    @staticmethod
+    def _template_chain(engine: Any, primary_template: str) -> frozenset[str]:
+        """Primary template plus every template it references, transitively when supported."""
+        template_names: set[str] = {primary_template}
+        if not engine:
+            return frozenset(template_names)
+        try:
+            referenced = getattr(engine, "_get_referenced_template_names", None)
+            if callable(referenced):
+                template_names.update(referenced(primary_template))
+            elif hasattr(engine, "_env"):
+                tpl = engine._env.get_template(primary_template)
+                if hasattr(tpl, "dependencies"):
+                    deps = tpl.dependencies()
+                    for key in ("extends", "includes", "embeds", "imports"):
+                        template_names.update(deps.get(key, []))
+        except Exception:
+            logger.debug("template_deps_engine_query_failed", template=primary_template)
+        return frozenset(template_names)
+
     def _store_page_artifacts(self, build_context: Any | None) -> None:
         """Persist post-render page artifacts accumulated during rendering."""
         if not self.cache or build_context is None:
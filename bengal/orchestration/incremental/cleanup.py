@@ -115,6 +115,8 @@ def cleanup_deleted_files(site: Site, cache: BuildCache) -> int:
         if source_path_str in cache.file_fingerprints:
             del cache.file_fingerprints[source_path_str]
         if source_path_str in cache.taxonomy_index.page_tags:
+            # Drop the page from tag -> pages as well so emptied tags are forgotten
+            cache.taxonomy_index.update_page_tags(source_path_str, set())
             del cache.taxonomy_index.page_tags[source_path_str]
         if source_path_str in cache.parsed_content:
             del cache.parsed_content[source_path_str]
@@ -77,6 +77,7 @@ class IncrementalOrchestrator:
         effect_tracer: EffectTracer for effect-based dependency tracking
         _cache_manager: CacheManager instance for cache operations
         _detector: EffectBasedDetector instance for change detection
+        deleted_sources: Cache key -> previous tags for sources deleted since the last build
 
     Example:
             >>> orchestrator = IncrementalOrchestrator(site)
@@ -101,6 +102,8 @@ class IncrementalOrchestrator:
         self._cache_manager = CacheManager(site)
         self._detector: EffectBasedDetector | None = None
         self._dependency_index: DependencyReadIndex | None = None
+        # Cache key -> previous tags for sources removed since the last build
+        self.deleted_sources: dict[str, set[str]] = {}
 
     def initialize(self, enabled: bool = False) -> BuildCache:
         """
@@ -731,9 +734,22 @@ class IncrementalOrchestrator:
         """Full rebuild placeholder (unused)."""
 
     def _cleanup_deleted_files(self) -> None:
-        """Clean up output files for deleted source files."""
+        """
+        Clean up output files for deleted source files.
+
+        Records the removed sources and their previous tags in
+        ``deleted_sources`` so the structural cascade can re-render the
+        pages that listed or linked to them.
+        """
+        self.deleted_sources = {}
         if self.cache:
+            tracked = set(self.cache.output_sources.values())
+            previous_tags = {
+                key: set(tags) for key, tags in self.cache.taxonomy_index.page_tags.items()
+            }
             cleanup_deleted_files(self.site, self.cache)
+            for source in tracked - set(self.cache.output_sources.values()):
+                self.deleted_sources[source] = previous_tags.get(source, set())
 
     def save_cache(
         self,
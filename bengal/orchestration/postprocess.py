@@ -41,6 +41,7 @@ if TYPE_CHECKING:
     from bengal.utils.observability.cli_progress import LiveProgressManager
 
 from bengal.postprocess.output_formats import OutputFormatsGenerator
+from bengal.postprocess.precompress import OutputCompressor, parse_precompress_config
 from bengal.postprocess.redirects import RedirectGenerator
 from bengal.postprocess.robots_txt import RobotsTxtGenerator
 from bengal.postprocess.rss import AtomGenerator, RSSGenerator
@@ -277,6 +278,32 @@ class PostprocessOrchestrator:
         if social_cards_task is not None:
             self._run_sequential([("social cards", social_cards_task)], progress_manager, reporter)
 
+        # Unused-selector purge: re-purge theme CSS when this build's pages use
+        # selectors the assets phase purged away. Needs every HTML output (special
+        # pages included) and must precede compression, which hashes the CSS.
+        css_purger = getattr(build_context, "css_purger", None)
+        if css_purger is not None:
+            self._run_sequential(
+                [
+                    (
+                        "css purge",
+                        lambda: css_purger.reconcile(
+                            build_context, incremental=incremental, collector=collector
+                        ),
+                    )
+                ],
+                progress_manager,
+                reporter,
+            )
+
+        # Compression runs last so every output exists. It is not gated by
+        # enabled_task_names: a skipped run would leave stale sidecars behind,
+        # and precompressed static servers prefer sidecars over the original.
+        if parse_precompress_config(self.site.config).enabled:
+            self._run_sequential(
+                [("precompress", self._precompress_outputs)], progress_manager, reporter
+            )
+
     def _record_task_timing(self, task_name: str, duration_ms: float) -> None:
         """Record postprocess task timing when build stats are available."""
         stats = getattr(self, "_stats", None)
@@ -566,6 +593,51 @@ class PostprocessOrchestrator:
         generator = RedirectGenerator(self.site, collector=collector)
         generator.generate()
 
+    def _precompress_outputs(self) -> None:
+        """
+        Write .gz/.br/.zst sidecars for text outputs that changed.
+
+        Only files this build reported to the collector, plus those already
+        registered, are checked; registered files are skipped on a matching
+        size/mtime stamp without being read.
+        """
+        from bengal.cache.content_hash_registry import ContentHashRegistry
+        from bengal.output import get_cli_output
+
+        config = parse_precompress_config(self.site.config)
+        registry_path = self.site.config_service.paths.precompress_registry
+        registry = ContentHashRegistry.load(registry_path)
+
+        report = OutputCompressor(config, registry).run(
+            self.site.output_dir, collector=getattr(self, "_collector", None)
+        )
+        registry.save(registry_path)
+
+        saved = {
+            output_type: {fmt: report.bytes_saved(output_type, fmt) for fmt in config.formats}
+            for output_type in sorted(report.by_type)
+        }
+        logger.info(
+            "precompress_complete",
+            compressed=report.compressed,
+            unchanged=report.unchanged,
+            orphans_removed=report.removed,
+            bytes_saved=saved,
+            errors=len(report.errors),
+        )
+        for error in report.errors[:5]:
+            logger.warning("precompress_failed", error=error)
+
+        if report.compressed:
+            fmt = config.formats[0]
+            cli = get_cli_output()
+            cli.detail(
+                f"Compressed: {report.compressed}, Unchanged: {report.unchanged}, "
+                f"{fmt} saved {report.bytes_saved(fmt=fmt) // 1024} KiB",
+                indent=1,
+                icon=cli.icons.tree_end,
+            )
+
     def _generate_social_cards(self, build_context: BuildContext | None = None) -> None:
         """
         Generate social card (Open Graph) images for pages.
@@ -104,9 +104,10 @@ class ProcessCoordinatorMixin:
         write_behind = None
         use_parallel = parallel  # Already computed in phase_render based on force_sequential
         if use_parallel and build_context:
+            from bengal.cache.output_gate import get_output_gate
             from bengal.rendering.pipeline.write_behind import WriteBehindCollector
 
-            write_behind = WriteBehindCollector(site=self.site)
+            write_behind = WriteBehindCollector(site=self.site, gate=get_output_gate(self.site))
             build_context.write_behind = write_behind
 
             # Pre-create all output directories in a single pass
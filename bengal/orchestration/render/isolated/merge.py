@@ -86,6 +86,7 @@ def merge_chunk_results(
             build_context.accumulate_page_assets(Path(src_str), set(refs))
             summary.asset_pages_count += 1
 
+        build_context.accumulate_selectors(result.selectors)
         external_refs.extend(result.external_refs)
 
         if result.errors:
@@ -73,6 +73,7 @@ class _ShardForkState:
     generated_pages: list[Any]  # all generated pages (tag/archive/pagination), assigned per S13.4e
     asset_ctx: Any
     quiet: bool
+    css_purger: Any = None  # set when assets.purge_css harvests selectors during render
 
 
 # Installed in the parent BEFORE the fork pool is created; inherited (not pickled) by every
@@ -193,6 +194,7 @@ def _render_shard_worker(shard_index: int) -> RenderChunkResult:
 
     ctx = BuildContext(site=ws, pages=render_pages)
     ctx.snapshot = state.snapshot  # section tiles render from it (inherited, immortalized)
+    ctx.css_purger = state.css_purger
     return render_shard(
         render_pages,
         ws,
@@ -280,6 +282,7 @@ class ShardRenderBackend:
                 generated_pages=list(generated_pages),
                 asset_ctx=asset_ctx,
                 quiet=quiet,
+                css_purger=getattr(build_context, "css_purger", None),
             )
             try:
                 ctx = mp.get_context("fork")
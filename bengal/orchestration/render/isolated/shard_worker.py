@@ -191,6 +191,7 @@ def render_shard(
     clear_thread_local_pipelines()
     build_context.clear_accumulated_page_data()
     build_context.clear_accumulated_assets()
+    build_context.clear_accumulated_selectors()
     site._external_ref_resolvers = []
     site._external_ref_resolvers_lock = threading.Lock()
 
@@ -257,6 +258,7 @@ def render_shard(
         page_data=page_data,
         assets=assets,
         external_refs=tuple(external_refs),
+        selectors=tuple(sorted(build_context.get_accumulated_selectors())),
     )
 
 
@@ -72,6 +72,8 @@ class RenderChunkResult:
             dependencies, to be replayed into the parent BuildContext.
         external_refs: Unresolved external reference payloads collected during
             render, for cross-subtree xref reconciliation in the merge phase.
+        selectors: Selector tokens harvested from rendered HTML when the CSS
+            purge is enabled, to be replayed into the parent BuildContext.
     """
 
     chunk_index: int
@@ -83,3 +85,4 @@ class RenderChunkResult:
     page_data: tuple[Any, ...] = ()
     assets: tuple[tuple[str, tuple[str, ...]], ...] = ()
     external_refs: tuple[Any, ...] = field(default=())
+    selectors: tuple[str, ...] = field(default=())
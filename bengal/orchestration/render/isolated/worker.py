@@ -119,6 +119,7 @@ def fork_render_chunk(payload: tuple[int, list[int]]) -> RenderChunkResult:
     clear_thread_local_pipelines()
     ctx.clear_accumulated_page_data()
     ctx.clear_accumulated_assets()
+    ctx.clear_accumulated_selectors()
     # Reset the external-ref accumulator (and its lock) so this worker reports
     # only refs discovered in this run — not any inherited from the parent's
     # forked state (e.g. a prior build on a reused Site). The pipeline lazily
@@ -189,6 +190,7 @@ def fork_render_chunk(payload: tuple[int, list[int]]) -> RenderChunkResult:
         page_data=page_data,
         assets=assets,
         external_refs=tuple(external_refs),
+        selectors=tuple(sorted(ctx.get_accumulated_selectors())),
     )
 
 
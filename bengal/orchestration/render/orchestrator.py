@@ -182,6 +182,10 @@ class RenderOrchestrator(
         # Must happen BEFORE _increment_active_renders() to avoid warning.
         clear_thread_local_pipelines()
 
+        # Real builds (with a build cache) reuse highlighted code across builds
+        if build_context is not None and build_context.cache is not None:
+            self._attach_highlight_store()
+
         # Track active render for cache lifecycle management (RFC: Phase 4)
         _increment_active_renders()
 
@@ -198,3 +202,16 @@ class RenderOrchestrator(
             )
         finally:
             _decrement_active_renders()
+            # Persist highlighted code blocks for the next build / server restart
+            self._highlight_cache.save()
+
+    def _attach_highlight_store(self) -> None:
+        """Back the highlight cache with .bengal/highlight/ (once per orchestrator)."""
+        if self._highlight_cache.store_dir is not None:
+            return
+        from bengal.rendering.highlighting.cache import highlight_cache_namespace
+
+        self._highlight_cache.attach_store(
+            self.site.config_service.paths.highlight_cache_dir,
+            highlight_cache_namespace(self.site.config),
+        )
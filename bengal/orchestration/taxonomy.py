@@ -300,6 +300,23 @@ class TaxonomyOrchestrator:
 
         return affected_tags
 
+    def regenerate_tags_from_cache(self, tag_slugs: set[str], cache: BuildCache) -> None:
+        """
+        Regenerate term pages for ``tag_slugs`` from the cached tag index.
+
+        Used for the tags of pages deleted since the last build: those pages
+        are not among the changed pages, so collect_and_generate_incremental()
+        never sees their tags. Tags left without pages are skipped.
+
+        Args:
+            tag_slugs: Tag slugs whose term pages listed a deleted page
+            cache: Build cache with tag index (deleted pages already removed)
+        """
+        self._rebuild_taxonomy_structure_from_cache(cache)
+        remaining = tag_slugs & set(self.site.taxonomies.get("tags", {}))
+        if remaining:
+            self.generate_dynamic_pages_for_tags_with_cache(remaining, taxonomy_index=None)
+
     def collect_taxonomies(self) -> None:
         """
         Collect taxonomies (tags, categories, etc.) from all pages.
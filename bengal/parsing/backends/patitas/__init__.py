@@ -463,6 +463,7 @@ class Markdown:
         "_delegate",
         # Pre-built immutable configs (reused for all parses)
         "_parse_config",
+        "_parse_identity",
         "_plugins",
         "_plugins_enabled",
         "_render_config",
@@ -488,6 +489,7 @@ class Markdown:
     ) -> None:
         self._plugins = tuple(plugins)  # Immutable
         self._delegate = delegate
+        self._parse_identity: str | None = None
 
         # Determine which plugins are enabled
         if "all" in plugins:
@@ -716,6 +718,34 @@ class Markdown:
         """Parse source to AST without rendering."""
         return self._parse_to_ast(source, text_transformer=text_transformer)
 
+    def parse_cache_identity(self) -> str:
+        """Everything besides the source that determines :meth:`parse_to_ast` output.
+
+        Used to key parsed ASTs in caches that outlive the process.
+        """
+        if self._parse_identity is None:
+            import sys
+            from importlib.metadata import PackageNotFoundError, version
+
+            from bengal import __version__
+
+            try:
+                patitas_version = version("patitas")
+            except PackageNotFoundError:
+                patitas_version = "unknown"
+            registry = self._parse_config.directive_registry
+            directives = sorted(registry.names) if registry is not None else []
+            self._parse_identity = "|".join(
+                (
+                    f"patitas={patitas_version}",
+                    f"bengal={__version__}",
+                    f"python={sys.implementation.cache_tag}",
+                    f"plugins={','.join(sorted(self._plugins_enabled))}",
+                    f"directives={','.join(directives)}",
+                )
+            )
+        return self._parse_identity
+
     def render_ast(
         self,
         ast: Sequence[Block],
@@ -404,6 +404,8 @@ class CardDirective:
     token_type: ClassVar[str] = "card"
     contract: ClassVar[DirectiveContract | None] = CARD_CONTRACT
     options_class: ClassVar[type[CardOptions]] = CardOptions
+    # Link resolution and pulled fields come from the xref index
+    cache_dependencies: ClassVar[frozenset[str]] = frozenset({"xref_index"})
 
     def parse(
         self,
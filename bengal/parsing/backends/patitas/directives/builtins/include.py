@@ -231,6 +231,7 @@ def _render_included_content(
         cache_key_for,
         get_cached_include_ast,
         get_cached_include_html,
+        parse_include_ast,
         store_cached_include_ast,
         store_cached_include_html,
     )
@@ -282,7 +283,7 @@ def _render_included_content(
                 store_cached_include_html(cache_key, html)
                 return html, ""
 
-            ast = engine.parse_to_ast(content)
+            ast = parse_include_ast(engine, content)
             html = engine.render_ast(
                 ast,
                 content,
@@ -48,6 +48,14 @@ class DirectiveHandler(Protocol):
         token_type: Token type identifier for the AST. Used for dispatch.
         contract: Optional nesting validation contract.
         options_class: Class for typed options parsing.
+        cache_dependencies: Optional site state the rendered output depends on,
+               for handlers that take it as a render argument. Declaring it
+               (e.g. ``frozenset({"xref_index"})``) keeps the output cacheable:
+               the renderer folds a fingerprint of that state into the cache
+               key. Handlers taking ``xref_index`` or ``site`` without declaring
+               it are never cached. See renderers/directives.py.
+        cache_version: Optional; bump to invalidate persisted output after
+               changing what render() emits.
 
     Template Overrides:
         Handlers may optionally implement get_template_context() to enable
@@ -1,4 +1,9 @@
-"""Thread-safe HTML and AST cache for static markdown include snippets."""
+"""Thread-safe HTML and AST cache for static markdown include snippets.
+
+Parsed ASTs also go to the machine-level shared cache when it is enabled
+(``build.shared_cache``), keyed by snippet content and parser identity, so
+sites and worktrees sharing ``_includes`` parse each snippet once.
+"""
 
 from __future__ import annotations
 
@@ -17,6 +22,7 @@ __all__ = [
     "clear_include_cache",
     "get_cached_include_ast",
     "get_cached_include_html",
+    "parse_include_ast",
     "store_cached_include_ast",
     "store_cached_include_html",
 ]
@@ -116,6 +122,23 @@ def store_cached_include_ast(
         _evict_if_needed(_ast_cache)
 
 
+def parse_include_ast(engine: Any, content: str) -> Sequence[Block]:
+    """Parse include *content* with *engine*, through the shared cache when enabled."""
+    from bengal.cache.shared_artifacts import artifact_key, get_shared_cache
+
+    shared = get_shared_cache()
+    identity = getattr(engine, "parse_cache_identity", None)
+    if shared is None or identity is None:
+        return engine.parse_to_ast(content)
+
+    key = artifact_key(identity(), content)
+    blocks = shared.get_object("include-ast", key)
+    if blocks is None:
+        blocks = tuple(engine.parse_to_ast(content))
+        shared.put_object("include-ast", key, blocks)
+    return blocks
+
+
 def clear_include_cache() -> None:
     """Clear all cached include HTML and AST entries (for tests)."""
     with _lock:
@@ -3,15 +3,26 @@
 Provides directive node rendering methods as a mixin class.
 Handles caching for versioned sites and page-dependent directive detection.
 
+Cache keys cover the directive's full AST (including nested directives), the
+implementation version of every handler involved, and a fingerprint of each
+site-state dependency declared by those handlers (``cache_dependencies``).
+Keys are stable across processes, so the directive cache's persistent tier
+can reuse them.
+
 Thread-safe: all state is local to each render() call.
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import inspect
 import re
+import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from patitas.nodes import Directive as DirectiveNode
 from patitas.stringbuilder import StringBuilder
 
 from bengal.parsing.backends.patitas.renderers.utils import escape_attr, escape_html
@@ -42,6 +53,64 @@ PAGE_DEPENDENT_DIRECTIVES = frozenset(
     }
 )
 
+# Site state a handler can declare in ``cache_dependencies`` to stay cacheable
+# while taking it as a render argument. The renderer folds a fingerprint of
+# each declared dependency into the cache key:
+#   xref_index -- link targets, titles and pullable metadata of all pages
+CACHE_DEPENDENCIES = frozenset({"xref_index"})
+
+# Render arguments that make output page-specific (never cached)
+_PAGE_PARAMS = frozenset({"page_context", "get_page_context"})
+
+# Render arguments carrying site state; cacheable only when declared
+_SITE_STATE_PARAMS = frozenset({"xref_index", "site"})
+
+
+class DirectiveCachePolicy(NamedTuple):
+    """How a handler's output may be cached."""
+
+    cacheable: bool
+    dependencies: frozenset[str]
+    version: str
+
+
+@functools.cache
+def directive_cache_policy(handler_type: type) -> DirectiveCachePolicy:
+    """Cache policy for a directive handler class (memoized per class).
+
+    Handlers taking page context are never cached. Handlers taking site state
+    (``xref_index``, ``site``) are cached only if they list it in a
+    ``cache_dependencies`` ClassVar with names from :data:`CACHE_DEPENDENCIES`.
+    ``current_page_dir`` is always folded into the key when taken.
+
+    The version string identifies the implementation: class path, optional
+    ``cache_version`` ClassVar and the defining module's file stat (so edits
+    to an editable install invalidate persisted output).
+    """
+    render = getattr(handler_type, "render", None)
+    params = frozenset(inspect.signature(render).parameters) if render else frozenset()
+    declared = frozenset(getattr(handler_type, "cache_dependencies", ())) & CACHE_DEPENDENCIES
+
+    module = sys.modules.get(handler_type.__module__)
+    source = getattr(module, "__file__", None)
+    stamp = ""
+    if source:
+        try:
+            st = Path(source).stat()
+            stamp = f"{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            pass
+    version = (
+        f"{handler_type.__module__}.{handler_type.__qualname__}"
+        f"@{getattr(handler_type, 'cache_version', '')}:{stamp}"
+    )
+
+    cacheable = not (params & _PAGE_PARAMS) and (params & _SITE_STATE_PARAMS) <= declared
+    dependencies = declared & params
+    if "current_page_dir" in params:
+        dependencies |= {"current_page_dir"}
+    return DirectiveCachePolicy(cacheable, dependencies, version)
+
 
 class DirectiveRendererMixin:
     """Mixin providing directive rendering methods.
@@ -64,36 +133,26 @@ class DirectiveRendererMixin:
         Note: Page-dependent directives (those that need page_context or get_page_context,
         or are listed in PAGE_DEPENDENT_DIRECTIVES) are NOT cached since their output
         varies by page. This includes child-cards, breadcrumbs, siblings, prev-next, related, etc.
+        Neither are directives that take site state without declaring it (see
+        directive_cache_policy), nor any directive containing one of those.
         """
-        import inspect
-
-        # Determine if directive is cacheable (not page-dependent or context-dependent)
-        is_cacheable = node.name not in PAGE_DEPENDENT_DIRECTIVES
         handler = None
         sig = None
         if self._directive_registry:
             handler = self._directive_registry.get(node.name)
             if handler and hasattr(handler, "render"):
                 sig = inspect.signature(handler.render)
-                # Page-dependent directives are NOT cacheable
-                if is_cacheable and (
-                    "page_context" in sig.parameters or "get_page_context" in sig.parameters
-                ):
-                    is_cacheable = False
-                # Context-dependent directives (xref_index, site) are NOT cacheable
-                # because their output varies based on cross-reference resolution
-                if is_cacheable and ("xref_index" in sig.parameters or "site" in sig.parameters):
-                    is_cacheable = False
 
         # Check directive cache FIRST (before rendering children) - only for cacheable directives
         cache_key: str | None = None
-        if self._directive_cache and is_cacheable:
+        if self._directive_cache:
             # Lightweight AST-based cache key (no rendering needed)
-            cache_key = self._directive_ast_cache_key(node)
-            cached = self._directive_cache.get("directive_html", cache_key)
-            if cached:
-                sb.append(cached)
-                return
+            cache_key = self._directive_cache_key(node)
+            if cache_key is not None:
+                cached = self._directive_cache.get("directive_html", cache_key)
+                if cached:
+                    sb.append(cached)
+                    return
 
         # Cache miss: now render children
         children_sb = StringBuilder()
@@ -278,7 +337,51 @@ class DirectiveRendererMixin:
             **extra,
         )
 
-    def _directive_ast_cache_key(self: HtmlRendererProtocol, node: Directive) -> str:
+    def _directive_cache_key(self: HtmlRendererProtocol, node: Directive) -> str | None:
+        """Full cache key for *node*, or None if its output must not be cached.
+
+        Combines the structural key with the policy of the directive and of
+        every directive nested inside it (their HTML is part of the output):
+        any uncacheable one makes the whole block uncacheable, and the
+        implementation versions and declared dependencies are unioned.
+        """
+        nested: list[Directive] = []
+        parts = [self._directive_ast_cache_key(node, nested)]
+        dependencies: set[str] = set()
+        registry = self._directive_registry
+        for directive in (node, *nested):
+            if directive.name in PAGE_DEPENDENT_DIRECTIVES:
+                return None
+            handler = registry.get(directive.name) if registry else None
+            if handler is None:
+                continue
+            policy = directive_cache_policy(type(handler))
+            if not policy.cacheable:
+                return None
+            dependencies |= policy.dependencies
+            parts.append(policy.version)
+
+        parts.extend(
+            f"{dependency}={self._cache_dependency_fingerprint(dependency)}"
+            for dependency in sorted(dependencies)
+        )
+        return "\x1f".join(parts)
+
+    def _cache_dependency_fingerprint(self: HtmlRendererProtocol, dependency: str) -> str:
+        """Fingerprint of the site state behind a declared cache dependency."""
+        if dependency == "current_page_dir":
+            return self._compute_current_page_dir() or ""
+        if dependency == "xref_index":
+            from bengal.utils.xref import xref_fingerprint
+
+            return xref_fingerprint(getattr(self, "_xref_index", None))
+        return ""
+
+    def _directive_ast_cache_key(
+        self: HtmlRendererProtocol,
+        node: Directive,
+        nested: list[Directive] | None = None,
+    ) -> str:
         """Generate cache key from directive AST structure without rendering.
 
         Creates a structural fingerprint of the directive that uniquely
@@ -298,6 +401,8 @@ class DirectiveRendererMixin:
         slot set keeps the key faithful as new node types/attributes are added.
 
         This allows cache lookup BEFORE expensive child rendering.
+
+        Directive nodes found below *node* are appended to *nested* when given.
         """
         parts: list[str] = [node.name, node.title or ""]
 
@@ -347,6 +452,8 @@ class DirectiveRendererMixin:
             directives onto one cache key.
             """
             sig_parts = [type(block).__name__]
+            if nested is not None and isinstance(block, DirectiveNode):
+                nested.append(block)
 
             # Fenced code stores content as source offsets (ZCLH), so the
             # offsets alone are not stable across documents — resolve the
@@ -366,6 +473,7 @@ class DirectiveRendererMixin:
 
         # Hash all children
         children_sig = "".join(hash_block(child) for child in node.children)
-        parts.append(str(hash(children_sig)))
+        # Stable across processes (unlike hash()) so keys can be persisted
+        parts.append(hashlib.sha256(children_sig.encode("utf-8", "surrogatepass")).hexdigest())
 
         return ":".join(parts)
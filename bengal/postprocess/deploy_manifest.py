@@ -0,0 +1,436 @@
+"""
+Deploy manifest: what is in ``public/`` and what changed since the last deploy.
+
+Deploy scripts used to re-hash the whole output tree to find changed files.
+After a build this module writes a compact manifest of every output file
+(path, SHA-256, size, content type, cache-control class) and a delta against
+the last *deployed* manifest (added / changed / removed, plus the
+content-addressed upload plan: one path per hash that deploy does not have).
+
+The delta base is, in order: an explicit ``previous_path``
+(``--deploy-manifest-base``), else ``.bengal/deploy/deployed.json``. Every
+emit overwrites ``manifest.json``, but only a successful deploy advances
+``deployed.json`` (:func:`mark_deployed`, called after
+:func:`sync_directory`), so builds between deploys do not lose changes from
+the delta. Deploy scripts that upload on their own call :func:`mark_deployed`
+or copy ``manifest.json`` to ``deployed.json`` once the upload succeeded.
+Without a base every file is ``added``.
+
+No output is re-hashed when its hash is already known:
+
+1. The ContentHashRegistry records the hash of every gated write (pages,
+   per-page formats, sitemaps, feeds) together with the size and mtime the
+   file had right after it was written.
+2. The last emitted manifest stores size and mtime too; a file that still
+   has them keeps its recorded hash (assets, copied static files).
+3. Anything else is hashed once.
+
+The AssetManifest marks fingerprinted assets, which get the ``immutable``
+cache class.
+
+:func:`sync_directory` applies a delta to a local directory with hardlinks,
+so a mirror or rsync staging tree is updated in O(changed). Links are safe
+because Bengal replaces outputs atomically (a new inode) instead of writing
+in place. The synced directory carries its own manifest,
+``.bengal-deploy.json`` in the target root by default (``target_manifest``
+moves it elsewhere); it is what the next sync diffs against.
+
+Usage:
+    result = emit_deploy_manifest(site)
+    report = sync_directory(site.output_dir, Path("/srv/www"), result.manifest)
+    mark_deployed(site, result.manifest)
+
+Related:
+- bengal/cache/output_gate.py: records output hashes while writing
+- bengal/assets/manifest.py: fingerprinted asset entries
+- bengal/cli/milo_commands/build.py: ``--emit-deploy-manifest`` / ``--deploy-sync-dir`` /
+  ``--deploy-manifest-base``
+"""
+
+from __future__ import annotations
+
+import json
+import mimetypes
+import os
+import shutil
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bengal.cache.output_gate import file_stamp
+from bengal.utils.io.atomic_write import atomic_write_text
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from bengal.cache.content_hash_registry import ContentHashRegistry
+    from bengal.protocols import SiteLike
+
+logger = get_logger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Manifest a synced directory carries (in its root unless sync_directory is
+# given target_manifest), so the next sync can diff against it
+TARGET_MANIFEST_NAME = ".bengal-deploy.json"
+
+# Cache-control classes: fingerprinted assets never change under their name;
+# documents keep their URL across content changes and must be revalidated.
+CACHE_IMMUTABLE = "immutable"
+CACHE_DOCUMENT = "document"
+CACHE_STATIC = "static"
+
+_DOCUMENT_SUFFIXES = frozenset({".html", ".htm", ".xml", ".json", ".txt", ".md", ".webmanifest"})
+
+
+@dataclass(frozen=True, slots=True)
+class DeployEntry:
+    """One output file in a deploy manifest."""
+
+    hash: str
+    size: int
+    content_type: str
+    cache: str
+    mtime_ns: int
+    encoding: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {
+            "hash": self.hash,
+            "size": self.size,
+            "type": self.content_type,
+            "cache": self.cache,
+            "mtime_ns": self.mtime_ns,
+        }
+        if self.encoding:
+            data["encoding"] = self.encoding
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DeployEntry:
+        return cls(
+            hash=str(data["hash"]),
+            size=int(data["size"]),
+            content_type=str(data.get("type", "application/octet-stream")),
+            cache=str(data.get("cache", CACHE_STATIC)),
+            mtime_ns=int(data.get("mtime_ns", 0)),
+            encoding=data.get("encoding"),
+        )
+
+
+@dataclass(slots=True)
+class DeployManifest:
+    """Output files keyed by POSIX path relative to the output directory."""
+
+    files: dict[str, DeployEntry] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        payload = {
+            "version": MANIFEST_VERSION,
+            "files": {path: entry.to_dict() for path, entry in sorted(self.files.items())},
+        }
+        return json.dumps(payload, separators=(",", ":"))
+
+    def write(self, path: Path) -> None:
+        atomic_write_text(path, self.to_json())
+
+    @classmethod
+    def load(cls, path: Path) -> DeployManifest | None:
+        """Load a manifest; None when missing, unreadable, or of another version."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            if payload.get("version") != MANIFEST_VERSION:
+                return None
+            return cls(
+                files={
+                    str(rel): DeployEntry.from_dict(data)
+                    for rel, data in payload.get("files", {}).items()
+                }
+            )
+        except OSError, ValueError, KeyError, TypeError, AttributeError:
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class DeployDelta:
+    """Changes between two manifests; paths are sorted."""
+
+    added: tuple[str, ...] = ()
+    changed: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    # One path per content hash the previous deploy does not hold
+    upload: tuple[str, ...] = ()
+
+    @classmethod
+    def between(cls, previous: DeployManifest | None, current: DeployManifest) -> DeployDelta:
+        before = previous.files if previous is not None else {}
+        after = current.files
+        added = sorted(path for path in after if path not in before)
+        changed = sorted(
+            path
+            for path, entry in after.items()
+            if path in before and _differs(before[path], entry)
+        )
+        removed = sorted(path for path in before if path not in after)
+
+        known = {entry.hash for entry in before.values()}
+        upload: list[str] = []
+        for path in sorted((*added, *changed)):
+            digest = after[path].hash
+            if digest not in known:
+                known.add(digest)
+                upload.append(path)
+        return cls(tuple(added), tuple(changed), tuple(removed), tuple(upload))
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.changed or self.removed)
+
+    def to_json(self, manifest: DeployManifest) -> str:
+        files = manifest.files
+        payload = {
+            "version": MANIFEST_VERSION,
+            "added": list(self.added),
+            "changed": list(self.changed),
+            "removed": list(self.removed),
+            "upload": [{"path": path, "hash": files[path].hash} for path in self.upload],
+        }
+        return json.dumps(payload, separators=(",", ":"))
+
+
+@dataclass(frozen=True, slots=True)
+class DeployManifestResult:
+    """What :func:`emit_deploy_manifest` wrote."""
+
+    manifest: DeployManifest
+    delta: DeployDelta
+    hashed: int
+    manifest_path: Path
+    delta_path: Path
+
+
+def _differs(before: DeployEntry, after: DeployEntry) -> bool:
+    return (before.hash, before.size, before.content_type, before.cache, before.encoding) != (
+        after.hash,
+        after.size,
+        after.content_type,
+        after.cache,
+        after.encoding,
+    )
+
+
+def _cache_class(rel: str, immutable: frozenset[str]) -> str:
+    if rel in immutable:
+        return CACHE_IMMUTABLE
+    suffix = os.path.splitext(rel)[1].lower()
+    return CACHE_DOCUMENT if suffix in _DOCUMENT_SUFFIXES else CACHE_STATIC
+
+
+def _registry_hash(
+    registry: ContentHashRegistry | None, path: str, st: os.stat_result
+) -> str | None:
+    # Trusted only while the file still carries the stamp recorded with it
+    if registry is None or registry.get_output_stamp(path) != file_stamp(st):
+        return None
+    return registry.get_output_hash(path)
+
+
+def _fingerprinted_paths(output_dir: Path) -> frozenset[str]:
+    from bengal.assets.manifest import AssetManifest
+
+    manifest = AssetManifest.load(output_dir / "asset-manifest.json")
+    if manifest is None:
+        return frozenset()
+    return frozenset(entry.output_path for entry in manifest.entries.values() if entry.fingerprint)
+
+
+def _iter_files(root: Path) -> list[tuple[str, str, os.stat_result]]:
+    """(relative POSIX path, absolute path, stat) for every regular file under ``root``."""
+    found: list[tuple[str, str, os.stat_result]] = []
+    stack = [(str(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    rel = f"{prefix}{item.name}"
+                    if item.is_dir(follow_symlinks=False):
+                        stack.append((item.path, f"{rel}/"))
+                    elif item.is_file():
+                        found.append((rel, item.path, item.stat()))
+        except OSError:
+            continue
+    return found
+
+
+def build_deploy_manifest(
+    output_dir: Path,
+    registry: ContentHashRegistry | None = None,
+    previous: DeployManifest | None = None,
+) -> tuple[DeployManifest, int]:
+    """
+    Describe every file under ``output_dir``.
+
+    Returns:
+        (manifest, number of files that had to be hashed)
+    """
+    from bengal.utils.primitives.hashing import hash_file
+
+    immutable = _fingerprinted_paths(output_dir)
+    carried = previous.files if previous is not None else {}
+    files: dict[str, DeployEntry] = {}
+    hashed = 0
+    for rel, path, st in _iter_files(output_dir):
+        if rel == TARGET_MANIFEST_NAME:
+            continue
+        digest = _registry_hash(registry, path, st)
+        if digest is None:
+            old = carried.get(rel)
+            if old is not None and old.size == st.st_size and old.mtime_ns == st.st_mtime_ns:
+                digest = old.hash
+        if digest is None:
+            try:
+                digest = hash_file(Path(path))  # hex SHA-256, like the registry
+            except OSError:
+                continue
+            hashed += 1
+        content_type, encoding = mimetypes.guess_type(rel)
+        files[rel] = DeployEntry(
+            hash=digest,
+            size=st.st_size,
+            content_type=content_type or "application/octet-stream",
+            cache=_cache_class(rel, immutable),
+            mtime_ns=st.st_mtime_ns,
+            encoding=encoding,
+        )
+    return DeployManifest(files), hashed
+
+
+def emit_deploy_manifest(site: SiteLike, previous_path: Path | None = None) -> DeployManifestResult:
+    """
+    Write ``.bengal/deploy/manifest.json`` and ``delta.json`` for ``site``.
+
+    Args:
+        site: Site that was just built
+        previous_path: Manifest to diff against; defaults to
+            ``.bengal/deploy/deployed.json`` (the last successful deploy)
+
+    Returns:
+        The manifest, its delta, and where both were written
+    """
+    from bengal.cache.content_hash_registry import ContentHashRegistry
+
+    paths = site.config_service.paths
+    manifest_path = paths.deploy_manifest
+    delta_path = paths.deploy_delta
+    base = DeployManifest.load(previous_path or paths.deploy_deployed)
+    # Hashes are carried from the last emit, which is at least as fresh as the base
+    last_emit = DeployManifest.load(manifest_path) or base
+    registry = ContentHashRegistry.load(paths.content_hash_registry)
+
+    manifest, hashed = build_deploy_manifest(site.output_dir, registry, last_emit)
+    delta = DeployDelta.between(base, manifest)
+
+    manifest.write(manifest_path)
+    atomic_write_text(delta_path, delta.to_json(manifest))
+    logger.info(
+        "deploy_manifest_written",
+        files=len(manifest.files),
+        hashed=hashed,
+        added=len(delta.added),
+        changed=len(delta.changed),
+        removed=len(delta.removed),
+        upload=len(delta.upload),
+        path=str(manifest_path),
+        base=str(previous_path or paths.deploy_deployed) if base is not None else None,
+    )
+    return DeployManifestResult(manifest, delta, hashed, manifest_path, delta_path)
+
+
+def mark_deployed(site: SiteLike, manifest: DeployManifest) -> Path:
+    """
+    Record ``manifest`` as deployed; the next emit diffs against it.
+
+    Call only after the deploy succeeded.
+
+    Returns:
+        Path of ``.bengal/deploy/deployed.json``
+    """
+    path = site.config_service.paths.deploy_deployed
+    manifest.write(path)
+    return path
+
+
+@dataclass(frozen=True, slots=True)
+class SyncReport:
+    """Result of :func:`sync_directory`."""
+
+    linked: int = 0
+    copied: int = 0
+    removed: int = 0
+
+
+def sync_directory(
+    source: Path,
+    target: Path,
+    manifest: DeployManifest,
+    *,
+    target_manifest: Path | None = None,
+) -> SyncReport:
+    """
+    Bring ``target`` in line with ``manifest`` (describing ``source``).
+
+    The delta is taken against the manifest the target carries from its last
+    sync; without one every file is (re)linked and nothing is removed. That
+    manifest is written to ``target_manifest``, by default
+    ``.bengal-deploy.json`` in the target root, where it is served along with
+    the site unless the server excludes it. Files are hardlinked, falling
+    back to a copy across filesystems, and replaced atomically.
+    """
+    target.mkdir(parents=True, exist_ok=True)
+    if target_manifest is None:
+        target_manifest = target / TARGET_MANIFEST_NAME
+    else:
+        target_manifest.parent.mkdir(parents=True, exist_ok=True)
+    delta = DeployDelta.between(DeployManifest.load(target_manifest), manifest)
+
+    linked = copied = removed = 0
+    for rel in (*delta.added, *delta.changed):
+        src = source / rel
+        dst = target / rel
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+        try:
+            os.link(src, tmp)
+            linked += 1
+        except OSError:
+            shutil.copy2(src, tmp)
+            copied += 1
+        os.replace(tmp, dst)
+
+    for rel in delta.removed:
+        dst = target / rel
+        try:
+            dst.unlink()
+            removed += 1
+        except FileNotFoundError:
+            continue
+        _prune_empty_parents(dst.parent, target)
+
+    manifest.write(target_manifest)
+    logger.info(
+        "deploy_sync_complete",
+        target=str(target),
+        linked=linked,
+        copied=copied,
+        removed=removed,
+    )
+    return SyncReport(linked=linked, copied=copied, removed=removed)
+
+
+def _prune_empty_parents(directory: Path, root: Path) -> None:
+    while directory != root and root in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
@@ -197,7 +197,7 @@ def _generate_search_backend_if_needed(
 
     result = self._generate_site_wide_if_needed(
         timings,
-        "site_lunr_index",
+        f"site_{search_backend_config.backend}_index",
         pages,
         accumulated_data,
         self._search_backend_fingerprint_options(search_backend_config, index_paths),
@@ -220,6 +220,7 @@ def _search_backend_fingerprint_options(
     return {
         "backend": search_backend_config.backend,
         "lunr": search_backend_config.lunr,
+        "native": search_backend_config.native,
         "index_paths": [_output_relative_path(self.site, path) for path in index_paths],
     }
 
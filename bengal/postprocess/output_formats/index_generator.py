@@ -40,7 +40,8 @@ Features:
 - Version-scoped indexes when versioning is enabled
 - i18n support with per-locale indexes
 - Autodoc page flagging for result grouping
-- Hash-based change detection: O(1) comparison instead of O(n) string compare
+- Streaming write with hash-based change detection: the JSON text is never
+  held in memory as a whole
 
 Versioning:
 When versioning is enabled, generates per-version indexes:
@@ -81,7 +82,8 @@ from bengal.postprocess.output_formats.utils import (
     generate_excerpt,
     get_i18n_output_path,
     get_page_relative_url,
-    write_if_content_changed,
+    iter_json_chunks,
+    write_stream_if_changed,
 )
 from bengal.postprocess.utils import get_section_name, tags_to_list
 from bengal.utils.autodoc import is_autodoc_page
@@ -159,6 +161,9 @@ class SiteIndexGenerator:
         self.json_indent = json_indent
         self.include_full_content = include_full_content
         self.include_heading_index = include_heading_index
+        # index.json payloads written by the last generate(), for in-memory consumers
+        # such as the native search backend
+        self.site_data_by_path: dict[Path, dict[str, Any]] = {}
 
     def generate(
         self,
@@ -192,6 +197,7 @@ class SiteIndexGenerator:
         """
         # Store for hybrid mode lookups
         self._build_context = build_context
+        self.site_data_by_path = {}
         self._accumulated_index: dict[Path, AccumulatedPageData] = {
             data.source_path: data for data in (accumulated_data or [])
         }
@@ -317,11 +323,9 @@ class SiteIndexGenerator:
         # Determine output path
         index_path = self._get_index_path()
 
-        # Write only if content changed (sort_keys for deterministic JSON)
-        new_json_str = json.dumps(
-            site_data, indent=self.json_indent, ensure_ascii=False, sort_keys=True
-        )
-        self._write_if_changed(index_path, new_json_str)
+        # Stream to disk; write only if content changed (sort_keys for deterministic JSON)
+        self._write_if_changed(index_path, site_data)
+        self.site_data_by_path[index_path] = site_data
 
         logger.debug(
             "site_index_json_written",
@@ -479,11 +483,9 @@ class SiteIndexGenerator:
             index_path = self.site.output_dir / "docs" / version_id / "index.json"
             index_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write only if content changed (sort_keys for deterministic JSON)
-        new_json_str = json.dumps(
-            site_data, indent=self.json_indent, ensure_ascii=False, sort_keys=True
-        )
-        self._write_if_changed(index_path, new_json_str)
+        # Stream to disk; write only if content changed (sort_keys for deterministic JSON)
+        self._write_if_changed(index_path, site_data)
+        self.site_data_by_path[index_path] = site_data
 
         logger.debug(
             "version_index_json_written",
@@ -521,16 +523,23 @@ class SiteIndexGenerator:
         """Get the output path for index.json, handling i18n prefixes."""
         return get_i18n_output_path(self.site, "index.json")
 
-    def _write_if_changed(self, path: Path, content: str) -> None:
+    def _write_if_changed(self, path: Path, site_data: dict[str, Any]) -> None:
         """
-        Write content only if content hash differs from stored hash.
+        Stream ``site_data`` as JSON to ``path`` unless the bytes are unchanged.
 
-        Uses write_if_content_changed utility for SHA-256 hash comparison:
-        - O(1) hash comparison vs O(n) string comparison
-        - Avoids reading entire existing file into memory
-        - Hash stored in .hash sidecar file
+        Uses write_stream_if_changed: the JSON is encoded one page at a time
+        and hashed as it is written, so peak memory does not include the
+        serialized document. The streamed SHA-256 is compared with the
+        skip-unchanged gate stamp or the .hash sidecar file.
         """
-        write_if_content_changed(path, content, hash_suffix=".hash")
+        from bengal.cache.output_gate import get_output_gate
+
+        write_stream_if_changed(
+            path,
+            iter_json_chunks(site_data, self.json_indent),
+            gate=get_output_gate(self.site),
+            hash_suffix=".hash",
+        )
 
     def _build_heading_records(self, pages: Sequence[PageLike]) -> list[dict[str, Any]]:
         """Build deterministic per-heading search records across pages."""
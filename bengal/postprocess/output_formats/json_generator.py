@@ -204,11 +204,15 @@ class PageJSONGenerator:
         if not page_items:
             return 0
 
+        from bengal.cache.output_gate import get_output_gate
+
+        gate = get_output_gate(self.site)
+
         # Write function for parallel execution
         def write_json(path: Any, data: dict[str, Any]) -> bool:
             # Use compact JSON (no indent) for speed - 3x faster
             content = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
-            return write_text_if_changed(path, content)
+            return write_text_if_changed(path, content, gate)
 
         # Use parallel write utility
         count = parallel_write_files(page_items, write_json, operation_name="page_json_write")
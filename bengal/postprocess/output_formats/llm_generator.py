@@ -63,20 +63,18 @@ Related:
 
 from __future__ import annotations
 
-import hashlib
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING
 
 from bengal.postprocess.output_formats.utils import (
     get_page_url,
+    write_stream_if_changed,
 )
 from bengal.postprocess.utils import get_section_name, tags_to_list
-from bengal.utils.io.atomic_write import AtomicFile
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterator, Sequence
     from pathlib import Path
 
     from bengal.protocols import PageLike, SiteConfig
@@ -112,7 +110,8 @@ class SiteLlmTxtGenerator:
 
     Optimizations:
         - Streaming write: O(c) memory instead of O(n×c) for large sites
-        - Hash-based change detection: Skip regeneration if content unchanged
+        - Hash-based change detection on the streamed bytes: unchanged output
+          is not rewritten (mtime preserved)
         - Uses cached Page.plain_text (computed during rendering)
 
     Example:
@@ -145,19 +144,27 @@ class SiteLlmTxtGenerator:
         page count and c is average content size. For 10K pages at 5KB each,
         this reduces peak memory from ~100MB to ~5KB.
 
+        The output is hashed as it streams to a temp file; when the hash
+        matches the previous output, the temp file is dropped and
+        llm-full.txt keeps its mtime.
+
         Args:
             pages: List of pages to include
 
         Returns:
             Path to the generated llm-full.txt file
         """
+        from bengal.cache.output_gate import get_output_gate
+
         llm_path = self.site.output_dir / "llm-full.txt"
-        hash_path = self.site.output_dir / ".llm-full.hash"
 
-        new_hash = self._emitted_content_hash(pages)
+        written = write_stream_if_changed(
+            llm_path, self._iter_chunks(pages), gate=get_output_gate(self.site)
+        )
+        # Superseded by the streamed hash; drop the old public sidecar
+        (self.site.output_dir / ".llm-full.hash").unlink(missing_ok=True)
 
-        # Check if content unchanged via hash comparison (O(1) instead of O(n))
-        if self._is_unchanged(hash_path, new_hash):
+        if not written:
             logger.debug(
                 "site_llm_txt_skipped",
                 reason="content_unchanged",
@@ -165,106 +172,54 @@ class SiteLlmTxtGenerator:
             )
             return llm_path
 
-        # OPTIMIZATION: Stream directly to file instead of building in memory
-        # Reduces memory from O(n×c) to O(c) (single page at a time)
+        logger.info("site_llm_txt_generated", path=str(llm_path), page_count=len(pages))
+        return llm_path
+
+    def _iter_chunks(self, pages: Sequence[PageLike]) -> Iterator[str]:
+        """Yield llm-full.txt text, one header or page at a time, in page order."""
         separator = "=" * self.separator_width
         title = self.site.title or "Bengal Site"
         baseurl = self.site.baseurl or ""
 
-        with AtomicFile(llm_path, "w", encoding="utf-8") as f:
-            # Site header
-            f.write(f"# {title}\n\n")
-            if baseurl:
-                f.write(f"Site: {baseurl}\n")
-
-            # Only include build date in production
-            # Use site.build_time for deterministic output (matches index_generator behavior)
-            if not self.site.dev_mode:
-                build_time = getattr(self.site, "build_time", None)
-                if isinstance(build_time, datetime):
-                    f.write(f"Build Date: {build_time.isoformat()}\n")
-                else:
-                    f.write(f"Build Date: {datetime.now().isoformat()}\n")
-
-            f.write(f"Total Pages: {len(pages)}\n\n")
-            f.write(separator + "\n")
+        # Site header
+        header = [f"# {title}\n\n"]
+        if baseurl:
+            header.append(f"Site: {baseurl}\n")
 
-            # Stream each page
-            for idx, page in enumerate(pages, 1):
-                f.write(f"\n## Page {idx}/{len(pages)}: {page.title}\n\n")
+        # Only include build date in production
+        # Use site.build_time for deterministic output (matches index_generator behavior)
+        if not self.site.dev_mode:
+            build_time = getattr(self.site, "build_time", None)
+            if isinstance(build_time, datetime):
+                header.append(f"Build Date: {build_time.isoformat()}\n")
+            else:
+                header.append(f"Build Date: {datetime.now().isoformat()}\n")
 
-                # Page metadata
-                url = get_page_url(page, self.site)
-                f.write(f"URL: {url}\n")
+        header.append(f"Total Pages: {len(pages)}\n\n")
+        header.append(separator + "\n")
+        yield "".join(header)
 
-                section_name = get_section_name(page)
-                if section_name:
-                    f.write(f"Section: {section_name}\n")
+        for idx, page in enumerate(pages, 1):
+            parts = [f"\n## Page {idx}/{len(pages)}: {page.title}\n\n"]
 
-                tags_list = tags_to_list(page.tags)
-                if tags_list:
-                    f.write(f"Tags: {', '.join(str(tag) for tag in tags_list)}\n")
+            # Page metadata
+            url = get_page_url(page, self.site)
+            parts.append(f"URL: {url}\n")
 
-                if page.date:
-                    f.write(f"Date: {page.date.strftime('%Y-%m-%d')}\n")
+            section_name = get_section_name(page)
+            if section_name:
+                parts.append(f"Section: {section_name}\n")
 
-                f.write("\n")  # Blank line before content
+            tags_list = tags_to_list(page.tags)
+            if tags_list:
+                parts.append(f"Tags: {', '.join(str(tag) for tag in tags_list)}\n")
 
-                # Page content (plain text via AST walker)
-                content = page.plain_text
-                f.write(content)
-                f.write("\n\n" + separator + "\n")
+            if page.date:
+                parts.append(f"Date: {page.date.strftime('%Y-%m-%d')}\n")
 
-        # Save hash for next build
-        from bengal.utils.io.atomic_write import atomic_write_text
+            parts.append("\n")  # Blank line before content
+            yield "".join(parts)
 
-        atomic_write_text(hash_path, new_hash, encoding="utf-8")
-
-        logger.info("site_llm_txt_generated", path=str(llm_path), page_count=len(pages))
-        return llm_path
-
-    def _is_unchanged(self, hash_path: Path, new_hash: str) -> bool:
-        """Check if content hash matches stored hash."""
-        try:
-            if hash_path.exists():
-                existing_hash = hash_path.read_text(encoding="utf-8").strip()
-                return existing_hash == new_hash
-        except Exception as e:
-            logger.debug(
-                "llm_hash_check_failed",
-                path=str(hash_path),
-                error=str(e),
-                error_type=type(e).__name__,
-            )
-        return False
-
-    def _emitted_content_hash(self, pages: Sequence[PageLike]) -> str:
-        """Hash all fields that affect the emitted llm-full.txt content."""
-        build_time = getattr(self.site, "build_time", None)
-        dev_mode = bool(getattr(self.site, "dev_mode", False))
-        payload = {
-            "separator_width": self.separator_width,
-            "site": {
-                "title": str(getattr(self.site, "title", None) or "Bengal Site"),
-                "baseurl": str(getattr(self.site, "baseurl", None) or ""),
-                "dev_mode": dev_mode,
-                "build_time": build_time.isoformat()
-                if not dev_mode and isinstance(build_time, datetime)
-                else None,
-            },
-            "pages": [
-                {
-                    "index": idx,
-                    "total": len(pages),
-                    "title": page.title,
-                    "url": get_page_url(page, self.site),
-                    "section": get_section_name(page),
-                    "tags": [str(tag) for tag in tags_to_list(page.tags)],
-                    "date": page.date.strftime("%Y-%m-%d") if page.date else None,
-                    "plain_text": page.plain_text,
-                }
-                for idx, page in enumerate(pages, 1)
-            ],
-        }
-        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
-        return hashlib.sha256(encoded).hexdigest()
+            # Page content (plain text via AST walker)
+            yield page.plain_text
+            yield "\n\n" + separator + "\n"
@@ -61,9 +61,8 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import TYPE_CHECKING
 
-from bengal.postprocess.output_formats.utils import get_page_url
+from bengal.postprocess.output_formats.utils import get_page_url, write_text_if_changed
 from bengal.postprocess.utils import get_section_name
-from bengal.utils.io.atomic_write import AtomicFile
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
@@ -120,10 +119,11 @@ class SiteLlmsTxtGenerator:
         curated = self._curate_pages(pages)
         content = self._render(curated)
         output_path = self.site.output_dir / "llms.txt"
-        output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with AtomicFile(output_path, "w", encoding="utf-8") as f:
-            f.write(content)
+        # Bounded by max_chars, so a single write-if-changed is enough
+        from bengal.cache.output_gate import get_output_gate
+
+        write_text_if_changed(output_path, content, get_output_gate(self.site))
 
         self._logger.info(
             "llms_txt_generated",
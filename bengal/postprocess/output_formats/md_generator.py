@@ -122,8 +122,12 @@ class PageMarkdownGenerator:
         if not page_items:
             return 0
 
+        from bengal.cache.output_gate import get_output_gate
+
+        gate = get_output_gate(self.site)
+
         def write_md(path: Path, content: str) -> bool:
-            return write_text_if_changed(path, content)
+            return write_text_if_changed(path, content, gate)
 
         count = parallel_write_files(
             page_items,
@@ -0,0 +1,502 @@
+"""
+Native sharded search index generator for Bengal SSG.
+
+Builds a compact inverted index directly from the page summaries and
+AccumulatedPageData collected during rendering, so no index.json round-trip
+and no third-party package are needed. The index is split into small shards
+that the client fetches on demand instead of one monolithic file:
+
+```
+search/
+├── manifest.json          # Shard list + content hashes, facets, doc count
+├── terms/<prefix>.json    # term -> flat postings [doc, section, weight, ...]
+└── docs/<section>.json    # Result records (pages + headings) of one section
+```
+
+Configuration:
+
+```yaml
+search:
+  backend: native
+  native:
+    prefix_length: 2  # Characters of a term that select its shard
+```
+
+Incremental builds:
+    Document ids are persisted in ``.bengal/search_doc_ids.json`` so an
+    unchanged page keeps its id (and therefore its postings) when other pages
+    are added or removed. Shards are serialized deterministically and a shard
+    whose hash matches the previous manifest is not rewritten, so an edit only
+    touches the section shard of the changed page and the term shards of the
+    terms it gained or lost.
+
+Matching:
+    Terms are lowercased ``\\w+`` tokens without stemming; the client relies on
+    prefix (trailing wildcard) lookups within a shard instead. Field weights
+    match the Lunr backend (LunrIndexGenerator.BOOSTS).
+
+Related:
+- index_generator.py: Builds the page summaries this generator consumes
+- lunr_index_generator.py: Monolithic Lunr backend
+- themes/default/assets/js/core/search/native.js: Client-side shard loader
+
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Any
+
+from bengal.postprocess.output_formats.lunr_index_generator import LunrIndexGenerator
+from bengal.utils.io.atomic_write import atomic_write_text
+from bengal.utils.observability.logger import get_logger
+from bengal.utils.primitives.hashing import hash_str
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from pathlib import Path
+
+    from bengal.orchestration.build_context import AccumulatedPageData
+    from bengal.protocols import SiteLike
+
+logger = get_logger(__name__)
+
+INDEX_FORMAT_VERSION = 1
+DEFAULT_PREFIX_LENGTH = 2
+SEARCH_DIR_NAME = "search"
+MANIFEST_NAME = "manifest.json"
+
+_TOKEN = re.compile(r"\w+")
+_SHARD_SAFE = re.compile(r"[a-z0-9]+")
+_SECTION_CHARS = re.compile(r"[^a-z0-9_-]+")
+_ROOT_SECTION = "_root"
+_MIN_TOKEN_LENGTH = 2
+
+# Very common English words carry no ranking signal but would dominate the
+# "th"/"an"/"to" shards every visitor downloads.
+_STOPWORDS = frozenset(
+    {
+        "an", "and", "are", "as", "at", "be", "but", "by", "for", "from", "if",
+        "in", "into", "is", "it", "its", "no", "not", "of", "on", "or", "so",
+        "such", "that", "the", "their", "then", "there", "these", "they",
+        "this", "to", "was", "were", "will", "with",
+    }
+)  # fmt: skip
+
+# Large text fields are indexed but not shipped in result records
+_RECORD_EXCLUDED_FIELDS = frozenset({"content"})
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens, without stopwords and single characters."""
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if len(token) >= _MIN_TOKEN_LENGTH and token not in _STOPWORDS
+    ]
+
+
+def term_shard_name(term: str, prefix_length: int) -> str:
+    """
+    Shard file stem for ``term``.
+
+    ASCII alphanumeric prefixes are used as-is; anything else is hex-encoded
+    (``_`` + UTF-8 hex) so shard names stay portable across file systems.
+    The client derives the same name from the query term.
+    """
+    prefix = term[:prefix_length]
+    if _SHARD_SAFE.fullmatch(prefix):
+        return prefix
+    return "_" + prefix.encode("utf-8").hex()
+
+
+def section_shard_name(section: str) -> str:
+    """Shard file stem for a section name."""
+    return _SECTION_CHARS.sub("-", section.lower()).strip("-") or _ROOT_SECTION
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+class NativeSearchIndexGenerator:
+    """
+    Generate the native sharded search index for one or more index.json files.
+
+    Example:
+            >>> generator = NativeSearchIndexGenerator(site, prefix_length=2)
+            >>> manifest = generator.generate(index_path, site_data, accumulated_data)
+
+    """
+
+    BOOSTS = LunrIndexGenerator.BOOSTS
+
+    def __init__(
+        self,
+        site: SiteLike,
+        *,
+        prefix_length: int = DEFAULT_PREFIX_LENGTH,
+        doc_ids_path: Path | None = None,
+    ) -> None:
+        """
+        Initialize the generator.
+
+        Args:
+            site: Site instance
+            prefix_length: Term prefix length that selects a term shard
+            doc_ids_path: Persisted objectID -> doc id map (None = ids follow
+                document order and are not kept between builds)
+        """
+        self.site = site
+        self.prefix_length = max(1, int(prefix_length))
+        self.doc_ids_path = doc_ids_path
+        self._doc_ids: dict[str, int] | None = None
+        self._next_id = 0
+        self._seen: set[str] = set()
+
+    def generate(
+        self,
+        index_path: Path,
+        site_data: Mapping[str, Any] | None = None,
+        accumulated_data: Iterable[AccumulatedPageData] | None = None,
+    ) -> Path | None:
+        """
+        Write the sharded index alongside ``index_path``.
+
+        Args:
+            index_path: index.json this index belongs to; shards go to
+                ``index_path.parent / "search"``
+            site_data: In-memory index.json payload built this run. Read back
+                from ``index_path`` only when index generation was skipped.
+            accumulated_data: Render accumulations; their full plain text is
+                indexed in place of the (truncated) summary content
+
+        Returns:
+            Path to search/manifest.json, or None if there was nothing to index
+        """
+        if site_data is None:
+            site_data = self._read_site_data(index_path)
+            if site_data is None:
+                return None
+
+        plain_text = {data.uri: data.plain_text for data in accumulated_data or ()}
+        documents = self._build_documents(site_data, plain_text)
+        if not documents:
+            logger.warning(
+                "no_searchable_documents",
+                reason="all pages excluded from search",
+                suggestion="Check pages for 'search_exclude: true' or 'draft: true' in frontmatter.",
+            )
+            return None
+
+        search_dir = index_path.parent / SEARCH_DIR_NAME
+        manifest_path = search_dir / MANIFEST_NAME
+        previous_raw, previous_hashes = self._read_manifest(manifest_path)
+
+        sections = sorted({doc["shard"] for doc in documents})
+        section_index = {name: i for i, name in enumerate(sections)}
+        records: dict[str, dict[str, list[dict[str, Any]]]] = {
+            name: {"headings": [], "pages": []} for name in sections
+        }
+        postings: dict[str, dict[str, list[tuple[int, int, int]]]] = defaultdict(dict)
+
+        for doc in documents:
+            doc_id = self._assign_id(doc["record"]["objectID"])
+            shard = doc["shard"]
+            record = {"id": doc_id, **doc["record"]}
+            records[shard]["headings" if doc["heading"] else "pages"].append(record)
+
+            weights: Counter[str] = Counter()
+            for field, text in doc["fields"].items():
+                boost = self.BOOSTS.get(field, 1)
+                for token in tokenize(text):
+                    weights[token] += boost
+            for term, weight in weights.items():
+                postings[term_shard_name(term, self.prefix_length)].setdefault(term, []).append(
+                    (doc_id, section_index[shard], weight)
+                )
+
+        written = 0
+        section_entries = []
+        for name in sections:
+            path = f"docs/{name}.json"
+            digest, changed = self._write_shard(search_dir, path, records[name], previous_hashes)
+            section_entries.append({"name": name, "path": path, "hash": digest})
+            written += changed
+
+        term_entries = {}
+        for shard_name in sorted(postings):
+            shard = {
+                term: [value for posting in sorted(entries) for value in posting]
+                for term, entries in postings[shard_name].items()
+            }
+            path = f"terms/{shard_name}.json"
+            digest, changed = self._write_shard(search_dir, path, shard, previous_hashes)
+            term_entries[shard_name] = {"path": path, "hash": digest}
+            written += changed
+
+        manifest = {
+            "version": INDEX_FORMAT_VERSION,
+            "prefix_length": self.prefix_length,
+            "documents": len(documents),
+            "sections": section_entries,
+            "terms": term_entries,
+            "facets": self._facets(site_data),
+        }
+        manifest_json = _dumps(manifest)
+        if manifest_json != previous_raw:
+            atomic_write_text(manifest_path, manifest_json)
+
+        removed = self._remove_stale_shards(search_dir, previous_hashes, manifest)
+
+        logger.debug(
+            "native_search_index_written",
+            path=str(manifest_path),
+            documents=len(documents),
+            section_shards=len(section_entries),
+            term_shards=len(term_entries),
+            shards_written=written,
+            shards_removed=removed,
+        )
+        return manifest_path
+
+    def save_doc_ids(self) -> None:
+        """Persist doc ids, dropping objectIDs not seen since the last load."""
+        if self.doc_ids_path is None or self._doc_ids is None:
+            return
+        ids = {key: value for key, value in self._doc_ids.items() if key in self._seen}
+        state = {"version": INDEX_FORMAT_VERSION, "next": self._next_id, "ids": ids}
+        try:
+            existing = self.doc_ids_path.read_text(encoding="utf-8")
+        except OSError:
+            existing = None
+        content = _dumps(state)
+        if content == existing:
+            return
+        try:
+            self.doc_ids_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(self.doc_ids_path, content)
+        except OSError as e:
+            logger.debug(
+                "native_search_doc_ids_save_failed", path=str(self.doc_ids_path), error=str(e)
+            )
+
+    # ------------------------------------------------------------------
+    # Documents
+    # ------------------------------------------------------------------
+
+    def _build_documents(
+        self, site_data: Mapping[str, Any], plain_text: Mapping[str, str]
+    ) -> list[dict[str, Any]]:
+        """Indexed fields + shipped record for every searchable page and heading."""
+        documents: list[dict[str, Any]] = []
+        page_sections: dict[str, str] = {}
+
+        for page in site_data.get("pages", []):
+            if page.get("search_exclude") or page.get("draft"):
+                continue
+            object_id = page.get("objectID") or page.get("uri") or page.get("url", "")
+            if not object_id:
+                continue
+            shard = section_shard_name(str(page.get("section") or ""))
+            page_sections[object_id] = shard
+            content = plain_text.get(page.get("uri", object_id)) or (
+                page.get("content") or page.get("excerpt", "")
+            )
+            documents.append(
+                {
+                    "shard": shard,
+                    "heading": False,
+                    "fields": {
+                        "title": str(page.get("title") or ""),
+                        "description": str(page.get("description") or ""),
+                        "content": str(content),
+                        "tags": self._join(page.get("tags")),
+                        "section": str(page.get("section") or ""),
+                        "author": self._author(page),
+                        "search_keywords": self._join(page.get("search_keywords")),
+                        "kind": str(page.get("kind") or page.get("type") or ""),
+                    },
+                    "record": self._record(page, object_id),
+                }
+            )
+
+        for heading in site_data.get("headings", []):
+            if not heading.get("title") or heading.get("search_exclude"):
+                continue
+            object_id = heading.get("objectID") or heading.get("url", "")
+            if not object_id:
+                continue
+            parent = heading.get("parent_objectID", "")
+            shard = page_sections.get(parent) or section_shard_name(
+                str(heading.get("section") or "")
+            )
+            documents.append(
+                {
+                    "shard": shard,
+                    "heading": True,
+                    "fields": {
+                        "title": str(heading.get("title") or ""),
+                        "description": str(heading.get("breadcrumb") or ""),
+                        "content": str(heading.get("content") or ""),
+                        "section": str(heading.get("section") or ""),
+                        "parent_title": str(heading.get("parent_title") or ""),
+                        "kind": "heading",
+                    },
+                    "record": self._record(heading, object_id),
+                }
+            )
+
+        return documents
+
+    @staticmethod
+    def _record(item: Mapping[str, Any], object_id: str) -> dict[str, Any]:
+        record = {k: v for k, v in item.items() if k not in _RECORD_EXCLUDED_FIELDS}
+        record["objectID"] = object_id
+        return record
+
+    @staticmethod
+    def _join(items: Any) -> str:
+        if not items:
+            return ""
+        if isinstance(items, str):
+            return items
+        return " ".join(str(item) for item in items)
+
+    def _author(self, page: Mapping[str, Any]) -> str:
+        if author := page.get("author"):
+            return str(author)
+        return self._join(page.get("authors"))
+
+    @staticmethod
+    def _facets(site_data: Mapping[str, Any]) -> dict[str, list[str]]:
+        """Filter values for the search UI, which no longer sees every record up front."""
+        values: dict[str, set[str]] = {
+            "authors": set(),
+            "sections": set(),
+            "tags": set(),
+            "types": set(),
+        }
+        for page in site_data.get("pages", []):
+            if page.get("search_exclude") or page.get("draft"):
+                continue
+            if section := page.get("section"):
+                values["sections"].add(str(section))
+            if kind := page.get("type"):
+                values["types"].add(str(kind))
+            values["tags"].update(str(tag) for tag in page.get("tags") or ())
+            if author := page.get("author"):
+                values["authors"].add(str(author))
+            values["authors"].update(str(a) for a in page.get("authors") or ())
+        return {name: sorted(found) for name, found in values.items()}
+
+    # ------------------------------------------------------------------
+    # Stable doc ids
+    # ------------------------------------------------------------------
+
+    def _assign_id(self, object_id: str) -> int:
+        if self._doc_ids is None:
+            self._doc_ids, self._next_id = self._load_doc_ids()
+        self._seen.add(object_id)
+        doc_id = self._doc_ids.get(object_id)
+        if doc_id is None:
+            doc_id = self._next_id
+            self._next_id += 1
+            self._doc_ids[object_id] = doc_id
+        return doc_id
+
+    def _load_doc_ids(self) -> tuple[dict[str, int], int]:
+        if self.doc_ids_path is None:
+            return {}, 0
+        try:
+            state = json.loads(self.doc_ids_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}, 0
+        except (OSError, ValueError) as e:
+            logger.debug(
+                "native_search_doc_ids_load_failed", path=str(self.doc_ids_path), error=str(e)
+            )
+            return {}, 0
+        if not isinstance(state, dict) or state.get("version") != INDEX_FORMAT_VERSION:
+            return {}, 0
+        ids = state.get("ids")
+        if not isinstance(ids, dict):
+            return {}, 0
+        ids = {str(k): v for k, v in ids.items() if isinstance(v, int)}
+        next_id = max(int(state.get("next") or 0), max(ids.values(), default=-1) + 1)
+        return ids, next_id
+
+    # ------------------------------------------------------------------
+    # Shard I/O
+    # ------------------------------------------------------------------
+
+    def _read_site_data(self, index_path: Path) -> dict[str, Any] | None:
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "index_json_not_found",
+                path=str(index_path),
+                error=str(e),
+                suggestion="Ensure site-wide index is enabled in [output_formats] config.",
+            )
+            return None
+        return data if isinstance(data, dict) else None
+
+    @staticmethod
+    def _read_manifest(path: Path) -> tuple[str | None, dict[str, str]]:
+        """Raw text of the previous manifest and its shard path -> hash map."""
+        try:
+            raw = path.read_text(encoding="utf-8")
+            manifest = json.loads(raw)
+        except OSError, ValueError:
+            return None, {}
+        if not isinstance(manifest, dict):
+            return raw, {}
+        entries = list(manifest.get("sections") or [])
+        terms = manifest.get("terms")
+        if isinstance(terms, dict):
+            entries.extend(terms.values())
+        hashes = {
+            entry["path"]: entry["hash"]
+            for entry in entries
+            if isinstance(entry, dict)
+            and isinstance(entry.get("path"), str)
+            and isinstance(entry.get("hash"), str)
+        }
+        return raw, hashes
+
+    @staticmethod
+    def _write_shard(
+        search_dir: Path, path: str, data: Any, previous_hashes: Mapping[str, str]
+    ) -> tuple[str, bool]:
+        """Write one shard unless the previous manifest records the same hash."""
+        content = _dumps(data)
+        digest = hash_str(content, truncate=16)
+        target = search_dir / path
+        if previous_hashes.get(path) == digest and target.exists():
+            return digest, False
+        atomic_write_text(target, content)
+        return digest, True
+
+    @staticmethod
+    def _remove_stale_shards(
+        search_dir: Path, previous_hashes: Mapping[str, str], manifest: Mapping[str, Any]
+    ) -> int:
+        current = {entry["path"] for entry in manifest["sections"]}
+        current.update(entry["path"] for entry in manifest["terms"].values())
+        removed = 0
+        for path in previous_hashes:
+            if path in current:
+                continue
+            # Only ever delete files inside search/ that an earlier manifest listed
+            if not path.startswith(("docs/", "terms/")) or ".." in path:
+                continue
+            try:
+                (search_dir / path).unlink(missing_ok=True)
+                removed += 1
+            except OSError:
+                pass
+        return removed
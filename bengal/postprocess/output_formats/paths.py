@@ -184,6 +184,6 @@ def expected_search_backend_outputs(
     index_paths: list[Path],
 ) -> list[Path] | None:
     """Return backend outputs that must exist before derived search can skip."""
-    if search_backend_config.backend == "lunr" and search_backend_config.prebuilt_enabled:
-        return [path.parent / "search-index.json" for path in index_paths]
+    if search_backend_config.enabled and search_backend_config.prebuilt_enabled:
+        return [path.parent / search_backend_config.artifact_name for path in index_paths]
     return None
@@ -78,7 +78,12 @@ def generate_site_wide_formats(
             logger.debug("generated_site_index_json")
 
         search_backend_config = resolve_search_backend_config(self.site.config.get("search", {}))
-        search_backend = create_search_backend(self.site, search_backend_config)
+        search_backend = create_search_backend(
+            self.site,
+            search_backend_config,
+            site_data=index_gen.site_data_by_path,
+            accumulated_data=accumulated_data,
+        )
         generated_search = self._generate_search_backend_if_needed(
             timings,
             search_backend,
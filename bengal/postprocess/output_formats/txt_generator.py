@@ -154,9 +154,13 @@ class PageTxtGenerator:
         if not page_items:
             return 0
 
+        from bengal.cache.output_gate import get_output_gate
+
+        gate = get_output_gate(self.site)
+
         # Write function for parallel execution
         def write_txt(path: Path, content: str) -> bool:
-            return write_text_if_changed(path, content)
+            return write_text_if_changed(path, content, gate)
 
         # Use parallel write utility
         count = parallel_write_files(page_items, write_txt, operation_name="page_txt_write")
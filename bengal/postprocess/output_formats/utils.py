@@ -24,6 +24,8 @@ Path Resolution:
 I/O Operations:
     - parallel_write_files: Write files in parallel with ThreadPoolExecutor
     - write_if_content_changed: Hash-based change detection for writes
+    - write_stream_if_changed: Streaming variant for large site-wide files
+    - iter_json_chunks: json.dumps output, one top-level item at a time
 
 Implementation Notes:
 Text utilities delegate to bengal.utils.text for DRY compliance.
@@ -53,6 +55,7 @@ Related:
 from __future__ import annotations
 
 import hashlib
+import json
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -65,9 +68,10 @@ from bengal.utils.primitives.text import strip_html as _strip_html_base
 logger = get_logger(__name__)
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
     from pathlib import Path
 
+    from bengal.cache.output_gate import OutputWriteGate
     from bengal.protocols import PageLike, SiteLike
 
 
@@ -327,7 +331,7 @@ def parallel_write_files[T](
     return count
 
 
-def write_text_if_changed(path: Path, content: str) -> bool:
+def write_text_if_changed(path: Path, content: str, gate: OutputWriteGate | None = None) -> bool:
     """
     Write text atomically only when the existing file differs.
 
@@ -337,10 +341,15 @@ def write_text_if_changed(path: Path, content: str) -> bool:
     Args:
         path: Output file path.
         content: Text content to write.
+        gate: Skip-unchanged gate (``get_output_gate(site)``). When given, the
+            recorded hash is checked instead of reading the existing file.
 
     Returns:
         True if the file was written, False if the existing content matched.
     """
+    if gate is not None:
+        return gate.write_text(path, content)
+
     try:
         if path.exists() and path.read_text(encoding="utf-8") == content:
             logger.debug(
@@ -624,3 +633,98 @@ def write_if_content_changed(
         f.write(new_hash)
 
     return True
+
+
+# Text is buffered into writes of about this many characters
+_STREAM_BUFFER_CHARS = 1 << 16
+
+
+def iter_json_chunks(data: Any, indent: int | None = None) -> Iterator[str]:
+    """
+    Yield ``json.dumps(data, indent=indent, ensure_ascii=False, sort_keys=True)``
+    in pieces, so a site-wide document is never held as one string.
+
+    Compact output (the default) is assembled from one ``json.dumps`` call per
+    top-level value and per element of top-level lists, which keeps the C
+    encoder and produces identical text. Indented output depends on nesting
+    depth, so it falls back to ``JSONEncoder.iterencode``.
+    """
+    if indent is not None or not isinstance(data, dict):
+        encoder = json.JSONEncoder(indent=indent, ensure_ascii=False, sort_keys=True)
+        yield from encoder.iterencode(data)
+        return
+
+    def dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+    if not data:
+        yield "{}"
+        return
+    for position, key in enumerate(sorted(data)):
+        yield f"{', ' if position else '{'}{dumps(key)}: "
+        value = data[key]
+        if isinstance(value, list) and value:
+            for item_position, item in enumerate(value):
+                yield f"{', ' if item_position else '['}{dumps(item)}"
+            yield "]"
+        else:
+            yield dumps(value)
+    yield "}"
+
+
+def encode_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+    """UTF-8 encode ``chunks``, coalesced into blocks of about 64K characters."""
+    buffer: list[str] = []
+    buffered = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered += len(chunk)
+        if buffered >= _STREAM_BUFFER_CHARS:
+            yield "".join(buffer).encode("utf-8")
+            buffer.clear()
+            buffered = 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def write_stream_if_changed(
+    path: Path,
+    chunks: Iterable[str],
+    *,
+    gate: OutputWriteGate | None = None,
+    hash_suffix: str | None = None,
+) -> bool:
+    """
+    Stream text ``chunks`` to ``path``, keeping the file when the bytes match.
+
+    Memory stays bounded by the chunk size: content is hashed as it is written
+    to a temp file, and the change check compares that streamed hash with the
+    previous one (gate stamp, ``hash_suffix`` sidecar, or a block-wise hash of
+    the existing file) instead of comparing full strings.
+
+    Args:
+        path: Output file path
+        chunks: Text pieces, in output order
+        gate: Skip-unchanged gate (``get_output_gate(site)``)
+        hash_suffix: Also keep the hash in a sidecar file (e.g. ``.hash``)
+
+    Returns:
+        True if the file was written, False if the content was unchanged
+    """
+    from bengal.cache.output_gate import write_streamed
+    from bengal.utils.io.atomic_write import atomic_write_text
+
+    hash_path = path.parent / f"{path.name}{hash_suffix}" if hash_suffix else None
+    previous: str | None = None
+    if hash_path is not None and path.exists():
+        try:
+            previous = hash_path.read_text(encoding="utf-8").strip() or None
+        except OSError:
+            previous = None
+
+    written, digest = write_streamed(path, encode_chunks(chunks), gate, previous=previous)
+    if not written:
+        logger.debug("write_skipped_unchanged", path=str(path), reason="content_hash_unchanged")
+    if hash_path is not None and digest != previous:
+        atomic_write_text(hash_path, digest, encoding="utf-8")
+    return written
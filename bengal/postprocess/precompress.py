@@ -0,0 +1,361 @@
+"""
+Precompressed sidecars (``.gz`` / ``.br`` / ``.zst``) for text outputs.
+
+Static hosts and CDNs that support precompressed assets (nginx
+``gzip_static``, Caddy ``precompressed``, Netlify, the Pounce preview server)
+serve ``page.html.br`` in place of ``page.html`` when the client accepts it.
+Without sidecars they compress on every request or not at all.
+
+This stage runs last in post-processing, after every output exists. It
+compresses HTML/CSS/JS/JSON/XML/SVG files across worker threads (zlib, zstd
+and brotli release the GIL). Sidecars are only kept when they are smaller
+than the original.
+
+Only changed files are read. With a build output collector and a registry
+from a previous run, the files looked at are the ones the collector saw
+written plus the ones already registered; nothing else is walked. A
+registered file whose size and mtime still match the stamp recorded when
+its sidecars were written (and whose sidecars are present) is skipped after
+a stat. Everything else is read and hashed, and recompressed only when the
+hash differs. Without a collector, or on the first run, the output tree is
+walked once.
+
+Configuration:
+    ```toml
+    [precompress]
+    enabled = true
+    formats = ["gzip", "br", "zstd"]   # br requires the optional brotli package
+    min_bytes = 1024
+    ```
+
+Related:
+- bengal.cache.content_hash_registry: output hash bookkeeping
+- bengal.server.buffer_manager: carries sidecars across dev-server swaps
+- bengal.orchestration.postprocess: registration point
+
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import os
+import tempfile
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from bengal.cache.content_hash_registry import ContentHashRegistry
+    from bengal.protocols import OutputCollector
+
+logger = get_logger(__name__)
+
+# Output suffixes worth compressing (already-compressed formats are skipped)
+COMPRESSIBLE_SUFFIXES = frozenset({".html", ".htm", ".css", ".js", ".mjs", ".json", ".xml", ".svg"})
+
+# Sidecar suffix per format, in the order they are written
+SIDECAR_SUFFIXES: dict[str, str] = {"gzip": ".gz", "br": ".br", "zstd": ".zst"}
+
+_FORMAT_ALIASES = {
+    "gz": "gzip",
+    "gzip": "gzip",
+    "br": "br",
+    "brotli": "br",
+    "zst": "zstd",
+    "zstd": "zstd",
+}
+
+DEFAULT_FORMATS: tuple[str, ...] = ("gzip", "br", "zstd")
+DEFAULT_MIN_BYTES = 1024
+
+# Build-time compression can afford maximum effort: each file is compressed
+# once and then reused until its content changes.
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+ZSTD_LEVEL = 19
+
+
+@dataclass(frozen=True, slots=True)
+class PrecompressConfig:
+    """Parsed ``[precompress]`` settings."""
+
+    enabled: bool = False
+    formats: tuple[str, ...] = DEFAULT_FORMATS
+    min_bytes: int = DEFAULT_MIN_BYTES
+
+
+def parse_precompress_config(config: Any) -> PrecompressConfig:
+    """
+    Parse the ``[precompress]`` section.
+
+    Accepts ``precompress = true`` as shorthand for the defaults. Unknown
+    formats are dropped, and ``br`` is dropped when brotli is not installed.
+    """
+    raw = config.get("precompress", False) if config else False
+    if isinstance(raw, bool):
+        raw = {"enabled": raw}
+    if not isinstance(raw, dict):
+        return PrecompressConfig()
+
+    formats: list[str] = []
+    for name in raw.get("formats", DEFAULT_FORMATS):
+        fmt = _FORMAT_ALIASES.get(str(name).lower())
+        if fmt is None:
+            logger.warning("precompress_unknown_format", format=name)
+        elif fmt not in formats:
+            formats.append(fmt)
+    if "br" in formats and not _brotli_available():
+        formats.remove("br")
+        if raw.get("enabled", True):
+            logger.warning(
+                "precompress_brotli_unavailable",
+                action="skipping_br_sidecars",
+                suggestion="Install with: pip install bengal[compression]",
+            )
+    return PrecompressConfig(
+        enabled=bool(raw.get("enabled", True)) and bool(formats),
+        formats=tuple(formats),
+        min_bytes=max(0, int(raw.get("min_bytes", DEFAULT_MIN_BYTES))),
+    )
+
+
+@dataclass
+class CompressionReport:
+    """
+    Result of one compression run.
+
+    ``by_type`` maps an output type (html, css, js, ...) to totals for files
+    compressed this run: ``files``, ``original_bytes`` and, per format, the
+    compressed bytes.
+    """
+
+    compressed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    errors: list[str] = field(default_factory=list)
+    by_type: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def bytes_saved(self, output_type: str | None = None, fmt: str = "gzip") -> int:
+        """Bytes saved by ``fmt`` sidecars, for one output type or all of them."""
+        rows = [self.by_type[output_type]] if output_type else list(self.by_type.values())
+        return sum(row["original_bytes"] - row.get(fmt, row["original_bytes"]) for row in rows)
+
+
+class OutputCompressor:
+    """
+    Write precompressed sidecars for an output directory.
+
+    Output hashes are recorded in a dedicated ContentHashRegistry
+    (``.bengal/precompress_hashes.json.zst``) under paths relative to the
+    output directory, so the dev server's two output buffers share one
+    record. The registry holds the hash and size/mtime stamp each file had
+    when its sidecars were written, nothing else.
+
+    Thread Safety:
+        run() fans out over worker threads; the registry guards its own maps
+        and report totals are merged on the calling thread.
+    """
+
+    def __init__(self, config: PrecompressConfig, registry: ContentHashRegistry) -> None:
+        self.config = config
+        self.registry = registry
+
+    def run(
+        self,
+        output_dir: Path,
+        *,
+        collector: OutputCollector | None = None,
+        max_workers: int | None = None,
+    ) -> CompressionReport:
+        """
+        Compress changed outputs under ``output_dir`` and drop orphaned sidecars.
+
+        Args:
+            output_dir: Build output directory
+            collector: This build's output collector; when given (and the
+                registry is not empty) only reported and registered files
+                are looked at instead of walking ``output_dir``
+            max_workers: Worker thread override (None = auto)
+
+        Returns:
+            CompressionReport with per-type byte totals
+        """
+        from concurrent.futures import as_completed
+
+        from bengal.utils.concurrency.executor import managed_executor
+        from bengal.utils.concurrency.workers import WorkloadType, get_optimal_workers
+
+        report = CompressionReport()
+        candidates = self._candidates(output_dir, collector)
+        report.removed = self._remove_orphans(output_dir, candidates)
+        if not candidates:
+            return report
+
+        workers = get_optimal_workers(
+            len(candidates), workload_type=WorkloadType.CPU_BOUND, config_override=max_workers
+        )
+        if workers <= 1:
+            results = [self._process(path, output_dir) for path in candidates]
+        else:
+            with managed_executor(workers, thread_name_prefix="precompress") as executor:
+                futures = [executor.submit(self._process, p, output_dir) for p in candidates]
+                results = [future.result() for future in as_completed(futures)]
+
+        for result in results:
+            if isinstance(result, str):
+                report.errors.append(result)
+            elif result is None:
+                report.unchanged += 1
+            else:
+                output_type, original_size, sizes = result
+                report.compressed += 1
+                row = report.by_type.setdefault(output_type, {"files": 0, "original_bytes": 0})
+                row["files"] += 1
+                row["original_bytes"] += original_size
+                for fmt, size in sizes.items():
+                    row[fmt] = row.get(fmt, 0) + size
+        return report
+
+    def _candidates(self, output_dir: Path, collector: OutputCollector | None) -> list[Path]:
+        """Existing compressible files to check: reported + registered, or a full walk."""
+        if collector is None or not self.registry.output_hashes:
+            return [
+                path
+                for path in output_dir.rglob("*")
+                if path.suffix.lower() in COMPRESSIBLE_SUFFIXES and path.is_file()
+            ]
+
+        keys = set(self.registry.output_hashes)
+        for record in collector.get_outputs():
+            path = record.path
+            if path.is_absolute():
+                try:
+                    path = path.relative_to(output_dir)
+                except ValueError:
+                    continue
+            if path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+                keys.add(path.as_posix())
+        return [output_dir / key for key in sorted(keys) if (output_dir / key).is_file()]
+
+    def _process(
+        self, path: Path, output_dir: Path
+    ) -> tuple[str, int, dict[str, int]] | str | None:
+        """
+        Compress one file if needed.
+
+        Returns:
+            None when unchanged, an error string on failure, otherwise
+            (output type, original size, {format: sidecar size})
+        """
+        from bengal.cache.output_gate import file_stamp
+        from bengal.core.output import OutputRecord
+        from bengal.utils.primitives.hashing import hash_bytes
+
+        key = path.relative_to(output_dir).as_posix()
+        try:
+            sidecars = {
+                fmt: path.with_name(path.name + SIDECAR_SUFFIXES[fmt])
+                for fmt in self.config.formats
+            }
+            st = path.stat()
+            stamp = file_stamp(st)
+            small = st.st_size < self.config.min_bytes
+
+            def current() -> bool:
+                return small or all(sidecar.exists() for sidecar in sidecars.values())
+
+            # Same size and mtime as when compressed: skip without reading
+            if self.registry.get_output_stamp(key) == stamp and current():
+                return None
+
+            data = path.read_bytes()
+            content_hash = hash_bytes(data, truncate=16)
+            small = len(data) < self.config.min_bytes
+            output_type = OutputRecord.from_path(path).output_type
+            if not self.registry.has_changed(key, content_hash) and current():
+                # Rewritten with identical bytes; refresh the stamp only
+                self.registry.update_output(key, content_hash, output_type, stamp=stamp)
+                return None
+
+            # Sidecars of formats no longer configured would go stale
+            for fmt, suffix in SIDECAR_SUFFIXES.items():
+                if fmt not in sidecars:
+                    _unlink(path.with_name(path.name + suffix))
+
+            sizes: dict[str, int] = {}
+            for fmt, sidecar in sidecars.items():
+                compressed = None if small else _compress(data, fmt)
+                if compressed is None or len(compressed) >= len(data):
+                    _unlink(sidecar)
+                    continue
+                _write_atomic(sidecar, compressed)
+                sizes[fmt] = len(compressed)
+
+            self.registry.update_output(key, content_hash, output_type, stamp=stamp)
+            return (output_type.value, len(data), sizes)
+        except OSError as e:
+            return f"{key}: {e}"
+
+    def _remove_orphans(self, output_dir: Path, candidates: list[Path]) -> int:
+        """Delete sidecars for registered outputs that no longer exist."""
+        live = {path.relative_to(output_dir).as_posix() for path in candidates}
+        removed = 0
+        for key in [k for k in self.registry.output_hashes if k not in live]:
+            for suffix in SIDECAR_SUFFIXES.values():
+                sidecar = output_dir / (key + suffix)
+                if sidecar.exists():
+                    _unlink(sidecar)
+                    removed += 1
+            self.registry.remove_output(key)
+        return removed
+
+
+def _compress(data: bytes, fmt: str) -> bytes | None:
+    """Compress ``data`` in one format; None if the codec is unavailable."""
+    if fmt == "gzip":
+        # mtime=0 keeps sidecars byte-identical across builds
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    if fmt == "zstd":
+        from compression import zstd
+
+        return zstd.compress(data, level=ZSTD_LEVEL)
+    if fmt == "br":
+        try:
+            import brotli
+        except ImportError:
+            return None
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    return None
+
+
+def _brotli_available() -> bool:
+    import importlib.util
+
+    return importlib.util.find_spec("brotli") is not None
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write via temp file + rename.
+
+    Never writes in place: output files may be hardlinks shared with the
+    dev server's other buffer, and a rename gives the sidecar a new inode.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):  # silent: best-effort temp file cleanup
+            os.unlink(tmp_path)
+        raise
+
+
+def _unlink(path: Path) -> None:
+    with contextlib.suppress(FileNotFoundError):
+        path.unlink()
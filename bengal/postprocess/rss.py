@@ -33,10 +33,34 @@ from bengal.utils.observability.logger import get_logger
 from bengal.utils.paths.normalize import to_posix
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from bengal.core.output import OutputCollector
     from bengal.protocols import SiteLike
 
 
+def _write_feed_xml(
+    site: SiteLike, collector: OutputCollector | None, root: ET.Element, path: Path
+) -> None:
+    """Write a feed document, leaving the file alone when its bytes are unchanged."""
+    from bengal.cache.output_gate import get_output_gate, record_write
+    from bengal.core.output import OutputType
+
+    gate = get_output_gate(site)
+    if gate is None:
+        from bengal.utils.io.atomic_write import AtomicFile
+
+        with AtomicFile(path, "wb") as f:
+            ET.ElementTree(root).write(f, encoding="utf-8", xml_declaration=True)
+        written = True
+    else:
+        data = ET.tostring(root, encoding="utf-8", xml_declaration=True)
+        written = gate.write_bytes(path, data)
+
+    # Record output for hot reload tracking
+    record_write(collector, path, written, OutputType.XML)
+
+
 class RSSGenerator:
     """
     Generates RSS/Atom feeds for content syndication.
@@ -208,9 +232,6 @@ class RSSGenerator:
                     ET.SubElement(item, "pubDate").text = pubdate
 
             # Write per-language RSS
-            from bengal.utils.io.atomic_write import AtomicFile
-
-            tree = ET.ElementTree(rss)
             if strategy == "prefix" and (default_in_subdir or code != default_lang):
                 rss_path = self.site.output_dir / code / "rss.xml"
             else:
@@ -225,14 +246,7 @@ class RSSGenerator:
             rss_path.parent.mkdir(parents=True, exist_ok=True)
             indent_xml(rss)
             try:
-                with AtomicFile(rss_path, "wb") as f:
-                    tree.write(f, encoding="utf-8", xml_declaration=True)
-
-                # Record output for hot reload tracking
-                if self._collector:
-                    from bengal.core.output import OutputType
-
-                    self._collector.record(rss_path, OutputType.XML, phase="postprocess")
+                _write_feed_xml(self.site, self._collector, rss, rss_path)
 
                 self.logger.info(
                     "rss_generation_complete",
@@ -340,19 +354,10 @@ class AtomGenerator:
             )
 
     def _write_feed(self, feed: ET.Element, atom_path: Any, code: str) -> None:
-        from bengal.utils.io.atomic_write import AtomicFile
-
         atom_path.parent.mkdir(parents=True, exist_ok=True)
         indent_xml(feed)
-        tree = ET.ElementTree(feed)
         try:
-            with AtomicFile(atom_path, "wb") as f:
-                tree.write(f, encoding="utf-8", xml_declaration=True)
-
-            if self._collector:
-                from bengal.core.output import OutputType
-
-                self._collector.record(atom_path, OutputType.XML, phase="postprocess")
+            _write_feed_xml(self.site, self._collector, feed, atom_path)
 
             self.logger.info("atom_generation_complete", lang=code, atom_path=str(atom_path))
         except Exception as e:
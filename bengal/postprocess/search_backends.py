@@ -9,13 +9,14 @@ from bengal.errors import BengalConfigError, ErrorCode
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
     from pathlib import Path
 
+    from bengal.orchestration.build_context import AccumulatedPageData
     from bengal.protocols import SiteLike
 
 
-SUPPORTED_SEARCH_BACKENDS = frozenset({"lunr"})
+SUPPORTED_SEARCH_BACKENDS = frozenset({"lunr", "native"})
 logger = get_logger(__name__)
 
 
@@ -26,12 +27,23 @@ class SearchBackendConfig:
     enabled: bool = True
     backend: str = "lunr"
     lunr: dict[str, Any] = field(default_factory=dict)
+    native: dict[str, Any] = field(default_factory=dict)
 
     @property
     def prebuilt_enabled(self) -> bool:
         """Whether this backend should emit prebuilt search artifacts."""
+        if self.backend == "native":
+            # The native index is the only search artifact; there is no runtime fallback
+            return True
         return bool(self.lunr.get("prebuilt", True))
 
+    @property
+    def artifact_name(self) -> str:
+        """Entry-point artifact written alongside each index.json."""
+        if self.backend == "native":
+            return "search/manifest.json"
+        return "search-index.json"
+
 
 class SearchIndexBackend(Protocol):
     """Provider interface for search artifacts generated from index.json."""
@@ -69,21 +81,38 @@ def resolve_search_backend_config(config: dict[str, Any] | bool | None) -> Searc
             f"Unsupported search backend: {backend!r}.",
             code=ErrorCode.C003,
             debug_payload={"backend": backend, "supported": supported},
-            suggestion=f"Use search.backend = 'lunr'. Supported backends: {supported}.",
+            suggestion=f"Use search.backend = 'lunr' or 'native'. Supported backends: {supported}.",
         )
 
-    lunr_config = config.get("lunr", {})
-    if lunr_config is None:
-        lunr_config = {}
-    if not isinstance(lunr_config, dict):
+    lunr_config = _backend_options(config, "lunr", "Lunr")
+    native_config = _backend_options(config, "native", "native search")
+    prefix_length = native_config.get("prefix_length", 2)
+    if isinstance(prefix_length, bool) or not isinstance(prefix_length, int) or prefix_length < 1:
         raise BengalConfigError(
-            "Invalid search.lunr configuration: expected a table.",
+            "Invalid search.native.prefix_length: expected a positive integer.",
             code=ErrorCode.C004,
-            debug_payload={"value_type": type(lunr_config).__name__},
-            suggestion="Configure Lunr options under search.lunr, or remove the key.",
+            debug_payload={"value": repr(prefix_length)},
+            suggestion="Set search.native.prefix_length to 1, 2 or 3 (default: 2).",
         )
 
-    return SearchBackendConfig(enabled=enabled, backend=backend, lunr=dict(lunr_config))
+    return SearchBackendConfig(
+        enabled=enabled, backend=backend, lunr=lunr_config, native=native_config
+    )
+
+
+def _backend_options(config: dict[str, Any], key: str, label: str) -> dict[str, Any]:
+    """Return the per-backend options table ``search.<key>``."""
+    options = config.get(key, {})
+    if options is None:
+        options = {}
+    if not isinstance(options, dict):
+        raise BengalConfigError(
+            f"Invalid search.{key} configuration: expected a table.",
+            code=ErrorCode.C004,
+            debug_payload={"value_type": type(options).__name__},
+            suggestion=f"Configure {label} options under search.{key}, or remove the key.",
+        )
+    return dict(options)
 
 
 class LunrSearchBackend:
@@ -125,15 +154,85 @@ class LunrSearchBackend:
         return generated
 
 
-def create_search_backend(site: SiteLike, config: SearchBackendConfig) -> SearchIndexBackend:
-    """Create the configured search backend adapter."""
+class NativeSearchBackend:
+    """Generate the native sharded search index from render accumulations."""
+
+    name = "native"
+
+    def __init__(
+        self,
+        site: SiteLike,
+        config: SearchBackendConfig,
+        *,
+        site_data: Mapping[Path, dict[str, Any]] | None = None,
+        accumulated_data: list[AccumulatedPageData] | None = None,
+    ) -> None:
+        self.site = site
+        self.config = config
+        self.site_data = site_data or {}
+        self.accumulated_data = accumulated_data
+
+    def generate(
+        self,
+        index_paths: list[Path],
+        timed_generate: Callable[[str, Callable[[], Path | None]], Path | None],
+    ) -> list[str]:
+        """Generate a sharded index alongside each index.json."""
+        if not self.config.enabled:
+            return []
+
+        from bengal.postprocess.output_formats.native_search_index import (
+            NativeSearchIndexGenerator,
+        )
+
+        paths = getattr(getattr(self.site, "config_service", None), "paths", None)
+        generator = NativeSearchIndexGenerator(
+            self.site,
+            prefix_length=self.config.native.get("prefix_length", 2),
+            doc_ids_path=getattr(paths, "search_doc_ids", None),
+        )
+
+        generated = []
+        for index_path in index_paths:
+            manifest_path = timed_generate(
+                "site_native_index",
+                lambda index_path=index_path: generator.generate(
+                    index_path,
+                    self.site_data.get(index_path),
+                    self.accumulated_data,
+                ),
+            )
+            if manifest_path:
+                generated.append(self.config.artifact_name)
+        generator.save_doc_ids()
+        return generated
+
+
+def create_search_backend(
+    site: SiteLike,
+    config: SearchBackendConfig,
+    *,
+    site_data: Mapping[Path, dict[str, Any]] | None = None,
+    accumulated_data: list[AccumulatedPageData] | None = None,
+) -> SearchIndexBackend:
+    """
+    Create the configured search backend adapter.
+
+    ``site_data`` (index.json payloads built this run, keyed by path) and
+    ``accumulated_data`` let the native backend index straight from memory;
+    the Lunr backend always reads index.json.
+    """
     if config.backend == "lunr":
         return LunrSearchBackend(site, config)
+    if config.backend == "native":
+        return NativeSearchBackend(
+            site, config, site_data=site_data, accumulated_data=accumulated_data
+        )
 
     supported = ", ".join(sorted(SUPPORTED_SEARCH_BACKENDS))
     raise BengalConfigError(
         f"Unsupported search backend: {config.backend!r}.",
         code=ErrorCode.C003,
         debug_payload={"backend": config.backend, "supported": supported},
-        suggestion=f"Use search.backend = 'lunr'. Supported backends: {supported}.",
+        suggestion=f"Use search.backend = 'lunr' or 'native'. Supported backends: {supported}.",
     )
@@ -11,6 +11,17 @@ Key Concepts:
 - Sitemap index: Index file for multiple sitemap files (large sites)
 - SEO optimization: Helps search engines discover and index content
 
+Streaming and sharding:
+    URL entries are serialized one at a time and streamed to disk, so memory
+    stays flat regardless of site size. Sites within the protocol limits
+    (50,000 URLs / 50 MB per file) get a single sitemap.xml. Larger sites get
+    one or more ``sitemap-<section>-N.xml`` shards per top-level output
+    directory plus ``sitemap_index.xml``; sitemap.xml then carries the same
+    index so robots.txt and existing submissions keep working. Shards follow
+    section boundaries, so a change in one section leaves the other shards
+    byte-identical, and files whose content did not change are not rewritten
+    (their mtime is kept and they are not reported to the output collector).
+
 Related Modules:
 - bengal.orchestration.postprocess: Post-processing orchestration
 - bengal.core.site: Site container with pages
@@ -24,18 +35,108 @@ See Also:
 
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+import itertools
+import re
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
+from xml.sax.saxutils import escape
 
 from bengal.errors import BengalRenderingError, ErrorCode, record_error
-from bengal.postprocess.utils import indent_xml
 from bengal.utils.observability.logger import get_logger
 from bengal.utils.paths.normalize import to_posix
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from bengal.cache.output_gate import OutputWriteGate
     from bengal.core.output import OutputCollector
     from bengal.protocols import SiteLike
 
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+XHTML_NS = "http://www.w3.org/1999/xhtml"
+
+# Per-file limits from the sitemap protocol
+MAX_URLS_PER_SITEMAP = 50_000
+MAX_SITEMAP_BYTES = 50 * 1024 * 1024
+
+SITEMAP_INDEX_NAME = "sitemap_index.xml"
+
+_XML_DECLARATION = b"<?xml version='1.0' encoding='utf-8'?>\n"
+_URLSET_OPEN = _XML_DECLARATION + (
+    f'<urlset xmlns="{SITEMAP_NS}" xmlns:xhtml="{XHTML_NS}">\n'.encode()
+)
+_URLSET_CLOSE = b"</urlset>\n"
+_INDEX_OPEN = _XML_DECLARATION + f'<sitemapindex xmlns="{SITEMAP_NS}">\n'.encode()
+_INDEX_CLOSE = b"</sitemapindex>\n"
+
+_ROOT_SECTION = "root"
+_SHARD_NAME = re.compile(r"^sitemap-[a-z0-9_-]+-\d+\.xml$")
+_SECTION_CHARS = re.compile(r"[^a-z0-9_]+")
+_INDEX_LOC = re.compile(r"<loc>([^<]*)</loc>")
+_ATTR_ENTITIES = {'"': "&quot;"}
+
+
+@dataclass(frozen=True, slots=True)
+class _SitemapEntry:
+    """One serialized ``<url>`` element and the shard group it belongs to."""
+
+    section: str
+    data: bytes
+    lastmod: str | None
+
+
+class _SitemapOverflow(Exception):
+    """A single-file sitemap would exceed the protocol limits."""
+
+
+class _UrlsetStream:
+    """
+    Chunks of one ``<urlset>`` file, pulled from a shared entry iterator.
+
+    Stops before the entry that would push the file past ``max_urls`` or
+    ``max_bytes`` and leaves it in ``carry`` for the next shard. With
+    ``strict`` the limit raises _SitemapOverflow instead.
+    """
+
+    def __init__(
+        self,
+        first: _SitemapEntry,
+        rest: Iterator[_SitemapEntry],
+        *,
+        max_urls: int,
+        max_bytes: int,
+        strict: bool = False,
+    ) -> None:
+        self._first = first
+        self._rest = rest
+        self._max_urls = max_urls
+        self._max_bytes = max_bytes
+        self._strict = strict
+        self.carry: _SitemapEntry | None = None
+        self.count = 0
+        self.lastmod: str | None = None
+
+    def chunks(self) -> Iterator[bytes]:
+        size = len(_URLSET_OPEN) + len(_URLSET_CLOSE)
+        yield _URLSET_OPEN
+        entry: _SitemapEntry | None = self._first
+        while entry is not None:
+            if self.count >= self._max_urls or size + len(entry.data) > self._max_bytes:
+                if self._strict:
+                    raise _SitemapOverflow
+                # An entry larger than the byte limit on its own still gets a file
+                if self.count:
+                    self.carry = entry
+                    break
+            yield entry.data
+            size += len(entry.data)
+            self.count += 1
+            if entry.lastmod and (self.lastmod is None or entry.lastmod > self.lastmod):
+                self.lastmod = entry.lastmod
+            entry = next(self._rest, None)
+        yield _URLSET_CLOSE
+
 
 class SitemapGenerator:
     """
@@ -52,6 +153,8 @@ class SitemapGenerator:
     Attributes:
         site: Site instance with pages and configuration
         logger: Logger instance for sitemap generation events
+        max_urls: URL limit per sitemap file
+        max_bytes: Size limit per sitemap file
 
     Relationships:
         - Used by: PostprocessOrchestrator for sitemap generation
@@ -62,7 +165,8 @@ class SitemapGenerator:
         - Last modified dates from page metadata
         - Change frequency and priority metadata
         - i18n alternate language links (hreflang)
-        - Sitemap index support for large sites
+        - Streaming output with section-stable shards and a sitemap index
+          once the protocol limits are exceeded
 
     Examples:
         generator = SitemapGenerator(site)
@@ -70,29 +174,43 @@ class SitemapGenerator:
 
     """
 
-    def __init__(self, site: SiteLike, collector: OutputCollector | None = None) -> None:
+    def __init__(
+        self,
+        site: SiteLike,
+        collector: OutputCollector | None = None,
+        *,
+        max_urls: int = MAX_URLS_PER_SITEMAP,
+        max_bytes: int = MAX_SITEMAP_BYTES,
+    ) -> None:
         """
         Initialize sitemap generator.
 
         Args:
             site: Site instance
             collector: Optional output collector for hot reload tracking
+            max_urls: URL limit per sitemap file before sharding
+            max_bytes: Size limit per sitemap file before sharding
         """
         self.site = site
         self.logger = get_logger(__name__)
         self._collector = collector
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self._included = 0
+        self._skipped = 0
 
     def generate(self) -> None:
         """
-        Generate and write sitemap.xml to output directory.
+        Generate and write sitemap.xml (and shards, for large sites).
 
-        Iterates through all pages, creates XML entries with URLs and metadata,
-        and writes the sitemap atomically to prevent corruption.
+        Iterates through all pages in a stable order, streams XML entries to
+        disk and writes every file atomically to prevent corruption. Files
+        whose content is unchanged are left untouched.
 
         If no pages exist, logs info and skips generation (no empty sitemap file).
 
         Raises:
-            Exception: If sitemap generation or file writing fails
+            BengalRenderingError: If sitemap generation or file writing fails
         """
         # Skip if no pages (empty site)
         if not self.site.pages:
@@ -112,84 +230,190 @@ class SitemapGenerator:
             if key:
                 translation_index.setdefault(key, []).append(page)
 
-        # Create root element with xhtml namespace for hreflang alternates
-        urlset = ET.Element("urlset")
-        urlset.set("xmlns", "http://www.sitemaps.org/schemas/sitemap/0.9")
-        urlset.set("xmlns:xhtml", "http://www.w3.org/1999/xhtml")
-
-        baseurl = self.site.baseurl or ""
-
         # Stable page order so aggregate outputs (sitemap.xml) are byte-identical
         # regardless of site.pages insertion order (shard vs thread backends).
+        # Sorting by output path also keeps each section's pages contiguous.
         pages_for_sitemap = sorted(
             self.site.pages,
             key=self._sitemap_page_sort_key,
         )
 
-        # Add each page to sitemap
-        included_count = 0
-        skipped_count = 0
+        sitemap_path = self.site.output_dir / "sitemap.xml"
+        try:
+            written, shards = self._write_sitemaps(pages_for_sitemap, translation_index)
+
+            # Record output for hot reload tracking (changed files only)
+            if self._collector:
+                from bengal.core.output import OutputType
 
-        for page in pages_for_sitemap:
+                for path in written:
+                    self._collector.record(path, OutputType.XML, phase="postprocess")
+
+            self.logger.info(
+                "sitemap_generation_complete",
+                sitemap_path=str(sitemap_path),
+                pages_included=self._included,
+                pages_skipped=self._skipped,
+                total_pages=len(self.site.pages),
+                shards=shards,
+                files_written=len(written),
+            )
+
+            # Detailed output removed - postprocess phase summary is sufficient
+            # Individual task output clutters the build log
+        except Exception as e:
+            # Create structured error for session tracking
+            error = BengalRenderingError(
+                f"Sitemap generation failed: {e}",
+                code=ErrorCode.B008,
+                file_path=sitemap_path,
+                suggestion="Check output directory permissions and available disk space.",
+                original_error=e,
+            )
+            record_error(error, build_phase="postprocess:sitemap")
+
+            self.logger.error(
+                "sitemap_generation_failed",
+                sitemap_path=str(sitemap_path),
+                error=str(e),
+                error_type=type(e).__name__,
+                error_code=ErrorCode.B008.value,
+                suggestion="Check output directory permissions and available disk space.",
+            )
+            raise error from e
+
+    def _write_sitemaps(
+        self, pages: list[Any], translation_index: dict[str, list[Any]]
+    ) -> tuple[list[Path], int]:
+        """
+        Write sitemap.xml, or shards plus an index when over the limits.
+
+        Returns:
+            (paths actually rewritten, number of shards; 0 for a single file)
+        """
+        output_dir = self.site.output_dir
+        sitemap_path = output_dir / "sitemap.xml"
+        index_path = output_dir / SITEMAP_INDEX_NAME
+        previous_shards = _read_index_shards(index_path)
+        written: list[Path] = []
+
+        from bengal.cache.output_gate import get_output_gate
+
+        gate = get_output_gate(self.site)
+
+        # Pages marked in_sitemap bound the URL count from above; only try a
+        # single file when it can fit
+        if sum(1 for page in pages if page.in_sitemap) <= self.max_urls:
+            entries = self._iter_entries(pages, translation_index)
+            first = next(entries, None)
+            if first is None:
+                stream_chunks: Iterable[bytes] = (_URLSET_OPEN, _URLSET_CLOSE)
+            else:
+                stream = _UrlsetStream(
+                    first,
+                    entries,
+                    max_urls=self.max_urls,
+                    max_bytes=self.max_bytes,
+                    strict=True,
+                )
+                stream_chunks = stream.chunks()
+            try:
+                if _write_streamed(sitemap_path, stream_chunks, gate):
+                    written.append(sitemap_path)
+            except _SitemapOverflow:
+                pass
+            else:
+                # Back below the limits: drop the previous build's shards
+                for name in previous_shards:
+                    _unlink(output_dir / name)
+                if previous_shards:
+                    _unlink(index_path)
+                return written, 0
+
+        shards: list[tuple[str, str | None]] = []
+        # groupby only merges adjacent entries: bring each section together
+        # (stable, so path order holds within a section)
+        by_section = sorted(pages, key=lambda page: _section_for(self._page_rel_path(page) or ""))
+        entries = self._iter_entries(by_section, translation_index)
+        for section, group in itertools.groupby(entries, key=lambda entry: entry.section):
+            # The group iterator is shared: each shard resumes where the last stopped
+            rest: Iterator[_SitemapEntry] = group
+            carry: _SitemapEntry | None = next(rest)
+            for number in itertools.count(1):
+                if carry is None:
+                    break
+                name = f"sitemap-{section}-{number}.xml"
+                stream = _UrlsetStream(
+                    carry, rest, max_urls=self.max_urls, max_bytes=self.max_bytes
+                )
+                if _write_streamed(output_dir / name, stream.chunks(), gate):
+                    written.append(output_dir / name)
+                shards.append((name, stream.lastmod))
+                carry = stream.carry
+
+        index = self._render_index(shards)
+        written.extend(
+            path for path in (index_path, sitemap_path) if _write_streamed(path, (index,), gate)
+        )
+
+        live = {name for name, _ in shards}
+        for name in previous_shards:
+            if name not in live:
+                _unlink(output_dir / name)
+        return written, len(shards)
+
+    def _render_index(self, shards: list[tuple[str, str | None]]) -> bytes:
+        """Serialize a ``<sitemapindex>`` listing ``shards``."""
+        baseurl = self.site.baseurl or ""
+        parts = [_INDEX_OPEN]
+        for name, lastmod in shards:
+            item = f"  <sitemap>\n    <loc>{escape(f'{baseurl}/{name}')}</loc>\n"
+            if lastmod:
+                item += f"    <lastmod>{escape(lastmod)}</lastmod>\n"
+            parts.append(f"{item}  </sitemap>\n".encode())
+        parts.append(_INDEX_CLOSE)
+        return b"".join(parts)
+
+    def _iter_entries(
+        self, pages: list[Any], translation_index: dict[str, list[Any]]
+    ) -> Iterator[_SitemapEntry]:
+        """Yield serialized entries for pages that belong in the sitemap."""
+        from bengal.core.page.lastmod import resolve_page_lastmod
+
+        self._included = 0
+        self._skipped = 0
+        baseurl = self.site.baseurl or ""
+        default_lang = self.site.config.get("i18n", {}).get("default_language", "en")
+        git_dates = getattr(self.site, "git_lastmod_by_source", None)
+        if not isinstance(git_dates, dict):
+            git_dates = None
+
+        for page in pages:
             # Skip pages that shouldn't be in sitemap (hidden, visibility.sitemap=false, drafts)
             if not page.in_sitemap:
-                skipped_count += 1
+                self._skipped += 1
                 continue
 
-            url_elem = ET.SubElement(urlset, "url")
-
             # Get page URL
-            if page.output_path:
-                try:
-                    rel_path = page.output_path.relative_to(self.site.output_dir)
-                    loc = f"{baseurl}/{to_posix(rel_path)}"
-                except ValueError:
-                    skipped_count += 1
-                    continue
-            else:
-                loc = f"{baseurl}/{page.slug}/"
+            rel_path = self._page_rel_path(page)
+            if rel_path is None:
+                self._skipped += 1
+                continue
 
             # Remove /index.html for cleaner URLs
-            loc = loc.replace("/index.html", "/")
-
-            ET.SubElement(url_elem, "loc").text = loc
+            loc = f"{baseurl}/{rel_path}".replace("/index.html", "/")
+            lines = [f"    <loc>{escape(loc)}</loc>\n"]
 
             # Add hreflang alternates when translation_key present
             try:
                 if getattr(page, "translation_key", None):
-                    key: str = page.translation_key  # type: ignore[assignment]
-                    # Collect alternates using pre-built index: O(1) lookup
-                    seen = set()
-                    for p in translation_index.get(key, []):
-                        if p.output_path:
-                            try:
-                                rel = p.output_path.relative_to(self.site.output_dir)
-                                href = f"{baseurl}/{to_posix(rel)}"
-                                href = href.replace("/index.html", "/")
-                            except ValueError:
-                                # Skip pages not under output_dir
-                                continue
-                            lang = getattr(p, "lang", None) or self.site.config.get("i18n", {}).get(
-                                "default_language", "en"
-                            )
-                            if (lang, href) in seen:
-                                continue
-                            link = ET.SubElement(url_elem, "{http://www.w3.org/1999/xhtml}link")
-                            link.set("rel", "alternate")
-                            link.set("hreflang", lang)
-                            link.set("href", href)
-                            seen.add((lang, href))
-                    # Add x-default if default language exists among alternates
-                    default_lang = self.site.config.get("i18n", {}).get("default_language", "en")
-                    for child in list(url_elem):
-                        if child.tag.endswith("link") and child.get("hreflang") == default_lang:
-                            default_href: str | None = child.get("href")
-                            if default_href is not None:
-                                link = ET.SubElement(url_elem, "{http://www.w3.org/1999/xhtml}link")
-                                link.set("rel", "alternate")
-                                link.set("hreflang", "x-default")
-                                link.set("href", default_href)
-                                break
+                    lines.extend(
+                        self._hreflang_links(
+                            translation_index.get(page.translation_key, []),
+                            baseurl,
+                            default_lang,
+                        )
+                    )
             except Exception as e:
                 # Keep sitemap resilient
                 self.logger.debug(
@@ -199,14 +423,9 @@ class SitemapGenerator:
                     error_type=type(e).__name__,
                     action="skipping_hreflang",
                 )
-            included_count += 1
+            self._included += 1
 
             # Add lastmod if available
-            from bengal.core.page.lastmod import resolve_page_lastmod
-
-            git_dates = getattr(self.site, "git_lastmod_by_source", None)
-            if not isinstance(git_dates, dict):
-                git_dates = None
             lastmod_dt = resolve_page_lastmod(page, git_dates=git_dates)
             if lastmod_dt is not None:
                 lastmod = lastmod_dt.strftime("%Y-%m-%d")
@@ -214,66 +433,54 @@ class SitemapGenerator:
                 lastmod = page.date.strftime("%Y-%m-%d")
             else:
                 lastmod = None
-
             if lastmod:
-                ET.SubElement(url_elem, "lastmod").text = lastmod
+                lines.append(f"    <lastmod>{lastmod}</lastmod>\n")
 
             # Add default priority and changefreq
             # Version-aware: older versions get lower priority
-            priority = self._get_version_priority(page)
-            ET.SubElement(url_elem, "changefreq").text = "weekly"
-            ET.SubElement(url_elem, "priority").text = priority
-
-        # Write sitemap to file atomically (crash-safe)
-        from bengal.utils.io.atomic_write import AtomicFile
+            lines.append("    <changefreq>weekly</changefreq>\n")
+            lines.append(f"    <priority>{self._get_version_priority(page)}</priority>\n")
 
-        tree = ET.ElementTree(urlset)
-        sitemap_path = self.site.output_dir / "sitemap.xml"
-
-        # Format XML with indentation
-        indent_xml(urlset)
-
-        # Write atomically using context manager
-        try:
-            with AtomicFile(sitemap_path, "wb") as f:
-                tree.write(f, encoding="utf-8", xml_declaration=True)
-
-            # Record output for hot reload tracking
-            if self._collector:
-                from bengal.core.output import OutputType
-
-                self._collector.record(sitemap_path, OutputType.XML, phase="postprocess")
-
-            self.logger.info(
-                "sitemap_generation_complete",
-                sitemap_path=str(sitemap_path),
-                pages_included=included_count,
-                pages_skipped=skipped_count,
-                total_pages=len(self.site.pages),
-            )
-
-            # Detailed output removed - postprocess phase summary is sufficient
-            # Individual task output clutters the build log
-        except Exception as e:
-            # Create structured error for session tracking
-            error = BengalRenderingError(
-                f"Sitemap generation failed: {e}",
-                code=ErrorCode.B008,
-                file_path=sitemap_path,
-                suggestion="Check output directory permissions and available disk space.",
-                original_error=e,
+            yield _SitemapEntry(
+                section=_section_for(rel_path),
+                data=f"  <url>\n{''.join(lines)}  </url>\n".encode(),
+                lastmod=lastmod,
             )
-            record_error(error, build_phase="postprocess:sitemap")
 
-            self.logger.error(
-                "sitemap_generation_failed",
-                sitemap_path=str(sitemap_path),
-                error=str(e),
-                error_type=type(e).__name__,
-                error_code=ErrorCode.B008.value,
-                suggestion="Check output directory permissions and available disk space.",
-            )
-            raise error from e
+    def _hreflang_links(self, alternates: list[Any], baseurl: str, default_lang: str) -> list[str]:
+        """Serialize ``xhtml:link`` alternates (plus x-default) for a translation group."""
+        links: list[str] = []
+        seen: set[tuple[str, str]] = set()
+        default_href: str | None = None
+        for p in alternates:
+            if not p.output_path:
+                continue
+            try:
+                rel = p.output_path.relative_to(self.site.output_dir)
+            except ValueError:
+                # Skip pages not under output_dir
+                continue
+            href = f"{baseurl}/{to_posix(rel)}".replace("/index.html", "/")
+            lang = getattr(p, "lang", None) or default_lang
+            if (lang, href) in seen:
+                continue
+            seen.add((lang, href))
+            links.append(_xhtml_link(lang, href))
+            if default_href is None and lang == default_lang:
+                default_href = href
+        # Add x-default if default language exists among alternates
+        if default_href is not None:
+            links.append(_xhtml_link("x-default", default_href))
+        return links
+
+    def _page_rel_path(self, page: Any) -> str | None:
+        """Output path relative to the output dir (slug fallback), None when outside it."""
+        if page.output_path:
+            try:
+                return to_posix(page.output_path.relative_to(self.site.output_dir))
+            except ValueError:
+                return None
+        return f"{page.slug}/"
 
     def _sitemap_page_sort_key(self, page: Any) -> str:
         """Stable sort key for deterministic sitemap entry ordering."""
@@ -324,3 +531,42 @@ class SitemapGenerator:
             return "0.8"
         # Older versions get lower priority but still indexed
         return "0.3"
+
+
+def _xhtml_link(lang: str, href: str) -> str:
+    return (
+        f'    <xhtml:link rel="alternate" hreflang="{escape(lang, _ATTR_ENTITIES)}"'
+        f' href="{escape(href, _ATTR_ENTITIES)}" />\n'
+    )
+
+
+def _section_for(rel_path: str) -> str:
+    """Shard group for an output path: its top-level directory, slugified."""
+    head, sep, _ = rel_path.partition("/")
+    if not sep:
+        return _ROOT_SECTION
+    return _SECTION_CHARS.sub("-", head.lower()).strip("-") or _ROOT_SECTION
+
+
+def _read_index_shards(index_path: Path) -> list[str]:
+    """Shard file names listed in a previously written sitemap index."""
+    try:
+        text = index_path.read_text(encoding="utf-8")
+    except OSError, UnicodeError:
+        return []
+    names = (loc.rsplit("/", 1)[-1] for loc in _INDEX_LOC.findall(text))
+    return [name for name in names if _SHARD_NAME.match(name)]
+
+
+def _write_streamed(
+    path: Path, chunks: Iterable[bytes], gate: OutputWriteGate | None = None
+) -> bool:
+    """Stream ``chunks`` into ``path``; False when the file already held them."""
+    from bengal.cache.output_gate import write_streamed
+
+    written, _ = write_streamed(path, chunks, gate)
+    return written
+
+
+def _unlink(path: Path) -> None:
+    path.unlink(missing_ok=True)
@@ -10,7 +10,10 @@ Key Concepts:
 - Social cards: 1200x630px PNG images for Open Graph
 - Templates: Default (branded), minimal (centered), documentation (badges)
 - Caching: Content-based hash prevents unnecessary regeneration
-- Sequential generation: Required for Pillow thread-safety
+- Card cache: Rendered cards persist under .bengal/social-cards/, keyed by
+  the content hash, and are hardlinked into the output (survives a clean)
+- Process pool: Large batches render in worker processes that each own
+  their Pillow and font state
 
 Configuration:
 Social cards are configured in bengal.toml:
@@ -34,17 +37,22 @@ See Also:
 
 Thread Safety Note:
 Pillow's C extensions are NOT thread-safe in free-threading Python (3.13+).
-Social card generation uses sequential mode to avoid segfaults.
-This is acceptable since social cards are only generated for production
+Cards are never rendered from multiple threads: small batches render
+sequentially in-process, larger ones in a spawn process pool where every
+worker is single-threaded. Social cards are only generated for production
 builds, not during dev server operation.
 
 """
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
 import json
+import os
+import tempfile
 from dataclasses import dataclass, replace
+from pathlib import Path
 from threading import Lock
 from typing import TYPE_CHECKING, Any
 
@@ -55,7 +63,6 @@ from bengal.utils.paths.url_normalization import path_to_slug
 
 if TYPE_CHECKING:
     from collections.abc import MutableMapping, Sequence
-    from pathlib import Path
 
     from bengal.core.output import OutputCollector
     from bengal.protocols import PageLike, SiteLike
@@ -67,6 +74,12 @@ CARD_WIDTH = 1200
 CARD_HEIGHT = 630
 SOCIAL_CARD_FINGERPRINT_PREFIX = "social_card:"
 
+# Bump when the card layout changes so cached renders are not reused.
+SOCIAL_CARD_RENDER_VERSION = 1
+
+# Below this many renders, spawning worker processes costs more than it saves.
+MIN_CARDS_FOR_POOL = 16
+
 
 @dataclass
 class SocialCardConfig:
@@ -167,6 +180,35 @@ def _string_attr(value: Any) -> str:
     return value if isinstance(value, str) else ""
 
 
+@dataclass(frozen=True, slots=True)
+class CardJob:
+    """
+    A single card render, picklable so it can be shipped to a worker process.
+
+    Attributes:
+        card_hash: Content hash from SocialCardGenerator._compute_card_hash
+        config: Effective (per-page) card configuration
+        title: Card title
+        description: Card description
+        site_name: Site name for branding
+        site_url: Site URL for the footer
+        title_font_path: Resolved TTF for the title
+        body_font_path: Resolved TTF for body text
+        dest_path: File to write (card cache entry or output path)
+
+    """
+
+    card_hash: str
+    config: SocialCardConfig
+    title: str
+    description: str
+    site_name: str
+    site_url: str
+    title_font_path: str
+    body_font_path: str
+    dest_path: str
+
+
 class SocialCardGenerator:
     """
     Generates social card (Open Graph) images for pages.
@@ -207,6 +249,7 @@ class SocialCardGenerator:
         config: SocialCardConfig,
         collector: OutputCollector | None = None,
         fingerprint_cache: MutableMapping[str, str] | None = None,
+        card_cache_dir: Path | None = None,
     ) -> None:
         """
         Initialize social card generator.
@@ -216,6 +259,8 @@ class SocialCardGenerator:
             config: SocialCardConfig with styling options
             collector: Optional output collector for hot reload tracking
             fingerprint_cache: Optional persisted cache mapping for card hashes
+            card_cache_dir: Directory for rendered cards keyed by content hash
+                (defaults to .bengal/social-cards/ when the site provides paths)
         """
         self.site = site
         self.config = config
@@ -224,9 +269,16 @@ class SocialCardGenerator:
             fingerprint_cache if fingerprint_cache is not None else {}
         )
         self._cache_lock = Lock()
+        if card_cache_dir is None:
+            paths = getattr(getattr(site, "config_service", None), "paths", None)
+            default_dir = getattr(paths, "social_cards_dir", None)
+            card_cache_dir = default_dir if isinstance(default_dir, Path) else None
+        self._card_cache_dir = card_cache_dir if config.cache else None
         self._title_font: ImageFont.FreeTypeFont | None = None
         self._body_font: ImageFont.FreeTypeFont | None = None
         self._small_font: ImageFont.FreeTypeFont | None = None
+        self._title_font_path: Path | None = None
+        self._body_font_path: Path | None = None
         self._fonts_available: bool = True  # Assume available until proven otherwise
 
     def _load_fonts(self) -> bool:
@@ -260,9 +312,7 @@ class SocialCardGenerator:
             body_path = self._get_font_path(self.config.body_font, bold=False)
 
             # Load fonts once - these will be reused for all cards
-            self._title_font = ImageFont.truetype(str(title_path), 56)
-            self._body_font = ImageFont.truetype(str(body_path), 28)
-            self._small_font = ImageFont.truetype(str(body_path), 22)
+            self._use_fonts(title_path, body_path)
 
             logger.info(
                 "social_cards_fonts_loaded",
@@ -285,6 +335,14 @@ class SocialCardGenerator:
             self._fonts_available = False
             return False
 
+    def _use_fonts(self, title_path: Path, body_path: Path) -> None:
+        """Load the title/body fonts from resolved TTF paths."""
+        self._title_font = ImageFont.truetype(str(title_path), 56)
+        self._body_font = ImageFont.truetype(str(body_path), 28)
+        self._small_font = ImageFont.truetype(str(body_path), 22)
+        self._title_font_path = title_path
+        self._body_font_path = body_path
+
     def _get_font_path(self, font_name: str, bold: bool = False) -> Path:
         """
         Get path to font file, downloading TTF from Google Fonts if needed.
@@ -459,7 +517,9 @@ class SocialCardGenerator:
         content = json.dumps(payload, sort_keys=True, separators=(",", ":"))
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
-    def _should_regenerate(self, page: PageLike, output_path: Path) -> bool:
+    def _should_regenerate(
+        self, page: PageLike, output_path: Path, card_hash: str | None = None
+    ) -> bool:
         """
         Check if card needs regeneration.
 
@@ -469,6 +529,7 @@ class SocialCardGenerator:
         Args:
             page: Page to check
             output_path: Expected output path
+            card_hash: Precomputed card hash (computed if omitted)
 
         Returns:
             True if card needs to be generated
@@ -479,7 +540,7 @@ class SocialCardGenerator:
         if not output_path.exists():
             return True
 
-        current_hash = self._compute_card_hash(page)
+        current_hash = card_hash or self._compute_card_hash(page)
         page_key = self._cache_key(page)
 
         with self._cache_lock:
@@ -487,6 +548,17 @@ class SocialCardGenerator:
 
         return current_hash != cached_hash
 
+    def _card_cache_path(self, card_hash: str) -> Path | None:
+        """Return the card cache entry for a content hash, or None without a cache."""
+        if self._card_cache_dir is None:
+            return None
+        ext = "jpg" if self.config.format == "jpg" else "png"
+        return (
+            self._card_cache_dir
+            / card_hash[:2]
+            / f"v{SOCIAL_CARD_RENDER_VERSION}_{card_hash}.{ext}"
+        )
+
     def _get_output_path(self, page: PageLike, output_dir: Path) -> Path:
         """
         Get output path for a page's social card.
@@ -730,6 +802,76 @@ class SocialCardGenerator:
 
         return img
 
+    def _build_job(self, page: PageLike, card_hash: str, dest_path: Path) -> CardJob:
+        """Capture everything needed to render a page's card, detached from the page."""
+        assert self._title_font_path is not None
+        assert self._body_font_path is not None
+        return CardJob(
+            card_hash=card_hash,
+            config=self._effective_config(page),
+            title=page.title or "Untitled",
+            description=page.description or "",
+            site_name=_string_attr(getattr(self.site, "title", "")),
+            site_url=_string_attr(getattr(self.site, "baseurl", "")),
+            title_font_path=str(self._title_font_path),
+            body_font_path=str(self._body_font_path),
+            dest_path=str(dest_path),
+        )
+
+    def _render_job(self, job: CardJob) -> bool:
+        """
+        Render a card job and write it atomically to ``job.dest_path``.
+
+        Returns:
+            False if fonts are unavailable, True once the image is written
+        """
+        config = job.config
+        if config.template == "minimal":
+            img = self._render_minimal_template(
+                job.title, job.description, job.site_name, job.site_url, config
+            )
+        else:
+            img = self._render_default_template(
+                job.title, job.description, job.site_name, job.site_url, config
+            )
+
+        # Skip if fonts unavailable (img is None)
+        if img is None:
+            return False
+
+        dest_path = Path(job.dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=dest_path.parent, prefix=".card_")
+        os.close(fd)
+        try:
+            if config.format == "jpg":
+                img.save(tmp_path, "JPEG", quality=config.quality, optimize=True)
+            else:
+                img.save(tmp_path, "PNG", optimize=True)
+            os.replace(tmp_path, dest_path)
+        except BaseException:
+            with contextlib.suppress(OSError):  # silent: best-effort temp file cleanup
+                os.unlink(tmp_path)
+            raise
+        return True
+
+    def _publish(self, page: PageLike, card_hash: str, output_path: Path) -> None:
+        """Place a rendered card at ``output_path`` and record its fingerprint."""
+        cache_path = self._card_cache_path(card_hash)
+        if cache_path is not None:
+            from bengal.utils.io.file_io import link_or_copy
+
+            link_or_copy(cache_path, output_path)
+
+        if self._collector:
+            from bengal.core.output import OutputType
+
+            self._collector.record(output_path, OutputType.IMAGE, phase="postprocess")
+
+        page_key = self._cache_key(page)
+        with self._cache_lock:
+            self._cache[page_key] = card_hash
+
     def generate_card(self, page: PageLike, output_path: Path) -> Path | None:
         """
         Generate a single social card for a page.
@@ -757,58 +899,28 @@ class SocialCardGenerator:
         if social_card_meta is False:
             return None
 
-        # Get content
-        title = page.title or "Untitled"
-        description = page.description or ""
-        site_name = _string_attr(getattr(self.site, "title", ""))
-        site_url = _string_attr(getattr(self.site, "baseurl", ""))
-
-        # Apply per-page overrides using a local copy to avoid mutating shared config
-        # This prevents one page's overrides from affecting subsequent pages
-        config = self._effective_config(page)
-
-        # Select template (use local config for per-page overrides)
-        template = config.template
-        if template == "minimal":
-            img = self._render_minimal_template(title, description, site_name, site_url, config)
-        else:
-            img = self._render_default_template(title, description, site_name, site_url, config)
-
-        # Skip if fonts unavailable (img is None)
-        if img is None:
+        if not self._load_fonts():
             return None
 
-        # Ensure output directory exists
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save image
-        if self.config.format == "jpg":
-            img.save(output_path, "JPEG", quality=self.config.quality, optimize=True)
-        else:
-            img.save(output_path, "PNG", optimize=True)
-
-        if self._collector:
-            from bengal.core.output import OutputType
-
-            self._collector.record(output_path, OutputType.IMAGE, phase="postprocess")
-
-        # Update cache
-        page_key = self._cache_key(page)
-        current_hash = self._compute_card_hash(page)
-        with self._cache_lock:
-            self._cache[page_key] = current_hash
+        card_hash = self._compute_card_hash(page)
+        cache_path = self._card_cache_path(card_hash)
+        job = self._build_job(page, card_hash, cache_path or output_path)
+        if not self._render_job(job):
+            return None
 
+        self._publish(page, card_hash, output_path)
         return output_path
 
     def generate_all(self, pages: Sequence[PageLike], output_dir: Path) -> tuple[int, int]:
         """
         Generate social cards for all pages.
 
-        Uses SEQUENTIAL processing because Pillow is NOT thread-safe
-        in free-threading Python. This is acceptable since:
-        - Social cards are only generated for production builds
-        - Dev server skips social cards entirely
-        - ~30ms per card is acceptable for deploy builds
+        Cards whose content hash is already in the card cache are hardlinked
+        (or copied) into the output instead of re-rendered, so a clean output
+        directory does not force a full re-render. Remaining cards render
+        sequentially for small batches and in a spawn process pool otherwise:
+        Pillow is NOT thread-safe in free-threading Python, but every pool
+        worker is single-threaded and owns its own Pillow and font state.
 
         Args:
             pages: List of pages to generate cards for
@@ -824,8 +936,10 @@ class SocialCardGenerator:
             return (0, 0)
 
         # Filter pages that need generation
-        pages_to_generate: list[tuple[PageLike, Path]] = []
+        pages_to_generate: list[tuple[PageLike, Path, str]] = []
+        live_hashes: set[str] = set()
         cached_count = 0
+        errors: list[tuple[str, str]] = []
 
         for page in pages:
             # Skip pages with manual images or disabled social cards
@@ -835,50 +949,70 @@ class SocialCardGenerator:
                 continue
 
             output_path = self._get_output_path(page, output_dir)
+            card_hash = self._compute_card_hash(page)
+            live_hashes.add(card_hash)
 
-            if self._should_regenerate(page, output_path):
-                pages_to_generate.append((page, output_path))
-            else:
+            if not self._should_regenerate(page, output_path, card_hash):
                 cached_count += 1
+                continue
+
+            cache_path = self._card_cache_path(card_hash)
+            if cache_path is not None and cache_path.exists():
+                # Rendered by an earlier build (or another page with the same card)
+                try:
+                    self._publish(page, card_hash, output_path)
+                    cached_count += 1
+                    continue
+                except OSError as e:
+                    logger.debug(
+                        "social_card_cache_link_failed",
+                        page=str(page.source_path),
+                        error=str(e),
+                        action="rerendering",
+                    )
+            pages_to_generate.append((page, output_path, card_hash))
+
+        self._prune_card_cache(live_hashes)
 
         if not pages_to_generate:
             return (0, cached_count)
 
-        generated_count = 0
-        errors: list[tuple[str, str]] = []
+        if not self._load_fonts():
+            return (0, cached_count)
 
-        # IMPORTANT: Pillow's C extensions are NOT thread-safe in free-threading Python.
-        # We use sequential generation to avoid segmentation faults.
-        # This is acceptable since social cards are only generated for production builds,
-        # not during dev server operation (~30ms per card).
-        logger.debug(
-            "social_cards_sequential_mode",
-            reason="pillow_thread_safety",
-            pages=len(pages_to_generate),
-        )
+        # Render each distinct card once, even when several pages share it
+        jobs: dict[str, CardJob] = {}
+        for page, output_path, card_hash in pages_to_generate:
+            if card_hash not in jobs:
+                cache_path = self._card_cache_path(card_hash)
+                jobs[card_hash] = self._build_job(page, card_hash, cache_path or output_path)
 
-        # Sequential generation (safe for all Python builds)
-        for i, (page, output_path) in enumerate(pages_to_generate):
-            try:
-                result = self.generate_card(page, output_path)
-                if result:
+        failures = self._render_jobs(list(jobs.values()))
+
+        generated_count = 0
+        for page, output_path, card_hash in pages_to_generate:
+            error = failures.get(card_hash)
+            if error is None:
+                try:
+                    if self._card_cache_path(card_hash) is None and str(output_path) != (
+                        jobs[card_hash].dest_path
+                    ):
+                        # No card cache: duplicate cards are copied from the first render
+                        from bengal.utils.io.file_io import link_or_copy
+
+                        link_or_copy(Path(jobs[card_hash].dest_path), output_path)
+                    self._publish(page, card_hash, output_path)
                     generated_count += 1
-                # Log progress for large batches
-                if len(pages_to_generate) > 100 and (i + 1) % 100 == 0:
-                    logger.debug(
-                        "social_cards_progress",
-                        generated=i + 1,
-                        total=len(pages_to_generate),
-                    )
-            except Exception as e:
-                errors.append((str(page.source_path), str(e)))
-                logger.warning(
-                    "social_card_generation_failed",
-                    page=str(page.source_path),
-                    error=str(e),
-                    error_type=type(e).__name__,
-                    suggestion="Check page frontmatter for invalid social_card options or font configuration.",
-                )
+                    continue
+                except OSError as e:
+                    error = str(e)
+            errors.append((str(page.source_path), error))
+            logger.warning(
+                "social_card_generation_failed",
+                page=str(page.source_path),
+                error=error,
+                suggestion="Check page frontmatter for invalid social_card options or font configuration.",
+            )
 
         if errors:
             logger.warning(
@@ -897,6 +1031,103 @@ class SocialCardGenerator:
 
         return (generated_count, cached_count)
 
+    def _render_jobs(self, jobs: list[CardJob]) -> dict[str, str]:
+        """
+        Render card jobs, in a process pool when the batch is large enough.
+
+        Returns:
+            Mapping of card hash to error message for jobs that failed
+        """
+        from bengal.utils.concurrency.workers import WorkloadType, get_optimal_workers
+
+        failures: dict[str, str] = {}
+        workers = get_optimal_workers(len(jobs), workload_type=WorkloadType.CPU_BOUND)
+
+        if workers > 1 and len(jobs) >= MIN_CARDS_FOR_POOL:
+            from concurrent.futures.process import BrokenProcessPool
+
+            from bengal.utils.concurrency.executor import managed_process_pool
+
+            logger.debug("social_cards_process_pool", workers=workers, cards=len(jobs))
+            try:
+                chunksize = max(1, len(jobs) // (workers * 4))
+                with managed_process_pool(workers) as pool:
+                    for job, error in zip(
+                        jobs, pool.map(render_card_job, jobs, chunksize=chunksize), strict=True
+                    ):
+                        if error is not None:
+                            failures[job.card_hash] = error
+                return failures
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(
+                    "social_cards_process_pool_failed",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    action="rendering_sequentially",
+                )
+                failures.clear()
+
+        # IMPORTANT: Pillow's C extensions are NOT thread-safe in free-threading Python.
+        # In-process rendering stays sequential on this thread.
+        logger.debug(
+            "social_cards_sequential_mode",
+            reason="pillow_thread_safety",
+            pages=len(jobs),
+        )
+        for i, job in enumerate(jobs):
+            try:
+                if not self._render_job(job):
+                    failures[job.card_hash] = "fonts unavailable"
+            except Exception as e:
+                failures[job.card_hash] = f"{type(e).__name__}: {e}"
+            # Log progress for large batches
+            if len(jobs) > 100 and (i + 1) % 100 == 0:
+                logger.debug("social_cards_progress", generated=i + 1, total=len(jobs))
+        return failures
+
+    def _prune_card_cache(self, live_hashes: set[str]) -> None:
+        """Delete cached cards that no page of this build references."""
+        if self._card_cache_dir is None or not self._card_cache_dir.is_dir():
+            return
+        live = {path.name for h in live_hashes if (path := self._card_cache_path(h))}
+        removed = 0
+        for entry in self._card_cache_dir.glob("*/*"):
+            if entry.name not in live:
+                with contextlib.suppress(OSError):
+                    entry.unlink()
+                    removed += 1
+        if removed:
+            logger.debug("social_card_cache_pruned", removed=removed)
+
+
+# Per-process generators for pool workers, keyed by (title font, body font).
+# Workers are single-threaded, so this needs no lock.
+_worker_generators: dict[tuple[str, str], SocialCardGenerator] = {}
+
+
+def render_card_job(job: CardJob) -> str | None:
+    """
+    Render one card job in a worker process.
+
+    Fonts are loaded once per worker and reused for every job it receives.
+
+    Returns:
+        None on success, otherwise an error message
+    """
+    try:
+        key = (job.title_font_path, job.body_font_path)
+        generator = _worker_generators.get(key)
+        if generator is None:
+            # The site is only consulted for font discovery, which the parent resolved
+            generator = SocialCardGenerator(None, job.config)  # type: ignore[arg-type]
+            generator._use_fonts(Path(job.title_font_path), Path(job.body_font_path))
+            _worker_generators[key] = generator
+        if not generator._render_job(job):
+            return "fonts unavailable"
+    except Exception as e:
+        return f"{type(e).__name__}: {e}"
+    return None
+
 
 def get_social_card_path(
     page: PageLike, config: SocialCardConfig, base_path: str = ""
@@ -118,6 +118,7 @@ class SpecialPagesGenerator:
         """
         self.site = site
         self._collector = collector
+        self._build_context: BuildContext | Any | None = None
 
     def generate(self, build_context: BuildContext | Any | None = None) -> None:
         """
@@ -133,6 +134,7 @@ class SpecialPagesGenerator:
             build_context: Optional BuildContext with cached knowledge graph
         """
         pages_generated = []
+        self._build_context = build_context
 
         # Always generate 404 page
         if self._generate_404():
@@ -160,6 +162,15 @@ class SpecialPagesGenerator:
                 suggestion="Check theme templates (404.html, search.html) and feature configuration.",
             )
 
+    def _harvest_selectors(self, html: str) -> None:
+        """Feed special-page markup to the unused-selector purge, when enabled."""
+        build_context = self._build_context
+        if getattr(build_context, "css_purger", None) is None:
+            return
+        from bengal.assets.css_purge import harvest_html
+
+        build_context.accumulate_selectors(harvest_html(html))
+
     def _generate_404(self) -> bool:
         """
         Generate 404 error page with site styling.
@@ -222,6 +233,7 @@ class SpecialPagesGenerator:
 
             # Render 404 page (template functions are already registered in TemplateEngine.__init__)
             rendered_html = template_engine.render("404.html", context)
+            self._harvest_selectors(rendered_html)
 
             # Write to output directory only if content changed (avoid churn)
             output_path = self.site.output_dir / "404.html"
@@ -379,6 +391,7 @@ class SpecialPagesGenerator:
 
             # Render search page
             rendered_html = template_engine.render(template_name, context)
+            self._harvest_selectors(rendered_html)
 
             # Determine output path: /search/index.html by default
             # raw_path always ends with '/'
@@ -486,6 +499,7 @@ class SpecialPagesGenerator:
             visualizer = GraphVisualizer(self.site, graph)
             title = f"Knowledge Graph - {self.site.config.get('title', 'Site')}"
             html = visualizer.generate_html(title=title)
+            self._harvest_selectors(html)
 
             # Determine output path: /graph/index.html by default
             # raw_path always ends with '/'
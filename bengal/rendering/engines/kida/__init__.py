@@ -176,10 +176,13 @@ class KidaTemplateEngine:
         kida_config = site.config.get("kida", {}) or {}
 
         # Configure bytecode cache for near-instant cold starts
-        # Uses .bengal/cache/kida/ under site root for persistent caching
+        # Uses .bengal/cache/kida/ under site root for persistent caching,
+        # or the machine-level shared cache (build.shared_cache) when enabled
         bytecode_cache: BytecodeCache | bool | None = None
         if kida_config.get("bytecode_cache", True):  # Enabled by default
-            cache_dir = site.root_path / ".bengal" / "cache" / "kida"
+            cache_dir = self._shared_bytecode_dir(kida_config)
+            if cache_dir is None:
+                cache_dir = site.root_path / ".bengal" / "cache" / "kida"
             bytecode_cache = BytecodeCache(cache_dir)
 
         # Fragment cache configuration
@@ -241,6 +244,42 @@ class KidaTemplateEngine:
         self._directive_template_renderer = self._create_directive_template_renderer()
         site._directive_template_renderer = self._directive_template_renderer
 
+    def _shared_bytecode_dir(self, kida_config: dict[str, Any]) -> Path | None:
+        """Bytecode directory in the machine-level shared cache, or None.
+
+        Kida keys bytecode by template name and source hash; the directory is
+        keyed by everything else that changes compiled output, so sites that
+        share a theme share its bytecode. Not used with ``static_context``,
+        which folds this site's config into the bytecode.
+        """
+        from bengal.cache.shared_artifacts import artifact_key, configure_shared_cache
+
+        shared = configure_shared_cache(self.site.config)
+        if shared is None or kida_config.get("static_context", False):
+            return None
+
+        import sys
+        from importlib.metadata import PackageNotFoundError, version
+
+        from bengal import __version__
+
+        try:
+            kida_version = version("kida")
+        except PackageNotFoundError:
+            kida_version = "unknown"
+        options = {
+            key: kida_config[key]
+            for key in ("max_extends_depth", "max_include_depth", "template_aliases")
+            if key in kida_config
+        }
+        identity = artifact_key(
+            kida_version,
+            __version__,
+            sys.implementation.cache_tag or "",
+            repr(sorted(options.items())),
+        )
+        return shared.namespace_dir("kida") / identity[:16]
+
     def _build_template_dirs(self) -> list[Path]:
         return build_template_dirs(self)
 
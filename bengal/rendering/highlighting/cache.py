@@ -1,32 +1,257 @@
 """Site-wide cache for syntax-highlighted code blocks.
 
-Uses rosettes.content_hash() as cache key. Thread-safe for parallel page
-rendering. Per-build scope; cache is cleared between builds.
+Uses rosettes.content_hash() as cache key (code, language, highlighted lines
+and line-number options). Thread-safe for parallel page rendering: entries
+live in sharded dicts that are read without locking; only writes take the
+shard's lock, so 3.14t render workers never serialize on lookups.
+
+When a store directory is given, highlighted HTML also persists across builds
+in a content-addressed segment store (see bengal/cache/segment_store.py).
+Persisted entries are decoded on first lookup, new entries are appended on
+save(), and the store is kept under ``max_bytes`` by evicting the entries
+least recently used, measured in builds. The store is scoped to a namespace
+(Rosettes version, syntax theme, CSS class style); a namespace change starts
+an empty store.
 """
 
 from __future__ import annotations
 
 import threading
+from typing import TYPE_CHECKING, Any
+
+from bengal.utils.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from bengal.cache.segment_store import TrackedStore
+
+logger = get_logger(__name__)
+
+# Bump when the cached HTML shape changes independently of Rosettes.
+HIGHLIGHT_CACHE_VERSION = 1
+
+# Default on-disk budget for persisted highlighted HTML.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+_SHARD_COUNT = 16
+_META_NAME = "lru.json"
+
+
+def highlight_cache_namespace(config: Any | None = None) -> str:
+    """
+    Return the namespace that persisted highlight entries are valid for.
+
+    Combines the cache format version, the installed Rosettes version and the
+    configured syntax theme and CSS class style.
+    """
+    import rosettes
+
+    from bengal.rendering.highlighting.theme_resolver import (
+        resolve_css_class_style,
+        resolve_syntax_theme,
+    )
+
+    version = getattr(rosettes, "__version__", None)
+    if version is None:
+        from importlib.metadata import PackageNotFoundError
+        from importlib.metadata import version as dist_version
+
+        try:
+            version = dist_version("rosettes")
+        except PackageNotFoundError:
+            version = "unknown"
+    config = config or {}
+    return ":".join(
+        (
+            f"v{HIGHLIGHT_CACHE_VERSION}",
+            f"rosettes-{version}",
+            resolve_syntax_theme(config),
+            resolve_css_class_style(config),
+        )
+    )
 
 
 class HighlightCache:
     """Site-wide cache for highlighted code blocks. Thread-safe for parallel page rendering."""
 
-    def __init__(self, enabled: bool = True) -> None:
+    def __init__(
+        self,
+        enabled: bool = True,
+        store_dir: Path | None = None,
+        namespace: str = "",
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
         self._enabled = enabled
-        self._cache: dict[str, str] = {}
-        self._lock = threading.Lock()
+        self._shards: tuple[dict[str, str], ...] = tuple({} for _ in range(_SHARD_COUNT))
+        self._locks = tuple(threading.Lock() for _ in range(_SHARD_COUNT))
+        # Persisted keys read this build (set.add is atomic, no lock needed)
+        self._touched: set[str] = set()
+        self._store_dir: Path | None = None
+        self._namespace = namespace
+        self._max_bytes = max_bytes
+        self._store: TrackedStore | None = None
+        self._meta: dict[str, Any] = {}
+        if store_dir is not None:
+            self.attach_store(store_dir, namespace)
+
+    @property
+    def store_dir(self) -> Path | None:
+        """Directory of the persistent store, or None for a per-build cache."""
+        return self._store_dir
+
+    def attach_store(self, store_dir: Path, namespace: str) -> None:
+        """
+        Back this cache with the persistent store in ``store_dir``.
+
+        Entries from a store written under a different namespace are ignored
+        and replaced on the next save().
+        """
+        if not self._enabled:
+            return
+        self._store_dir = store_dir
+        self._namespace = namespace
+        self._store = None
+        self._meta = {}
+        self._open_store(store_dir)
 
     def get(self, key: str) -> str | None:
-        """Return cached HTML if present. Thread-safe for parallel rendering."""
+        """Return cached HTML if present. Lock-free for parallel rendering."""
         if not self._enabled:
             return None
-        with self._lock:
-            return self._cache.get(key)
+        html = self._shards[hash(key) % _SHARD_COUNT].get(key)
+        if html is not None or self._store is None:
+            return html
+        html = self._store.get(key)
+        if html is not None:
+            self._touched.add(key)
+        return html
 
     def set(self, key: str, html: str) -> None:
-        """Store highlighted HTML. Uses lock for thread-safe writes."""
+        """Store highlighted HTML. Locks only the key's shard."""
         if not self._enabled:
             return
-        with self._lock:
-            self._cache[key] = html
+        shard = hash(key) % _SHARD_COUNT
+        with self._locks[shard]:
+            self._shards[shard][key] = html
+
+    def save(self) -> None:
+        """
+        Persist new entries and evict least-recently-used ones over budget.
+
+        No-op without a store directory. Call once rendering has finished;
+        failures are logged and leave the previous store intact.
+        """
+        if self._store_dir is None:
+            return
+
+        from bengal.cache.segment_store import SegmentStore, TrackedStore
+        from bengal.utils.io import json_compat
+        from bengal.utils.io.file_lock import file_lock
+
+        store = self._store if self._store is not None else TrackedStore()
+        build = int(self._meta.get("build", 0)) + 1
+        entries: dict[str, list[int]] = self._meta.get("entries", {})
+
+        for key in self._touched:
+            if key in entries:
+                entries[key][0] = build
+        for shard in self._shards:
+            for key, html in list(shard.items()):
+                if key not in store:
+                    store[key] = html
+                    entries[key] = [build, len(html)]
+
+        evicted = 0
+        total = sum(size for _, size in entries.values())
+        if total > self._max_bytes:
+            for key in sorted(entries, key=lambda k: entries[k][0]):
+                if total <= self._max_bytes:
+                    break
+                total -= entries.pop(key)[1]
+                if key in store:
+                    del store[key]
+                evicted += 1
+
+        segments = SegmentStore(self._store_dir)
+        try:
+            with file_lock(self._store_dir / _META_NAME, exclusive=True):
+                dirty_keys, deleted_keys = store.pending_changes()
+                generation = segments.save(
+                    store,
+                    dirty_keys=dirty_keys,
+                    deleted_keys=deleted_keys,
+                    generation=store.generation,
+                )
+                store.mark_clean(generation)
+                if segments.needs_compaction():
+                    segments.compact()
+                json_compat.dump(
+                    {
+                        "namespace": self._namespace,
+                        "generation": generation,
+                        "build": build,
+                        "entries": entries,
+                    },
+                    self._store_dir / _META_NAME,
+                    indent=None,
+                )
+        except Exception as e:
+            logger.warning(
+                "highlight_cache_save_failed",
+                path=str(self._store_dir),
+                error=str(e),
+                error_type=type(e).__name__,
+                action="next_build_rehighlights",
+            )
+            return
+
+        self._store = store
+        self._meta = {"build": build, "entries": entries}
+        self._touched.clear()
+        # Saved entries are served (and LRU-stamped) through the store from now on
+        for lock, shard in zip(self._locks, self._shards, strict=True):
+            with lock:
+                shard.clear()
+        logger.debug(
+            "highlight_cache_saved",
+            path=str(self._store_dir),
+            entries=len(entries),
+            bytes=total,
+            appended=len(dirty_keys),
+            evicted=evicted,
+        )
+
+    def _open_store(self, store_dir: Path) -> None:
+        """Map the persisted store if it matches this cache's namespace."""
+        from bengal.cache.segment_store import SegmentStore
+        from bengal.utils.io import json_compat
+
+        try:
+            meta = json_compat.load(store_dir / _META_NAME)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            logger.warning(
+                "highlight_cache_load_failed",
+                path=str(store_dir),
+                error=str(e),
+                action="starting_empty",
+            )
+            return
+        if not isinstance(meta, dict) or meta.get("namespace") != self._namespace:
+            return
+
+        store = SegmentStore(store_dir).open()
+        if store is None or store.generation != meta.get("generation"):
+            return
+        entries = meta.get("entries")
+        if not isinstance(entries, dict):
+            return
+        # Keep LRU metadata only for keys the store still holds; keys without
+        # metadata (interrupted save) are evicted first
+        self._meta = {
+            "build": meta.get("build", 0),
+            "entries": {key: list(entries.get(key, (0, 0))) for key in store},
+        }
+        self._store = store
@@ -139,7 +139,8 @@ class CodeBlockCollector:
         """Batch highlight all pending code blocks.
 
         Uses parallel highlighting on 3.14t for speedup. When cache is provided,
-        checks cache first; cache misses are highlighted and stored.
+        checks cache first (including entries persisted by earlier builds);
+        only cache misses are batch highlighted, then stored.
         """
         if not self._pending:
             return {}
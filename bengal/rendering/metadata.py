@@ -128,6 +128,17 @@ def _get_capabilities(site: SiteLike | None = None) -> dict[str, bool]:
         from bengal.capabilities.runtime import resolve_runtime_capabilities, vendor_dir_for_site
 
         config = getattr(site, "config", {}) or {}
+
+        # Native sharded search index (no optional dependency; replaces search-index.json)
+        search = config.get("search", {})
+        native_search = (
+            isinstance(search, dict)
+            and bool(search.get("enabled", True))
+            and str(search.get("backend", "")).strip().lower() == "native"
+        )
+        capabilities["native_search"] = native_search
+        if native_search:
+            capabilities["prebuilt_search"] = False
         vendor_dir = vendor_dir_for_site(getattr(site, "root_path", Path()))
         capabilities.update(resolve_runtime_capabilities(config, vendor_dir))
 
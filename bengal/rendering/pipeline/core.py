@@ -167,6 +167,11 @@ class RenderingPipeline:
 
         configure_for_site(site)
 
+        # Machine-level shared artifact cache (opt-in: build.shared_cache)
+        from bengal.cache.shared_artifacts import configure_shared_cache
+
+        configure_shared_cache(site.config)
+
         # Get markdown engine from config (default: patitas)
         markdown_engine = site.config.get("markdown_engine")
         if not markdown_engine:
@@ -231,6 +236,8 @@ class RenderingPipeline:
                 getattr(build_context, "profile_templates", False) if build_context else False
             )
             self.template_engine = create_engine(site, profile=profile_templates)
+            if getattr(build_context, "render_template_engine", False) is None:
+                build_context.render_template_engine = self.template_engine
 
         self.renderer = Renderer(
             self.template_engine,
@@ -342,6 +349,10 @@ class RenderingPipeline:
             self._process_page_impl(page)
         finally:
             set_enhancer_for_render(None)
+            # Deferred bodies (build.defer_page_bodies) are re-read if needed later
+            from bengal.content.discovery.deferred_body import release_page_body
+
+            release_page_body(page)
 
     def _process_page_impl(self, page: PageLike) -> None:
         """Implementation of page processing (called within tracker context)."""
@@ -236,7 +236,8 @@ def write_output(
 
     # Write-behind mode: queue for async write (RFC: rfc-path-to-200-pgs)
     if write_behind is not None:
-        write_behind.enqueue(output_path, rendered_html)
+        if not write_behind.enqueue(output_path, rendered_html):
+            record_output = False  # skip-unchanged: file already holds these bytes
         _copy_notebook_source(page, output_path=output_path, collector=collector)
         _track_and_record(
             page,
@@ -261,6 +262,24 @@ def write_output(
     # temp-then-rename so served output is never partial.
     fast_writes = site.config.get("build", {}).get("fast_writes", False)
 
+    from bengal.cache.output_gate import get_output_gate
+
+    gate = get_output_gate(site)
+    if gate is not None:
+        # Skip-unchanged mode: identical bytes leave the file (and its mtime) alone
+        if not gate.write_text(output_path, rendered_html):
+            record_output = False
+        _copy_notebook_source(page, collector=collector)
+        _track_and_record(
+            page,
+            site,
+            collector,
+            build_cache=build_cache,
+            output_path=output_path,
+            record_output=record_output,
+        )
+        return
+
     try:
         from bengal.utils.io.atomic_write import atomic_write_text
 
@@ -366,10 +385,11 @@ def _track_and_record(
         cache.track_output(page.source_path, effective_output_path, site.output_dir)
 
     # Record output for hot reload tracking
-    if collector is not None and effective_output_path and record_output:
+    if collector is not None and effective_output_path:
+        from bengal.cache.output_gate import record_write
         from bengal.core.output import OutputType
 
-        collector.record(effective_output_path, OutputType.HTML, phase="render")
+        record_write(collector, effective_output_path, record_output, OutputType.HTML, "render")
 
 
 def format_html(html: str, page: PageLike, site: SiteLike) -> str:
@@ -239,6 +239,12 @@ def accumulate_asset_deps(
     if not pipeline.build_context or not html:
         return
 
+    # Unused-selector purge (assets.purge_css): record what this page's markup uses
+    if getattr(pipeline.build_context, "css_purger", None) is not None:
+        from bengal.assets.css_purge import harvest_html
+
+        pipeline.build_context.accumulate_selectors(harvest_html(html))
+
     assets: set[str] = set()
 
     # RFC: rfc-build-performance-optimizations Phase 2
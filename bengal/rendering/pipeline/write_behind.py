@@ -15,6 +15,11 @@ collector.enqueue(output_path, html_content)  # Non-blocking
 # After all rendering:
 collector.flush_and_close()  # Wait for writes to complete
 
+Pages are encoded to UTF-8 once, in the render thread, and written as bytes
+straight to a file descriptor. With an OutputWriteGate (see
+bengal/cache/output_gate.py), a page whose bytes match what its file already
+holds is not written at all (no temp file, no rename, no mtime churn).
+
 Thread Safety:
 Queue operations are thread-safe. Multiple render threads can
 enqueue simultaneously while the writer pool drains.
@@ -22,6 +27,7 @@ enqueue simultaneously while the writer pool drains.
 Performance Optimizations:
 - Multiple writer threads (8 by default) for SSD parallelism
 - Uses atomic temp-then-rename writes for every output
+- Skips outputs whose bytes match the last build (one stat instead of a write)
 - Pre-create directories to reduce lock contention
 - Atomic counter for temp file names (faster than uuid4)
 
@@ -49,6 +55,7 @@ from bengal.errors import BengalRenderingError, ErrorCode
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
+    from bengal.cache.output_gate import OutputWriteGate
     from bengal.protocols import SiteLike
 
 logger = get_logger(__name__)
@@ -56,6 +63,13 @@ logger = get_logger(__name__)
 # Module-level atomic counter for temp file names (faster than uuid4)
 _temp_file_counter = itertools.count()
 
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+)
+
+# open + write + close + rename for a written page vs. one stat for a skipped one
+_SYSCALLS_SAVED_PER_SKIP = 3
+
 # Module-level kill switch for all WriteBehindCollector threads.
 # Used by test teardown to stop leaked writer threads between tests.
 _global_shutdown = threading.Event()
@@ -93,7 +107,7 @@ def reset_writer_shutdown() -> None:
 class WriteBehindCollector:
     """Async write-behind buffer for rendered pages.
 
-    Worker threads push (path, content) pairs to a queue.
+    Worker threads push (path, bytes, hash) items to a queue.
     A pool of writer threads drains the queue to disk in parallel.
 
     Benefits:
@@ -102,31 +116,37 @@ class WriteBehindCollector:
         - Keeps final output writes atomic in every mode
         - Pre-creates directories to reduce lock contention
         - Uses atomic counter instead of uuid4 for temp files
+        - Skips outputs whose bytes are unchanged (with an OutputWriteGate)
 
     Attributes:
-        _queue: Thread-safe queue of (Path, str) pairs
+        _queue: Thread-safe queue of (Path, bytes, hash) items
         _writer_threads: Background threads draining to disk
         _shutdown: Event signaling shutdown
         _error: Any error from writer threads
         _writes_completed: Count of successful writes
+        _gate: Skip-unchanged gate for this build (None to always write)
 
     """
 
     __slots__ = (
         "__weakref__",
         "_all_exited",
+        "_bytes_skipped",
+        "_bytes_written",
         "_created_dirs",
         "_created_dirs_lock",
         "_error",
         "_exited_count",
         "_exited_lock",
         "_fast_writes",
+        "_gate",
         "_num_writers",
         "_queue",
         "_shutdown",
         "_writer_threads",
         "_writes_completed",
         "_writes_lock",
+        "_writes_skipped",
     )
 
     def __init__(
@@ -135,6 +155,7 @@ class WriteBehindCollector:
         max_queue_size: int = 500,
         num_writers: int | None = None,
         dev_mode: bool | None = None,
+        gate: OutputWriteGate | None = None,
     ) -> None:
         """Initialize write-behind collector.
 
@@ -143,11 +164,17 @@ class WriteBehindCollector:
             max_queue_size: Maximum queue depth before blocking (backpressure)
             num_writers: Number of writer threads (default: 8 for SSD parallelism)
             dev_mode: Override dev mode detection (auto-detects from site if None)
+            gate: Skip-unchanged gate (``get_output_gate(site)``); None writes every page
         """
-        self._queue: Queue[tuple[Path, str] | None] = Queue(maxsize=max_queue_size)
+        self._queue: Queue[tuple[Path, bytes | memoryview, str | None] | None] = Queue(
+            maxsize=max_queue_size
+        )
         self._shutdown = threading.Event()
         self._error: Exception | None = None
         self._writes_completed = 0
+        self._writes_skipped = 0
+        self._bytes_written = 0
+        self._bytes_skipped = 0
         self._writes_lock = threading.Lock()
         self._created_dirs: set[str] = set()
         self._created_dirs_lock = threading.Lock()
@@ -166,6 +193,8 @@ class WriteBehindCollector:
         # report it, but output writes remain atomic in every mode.
         self._fast_writes = False
 
+        self._gate = gate
+
         # Start writer threads
         self._writer_threads: list[threading.Thread] = []
         for i in range(self._num_writers):
@@ -219,14 +248,25 @@ class WriteBehindCollector:
             files=len(paths),
         )
 
-    def enqueue(self, output_path: Path, content: str) -> None:
+    def enqueue(
+        self,
+        output_path: Path,
+        content: str | bytes | memoryview,
+        content_hash: str | None = None,
+    ) -> bool:
         """Queue a page for writing.
 
-        Non-blocking unless queue is full (backpressure).
+        Non-blocking unless queue is full (backpressure). ``str`` content is
+        encoded here, so the writer threads only move bytes.
 
         Args:
             output_path: Destination file path
-            content: Rendered HTML content
+            content: Rendered HTML (text or UTF-8 bytes)
+            content_hash: Precomputed hash of the bytes (computed when needed)
+
+        Returns:
+            False if the output is unchanged since the last build and was not
+            queued, True otherwise
 
         Raises:
             BengalRenderingError: If writer thread has failed
@@ -239,7 +279,21 @@ class WriteBehindCollector:
                 suggestion="Check disk space and file permissions in output directory",
             ) from self._error
 
-        self._queue.put((output_path, content))
+        data = content.encode("utf-8") if isinstance(content, str) else content
+        gate = self._gate
+        if gate is not None:
+            if content_hash is None:
+                from bengal.cache.output_gate import content_hash as hash_output
+
+                content_hash = hash_output(data)
+            if gate.is_unchanged(output_path, content_hash, len(data)):
+                with self._writes_lock:
+                    self._writes_skipped += 1
+                    self._bytes_skipped += len(data)
+                return False
+
+        self._queue.put((output_path, data, content_hash))
+        return True
 
     def _drain_loop(self) -> None:
         """Background thread: drain queue to disk."""
@@ -257,10 +311,13 @@ class WriteBehindCollector:
                     # Dedicated sentinel for this thread — just exit
                     break
 
-                path, content = item
-                self._write_file(path, content)
+                path, data, content_hash = item
+                self._write_file(path, data)
+                if self._gate is not None and content_hash is not None:
+                    self._gate.record(path, content_hash)
                 with self._writes_lock:
                     self._writes_completed += 1
+                    self._bytes_written += len(data)
                 self._queue.task_done()
 
         except Exception as e:
@@ -273,12 +330,12 @@ class WriteBehindCollector:
         finally:
             self._mark_thread_exited()
 
-    def _write_file(self, path: Path, content: str) -> None:
+    def _write_file(self, path: Path, data: bytes | memoryview) -> None:
         """Write a single file to disk.
 
         Args:
             path: Destination path
-            content: File content
+            data: File content
         """
         # Ensure parent directory exists (thread-safe with lock)
         # Note: If precreate_directories() was called, this is a fast no-op
@@ -290,17 +347,18 @@ class WriteBehindCollector:
                     self._created_dirs.add(parent)
 
         # Atomic write with fast temp file naming (counter instead of uuid4)
-        self._atomic_write_fast(path, content)
+        self._atomic_write_fast(path, data)
 
-    def _atomic_write_fast(self, path: Path, content: str) -> None:
+    def _atomic_write_fast(self, path: Path, data: bytes | memoryview) -> None:
         """Atomic write using counter-based temp file names.
 
         Faster than uuid4-based naming while maintaining crash safety.
-        Uses PID + thread ID + atomic counter for uniqueness.
+        Uses PID + thread ID + atomic counter for uniqueness. Bytes go straight
+        to the descriptor (no text layer, no buffered copy).
 
         Args:
             path: Destination path
-            content: File content
+            data: File content
         """
         # Use atomic counter instead of uuid4 (faster)
         pid = os.getpid()
@@ -309,8 +367,14 @@ class WriteBehindCollector:
         tmp_path = path.parent / f".{path.name}.{pid}.{tid}.{counter}.tmp"
 
         try:
-            tmp_path.write_text(content, encoding="utf-8")
-            tmp_path.replace(path)  # Atomic rename on POSIX
+            fd = os.open(tmp_path, _WRITE_FLAGS, 0o666)
+            try:
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(fd, view) :]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, path)  # Atomic rename on POSIX
         except Exception:
             tmp_path.unlink(missing_ok=True)
             raise
@@ -356,6 +420,14 @@ class WriteBehindCollector:
             ) from self._error
 
         with self._writes_lock:
+            logger.debug(
+                "write_behind_complete",
+                files_written=self._writes_completed,
+                bytes_written=self._bytes_written,
+                files_unchanged=self._writes_skipped,
+                bytes_saved=self._bytes_skipped,
+                syscalls_saved=self._writes_skipped * _SYSCALLS_SAVED_PER_SKIP,
+            )
             return self._writes_completed
 
     @property
@@ -368,3 +440,15 @@ class WriteBehindCollector:
         """Number of writes completed."""
         with self._writes_lock:
             return self._writes_completed
+
+    @property
+    def skipped_count(self) -> int:
+        """Number of outputs left untouched because their bytes were unchanged."""
+        with self._writes_lock:
+            return self._writes_skipped
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes not written because their outputs were unchanged."""
+        with self._writes_lock:
+            return self._bytes_skipped
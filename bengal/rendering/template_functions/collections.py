@@ -10,10 +10,14 @@ from __future__ import annotations
 from itertools import groupby
 from typing import TYPE_CHECKING, Any
 
+from bengal.rendering.template_functions.query_planner import run_planned
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from bengal.protocols import SiteLike, TemplateEnvironment
+    from bengal.rendering.template_functions.query_planner import CollectionPlanner
 
 logger = get_logger(__name__)
 
@@ -117,6 +121,51 @@ def where(
 
     compare = operators[operator_normalized]
 
+    def scan() -> list[dict[str, Any]]:
+        return _where_scan(items, key, value, operator_normalized, compare)
+
+    def lookup(planner: CollectionPlanner) -> list[int] | None:
+        if not _is_hashable(value):
+            # e.g. where('tags', ['a']): equality against a list, scan it
+            return None
+        if operator_normalized in ("eq", "ne"):
+            index = planner.equality_index(key, _get_nested_value)
+        elif isinstance(value, list | tuple | set | frozenset):
+            return None
+        else:
+            index = planner.membership_index(key, _get_nested_value)
+        if index is None:
+            return None
+        positions = index.get(value, [])
+        if operator_normalized in ("ne", "not_in"):
+            return planner.complement(positions)
+        return positions
+
+    return run_planned(
+        items,
+        ("where", key, value, operator_normalized),
+        scan,
+        lookup=lookup if operator_normalized in ("eq", "ne", "in", "not_in") else None,
+    )
+
+
+def _is_hashable(value: Any) -> bool:
+    """True when ``value`` can key an index lookup."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _where_scan(
+    items: list[dict[str, Any]],
+    key: str,
+    value: Any,
+    operator_normalized: str,
+    compare: Callable[[Any, Any], bool],
+) -> list[dict[str, Any]]:
+    """Linear scan behind where()."""
     result = []
     for item in items:
         item_value = _get_nested_value(item, key)
@@ -173,13 +222,23 @@ def where_not(items: list[dict[str, Any]], key: str, value: Any) -> list[dict[st
     if not items:
         return []
 
-    result = []
-    for item in items:
-        item_value = _get_nested_value(item, key)
-        if item_value != value:
-            result.append(item)
+    def scan() -> list[dict[str, Any]]:
+        result = []
+        for item in items:
+            item_value = _get_nested_value(item, key)
+            if item_value != value:
+                result.append(item)
+        return result
 
-    return result
+    def lookup(planner: CollectionPlanner) -> list[int] | None:
+        if not _is_hashable(value):
+            return None
+        index = planner.equality_index(key, _get_nested_value)
+        if index is None:
+            return None
+        return planner.complement(index.get(value, []))
+
+    return run_planned(items, ("where_not", key, value), scan, lookup=lookup)
 
 
 def group_by(items: list[dict[str, Any]], key: str) -> dict[Any, list[dict[str, Any]]]:
@@ -203,6 +262,13 @@ def group_by(items: list[dict[str, Any]], key: str) -> dict[Any, list[dict[str,
     """
     if not items:
         return {}
+    return run_planned(
+        items, ("group_by", key), lambda: _group_by_scan(items, key), copy=_copy_groups
+    )
+
+
+def _group_by_scan(items: list[dict[str, Any]], key: str) -> dict[Any, list[dict[str, Any]]]:
+    """Sort-and-group pass behind group_by()."""
 
     # Handle both dict and object attributes
     def get_value(item: Any) -> Any:
@@ -235,6 +301,11 @@ def group_by(items: list[dict[str, Any]], key: str) -> dict[Any, list[dict[str,
     return result
 
 
+def _copy_groups[K](groups: dict[K, list[Any]]) -> dict[K, list[Any]]:
+    """Fresh copy of a memoized grouping, safe to mutate in templates."""
+    return {group: list(members) for group, members in groups.items()}
+
+
 def sort_by(items: list[Any], key: str, reverse: bool = False) -> list[Any]:
     """
     Sort items by key with None-safe comparison.
@@ -254,6 +325,11 @@ def sort_by(items: list[Any], key: str, reverse: bool = False) -> list[Any]:
     """
     if not items:
         return []
+    return run_planned(items, ("sort_by", key, reverse), lambda: _sort_by_scan(items, key, reverse))
+
+
+def _sort_by_scan(items: list[Any], key: str, reverse: bool) -> list[Any]:
+    """None-safe sort behind sort_by()."""
 
     def get_value(item: Any) -> Any:
         if isinstance(item, dict):
@@ -651,7 +727,16 @@ def group_by_year(items: list[Any], date_attr: str = "date") -> dict[int, list[A
     """
     if not items:
         return {}
+    return run_planned(
+        items,
+        ("group_by_year", date_attr),
+        lambda: _group_by_year_scan(items, date_attr),
+        copy=_copy_groups,
+    )
+
 
+def _group_by_year_scan(items: list[Any], date_attr: str) -> dict[int, list[Any]]:
+    """Single pass behind group_by_year()."""
     result: dict[int, list[Any]] = {}
 
     for item in items:
@@ -747,7 +832,16 @@ def archive_years(items: list[Any], date_attr: str = "date") -> list[dict[str, A
     """
     if not items:
         return []
+    return run_planned(
+        items,
+        ("archive_years", date_attr),
+        lambda: _archive_years_scan(items, date_attr),
+        copy=lambda years: [dict(entry) for entry in years],
+    )
+
 
+def _archive_years_scan(items: list[Any], date_attr: str) -> list[dict[str, Any]]:
+    """Single pass behind archive_years()."""
     year_counts: dict[int, int] = {}
 
     for item in items:
@@ -1,13 +1,21 @@
 """
 Image processing functions for templates.
 
-Provides 6 functions for working with images in templates.
-Note: Some functions are stubs for future PIL/Pillow integration.
+Provides 7 functions for working with images in templates.
+
+When ``assets.responsive_images`` is enabled, the build generates resized
+variants before render (see bengal/assets/image_variants.py) and the
+site-bound helpers resolve to those real files: ``image_srcset`` and
+``image_srcset_gen`` emit variant URLs, ``image_url(..., width=N)`` picks the
+smallest variant at least N wide, and ``image_dimensions`` reads intrinsic
+sizes from the variant index. Without variants they fall back to ``?w=N``
+query URLs.
 """
 
 from __future__ import annotations
 
 import base64
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -15,27 +23,56 @@ from bengal.errors import ErrorCode
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
+    from bengal.assets.image_variants import ResponsiveImage
     from bengal.protocols import SiteLike, TemplateEnvironment
 
 logger = get_logger(__name__)
 
+# Variant index per cache dir, reloaded when index.json changes: {dir: (mtime_ns, index)}
+_variant_indexes: dict[Path, tuple[int, dict[str, ResponsiveImage]]] = {}
+_variant_index_lock = threading.Lock()
+
 
 def register(env: TemplateEnvironment, site: SiteLike) -> None:
     """Register functions with template environment."""
 
+    baseurl = site.baseurl or ""
+
     # Create closures that have access to site
     def image_url_with_site(path: str, **params: Any) -> str:
-        return image_url(path, site.baseurl or "", **params)
+        image = responsive_image(path, site)
+        if image is not None and params.get("width") and not params.get("height"):
+            return image.with_baseurl(baseurl).url_for_width(int(params["width"]))
+        return image_url(path, baseurl, **params)
 
     def image_dimensions_with_site(path: str) -> tuple[int, int] | None:
+        image = responsive_image(path, site)
+        if image is not None:
+            return image.width, image.height
         return image_dimensions(path, site.root_path)
 
     def image_data_uri_with_site(path: str) -> str:
         return image_data_uri(path, site.root_path)
 
+    def image_srcset_with_site(image_path: str, sizes: list[int]) -> str:
+        image = responsive_image(image_path, site)
+        if image is not None and sizes:
+            return image.with_baseurl(baseurl).srcset(widths=sizes)
+        return image_srcset(image_path, sizes)
+
+    def image_srcset_gen_with_site(image_path: str, sizes: list[int] | None = None) -> str:
+        image = responsive_image(image_path, site)
+        if image is not None:
+            return image.with_baseurl(baseurl).srcset(widths=sizes)
+        return image_srcset_gen(image_path, sizes)
+
+    def image_variants_with_site(path: str) -> ResponsiveImage | None:
+        image = responsive_image(path, site)
+        return image.with_baseurl(baseurl) if image is not None else None
+
     env.filters.update(
         {
-            "image_srcset": image_srcset,
+            "image_srcset": image_srcset_with_site,
             "image_alt": image_alt,
         }
     )
@@ -44,12 +81,66 @@ def register(env: TemplateEnvironment, site: SiteLike) -> None:
         {
             "image_url": image_url_with_site,
             "image_dimensions": image_dimensions_with_site,
-            "image_srcset_gen": image_srcset_gen,
+            "image_srcset_gen": image_srcset_gen_with_site,
             "image_data_uri": image_data_uri_with_site,
+            "image_variants": image_variants_with_site,
         }
     )
 
 
+def responsive_image(path: str, site: SiteLike) -> ResponsiveImage | None:
+    """
+    Look up generated variants for an image asset.
+
+    Args:
+        path: Image path as written in templates (``hero.jpg``,
+            ``images/hero.jpg`` or ``/assets/images/hero.jpg``)
+        site: Site whose variant index to consult
+
+    Returns:
+        ResponsiveImage with intrinsic size and variants, or None when
+        responsive images are disabled or the image has no variants
+
+    Example:
+        {% let hero = image_variants('images/hero.jpg') %}
+        <img src="{{ hero.src }}" srcset="{{ hero.srcset() }}"
+             width="{{ hero.width }}" height="{{ hero.height }}">
+
+    """
+    if not path or "://" in path:
+        return None
+    paths = getattr(getattr(site, "config_service", None), "paths", None)
+    if paths is None:
+        return None
+    index = _load_variant_index(paths.image_variants_dir)
+    if not index:
+        return None
+
+    logical = path.split("?", 1)[0].lstrip("/")
+    if logical.startswith("assets/"):
+        logical = logical[len("assets/") :]
+    return index.get(logical)
+
+
+def _load_variant_index(cache_dir: Path) -> dict[str, ResponsiveImage]:
+    """Return the variant index for ``cache_dir``, reloading it when it changes."""
+    from bengal.assets.image_variants import load_variant_index
+
+    try:
+        mtime_ns = (cache_dir / "index.json").stat().st_mtime_ns
+    except OSError:
+        return {}
+    cached = _variant_indexes.get(cache_dir)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with _variant_index_lock:
+        cached = _variant_indexes.get(cache_dir)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, load_variant_index(cache_dir))
+            _variant_indexes[cache_dir] = cached
+    return cached[1]
+
+
 def image_url(
     path: str,
     base_url: str,
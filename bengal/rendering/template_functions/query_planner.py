@@ -0,0 +1,286 @@
+"""
+Build-scoped query planning for collection filters over site-level page lists.
+
+Themes call ``site.pages | where('section', ...) | sort_by('date')`` from
+sidebars and footers, so the same pipeline runs once per rendered page and
+a plain linear scan makes the build O(pages²). While rendering against a
+frozen SiteSnapshot the site's page lists cannot change, so the filters in
+collections.py route their work through this module:
+
+- Inputs are recognized by identity: ``site.pages`` and the cached
+  ``regular_pages`` / ``generated_pages`` / ``listable_pages`` views.
+- Equality (``where`` eq/ne, ``where_not``) and scalar membership
+  (``where(key, value, 'in')`` over list attributes such as tags) are
+  answered from attribute indexes built lazily, once per key path.
+- Every other operation runs the normal scan once and is memoized.
+- Results are QueryResult lists that remember the query that produced
+  them, so chained filters (``where | sort_by``) are memoized too.
+
+Repeated pipelines therefore cost O(result) instead of O(site).
+
+Parity:
+    Indexes only cover attribute values of exact plain types (str, int,
+    float, bool, None, date, datetime; NaN excluded), whose dict lookup
+    agrees with the ``==`` comparisons the scans perform. Any key path with
+    other values (e.g. Section objects, custom classes) falls back to the
+    memoized scan. Filter arguments must be plain values (or lists/tuples/
+    sets of them) to be memoized at all; anything else bypasses the planner.
+
+QueryIndexRegistry indexes are not consulted: they skip generated pages and
+normalize keys (section name, lowercased category, "YYYY-MM" date buckets),
+so their answers differ from ``where`` semantics.
+
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+from bengal.rendering.template_functions.memo import get_build_context
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from bengal.orchestration.build_context import BuildContext
+
+_PLAIN_TYPES = frozenset({str, int, float, bool, type(None), date, datetime})
+_COLLECTION_TYPES = (list, tuple, set, frozenset)
+_MISSING = object()
+
+
+class _Unplannable(Exception):
+    """Raised when a value cannot take part in a memo key or index."""
+
+
+def _is_plain(value: Any) -> bool:
+    # NaN never compares equal, but a dict lookup would still find it by identity
+    return type(value) in _PLAIN_TYPES and value == value
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable memo key for a filter argument (type-tagged: 1, 1.0 and True differ)."""
+    if _is_plain(value):
+        return (type(value), value)
+    if isinstance(value, _COLLECTION_TYPES):
+        frozen = tuple(_freeze(v) for v in value)
+        if isinstance(value, set | frozenset):
+            return (type(value), frozenset(frozen))
+        return (type(value), frozen)
+    raise _Unplannable
+
+
+class QueryResult(list):
+    """
+    List returned by planned filters.
+
+    Remembers the planner and query that produced it so a further filter
+    can be memoized as a continuation of the same pipeline. Any in-place
+    change detaches it from the planner.
+    """
+
+    __slots__ = ("_planner", "_query")
+
+    def __init__(
+        self,
+        items: Any = (),
+        planner: CollectionPlanner | None = None,
+        query: Hashable | None = None,
+    ) -> None:
+        super().__init__(items)
+        self._planner = planner
+        self._query = query
+
+
+def _detaching(name: str) -> Callable[..., Any]:
+    method = getattr(list, name)
+
+    def wrapper(self: QueryResult, *args: Any, **kwargs: Any) -> Any:
+        self._planner = None
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = name
+    wrapper.__qualname__ = f"QueryResult.{name}"
+    return wrapper
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(QueryResult, _name, _detaching(_name))
+
+
+class CollectionPlanner:
+    """
+    Indexes and memoized results for one site-level page list in one build.
+
+    Created through BuildContext.get_cached(), so it is dropped with the
+    rest of the build-scoped cache. Safe for parallel rendering: index
+    builds and memo writes happen under a lock.
+    """
+
+    __slots__ = ("_equality", "_lock", "_membership", "_results", "context", "items", "size")
+
+    def __init__(self, items: list[Any], context: BuildContext) -> None:
+        self.items = items
+        self.size = len(items)
+        self.context = context
+        self._lock = threading.Lock()
+        self._results: dict[Hashable, Any] = {}
+        self._equality: dict[str, dict[Any, list[int]] | None] = {}
+        self._membership: dict[str, dict[Any, list[int]] | None] = {}
+
+    def is_current(self) -> bool:
+        """Whether this planner still describes its list in the active build."""
+        return len(self.items) == self.size and get_build_context() is self.context
+
+    def equality_index(
+        self, key: str, getter: Callable[[Any, str], Any]
+    ) -> dict[Any, list[int]] | None:
+        """Value -> positions for ``key``, or None if any value is not plain."""
+        index = self._equality.get(key, _MISSING)
+        if index is _MISSING:
+            with self._lock:
+                index = self._equality.get(key, _MISSING)
+                if index is _MISSING:
+                    index = self._build_equality(key, getter)
+                    self._equality[key] = index
+        return index
+
+    def membership_index(
+        self, key: str, getter: Callable[[Any, str], Any]
+    ) -> dict[Any, list[int]] | None:
+        """Element -> positions of items whose list/tuple ``key`` contains it."""
+        index = self._membership.get(key, _MISSING)
+        if index is _MISSING:
+            with self._lock:
+                index = self._membership.get(key, _MISSING)
+                if index is _MISSING:
+                    index = self._build_membership(key, getter)
+                    self._membership[key] = index
+        return index
+
+    def _build_equality(
+        self, key: str, getter: Callable[[Any, str], Any]
+    ) -> dict[Any, list[int]] | None:
+        index: dict[Any, list[int]] = {}
+        for position, item in enumerate(self.items):
+            value = getter(item, key)
+            if not _is_plain(value):
+                return None
+            index.setdefault(value, []).append(position)
+        return index
+
+    def _build_membership(
+        self, key: str, getter: Callable[[Any, str], Any]
+    ) -> dict[Any, list[int]] | None:
+        index: dict[Any, list[int]] = {}
+        for position, item in enumerate(self.items):
+            value = getter(item, key)
+            if not isinstance(value, list | tuple):
+                continue
+            for element in value:
+                if not _is_plain(element):
+                    return None
+                positions = index.setdefault(element, [])
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+        return index
+
+    def complement(self, positions: list[int]) -> list[int]:
+        """Positions (in order) not in the sorted ``positions``."""
+        excluded = set(positions)
+        return [i for i in range(self.size) if i not in excluded]
+
+    def lookup(self, query: Hashable) -> Any:
+        return self._results.get(query, _MISSING)
+
+    def store(self, query: Hashable, result: Any) -> Any:
+        with self._lock:
+            return self._results.setdefault(query, result)
+
+
+def _planner_for(items: Any) -> tuple[CollectionPlanner, Hashable] | None:
+    """Planner and base query for ``items``, or None if it is not planned."""
+    if isinstance(items, QueryResult):
+        planner = items._planner
+        if planner is None or items._query is None or not planner.is_current():
+            return None
+        return planner, items._query
+
+    ctx = get_build_context()
+    if ctx is None or getattr(ctx, "snapshot", None) is None:
+        return None
+    site = getattr(ctx, "site", None)
+    if site is None:
+        return None
+    if items is not getattr(site, "pages", None):
+        page_cache = getattr(site, "page_cache", None)
+        if page_cache is None or not page_cache.is_cached_view(items):
+            return None
+
+    planner = ctx.get_cached(f"query_planner:{id(items)}", lambda: CollectionPlanner(items, ctx))
+    if planner.items is not items or not planner.is_current():
+        return None
+    return planner, ()
+
+
+def run_planned[R](
+    items: Any,
+    operation: tuple[Any, ...],
+    compute: Callable[[], R],
+    *,
+    lookup: Callable[[CollectionPlanner], list[int] | None] | None = None,
+    copy: Callable[[R], R] | None = None,
+) -> R:
+    """
+    Run a collection filter through the planner when ``items`` is planned.
+
+    Args:
+        items: Filter input
+        operation: Filter name and arguments; must freeze to a memo key
+        compute: Plain scan over ``items`` (also used when not planned)
+        lookup: Index-backed answer for a site-level list, as positions in
+            list order, or None to fall back to ``compute``
+        copy: Copies a memoized result for the caller; by default list
+            results are returned as chainable QueryResult copies
+
+    Returns:
+        The filter result, identical to ``compute()``
+    """
+    planned = _planner_for(items)
+    if planned is None:
+        return compute()
+    planner, base = planned
+    try:
+        query = (base, _freeze(operation))
+    except _Unplannable:
+        return compute()
+
+    result = planner.lookup(query)
+    if result is _MISSING:
+        positions = lookup(planner) if lookup is not None and base == () else None
+        if positions is not None:
+            source = planner.items
+            result = [source[i] for i in positions]
+        else:
+            result = compute()
+        result = planner.store(query, result)
+
+    if copy is not None:
+        return copy(result)
+    if isinstance(result, list):
+        return QueryResult(result, planner, query)  # type: ignore[return-value]
+    return result
@@ -49,6 +49,7 @@ _DEFERRED_GENERATED_ARTIFACT_NAMES = frozenset(
         "rss.xml",
         "search-index.json",
         "sitemap.xml",
+        "sitemap_index.xml",
         "xref.json",
     }
 )
@@ -480,7 +481,13 @@ def is_deferred_generated_artifact_path(path: str) -> bool:
     raw = path.split("?")[0].rstrip("/")
     if not raw:
         return False
-    return raw.rsplit("/", 1)[-1] in _DEFERRED_GENERATED_ARTIFACT_NAMES
+    name = raw.rsplit("/", 1)[-1]
+    if name.startswith("sitemap-") and name.endswith(".xml"):
+        return True
+    if name.endswith(".json") and "/search/" in f"/{raw.lstrip('/')}":
+        # Native search index manifest and shards
+        return True
+    return name in _DEFERRED_GENERATED_ARTIFACT_NAMES
 
 
 async def _serve_markdown_negotiated(
@@ -20,6 +20,10 @@ Usage (dev_server.py / build_trigger.py):
 
     # ASGI app resolves on each request:
     serving_dir = mgr.active_dir
+
+Precompressed sidecars (``page.html.gz``/``.br``/``.zst``) travel with their
+source file on delta staging, so a swap never pairs fresh HTML with a sidecar
+from an older generation and unchanged files are not recompressed.
 """
 
 from __future__ import annotations
@@ -33,7 +37,7 @@ from typing import TYPE_CHECKING
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 logger = get_logger(__name__)
 
@@ -55,6 +59,18 @@ def _hidden_path_component(directory: Path) -> str | None:
     return None
 
 
+def _with_sidecars(paths: Iterable[Path | str]) -> Iterator[Path]:
+    """Yield each path followed by its possible precompressed sidecars."""
+    from bengal.postprocess.precompress import COMPRESSIBLE_SUFFIXES, SIDECAR_SUFFIXES
+
+    for raw_path in paths:
+        path = Path(raw_path)
+        yield path
+        if path.suffix.lower() in COMPRESSIBLE_SUFFIXES:
+            for suffix in SIDECAR_SUFFIXES.values():
+                yield path.with_name(path.name + suffix)
+
+
 class BufferManager:
     """Thread-safe double-buffer manager with in-process reference swap."""
 
@@ -183,6 +199,9 @@ class BufferManager:
         appear in ``changed_paths`` and would otherwise drift a generation behind
         across swaps — leaving a buffer serving a stale/divergent manifest (#315).
         Seeding them from active each time keeps both buffers consistent.
+
+        Each changed path also syncs its precompressed sidecars, so staging
+        carries the active buffer's compressed copies instead of stale ones.
         """
         staging = self.staging_dir
         active = self.active_dir
@@ -194,7 +213,7 @@ class BufferManager:
 
         synced = 0
         removed = 0
-        for raw_path in changed_paths:
+        for raw_path in _with_sidecars(changed_paths):
             rel_path = self._normalize_relative_output_path(Path(raw_path), active)
             if rel_path is None:
                 logger.debug(
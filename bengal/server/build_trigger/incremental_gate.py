@@ -23,16 +23,30 @@ def _needs_full_rebuild(
     Determine if a full rebuild is needed.
 
     Full rebuild triggers:
-    - Structural changes (created/deleted/moved files)
-    - Template changes (.html in templates/themes)
+    - Structural changes (created/deleted/moved) that are not plain content
+      pages inside an existing section (see bengal.build.provenance.structural)
+    - Template changes (.html) that cannot be scoped to their dependent pages
     - Autodoc source changes (.py, OpenAPI specs)
     - SVG icon changes (inlined in HTML)
     - Shared content changes (_shared/ directory) [versioned sites]
     - Version config changes (versioning.yaml)
     """
-    # Structural changes always need full rebuild
+    # Structural changes to content pages are scoped by the build's
+    # structural cascade; anything else needs a full rebuild
     if {"created", "deleted", "moved"} & event_types:
-        return True
+        from bengal.build.provenance.structural import (
+            is_multi_tree_site,
+            structural_fallback_reason,
+        )
+
+        reason = structural_fallback_reason(
+            changed_paths,
+            trigger.site.root_path / "content",
+            multi_tree=is_multi_tree_site(trigger.site),
+        )
+        if reason is not None:
+            logger.debug("full_rebuild_triggered_by_structural_change", reason=reason)
+            return True
 
     # Check for template changes
     if trigger._is_template_change(changed_paths):
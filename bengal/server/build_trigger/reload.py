@@ -4,12 +4,14 @@ Turns a finished (or failed) rebuild into stats, browser-overlay messages,
 and a typed reload decision.
 """
 
+import time
 from typing import TYPE_CHECKING, Any
 
 from bengal.errors import ErrorCode
 from bengal.orchestration.stats import ReloadHint, display_build_stats
 from bengal.server.build_executor import BuildResult
 from bengal.server.build_state import build_state
+from bengal.server.live_reload import record_reload_decision
 from bengal.server.reload_controller import ReloadDecision
 from bengal.utils.observability.logger import get_logger
 from bengal.utils.stats_minimal import MinimalStats
@@ -122,16 +124,22 @@ def _handle_reload(trigger: Any, info: BuildReloadInfo) -> None:
     3. No outputs but changed_files → full reload (fallback when output collector empty)
     4. Neither → suppress
 
+    The content-hash filter hashes only the outputs the build recorded;
+    ``decision_ms`` on the decision logs is the time spent deciding, also
+    sampled into the live-reload stats (``get_reload_stats``).
+
     Args:
         info: BuildReloadInfo from build (changed_files, changed_outputs, reload_hint)
     """
+    decision_start = time.perf_counter()
     changed_files = list(info.changed_files)
     changed_outputs = info.changed_outputs
     reload_hint = info.reload_hint
 
     # Trust reload_hint=NONE only when we have typed outputs (build can confirm)
     if reload_hint is ReloadHint.NONE and changed_outputs:
-        logger.info("reload_suppressed", reason="reload-hint-none")
+        decision_ms = _record_decision_ms(decision_start)
+        logger.info("reload_suppressed", reason="reload-hint-none", decision_ms=decision_ms)
         return
 
     decision: ReloadDecision | None = None
@@ -202,7 +210,10 @@ def _handle_reload(trigger: Any, info: BuildReloadInfo) -> None:
         and hasattr(trigger._reload_controller, "_baseline_content_hashes")
         and trigger._reload_controller._baseline_content_hashes
     ):
-        enhanced = trigger._reload_controller.decide_with_content_hashes(trigger.site.output_dir)
+        enhanced = trigger._reload_controller.decide_with_content_hashes(
+            trigger.site.output_dir,
+            changed_paths=[rec.path for rec in changed_outputs],
+        )
         if enhanced.meaningful_change_count == 0:
             # All changes are aggregate-only (sitemap, feeds, search index)
             decision = ReloadDecision(
@@ -225,17 +236,20 @@ def _handle_reload(trigger: Any, info: BuildReloadInfo) -> None:
                 asset_changes=len(enhanced.asset_changes),
             )
 
+    decision_ms = _record_decision_ms(decision_start)
+
     # Log decision source for observability
     logger.debug(
         "reload_decision_source",
         source=decision_source,
         action=decision.action,
         reason=decision.reason,
+        decision_ms=decision_ms,
     )
 
     # Send reload notification
     if decision.action == "none":
-        logger.info("reload_suppressed", reason=decision.reason)
+        logger.info("reload_suppressed", reason=decision.reason, decision_ms=decision_ms)
         # Safety: user changed files but decision is none (e.g. throttled).
         # Send reload unless we trust aggregate-only (sitemap/feeds only).
         if changed_files and decision.reason != "aggregate-only":
@@ -252,10 +266,18 @@ def _handle_reload(trigger: Any, info: BuildReloadInfo) -> None:
         action=decision.action,
         reason=decision.reason,
         source=decision_source,
+        decision_ms=decision_ms,
     )
     trigger._reload_notifier.send(decision.action, decision.reason, decision.changed_paths)
 
 
+def _record_decision_ms(decision_start: float) -> float:
+    """Milliseconds since ``decision_start``, recorded in the live-reload stats."""
+    decision_ms = round((time.perf_counter() - decision_start) * 1000, 2)
+    record_reload_decision(decision_ms)
+    return decision_ms
+
+
 def _should_capture_content_hash_baseline(trigger: Any, changed_files: Sequence[str]) -> bool:
     """Return whether this build still needs pre-build output hash scanning."""
     return trigger._reload_controller._use_content_hashes and not changed_files
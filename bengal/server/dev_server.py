@@ -82,7 +82,7 @@ from bengal.server.build_state import build_state
 from bengal.server.build_trigger import BuildTrigger
 from bengal.server.constants import DEFAULT_DEV_HOST, DEFAULT_DEV_PORT
 from bengal.server.ignore_filter import IgnoreFilter
-from bengal.server.live_reload import LiveReloadMixin
+from bengal.server.live_reload import LiveReloadMixin, get_reload_stats
 from bengal.server.pid_manager import PIDManager
 from bengal.server.resource_manager import ResourceManager
 from bengal.server.watcher_runner import WatcherRunner
@@ -330,7 +330,9 @@ class DevServer:
                         sys.exit(1)
                 except KeyboardInterrupt:
                     self._print_shutdown_message()
-                    logger.info("dev_server_shutdown", reason="keyboard_interrupt")
+                    logger.info(
+                        "dev_server_shutdown", reason="keyboard_interrupt", **get_reload_stats()
+                    )
                     backend.shutdown()
 
             else:
@@ -436,7 +438,9 @@ class DevServer:
                     ) from exc
                 except KeyboardInterrupt:
                     self._print_shutdown_message()
-                    logger.info("dev_server_shutdown", reason="keyboard_interrupt")
+                    logger.info(
+                        "dev_server_shutdown", reason="keyboard_interrupt", **get_reload_stats()
+                    )
             # ResourceManager cleanup happens automatically via __exit__
 
     def _has_cached_output(self) -> bool:
@@ -20,6 +20,8 @@ from .script import LIVE_RELOAD_SCRIPT
 from .sse import (
     ReloadState,
     get_current_generation,
+    get_reload_stats,
+    record_reload_decision,
     reset_for_testing,
     reset_sse_shutdown,
     run_sse_loop,
@@ -34,8 +36,10 @@ __all__ = [
     "LiveReloadNotifier",
     "ReloadState",
     "get_current_generation",
+    "get_reload_stats",
     "inject_live_reload_into_response",
     "notify_clients_reload",
+    "record_reload_decision",
     "reset_for_testing",
     "reset_sse_shutdown",
     "run_sse_loop",
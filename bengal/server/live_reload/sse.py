@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import os
 import threading
+from collections import deque
 from typing import TYPE_CHECKING
 
 from bengal.utils.observability.logger import get_logger
@@ -22,6 +23,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Most recent reload-decision latencies kept for the percentile in get_reload_stats()
+DECISION_SAMPLES = 256
+
 
 class ReloadState:
     """Encapsulates live reload SSE state (generation, action, condition)."""
@@ -32,6 +36,10 @@ class ReloadState:
         self.sent_count: int = 0
         self.condition = threading.Condition()
         self.shutdown_requested: bool = False
+        self.decision_count: int = 0
+        self.decision_ms_total: float = 0.0
+        self.decision_ms_max: float = 0.0
+        self.decision_ms_recent: deque[float] = deque(maxlen=DECISION_SAMPLES)
 
 
 _state = ReloadState()
@@ -62,6 +70,38 @@ def get_current_generation() -> int:
         return _state.generation
 
 
+def record_reload_decision(decision_ms: float) -> None:
+    """Add one reload-decision latency sample (milliseconds) to the reload stats."""
+    with _state.condition:
+        _state.decision_count += 1
+        _state.decision_ms_total += decision_ms
+        _state.decision_ms_max = max(_state.decision_ms_max, decision_ms)
+        _state.decision_ms_recent.append(decision_ms)
+
+
+def get_reload_stats() -> dict[str, int | float]:
+    """
+    Reload counters and decision latency for the dev server's stats output.
+
+    ``decision_ms_p95`` covers the last ``DECISION_SAMPLES`` decisions; the
+    mean and max cover the whole session.
+    """
+    with _state.condition:
+        count = _state.decision_count
+        recent = sorted(_state.decision_ms_recent)
+        stats: dict[str, int | float] = {
+            "reloads_sent": _state.sent_count,
+            "reload_decisions": count,
+            "decision_ms_last": _state.decision_ms_recent[-1] if recent else 0.0,
+            "decision_ms_mean": round(_state.decision_ms_total / count, 2) if count else 0.0,
+            "decision_ms_max": _state.decision_ms_max,
+        }
+    stats["decision_ms_p95"] = (
+        recent[min(len(recent) - 1, len(recent) * 95 // 100)] if recent else 0.0
+    )
+    return stats
+
+
 def wait_for_sse_event(
     last_seen_generation: int,
     timeout: float,
@@ -161,11 +201,16 @@ def reset_for_testing() -> None:
     Reset SSE state for isolated tests.
 
     Call between tests that need a clean state. Resets generation, action,
-    sent_count, and shutdown flag. Use only in test fixtures.
+    sent_count, decision latency stats, and shutdown flag. Use only in test
+    fixtures.
     """
     with _state.condition:
         _state.generation = 0
         _state.last_action = "reload"
         _state.sent_count = 0
+        _state.decision_count = 0
+        _state.decision_ms_total = 0.0
+        _state.decision_ms_max = 0.0
+        _state.decision_ms_recent.clear()
         _state.shutdown_requested = False
         _state.condition.notify_all()
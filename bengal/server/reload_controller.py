@@ -45,6 +45,12 @@ from bengal:content-hash meta tags for accurate change detection:
 2. decide_with_content_hashes(): Compare hashes to detect real changes
 3. Aggregate-only changes (sitemap, feeds) don't trigger reload
 
+After a rebuild the build's output collector already knows which files were
+written, so decide_with_content_hashes(changed_paths=...) hashes only those
+and carries the rest of the baseline forward. Every
+CONSISTENCY_SCAN_INTERVAL-th decision rescans the whole tree instead, which
+bounds drift from writes the collector did not see.
+
 Related:
 - bengal/server/build_trigger.py: Calls decide_and_update after builds
 - bengal/server/live_reload.py: Sends reload events to connected clients
@@ -68,6 +74,8 @@ from bengal.orchestration.stats import ReloadHint
 from bengal.utils.primitives.hashing import hash_file
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from bengal.core.output import OutputRecord
 
 
@@ -163,6 +171,9 @@ class EnhancedReloadDecision:
 
 MAX_CHANGED_PATHS_TO_SEND = 20
 
+# Targeted (collector-driven) hash decisions between full output-tree rescans
+CONSISTENCY_SCAN_INTERVAL = 25
+
 
 class ReloadController:
     """
@@ -232,6 +243,7 @@ class ReloadController:
         self._baseline_content_hashes: dict[str, str] = {}
         self._output_types: dict[str, str] = {}  # Store type name as string
         self._baseline_output_dir_mtime: float | None = None
+        self._targeted_decisions: int = 0
 
     # --- Runtime configuration setters ---
     def set_min_notify_interval_ms(self, value: int) -> None:
@@ -400,7 +412,11 @@ class ReloadController:
         with suppress(OSError):
             self._baseline_output_dir_mtime = output_dir.stat().st_mtime
 
-    def decide_with_content_hashes(self, output_dir: Path) -> EnhancedReloadDecision:
+    def decide_with_content_hashes(
+        self,
+        output_dir: Path,
+        changed_paths: Iterable[str] | None = None,
+    ) -> EnhancedReloadDecision:
         """
         Analyze changes using content hashes for accurate detection.
 
@@ -410,6 +426,10 @@ class ReloadController:
 
         Args:
             output_dir: Path to output directory (e.g., public/)
+            changed_paths: Output paths the build wrote (relative to
+                output_dir). When given, only these are hashed and the rest
+                of the baseline is kept, except on every
+                CONSISTENCY_SCAN_INTERVAL-th call, which rescans the tree.
 
         Returns:
             EnhancedReloadDecision with action and categorized changes.
@@ -422,14 +442,35 @@ class ReloadController:
         content_changes: list[str] = []
         aggregate_changes: list[str] = []
         asset_changes: list[str] = []
-        current_hashes: dict[str, str] = {}
-        current_types: dict[str, str] = {}
+        current_hashes: dict[str, str]
+        current_types: dict[str, str]
+        html_files: Iterable[Path]
+        css_files: Iterable[Path]
 
-        for html_file in output_dir.rglob("*.html"):
+        targeted = changed_paths is not None and (
+            self._targeted_decisions < CONSISTENCY_SCAN_INTERVAL
+        )
+        if targeted and changed_paths is not None:
+            self._targeted_decisions += 1
+            html_files, css_files = _split_written_outputs(output_dir, changed_paths)
+            with self._config_lock:
+                current_hashes = dict(self._baseline_content_hashes)
+                current_types = dict(self._output_types)
+        else:
+            self._targeted_decisions = 0
+            html_files = output_dir.rglob("*.html")
+            css_files = output_dir.rglob("*.css")
+            current_hashes = {}
+            current_types = {}
+
+        for html_file in html_files:
             rel_path = str(html_file.relative_to(output_dir))
             try:
                 content = html_file.read_text(errors="ignore")
             except OSError:
+                # Deleted (targeted) or removed during the scan
+                current_hashes.pop(rel_path, None)
+                current_types.pop(rel_path, None)
                 continue
 
             current_hash = extract_content_hash(content)
@@ -458,7 +499,9 @@ class ReloadController:
                     rel_path, classify_output(html_file).name
                 )
 
-        css_changes = self._check_css_changes_hashed(output_dir, current_hashes, current_types)
+        css_changes = self._check_css_changes_hashed(
+            output_dir, current_hashes, current_types, css_files
+        )
 
         decision: EnhancedReloadDecision
         now = self._now_ms()
@@ -517,6 +560,14 @@ class ReloadController:
             with suppress(OSError):
                 self._baseline_output_dir_mtime = output_dir.stat().st_mtime
 
+        from bengal.utils.observability.logger import get_logger
+
+        get_logger(__name__).debug(
+            "reload_controller_content_hash_scan",
+            mode="targeted" if targeted else "full",
+            baseline_size=len(current_hashes),
+            action=decision.action,
+        )
         return decision
 
     def _check_css_changes_hashed(
@@ -524,10 +575,11 @@ class ReloadController:
         output_dir: Path,
         current_hashes: dict[str, str],
         current_types: dict[str, str],
+        css_files: Iterable[Path] | None = None,
     ) -> list[str]:
-        """Check CSS files for content changes using hashes."""
+        """Check CSS files (default: every CSS file) for content changes using hashes."""
         changed: list[str] = []
-        for css_file in output_dir.rglob("*.css"):
+        for css_file in output_dir.rglob("*.css") if css_files is None else css_files:
             rel_path = str(css_file.relative_to(output_dir))
             try:
                 current_hash = hash_file(css_file, truncate=16)
@@ -536,6 +588,8 @@ class ReloadController:
                 if self._baseline_content_hashes.get(rel_path) != current_hash:
                     changed.append(rel_path)
             except OSError:
+                current_hashes.pop(rel_path, None)
+                current_types.pop(rel_path, None)
                 continue
         return changed
 
@@ -878,6 +932,24 @@ class ReloadController:
         return self._make_css_decision(paths, css_paths)
 
 
+def _split_written_outputs(
+    output_dir: Path, changed_paths: Iterable[str]
+) -> tuple[list[Path], list[Path]]:
+    """Written HTML and CSS files under ``output_dir``, in first-seen order."""
+    html_files: list[Path] = []
+    css_files: list[Path] = []
+    for rel_path in dict.fromkeys(changed_paths):
+        path = output_dir / rel_path
+        if not path.is_relative_to(output_dir):
+            continue
+        suffix = path.suffix.lower()
+        if suffix == ".html":
+            html_files.append(path)
+        elif suffix == ".css":
+            css_files.append(path)
+    return html_files, css_files
+
+
 def _outputs_are_aggregate_only(outputs: list[Any]) -> bool:
     """Return whether outputs only contain non-visible aggregate artifacts."""
     if not outputs:
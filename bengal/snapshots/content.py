@@ -77,8 +77,14 @@ def _snapshot_page_initial(page: PageLike, site: SiteLike) -> PageSnapshot:
     # Determine template name
     template_name = resolve_template_name(page)
 
-    # Get raw markdown content (for reference/debugging/incremental comparison)
-    raw_content = getattr(page, "_source", "") or getattr(page, "content", "") or ""
+    # Get raw markdown content (for reference/debugging/incremental comparison).
+    # Deferred bodies stay on disk; the snapshot loads them on demand.
+    body_offset = getattr(page, "_body_offset", None)
+    if body_offset is not None and getattr(page, "_body", None) is None:
+        raw_content = ""
+    else:
+        body_offset = None
+        raw_content = getattr(page, "_source", "") or getattr(page, "content", "") or ""
 
     # Get parsed HTML (pre-parsed during parsing phase - RFC: rfc-bengal-snapshot-engine)
     # This is what rendering should use, eliminating re-parsing during render
@@ -137,6 +143,7 @@ def _snapshot_page_initial(page: PageLike, site: SiteLike) -> PageSnapshot:
         content_hash=content_hash,
         attention_score=attention_score,
         estimated_render_ms=estimated_render_ms,
+        body_offset=body_offset,
     )
 
 
@@ -41,7 +41,7 @@ class PageSnapshot:
     template_name: str
 
     # Content
-    content: str  # Raw markdown source (for reference/debugging)
+    content: str  # Raw markdown source ("" for deferred bodies; see load_content)
     parsed_html: str  # Pre-parsed HTML from parsing phase (rendering uses this)
     toc: str
     toc_items: tuple[dict[str, Any], ...]
@@ -68,6 +68,17 @@ class PageSnapshot:
     attention_score: float = 0.0
     estimated_render_ms: float = 0.0
 
+    # Deferred body (build.defer_page_bodies): byte offset into source_path
+    body_offset: int | None = None
+
+    def load_content(self) -> str:
+        """Raw markdown source, read from disk when the body was deferred."""
+        if self.body_offset is None:
+            return self.content
+        from bengal.content.discovery.deferred_body import load_body
+
+        return load_body(self.source_path, self.body_offset)
+
     # Compatibility with existing templates
     @property
     def params(self) -> MappingProxyType[str, Any]:
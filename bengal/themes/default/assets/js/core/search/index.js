@@ -1,8 +1,10 @@
 /**
  * Bengal Search — index loading module
  *
- * Loads pre-built Lunr index (search-index.json) or builds at runtime from index.json.
- * Emits searchIndexLoaded / searchIndexError events.
+ * Loads the native sharded index (search/manifest.json) when the site uses the
+ * native backend, otherwise the pre-built Lunr index (search-index.json), or builds
+ * a Lunr index at runtime from index.json.
+ * Emits searchIndexLoaded / searchIndexError events (native shards: searchIndexUpdated).
  */
 (function () {
   'use strict';
@@ -161,6 +163,43 @@
     }
   }
 
+  function loadNativeScript() {
+    if (window.BengalNativeSearch) return Promise.resolve();
+    const meta = document.querySelector('meta[name="bengal:search_native_script"]');
+    const src = meta && meta.getAttribute('content');
+    if (!src) return Promise.reject(new Error('native search script not configured'));
+    return new Promise(function (resolve, reject) {
+      const script = document.createElement('script');
+      script.src = src;
+      script.async = true;
+      script.onload = function () { resolve(); };
+      script.onerror = function () { reject(new Error('Failed to load ' + src)); };
+      document.head.appendChild(script);
+    });
+  }
+
+  async function tryLoadNativeIndex(baseurl) {
+    const metaTag = document.querySelector('meta[name="bengal:search_manifest_url"]');
+    if (!metaTag) return false;
+
+    try {
+      const version = detectCurrentVersion();
+      const manifestUrl = version
+        ? buildIndexUrl(`docs/${version}/search/manifest.json`, baseurl)
+        : metaTag.getAttribute('content') || buildIndexUrl('search/manifest.json', baseurl);
+
+      await loadNativeScript();
+      const loaded = await window.BengalNativeSearch.load(manifestUrl);
+      searchIndex = loaded.index;
+      searchData = loaded.data;
+      log(`Search index loaded (native): ${loaded.index.manifest.documents} documents`);
+      return true;
+    } catch (error) {
+      log('Native index load failed, falling back to runtime build:', error.message);
+      return false;
+    }
+  }
+
   async function loadAndBuildRuntimeIndex(baseurl) {
     let indexUrl = '';
     try {
@@ -200,6 +239,20 @@
     try {
       const baseurl = resolveBaseUrl();
 
+      if (await tryLoadNativeIndex(baseurl)) {
+        isIndexLoaded = true;
+        isIndexLoading = false;
+        window.dispatchEvent(new CustomEvent('searchIndexLoaded', {
+          detail: {
+            pages: searchIndex.manifest.documents,
+            headings: 0,
+            prebuilt: true,
+            native: true,
+          },
+        }));
+        return;
+      }
+
       if (CONFIG.usePrebuilt) {
         const prebuiltLoaded = await tryLoadPrebuiltIndex(baseurl);
         if (prebuiltLoaded) {
@@ -0,0 +1,241 @@
+/**
+ * Bengal Search — native sharded index
+ *
+ * Client for the index written by the native search backend (search/manifest.json).
+ * Term and section shards are fetched on first use; queries run synchronously over
+ * what is loaded and a searchIndexUpdated event fires when more shards arrive, so
+ * the UI can re-run the query. The query builder mirrors the subset of lunr's API
+ * used by query.js (term, boost, trailing wildcard, editDistance, presence).
+ */
+(function () {
+  'use strict';
+
+  const log = window.BengalUtils?.log || (() => {});
+
+  // Same values as lunr.Query so query.js can use either set of constants
+  const Query = {
+    wildcard: { NONE: 0, LEADING: 1, TRAILING: 2 },
+    presence: { OPTIONAL: 1, REQUIRED: 2, PROHIBITED: 3 },
+  };
+
+  const NON_WORD = /[^\p{L}\p{N}_]+/gu;
+  const SAFE_SHARD = /^[a-z0-9]+$/;
+
+  function hex(text) {
+    return Array.from(new TextEncoder().encode(text))
+      .map(function (b) { return b.toString(16).padStart(2, '0'); })
+      .join('');
+  }
+
+  /** Must match term_shard_name() in native_search_index.py. */
+  function termShardName(term, prefixLength) {
+    const prefix = Array.from(term).slice(0, prefixLength).join('');
+    return SAFE_SHARD.test(prefix) ? prefix : '_' + hex(prefix);
+  }
+
+  function withinEditDistance(a, b, max) {
+    if (Math.abs(a.length - b.length) > max) return false;
+    let prev = [];
+    for (let j = 0; j <= b.length; j++) prev.push(j);
+    for (let i = 1; i <= a.length; i++) {
+      const cur = [i];
+      let rowMin = i;
+      for (let j = 1; j <= b.length; j++) {
+        const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+        cur.push(Math.min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost));
+        rowMin = Math.min(rowMin, cur[j]);
+      }
+      if (rowMin > max) return false;
+      prev = cur;
+    }
+    return prev[b.length] <= max;
+  }
+
+  function QueryBuilder() {
+    this.clauses = [];
+  }
+
+  QueryBuilder.prototype.term = function (term, options) {
+    options = options || {};
+    const text = String(term).toLowerCase().replace(NON_WORD, '');
+    if (text) {
+      this.clauses.push({
+        term: text,
+        boost: options.boost || 1,
+        wildcard: options.wildcard || Query.wildcard.NONE,
+        editDistance: options.editDistance || 0,
+        presence: options.presence || Query.presence.OPTIONAL,
+      });
+    }
+    return this;
+  };
+
+  function NativeIndex(manifest, manifestUrl) {
+    this.manifest = manifest;
+    this.manifestUrl = manifestUrl;
+    this.queryConstants = Query;
+    this.data = { pages: [], headings: [], facets: manifest.facets || {} };
+    this.termShards = new Map();
+    this.sectionShards = new Map();
+    this.updateScheduled = false;
+  }
+
+  NativeIndex.prototype.shardUrl = function (entry) {
+    const url = new URL(entry.path, this.manifestUrl);
+    url.searchParams.set('v', entry.hash);
+    return url.toString();
+  };
+
+  NativeIndex.prototype.fetchShard = function (cache, key, entry, onLoad) {
+    if (cache.has(key)) return cache.get(key);
+    cache.set(key, null);
+    const self = this;
+    fetch(this.shardUrl(entry))
+      .then(function (response) {
+        if (!response.ok) throw new Error('HTTP ' + response.status);
+        return response.json();
+      })
+      .then(function (shard) {
+        cache.set(key, onLoad(shard));
+        self.scheduleUpdate();
+      })
+      .catch(function (error) {
+        log('Search shard failed to load:', entry.path, error.message);
+        cache.set(key, {});
+      });
+    return null;
+  };
+
+  NativeIndex.prototype.scheduleUpdate = function () {
+    if (this.updateScheduled) return;
+    this.updateScheduled = true;
+    const self = this;
+    setTimeout(function () {
+      self.updateScheduled = false;
+      window.dispatchEvent(new CustomEvent('searchIndexUpdated', {
+        detail: { pages: self.data.pages.length, headings: self.data.headings.length },
+      }));
+    }, 0);
+  };
+
+  NativeIndex.prototype.termShard = function (name) {
+    const entry = (this.manifest.terms || {})[name];
+    if (!entry) return {};
+    return this.fetchShard(this.termShards, name, entry, function (shard) { return shard; });
+  };
+
+  NativeIndex.prototype.sectionShard = function (sectionIndex) {
+    const entry = (this.manifest.sections || [])[sectionIndex];
+    if (!entry) return {};
+    const data = this.data;
+    return this.fetchShard(this.sectionShards, sectionIndex, entry, function (shard) {
+      const byId = {};
+      (shard.pages || []).forEach(function (record) {
+        byId[record.id] = record;
+        data.pages.push(record);
+      });
+      (shard.headings || []).forEach(function (record) {
+        byId[record.id] = record;
+        data.headings.push(record);
+      });
+      return byId;
+    });
+  };
+
+  /** Term shards that can hold terms starting with ``term``. */
+  NativeIndex.prototype.shardNamesFor = function (term) {
+    const prefixLength = this.manifest.prefix_length || 2;
+    if (Array.from(term).length >= prefixLength) {
+      return [termShardName(term, prefixLength)];
+    }
+    return Object.keys(this.manifest.terms || {}).filter(function (name) {
+      return name.startsWith(term);
+    });
+  };
+
+  NativeIndex.prototype.matchClause = function (clause) {
+    const matches = [];
+    const self = this;
+    this.shardNamesFor(clause.term).forEach(function (name) {
+      const shard = self.termShard(name);
+      if (!shard) return;
+      if (clause.editDistance) {
+        Object.keys(shard).forEach(function (key) {
+          if (key !== clause.term && withinEditDistance(clause.term, key, clause.editDistance)) {
+            matches.push(shard[key]);
+          }
+        });
+      } else if (clause.wildcard === Query.wildcard.TRAILING) {
+        Object.keys(shard).forEach(function (key) {
+          if (key.startsWith(clause.term)) matches.push(shard[key]);
+        });
+      } else if (Object.prototype.hasOwnProperty.call(shard, clause.term)) {
+        matches.push(shard[clause.term]);
+      }
+    });
+    return matches;
+  };
+
+  NativeIndex.prototype.query = function (fn) {
+    const builder = new QueryBuilder();
+    fn.call(builder, builder);
+
+    const total = this.manifest.documents || 1;
+    const scores = new Map();
+    const sectionOf = new Map();
+    const required = [];
+    const prohibited = new Set();
+    const self = this;
+
+    builder.clauses.forEach(function (clause) {
+      const matched = new Set();
+      self.matchClause(clause).forEach(function (postings) {
+        const df = postings.length / 3;
+        const idf = Math.log(1 + total / df);
+        for (let i = 0; i < postings.length; i += 3) {
+          const doc = postings[i];
+          matched.add(doc);
+          if (clause.presence === Query.presence.PROHIBITED) continue;
+          sectionOf.set(doc, postings[i + 1]);
+          scores.set(doc, (scores.get(doc) || 0) + clause.boost * postings[i + 2] * idf);
+        }
+      });
+      if (clause.presence === Query.presence.REQUIRED) required.push(matched);
+      if (clause.presence === Query.presence.PROHIBITED) {
+        matched.forEach(function (doc) { prohibited.add(doc); });
+      }
+    });
+
+    const results = [];
+    scores.forEach(function (score, doc) {
+      if (prohibited.has(doc)) return;
+      if (!required.every(function (set) { return set.has(doc); })) return;
+      const records = self.sectionShard(sectionOf.get(doc));
+      const record = records && records[doc];
+      if (!record) return;
+      results.push({ ref: record.objectID, score: score, matchData: { metadata: {} }, doc: doc });
+    });
+
+    results.sort(function (a, b) { return b.score - a.score || a.doc - b.doc; });
+    return results;
+  };
+
+  async function load(manifestUrl) {
+    const response = await fetch(manifestUrl);
+    if (!response.ok) {
+      throw new Error(`Failed to load search manifest: ${response.status}`);
+    }
+    const manifest = await response.json();
+    if (!manifest || manifest.version !== 1 || !Array.isArray(manifest.sections)) {
+      throw new Error('Invalid search manifest');
+    }
+    const index = new NativeIndex(manifest, new URL(manifestUrl, window.location.href));
+    return { index: index, data: index.data };
+  }
+
+  window.BengalNativeSearch = {
+    Query: Query,
+    load: load,
+    termShardName: termShardName,
+  };
+})();
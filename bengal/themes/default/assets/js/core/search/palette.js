@@ -263,8 +263,10 @@
 
       this._onGlobalKeydown = this._handleGlobalKeydown.bind(this);
       this._onIndexLoaded = this._handleIndexLoaded.bind(this);
+      this._onIndexUpdated = this._handleIndexUpdated.bind(this);
       document.addEventListener('keydown', this._onGlobalKeydown);
       window.addEventListener('searchIndexLoaded', this._onIndexLoaded);
+      window.addEventListener('searchIndexUpdated', this._onIndexUpdated);
 
       this._initSearchPage();
 
@@ -304,6 +306,7 @@
         this.modal.removeEventListener('click', this._onModalClick);
       }
       window.removeEventListener('searchIndexLoaded', this._onIndexLoaded);
+      window.removeEventListener('searchIndexUpdated', this._onIndexUpdated);
     }
 
     _bindModalEvents() {
@@ -393,6 +396,19 @@
       }
     }
 
+    /** Native index: more shards arrived, so re-run the visible queries. */
+    _handleIndexUpdated() {
+      if (this.isModalOpen && this.modalInput) {
+        const query = this.modalInput.value.trim();
+        if (query.length >= CONFIG.minQueryLength) {
+          this._performModalSearch(query);
+        }
+      }
+      if (this.pageCurrentQuery && this.pageCurrentQuery.length >= CONFIG.minQueryLength) {
+        this._performPageSearch(this.pageCurrentQuery);
+      }
+    }
+
     _handleModalInput(e) {
       const query = e.target.value.trim();
       if (query.length < CONFIG.minQueryLength) {
@@ -347,6 +347,9 @@
         return [];
       }
 
+      // Native index ships lunr-compatible constants; lunr.js may not be loaded
+      const Query = searchIndex.queryConstants || lunr.Query;
+
       let results = searchIndex.query(function (q) {
         parsedTerms.forEach(function (_ref) {
           const term = _ref.term;
@@ -362,15 +365,15 @@
           q.term(term, {
             boost: 10,
             usePipeline: true,
-            presence: lunr.Query.presence.OPTIONAL,
+            presence: Query.presence.OPTIONAL,
           });
 
           if (!isExact) {
             q.term(term, {
               boost: 5,
-              wildcard: lunr.Query.wildcard.TRAILING,
+              wildcard: Query.wildcard.TRAILING,
               usePipeline: true,
-              presence: lunr.Query.presence.OPTIONAL,
+              presence: Query.presence.OPTIONAL,
             });
           }
 
@@ -379,7 +382,7 @@
               boost: 1,
               editDistance: 1,
               usePipeline: true,
-              presence: lunr.Query.presence.OPTIONAL,
+              presence: Query.presence.OPTIONAL,
             });
           }
         });
@@ -408,11 +411,17 @@
     }
   }
 
+  // Native index: shards load lazily, so filter values come from the manifest
+  const FACET_NAMES = { section: 'sections', type: 'types', tags: 'tags' };
+
   function getUniqueValues(field) {
     const api = getIndexApi();
     const searchData = api.getData();
     if (!searchData || !Array.isArray(searchData.pages)) return [];
 
+    const facet = searchData.facets && searchData.facets[FACET_NAMES[field]];
+    if (Array.isArray(facet)) return facet.slice();
+
     const values = new Set();
     searchData.pages.forEach(function (page) {
       const value = page[field];
@@ -445,6 +454,10 @@
     const searchData = api.getData();
     const authors = new Set();
 
+    if (searchData && searchData.facets && Array.isArray(searchData.facets.authors)) {
+      return searchData.facets.authors.slice();
+    }
+
     if (searchData && Array.isArray(searchData.pages)) {
       searchData.pages.forEach(function (page) {
         if (page.author) authors.add(page.author);
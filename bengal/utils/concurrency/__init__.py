@@ -25,7 +25,12 @@ Example:
 from bengal.utils.concurrency.async_compat import install_uvloop, run_async
 from bengal.utils.concurrency.concurrent_locks import PerKeyLockManager
 from bengal.utils.concurrency.context_propagation import submit_with_context
-from bengal.utils.concurrency.executor import CancellationError, CancellationToken, managed_executor
+from bengal.utils.concurrency.executor import (
+    CancellationError,
+    CancellationToken,
+    managed_executor,
+    managed_process_pool,
+)
 from bengal.utils.concurrency.gil import (
     FreeThreadingState,
     FreeThreadingStatus,
@@ -82,6 +87,7 @@ __all__ = [
     "is_free_threading_build",
     "is_gil_disabled",
     "managed_executor",
+    "managed_process_pool",
     "order_by_complexity",
     "retry_with_backoff",
     "run_async",
@@ -1,4 +1,4 @@
-"""Managed ThreadPoolExecutor with safe shutdown and cancellation support.
+"""Managed thread/process pool executors with safe shutdown and cancellation support.
 
 Provides a context manager that handles KeyboardInterrupt, SystemExit,
 and interpreter shutdown correctly — cancelling pending futures on interrupt
@@ -30,7 +30,7 @@ from typing import TYPE_CHECKING
 from bengal.utils.observability.logger import get_logger
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
 
 logger = get_logger(__name__)
 
@@ -83,6 +83,49 @@ def managed_executor(
         executor.shutdown(wait=False, cancel_futures=True)
 
 
+@contextmanager
+def managed_process_pool(
+    max_workers: int,
+    *,
+    initializer: Callable[..., object] | None = None,
+    initargs: tuple[object, ...] = (),
+) -> Generator[concurrent.futures.ProcessPoolExecutor]:
+    """Context manager for a spawn-context ProcessPoolExecutor.
+
+    For CPU-bound work around C extensions that are not safe to share between
+    free-threaded workers (e.g. Pillow): each worker process owns its own
+    interpreter and extension state. Uses the ``spawn`` start method so no
+    parent threads or locks are inherited. Submitted callables and their
+    arguments must be picklable, module-level objects.
+
+    On KeyboardInterrupt/SystemExit, cancels pending futures and re-raises;
+    otherwise waits for the workers to exit.
+
+    Args:
+        max_workers: Maximum number of worker processes.
+        initializer: Optional per-worker setup callable.
+        initargs: Arguments for ``initializer``.
+
+    Yields:
+        Configured ProcessPoolExecutor.
+    """
+    import multiprocessing
+
+    executor = concurrent.futures.ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=initializer,
+        initargs=initargs,
+    )
+    try:
+        yield executor
+    except KeyboardInterrupt, SystemExit:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
 class CancellationToken:
     """Cooperative cancellation token for bounded parallel work.
 
@@ -20,6 +20,7 @@ Example:
 
 from bengal.utils.io.atomic_write import AtomicFile, atomic_write_bytes, atomic_write_text
 from bengal.utils.io.file_io import (
+    link_or_copy,
     load_data_file,
     load_json,
     load_toml,
@@ -52,6 +53,7 @@ __all__ = [
     # file_lock
     "file_lock",
     "is_locked",
+    "link_or_copy",
     "load",
     "load_data_file",
     "load_json",
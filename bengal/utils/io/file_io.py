@@ -21,6 +21,9 @@ data = load_data_file(path)  # Works for .json, .yaml, .toml
 
 # Robust directory removal (handles macOS quirks)
 rmtree_robust(Path('/path/to/dir'))
+
+# Publish a cached file into the output tree (hardlink, else copy)
+link_or_copy(cache_dir / "abc123.webp", output_dir / "hero.800w.webp")
 ```
 """
 
@@ -592,6 +595,40 @@ def write_json(
 _RETRY_DELAY_BASE = 0.1  # seconds
 
 
+def link_or_copy(source: Path, dest: Path) -> None:
+    """
+    Materialize a cached file at ``dest`` by hardlink, falling back to copy.
+
+    Used to publish content-addressed cache entries into the output tree
+    without re-encoding or re-reading them. The destination is replaced
+    atomically (link/copy to a temp name, then rename), so readers never see
+    a partial file and an existing hardlink to the cache is never written
+    through.
+
+    Args:
+        source: Cached file to publish
+        dest: Output path (parent directories are created)
+
+    Raises:
+        OSError: If the file can be neither linked nor copied
+
+    """
+    import os
+    import uuid
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = dest.parent / f".{dest.name}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        try:
+            os.link(source, tmp_path)
+        except OSError:
+            shutil.copyfile(source, tmp_path)
+        tmp_path.replace(dest)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def _remove_hidden_files(dir_path: Path) -> int:
     """
     Remove macOS hidden files that may prevent directory deletion.
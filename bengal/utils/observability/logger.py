@@ -16,20 +16,29 @@ with logger.phase("discovery", page_count=100):
     logger.info("discovered_content", files=len(files))
     logger.debug("parsed_frontmatter", page=page.path, keys=list(metadata.keys()))
 ```
+
+Each logger keeps its most recent events in a bounded ring buffer (phase
+timings are kept separately so summaries survive eviction). Events for a
+log file are handed to one background writer per file, which serializes
+them as NDJSON and flushes once per batch; a ``.zst`` log file gets one
+zstd frame per batch.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
 import threading
 import time
 import traceback
 import tracemalloc
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import TYPE_CHECKING, Any, TextIO, TypedDict, cast
+from typing import TYPE_CHECKING, Any, BinaryIO, TypedDict, cast
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -86,6 +95,41 @@ def _render_cli_template(template_name: str, **context: Any) -> None:
     get_cli_output().render_write(template_name, **context)
 
 
+# In-memory events kept per logger (oldest are dropped first)
+DEFAULT_MAX_EVENTS = 10_000
+
+# phase_complete events kept per logger for timing summaries (oldest dropped first)
+DEFAULT_MAX_PHASE_EVENTS = 2_000
+
+# Events a log file writer holds before dropping the oldest (slow disk, stalled writer)
+_MAX_QUEUED_EVENTS = 50_000
+
+# Upper bound on events serialized per write/flush by a log file writer
+_MAX_WRITE_BATCH = 1_000
+
+# Seconds close()/flush() wait for the writer thread to drain
+_FLUSH_TIMEOUT = 10.0
+
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def _event_timestamp() -> str:
+    """
+    Local ISO-8601 timestamp with microseconds.
+
+    Same format as ``datetime.now().isoformat()``, but the date/time prefix is
+    formatted once per second instead of once per event.
+    """
+    global _timestamp_cache
+    now = time.time()
+    second = int(now)
+    cached_second, prefix = _timestamp_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _timestamp_cache = (second, prefix)
+    return f"{prefix}.{int((now - second) * 1_000_000):06d}"
+
+
 class LogLevel(Enum):
     """Log levels in order of severity."""
 
@@ -96,6 +140,12 @@ class LogLevel(Enum):
     CRITICAL = 50
 
 
+# Plain ints for the per-call level checks in BengalLogger.debug/info/warning
+_DEBUG_VALUE = LogLevel.DEBUG.value
+_INFO_VALUE = LogLevel.INFO.value
+_WARNING_VALUE = LogLevel.WARNING.value
+
+
 @dataclass
 class LogEvent:
     """Structured log event with context."""
@@ -258,6 +308,199 @@ class LogEvent:
         return {k: v for k, v in self.context.items() if k not in skip}
 
 
+class _LogFileSink:
+    """
+    Batched NDJSON writer for one log file, shared by all loggers targeting it.
+
+    Loggers enqueue LogEvent objects; a daemon thread serializes whatever is
+    queued (up to _MAX_WRITE_BATCH events), writes it with one write() call and
+    flushes once. JSON encoding and file I/O therefore stay off the threads
+    that log. A ``.zst`` path gets each batch as an independent zstd frame
+    (concatenated frames decompress as one stream).
+
+    The queue holds at most _MAX_QUEUED_EVENTS events; when the writer falls
+    behind, the oldest are dropped, counted in ``dropped``, and reported in
+    the file as a ``log_events_dropped`` line.
+
+    Thread Safety:
+        submit() may be called from any thread. flush()/close() block until
+        everything submitted before them is written (or dropped).
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.compress = path.suffix == ".zst"
+        self.refs = 0
+        self._file: BinaryIO | None = open(path, "ab")  # noqa: SIM115
+        self._init_queue()
+
+    def _init_queue(self) -> None:
+        self._cond = threading.Condition()
+        self._pending: deque[LogEvent] = deque(maxlen=_MAX_QUEUED_EVENTS)
+        # Events submitted, and events written or dropped (flush waits on these)
+        self._submitted = 0
+        self._done = 0
+        self._waiters: list[tuple[int, threading.Event]] = []
+        self._stopping = False
+        self.dropped = 0
+        self._reported_dropped = 0
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, event: LogEvent) -> None:
+        """Queue an event for writing, dropping the oldest queued one when full."""
+        if self._thread is None:
+            self._start()
+        with self._cond:
+            if len(self._pending) == _MAX_QUEUED_EVENTS:
+                self.dropped += 1
+                self._done += 1
+            self._pending.append(event)
+            self._submitted += 1
+            self._cond.notify()
+
+    def flush(self) -> None:
+        """Block until every event submitted so far has been written."""
+        if self._thread is None or not self._thread.is_alive():
+            return
+        done = threading.Event()
+        with self._cond:
+            if self._done >= self._submitted:
+                return
+            self._waiters.append((self._submitted, done))
+        done.wait(_FLUSH_TIMEOUT)
+
+    def close(self) -> None:
+        """Drain pending events, stop the writer thread and close the file."""
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            with self._cond:
+                self._stopping = True
+                self._cond.notify()
+            thread.join(_FLUSH_TIMEOUT)
+        self._thread = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def reset_after_fork(self) -> None:
+        """Forget the parent's writer thread and queue (child process only)."""
+        self._init_queue()
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"bengal-log-{self.path.name}", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        cond = self._cond
+        pending = self._pending
+        while True:
+            with cond:
+                while not pending and not self._stopping:
+                    cond.wait()
+                batch = [pending.popleft() for _ in range(min(len(pending), _MAX_WRITE_BATCH))]
+                stop = self._stopping and not pending
+                dropped = self.dropped - self._reported_dropped
+                self._reported_dropped = self.dropped
+
+            lines = [json.dumps(event.to_dict(), default=str) for event in batch]
+            if dropped:
+                lines.append(
+                    json.dumps(
+                        {
+                            "timestamp": _event_timestamp(),
+                            "level": "WARNING",
+                            "event_type": "log_events_dropped",
+                            "message": "log_events_dropped",
+                            "context": {"dropped": dropped},
+                        }
+                    )
+                )
+            if lines:
+                self._write(("\n".join(lines) + "\n").encode("utf-8"))
+
+            with cond:
+                self._done += len(batch)
+                ready = [waiter for target, waiter in self._waiters if target <= self._done]
+                self._waiters = [item for item in self._waiters if item[0] > self._done]
+            for waiter in ready:
+                waiter.set()
+            if stop:
+                return
+
+    def _write(self, data: bytes) -> None:
+        if self._file is None:
+            return
+        if self.compress:
+            from compression import zstd
+
+            data = zstd.compress(data)
+        try:
+            self._file.write(data)
+            self._file.flush()
+        except OSError:
+            # Logging must never take the build down (disk full, file removed)
+            pass
+
+
+# Open log file writers, keyed by path. Guarded by _logger_lock.
+_sinks: dict[Path, _LogFileSink] = {}
+
+
+def _acquire_sink(path: Path) -> _LogFileSink | None:
+    """Shared writer for ``path`` (opened on first use); None if it cannot be opened."""
+    with _logger_lock:
+        sink = _sinks.get(path)
+        if sink is None:
+            from contextlib import suppress
+
+            with suppress(Exception):
+                path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                sink = _LogFileSink(path)
+            except OSError:
+                return None
+            _sinks[path] = sink
+        sink.refs += 1
+        return sink
+
+
+def _release_sink(sink: _LogFileSink) -> None:
+    """Drop one reference; the last one drains and closes the writer."""
+    with _logger_lock:
+        sink.refs -= 1
+        last = sink.refs <= 0
+        if last and _sinks.get(sink.path) is sink:
+            del _sinks[sink.path]
+    # Drain outside the lock so other loggers are not blocked on the writer
+    if last:
+        sink.close()
+    else:
+        sink.flush()
+
+
+def flush_log_files() -> None:
+    """Write out every queued log event (e.g. before reading the log file)."""
+    with _logger_lock:
+        sinks = list(_sinks.values())
+    for sink in sinks:
+        sink.flush()
+
+
+def _reset_sinks_after_fork() -> None:
+    for sink in _sinks.values():
+        sink.reset_after_fork()
+
+
+atexit.register(flush_log_files)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sinks_after_fork)
+
+
 class BengalLogger:
     """
     Phase-aware structured logger for Bengal builds.
@@ -266,6 +509,11 @@ class BengalLogger:
     timing information. All logs are written to both console
     and a build log file.
 
+    The most recent ``max_events`` events are kept in memory; older ones
+    are dropped (they remain in the log file). The most recent
+    ``DEFAULT_MAX_PHASE_EVENTS`` ``phase_complete`` events are additionally
+    kept for timing summaries; ``phase_events_dropped`` counts the rest.
+
     """
 
     def __init__(
@@ -275,6 +523,7 @@ class BengalLogger:
         log_file: Path | None = None,
         verbose: bool = False,
         quiet_console: bool = False,
+        max_events: int | None = DEFAULT_MAX_EVENTS,
     ):
         """
         Initialize logger.
@@ -285,6 +534,7 @@ class BengalLogger:
             log_file: Path to log file (optional)
             verbose: Whether to show verbose output
             quiet_console: Suppress console output (for live progress mode)
+            max_events: In-memory event limit (None = unbounded)
         """
         self.name = name
         self.level = level
@@ -296,18 +546,26 @@ class BengalLogger:
         # Without this, concurrent builds sharing a module-level logger corrupt
         # the stack under free-threaded Python 3.14t.
         self._phase_tls = threading.local()
-        self._events: list[LogEvent] = []
+        self._events: deque[LogEvent] = deque(maxlen=max_events)
+        self._phase_events: deque[LogEvent] = deque(maxlen=DEFAULT_MAX_PHASE_EVENTS)
+        self.phase_events_dropped = 0
 
-        # File handle - properly closed in close() method
-        # Open in append mode to allow multiple loggers to write to same file safely
-        self._file_handle: TextIO | None = None
-        if log_file:
-            # Ensure parent directory exists before opening the log file
-            from contextlib import suppress
+        # Shared batched writer for log_file - released in close()
+        self._file_handle: _LogFileSink | None = _acquire_sink(log_file) if log_file else None
 
-            with suppress(Exception):
-                log_file.parent.mkdir(parents=True, exist_ok=True)
-            self._file_handle = open(log_file, "a", encoding="utf-8")  # noqa: SIM115
+    @property
+    def level(self) -> LogLevel:
+        """Minimum level emitted."""
+        return self._level
+
+    @level.setter
+    def level(self, level: LogLevel) -> None:
+        self._level = level
+        self._level_value = level.value
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Whether events at ``level`` are emitted (guard for expensive context)."""
+        return level.value >= self._level_value
 
     @property
     def _phase_stack(self) -> list[tuple[str, float, dict[str, Any]]]:
@@ -513,7 +771,7 @@ class BengalLogger:
             **context: Additional context data
         """
         # Check if we should emit based on level
-        if level.value < self.level.value:
+        if level.value < self._level_value:
             return
 
         # Get current phase context
@@ -534,7 +792,7 @@ class BengalLogger:
 
         # Create event
         event = LogEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp=_event_timestamp(),
             level=level.name,
             logger_name=self.name,
             event_type=message,  # Use message as event_type (e.g., "phase_start", "discovery_complete")
@@ -547,8 +805,12 @@ class BengalLogger:
             context=merged_context,
         )
 
-        # Store event
+        # Store event (ring buffer; phase completions are also kept in full)
         self._events.append(event)
+        if message == "phase_complete":
+            if len(self._phase_events) == DEFAULT_MAX_PHASE_EVENTS:
+                self.phase_events_dropped += 1
+            self._phase_events.append(event)
 
         # Output to console (unless suppressed for live progress or by _console=False)
         # Always show WARNING and above, even if quiet_console is True
@@ -568,22 +830,28 @@ class BengalLogger:
                 else:
                     _write_cli_terminal(line)
 
-        # Output to file (JSON format)
-        if self._file_handle:
-            self._file_handle.write(json.dumps(event.to_dict()) + "\n")
-            self._file_handle.flush()
+        # Output to file (JSON lines, serialized by the background writer)
+        sink = self._file_handle
+        if sink is not None:
+            sink.submit(event)
+
+    # The level checks below run before _emit so filtered events cost no more
+    # than the call itself (no context merging, event or timestamp).
 
     def debug(self, message: str, **context: Any) -> None:
         """Log debug event."""
-        self._emit(LogLevel.DEBUG, message, **context)
+        if self._level_value <= _DEBUG_VALUE:
+            self._emit(LogLevel.DEBUG, message, **context)
 
     def info(self, message: str, **context: Any) -> None:
         """Log info event."""
-        self._emit(LogLevel.INFO, message, **context)
+        if self._level_value <= _INFO_VALUE:
+            self._emit(LogLevel.INFO, message, **context)
 
     def warning(self, message: str, **context: Any) -> None:
         """Log warning event."""
-        self._emit(LogLevel.WARNING, message, **context)
+        if self._level_value <= _WARNING_VALUE:
+            self._emit(LogLevel.WARNING, message, **context)
 
     def error(self, message: str, **context: Any) -> None:
         """Log error event."""
@@ -594,8 +862,12 @@ class BengalLogger:
         self._emit(LogLevel.CRITICAL, message, **context)
 
     def get_events(self) -> list[LogEvent]:
-        """Get all logged events."""
-        return self._events.copy()
+        """Get buffered events (the most recent ``max_events``), oldest first."""
+        return list(self._events)
+
+    def get_phase_events(self) -> list[LogEvent]:
+        """Get ``phase_complete`` events (the most recent ``DEFAULT_MAX_PHASE_EVENTS``)."""
+        return list(self._phase_events)
 
     def get_phase_timings(self) -> dict[str, float]:
         """
@@ -605,8 +877,8 @@ class BengalLogger:
             Dict mapping phase names to duration in milliseconds
         """
         timings = {}
-        for event in self._events:
-            if event.message == "phase_complete" and event.duration_ms is not None:
+        for event in self._phase_events:
+            if event.duration_ms is not None:
                 phase = event.context.get("phase_name", event.phase)
                 if phase:
                     timings[phase] = event.duration_ms
@@ -642,11 +914,16 @@ class BengalLogger:
             show_memory=False,
         )
 
+    def flush(self) -> None:
+        """Block until this logger's queued file output is written."""
+        if self._file_handle is not None:
+            self._file_handle.flush()
+
     def close(self) -> None:
-        """Close log file handle."""
-        if self._file_handle:
-            self._file_handle.close()
-            self._file_handle = None
+        """Flush and release the log file writer."""
+        if self._file_handle is not None:
+            sink, self._file_handle = self._file_handle, None
+            _release_sink(sink)
 
     def __enter__(self) -> BengalLogger:
         """Context manager entry."""
@@ -816,6 +1093,10 @@ def configure_logging(
 
         # Clear log file if specified (truncate once at start)
         if log_file:
+            existing = _sinks.get(log_file)
+            if existing is not None:
+                # Pending events belong to the previous run; write them first
+                existing.flush()
             try:
                 # Ensure parent directory exists before truncating
                 log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -838,18 +1119,12 @@ def configure_logging(
             # Update log_file for existing loggers if changed
             # This is needed when reusing loggers across test runs with different log files
             if logger.log_file != log_file:
-                # Close old file handle if exists
-                if logger._file_handle:
-                    logger._file_handle.close()
-                    logger._file_handle = None
+                # Release old writer if exists
+                logger.close()
                 logger.log_file = log_file
-                # Open new file handle if log_file specified
+                # Attach to the shared writer for the new file
                 if log_file:
-                    from contextlib import suppress
-
-                    with suppress(Exception):
-                        log_file.parent.mkdir(parents=True, exist_ok=True)
-                    logger._file_handle = open(log_file, "a", encoding="utf-8")  # noqa: SIM115
+                    logger._file_handle = _acquire_sink(log_file)
 
 
 def get_logger(
@@ -973,7 +1248,7 @@ def print_all_summaries() -> None:
     with _logger_lock:
         all_events = []
         for logger in _loggers.values():
-            all_events.extend(logger.get_events())
+            all_events.extend(logger.get_phase_events())
 
     # Extract phase timings and memory
     timings = {}
@@ -981,15 +1256,14 @@ def print_all_summaries() -> None:
     peak_memories = {}
 
     for event in all_events:
-        if event.message == "phase_complete":
-            phase = event.context.get("phase_name", event.phase)
-            if phase:
-                if event.duration_ms is not None:
-                    timings[phase] = event.duration_ms
-                if event.memory_mb is not None:
-                    memory_deltas[phase] = event.memory_mb
-                if event.peak_memory_mb is not None:
-                    peak_memories[phase] = event.peak_memory_mb
+        phase = event.context.get("phase_name", event.phase)
+        if phase:
+            if event.duration_ms is not None:
+                timings[phase] = event.duration_ms
+            if event.memory_mb is not None:
+                memory_deltas[phase] = event.memory_mb
+            if event.peak_memory_mb is not None:
+                peak_memories[phase] = event.peak_memory_mb
 
     if not timings:
         return
@@ -1,10 +1,20 @@
-"""Git-derived metadata helpers for content files."""
+"""
+Git-derived metadata helpers for content files.
+
+``batch_git_last_modified`` resolves last commit dates with one ``git log``
+pass. Given an ``index_path`` it keeps a persisted path-to-last-commit index
+keyed by the HEAD commit instead: later builds only read the commits in
+``<previous HEAD>..HEAD`` (a full scan is needed only after a history
+rewrite or scope change), and files with uncommitted changes are overlaid
+with their mtime.
+"""
 
 from __future__ import annotations
 
+import os
 import subprocess
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from bengal.utils.observability.logger import get_logger
 
@@ -27,16 +37,24 @@ def find_git_root(start: Path) -> Path | None:
     return None
 
 
+# Bump when the persisted index layout changes
+GIT_LASTMOD_INDEX_VERSION = 1
+
+
 def batch_git_last_modified(
     paths: Sequence[Path],
     *,
     repo_root: Path | None = None,
+    index_path: Path | None = None,
 ) -> dict[Path, datetime]:
     """
     Batch-resolve last commit dates for content files via ``git log``.
 
     Uses a single ``git log --name-only`` pass and keeps the first (most
-    recent) commit date encountered for each tracked file.
+    recent) commit date encountered for each tracked file. With
+    ``index_path`` the result comes from a GitLastModifiedIndex persisted
+    there, which only scans commits made since the previous build and
+    reports the mtime of files with uncommitted changes.
 
     Returns an empty dict when git is unavailable, the tree is not a repo,
     or the subprocess fails (shallow CI clones, sandbox builds, etc.).
@@ -44,6 +62,7 @@ def batch_git_last_modified(
     Args:
         paths: Absolute or repo-relative source file paths.
         repo_root: Optional git root. When omitted, inferred from the first path.
+        index_path: Optional location of the persisted last-modified index.
 
     Returns:
         Mapping of resolved absolute paths to UTC commit datetimes.
@@ -69,40 +88,20 @@ def batch_git_last_modified(
     if not rel_paths:
         return {}
 
-    try:
-        completed = subprocess.run(
-            [
-                "git",
-                "-C",
-                str(root),
-                "log",
-                "--format=%cI",
-                "--name-only",
-                "--",
-                *rel_paths,
-            ],
-            check=False,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-    except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as exc:
-        logger.debug("git_lastmod_lookup_failed", error=str(exc))
-        return {}
+    if index_path is not None:
+        index = GitLastModifiedIndex(root, index_path)
+        dates = index.lookup(rel_paths)
+        return {rel_to_abs[rel]: date for rel, date in dates.items()}
 
-    if completed.returncode != 0:
-        logger.debug(
-            "git_lastmod_lookup_nonzero",
-            returncode=completed.returncode,
-            stderr=completed.stderr.strip(),
-        )
+    stdout = _git_output(root, "log", "--format=%cI", "--name-only", "--", *rel_paths)
+    if stdout is None:
         return {}
 
     wanted = set(rel_paths)
     results: dict[Path, datetime] = {}
     current_date: datetime | None = None
 
-    for raw_line in completed.stdout.splitlines():
+    for raw_line in stdout.splitlines():
         line = raw_line.strip()
         if not line:
             continue
@@ -112,12 +111,12 @@ def batch_git_last_modified(
             current_date = parsed
             continue
 
-        if current_date is None or line not in wanted or line in results:
+        if current_date is None or line not in wanted:
             continue
 
-        abs_path = rel_to_abs.get(line)
-        if abs_path is not None:
-            results[abs_path] = current_date
+        # Newest commit first: later (older) mentions must not overwrite it
+        wanted.discard(line)
+        results[rel_to_abs[line]] = current_date
 
     return results
 
@@ -130,3 +129,208 @@ def _parse_git_timestamp(value: str) -> datetime | None:
     if parsed.tzinfo is None:
         parsed = parsed.replace(tzinfo=UTC)
     return parsed.astimezone(UTC).replace(tzinfo=None)
+
+
+class GitLastModifiedIndex:
+    """
+    Persisted path-to-last-commit-date index for one repository.
+
+    The index file records the HEAD commit it was built at, the pathspec
+    scope it covers and the last commit date of every path git reported in
+    that scope. When HEAD moves forward only ``<recorded HEAD>..HEAD`` is
+    read and merged in; a recorded HEAD that is no longer an ancestor
+    (rebase, amend, force-push, shallow clone) or a wider scope triggers a
+    full scan. Files that are modified or untracked in the worktree are
+    overlaid with their mtime on every lookup and never persisted.
+
+    Timestamps are naive UTC datetimes, matching batch_git_last_modified().
+    """
+
+    def __init__(self, repo_root: Path, index_path: Path) -> None:
+        self.repo_root = repo_root
+        self.index_path = index_path
+
+    def lookup(self, rel_paths: Sequence[str]) -> dict[str, datetime]:
+        """
+        Return last-modified dates for repo-relative POSIX paths.
+
+        Paths git has no record of (and that are not dirty) are omitted.
+        Returns an empty dict when git is unavailable.
+        """
+        if not rel_paths:
+            return {}
+        head = _git_output(self.repo_root, "rev-parse", "HEAD")
+        if head is None:
+            return {}
+
+        scope = _common_scope(rel_paths)
+        dates = self._updated_dates(head.strip(), scope)
+        if dates is None:
+            return {}
+
+        results: dict[str, datetime] = {}
+        for rel in rel_paths:
+            raw = dates.get(rel)
+            if raw is not None and (parsed := _parse_git_timestamp(raw)) is not None:
+                results[rel] = parsed
+        results.update(self._dirty_overlay(scope, set(rel_paths)))
+        return results
+
+    def _updated_dates(self, head: str, scope: str) -> dict[str, str] | None:
+        """Bring the persisted index up to ``head`` and return its dates."""
+        state = self._load()
+        previous_head = state.get("head") if state else None
+        dates: dict[str, str] = dict(state.get("dates", {})) if state else {}
+        if state is not None and not _scope_covers(state.get("scope", ""), scope):
+            previous_head = None
+            dates = {}
+        else:
+            scope = state.get("scope", scope) if state else scope
+
+        if previous_head == head:
+            return dates
+
+        incremental = isinstance(previous_head, str) and _is_ancestor(
+            self.repo_root, previous_head, head
+        )
+        revisions = [f"{previous_head}..{head}"] if incremental else [head]
+        log = _git_output(
+            self.repo_root,
+            "log",
+            "--format=%cI",
+            "--name-only",
+            *revisions,
+            "--",
+            scope or ".",
+        )
+        if log is None:
+            return None
+        if not incremental:
+            dates = {}
+
+        # Newest commits come first; only the first date seen per path counts
+        seen: set[str] = set()
+        current: str | None = None
+        for raw_line in log.splitlines():
+            line = raw_line.strip()
+            if not line:
+                continue
+            if _parse_git_timestamp(line) is not None:
+                current = line
+            elif current is not None and line not in seen:
+                seen.add(line)
+                dates[line] = current
+
+        logger.debug(
+            "git_lastmod_index_updated",
+            mode="incremental" if incremental else "full",
+            commits_from=previous_head if incremental else None,
+            paths_updated=len(seen),
+            paths_total=len(dates),
+        )
+        self._save({"head": head, "scope": scope, "dates": dates})
+        return dates
+
+    def _dirty_overlay(self, scope: str, wanted: set[str]) -> dict[str, datetime]:
+        """Mtime-based dates for requested files with uncommitted changes."""
+        status = _git_output(
+            self.repo_root,
+            "status",
+            "--porcelain=v1",
+            "-z",
+            "--untracked-files=all",
+            "--no-renames",
+            "--",
+            scope or ".",
+        )
+        if not status:
+            return {}
+        overlay: dict[str, datetime] = {}
+        for record in status.split("\0"):
+            rel = record[3:]
+            if rel not in wanted:
+                continue
+            try:
+                mtime = os.stat(self.repo_root / rel).st_mtime
+            except OSError:
+                continue
+            overlay[rel] = datetime.fromtimestamp(mtime, UTC).replace(tzinfo=None)
+        return overlay
+
+    def _load(self) -> dict[str, Any] | None:
+        from bengal.utils.io import json_compat
+
+        try:
+            state = json_compat.load(self.index_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("git_lastmod_index_load_failed", path=str(self.index_path), error=str(e))
+            return None
+        if (
+            not isinstance(state, dict)
+            or state.get("version") != GIT_LASTMOD_INDEX_VERSION
+            or not isinstance(state.get("dates"), dict)
+        ):
+            return None
+        return state
+
+    def _save(self, state: dict[str, Any]) -> None:
+        from bengal.utils.io import json_compat
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            json_compat.dump(
+                {"version": GIT_LASTMOD_INDEX_VERSION, **state}, self.index_path, indent=None
+            )
+        except OSError as e:
+            logger.debug("git_lastmod_index_save_failed", path=str(self.index_path), error=str(e))
+
+
+def _git_output(root: Path, *args: str) -> str | None:
+    """Run a git command in ``root``; stdout on success, None otherwise."""
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(root), *args],
+            check=False,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired, OSError) as exc:
+        logger.debug("git_lastmod_lookup_failed", error=str(exc))
+        return None
+    if completed.returncode != 0:
+        logger.debug(
+            "git_lastmod_lookup_nonzero",
+            command=args[0],
+            returncode=completed.returncode,
+            stderr=completed.stderr.strip(),
+        )
+        return None
+    return completed.stdout
+
+
+def _is_ancestor(root: Path, ancestor: str, head: str) -> bool:
+    try:
+        completed = subprocess.run(
+            ["git", "-C", str(root), "merge-base", "--is-ancestor", ancestor, head],
+            check=False,
+            capture_output=True,
+            timeout=60,
+        )
+    except FileNotFoundError, subprocess.TimeoutExpired, OSError:
+        return False
+    return completed.returncode == 0
+
+
+def _common_scope(rel_paths: Sequence[str]) -> str:
+    """Deepest directory containing every path ("" for the repository root)."""
+    common = os.path.commonpath([f"/{rel}" for rel in rel_paths]).lstrip("/")
+    if len(rel_paths) == 1 or common in rel_paths:
+        common = common.rpartition("/")[0]
+    return common
+
+
+def _scope_covers(indexed: str, requested: str) -> bool:
+    return not indexed or requested == indexed or requested.startswith(f"{indexed}/")
@@ -9,11 +9,20 @@ links (id:, path:, slug:, ./, ../) to page objects or URLs.
 
 from __future__ import annotations
 
+import hashlib
+import threading
 from typing import Any
 
 from bengal.utils.paths.url_normalization import clean_md_path
 
-__all__ = ["resolve_link_to_url_and_page", "resolve_page"]
+__all__ = ["resolve_link_to_url_and_page", "resolve_page", "xref_fingerprint"]
+
+# Page fields a resolved reference can contribute to rendered output
+# (link target plus the fields cards can pull from the linked page)
+_FINGERPRINT_FIELDS = ("description", "icon", "image", "badge")
+
+_fingerprint_lock = threading.Lock()
+_last_fingerprint: tuple[dict[str, Any], int, str] | None = None
 
 
 def resolve_page(
@@ -116,3 +125,47 @@ def resolve_link_to_url_and_page(
         url = getattr(page, "href", None) or getattr(page, "url", "")
         return url, page
     return link, None
+
+
+def xref_fingerprint(xref_index: dict[str, Any] | None) -> str:
+    """Hash of everything :func:`resolve_page` callers can observe in *xref_index*.
+
+    Covers the by_id/by_path/by_slug keys and, for each target page, its href,
+    title and pullable metadata. Cached output that resolved references (e.g.
+    the card directive) folds this into its key, so adding, moving or retitling
+    a page invalidates it.
+
+    The index is built once per build and then read-only, so the result for
+    the most recent index is memoized (recomputed if its size changes).
+    """
+    global _last_fingerprint
+
+    if not xref_index:
+        return ""
+    size = sum(len(xref_index.get(kind) or ()) for kind in ("by_id", "by_path", "by_slug"))
+    memo = _last_fingerprint
+    if memo is not None and memo[0] is xref_index and memo[1] == size:
+        return memo[2]
+
+    hasher = hashlib.sha256()
+    for kind in ("by_id", "by_path", "by_slug"):
+        entries = xref_index.get(kind) or {}
+        for key in sorted(entries):
+            value = entries[key]
+            pages = value if isinstance(value, list) else [value]
+            hasher.update(f"{kind}\0{key}\0".encode())
+            for page in pages[:1]:
+                metadata = getattr(page, "metadata", None)
+                if not isinstance(metadata, dict):
+                    metadata = {}
+                fields = [
+                    str(getattr(page, "href", None) or getattr(page, "url", "")),
+                    str(getattr(page, "title", "")),
+                    *(str(metadata.get(name, "")) for name in _FINGERPRINT_FIELDS),
+                ]
+                hasher.update("\0".join(fields).encode("utf-8", "surrogatepass"))
+            hasher.update(b"\n")
+    fingerprint = hasher.hexdigest()[:16]
+    with _fingerprint_lock:
+        _last_fingerprint = (xref_index, size, fingerprint)
+    return fingerprint
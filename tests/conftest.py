@@ -45,6 +45,12 @@ def pytest_configure(config: pytest.Config) -> None:
             stacklevel=2,
         )
 
+    # Keep user-level caches (e.g. the shared minification cache) out of $HOME
+    if "BENGAL_CACHE_DIR" not in os.environ:
+        import tempfile
+
+        os.environ["BENGAL_CACHE_DIR"] = tempfile.mkdtemp(prefix="bengal-test-cache-")
+
     if os.environ.get("BENGAL_CI_FAST") == "1":
         try:
             from hypothesis import settings
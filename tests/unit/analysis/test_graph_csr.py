@@ -0,0 +1,133 @@
+"""
+Tests for the CSR (integer-indexed) knowledge-graph view.
+
+The array kernels must reproduce the dict-based implementations exactly, so
+every test runs an analysis twice on the same graph — once with ``graph.csr``
+set, once without — and compares the results with ``==``.
+"""
+
+import random
+from collections import defaultdict
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from bengal.analysis.graph.community_detection import LouvainCommunityDetector
+from bengal.analysis.graph.csr import CSRGraph
+from bengal.analysis.graph.page_rank import PageRankCalculator
+from bengal.analysis.performance.path_analysis import PathAnalyzer
+
+
+def _random_graph(n=80, seed=7):
+    """
+    Random directed graph with a few generated pages and out-of-graph targets.
+
+    Generated pages are analysis pages but not content pages, and "external"
+    pages receive links without being analysis pages at all, so the CSR view
+    has to cope with both kinds of non-member nodes.
+    """
+    rng = random.Random(seed)
+    pages = [Mock(source_path=Path(f"p{i:03d}.md"), metadata={}) for i in range(n)]
+    for page in pages[-5:]:
+        page.metadata = {"_generated": True}
+    external = [Mock(source_path=Path(f"api/x{i}.md"), metadata={}) for i in range(3)]
+
+    site = Mock()
+    site.pages = pages + external
+    site.root_path = None
+
+    graph = Mock()
+    graph.site = site
+    graph.get_analysis_pages.return_value = list(pages)
+    graph.outgoing_refs = defaultdict(set)
+    graph.incoming_edges = defaultdict(list)
+    for source in pages[:-5]:
+        for target in rng.sample(pages + external, rng.randint(0, 6)):
+            if target is source:
+                continue
+            graph.outgoing_refs[source].add(target)
+            graph.incoming_edges[target].append(source)
+    # Navigation-style edges appear only in incoming_edges, some duplicated
+    for i in range(0, n - 6, 3):
+        graph.incoming_edges[pages[i + 1]].append(pages[i])
+        graph.incoming_edges[pages[i + 1]].append(pages[i])
+    return graph, pages
+
+
+def _with_and_without_csr(graph, run):
+    graph.csr = None
+    expected = run()
+    graph.csr = CSRGraph.build(
+        graph.get_analysis_pages(), graph.outgoing_refs, graph.incoming_edges
+    )
+    return expected, run()
+
+
+class TestCSRGraph:
+    def test_build_preserves_neighbor_order_and_drops_non_members(self):
+        a, b, c, outside = (Mock() for _ in range(4))
+        outgoing = {a: {b, c, outside}, b: {a}}
+        incoming = {a: [b, b], b: [a], c: [a], outside: [a]}
+
+        csr = CSRGraph.build([a, b, c], outgoing, incoming)
+
+        assert csr.num_nodes == 3
+        assert csr.out_lists()[0] == [csr.index[p] for p in outgoing[a] if p is not outside]
+        assert csr.in_indices[csr.in_indptr[0] : csr.in_indptr[1]].tolist() == [1, 1]
+        # The link to ``outside`` still counts toward a's PageRank out-degree
+        assert csr.edge_out_degree.tolist() == [3, 2, 0]
+
+    def test_ids_returns_none_for_unknown_page(self):
+        a, b = Mock(), Mock()
+        csr = CSRGraph.build([a], {}, {})
+
+        assert csr.ids([a]) == [0]
+        assert csr.ids([a, b]) is None
+
+
+class TestCSRParity:
+    def test_pagerank_matches_dict_implementation(self):
+        graph, _pages = _random_graph()
+        calculator = PageRankCalculator(graph, max_iterations=200)
+
+        expected, actual = _with_and_without_csr(graph, calculator.compute)
+
+        assert actual.scores == expected.scores
+        assert actual.iterations == expected.iterations
+        assert actual.converged == expected.converged
+
+    def test_personalized_pagerank_matches_dict_implementation(self):
+        graph, pages = _random_graph()
+        seeds = set(pages[:4])
+        calculator = PageRankCalculator(graph)
+
+        expected, actual = _with_and_without_csr(
+            graph, lambda: calculator.compute(seed_pages=seeds, personalized=True)
+        )
+
+        assert actual.scores == expected.scores
+
+    def test_louvain_matches_dict_implementation(self):
+        graph, _pages = _random_graph()
+
+        expected, actual = _with_and_without_csr(
+            graph, lambda: LouvainCommunityDetector(graph, random_seed=3).detect()
+        )
+
+        assert [c.pages for c in actual.communities] == [c.pages for c in expected.communities]
+        assert actual.modularity == expected.modularity
+        assert actual.iterations == expected.iterations
+
+    @pytest.mark.parametrize("threshold", [1000, 10])
+    def test_path_analysis_matches_dict_implementation(self, threshold):
+        """Exact (threshold above N) and pivot-approximate (below N) modes."""
+        graph, _pages = _random_graph()
+        analyzer = PathAnalyzer(graph, k_pivots=12, auto_approximate_threshold=threshold)
+
+        expected, actual = _with_and_without_csr(graph, analyzer.analyze)
+
+        assert actual.betweenness_centrality == expected.betweenness_centrality
+        assert actual.closeness_centrality == expected.closeness_centrality
+        assert actual.avg_path_length == expected.avg_path_length
+        assert actual.diameter == expected.diameter
@@ -0,0 +1,146 @@
+"""Tests for the HTML-driven unused-selector purge integration."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from bengal.assets.css_purge import (
+    PurgeCSSConfig,
+    harvest_html,
+    inventory_from_tokens,
+    load_pinned_tokens,
+    parse_purge_css_config,
+    referencing_html,
+    rewrite_html_references,
+    safelist_tokens,
+    save_pinned_tokens,
+)
+from bengal.cache.asset_dependency_map import AssetDependencyMap
+from bengal.cache.paths import BengalPaths
+from bengal.core.output import BuildOutputCollector
+from bengal.css import minify_css
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_harvest_collects_names_from_markup() -> None:
+    tokens = harvest_html(
+        '<DIV class="Card  is-active" id="main" data-theme=dark>'
+        "<a href='/x' title=\"a > b\">x</a></div>"
+    )
+
+    assert {"e:div", "e:a", "c:card", "c:is-active", "i:main"} <= tokens
+    assert {"a:class", "a:id", "a:data-theme", "a:href", "a:title"} <= tokens
+
+
+def test_harvest_reads_scripts_and_handlers() -> None:
+    tokens = harvest_html(
+        "<button onclick=\"menu.classList.toggle('menu-open')\">x</button>"
+        "<script>el.className = 'toast-' + level;</script>"
+    )
+
+    assert {"w:menu-open", "w:toast-", "p:toast-"} <= tokens
+
+
+def test_inventory_from_tokens_keeps_scripted_names() -> None:
+    tokens = harvest_html('<p class="lead"></p><script>show("modal")</script>')
+    tokens |= safelist_tokens([".js-only", "#dialog", "tip-*"])
+    css = (
+        ".lead{color:red}.modal{top:0}.js-only{top:1px}#dialog{top:2px}"
+        ".tip-top{top:3px}.unused{top:4px}"
+    )
+
+    result = minify_css(css, used_selectors=inventory_from_tokens(tokens))
+
+    assert result == (
+        ".lead{color:red}.modal{top:0}.js-only{top:1px}#dialog{top:2px}.tip-top{top:3px}"
+    )
+
+
+def test_safelist_tokens() -> None:
+    assert safelist_tokens(["Open", ".Menu", "#nav", ".state-*"]) == {
+        "w:open",
+        "c:menu",
+        "i:nav",
+        "p:state-",
+    }
+
+
+def test_parse_config() -> None:
+    assert parse_purge_css_config({}) == PurgeCSSConfig()
+    assert parse_purge_css_config({"purge_css": True}) == PurgeCSSConfig(enabled=True)
+    assert parse_purge_css_config(
+        {"purge_css": {"enabled": True, "safelist": ["a", " ", ".b"]}}
+    ) == PurgeCSSConfig(enabled=True, safelist=("a", ".b"))
+
+
+def test_pinned_tokens_round_trip(tmp_path: Path) -> None:
+    path = tmp_path / "selector_inventory.json"
+    assert load_pinned_tokens(path) is None
+
+    save_pinned_tokens(path, frozenset({"c:card", "e:div"}))
+
+    assert load_pinned_tokens(path) == frozenset({"c:card", "e:div"})
+    path.write_text('{"version": 0, "tokens": []}', encoding="utf-8")
+    assert load_pinned_tokens(path) is None
+
+
+def test_rewrite_html_references(tmp_path: Path) -> None:
+    page = tmp_path / "docs" / "index.html"
+    page.parent.mkdir()
+    page.write_text('<link href="/assets/css/style.aaaa.css">', encoding="utf-8")
+    other = tmp_path / "other.html"
+    other.write_text("<p>no stylesheet</p>", encoding="utf-8")
+
+    moved = [("assets/css/style.aaaa.css", "assets/css/style.bbbb.css")]
+
+    assert rewrite_html_references(tmp_path, moved) == 1
+    assert page.read_text(encoding="utf-8") == '<link href="/assets/css/style.bbbb.css">'
+    assert other.read_text(encoding="utf-8") == "<p>no stylesheet</p>"
+
+
+def test_referencing_html_uses_asset_dependencies(tmp_path: Path) -> None:
+    output_dir = tmp_path / "public"
+    output_dir.mkdir()
+    paths = BengalPaths(tmp_path)
+    (output_dir / "asset-manifest.json").write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "assets": {
+                    "css/style.css": {
+                        "output_path": "assets/css/style.bbbb.css",
+                        "fingerprint": "bbbb",
+                    }
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    styled, plain, untracked = (
+        SimpleNamespace(source_path=tmp_path / name, output_path=output_dir / name / "index.html")
+        for name in ("styled", "plain", "untracked")
+    )
+    dependency_map = AssetDependencyMap(paths.asset_cache)
+    dependency_map.track_page_assets(styled.source_path, {"css/style.css"})
+    dependency_map.track_page_assets(plain.source_path, {"js/app.js"})
+    dependency_map.save_to_disk()
+    collector = BuildOutputCollector(output_dir=output_dir)
+    collector.record(output_dir / "404.html")
+    collector.record(styled.output_path)
+    site = SimpleNamespace(
+        output_dir=output_dir,
+        config_service=SimpleNamespace(paths=paths),
+        pages=[styled, plain, untracked],
+    )
+    moved = [("assets/css/style.aaaa.css", "assets/css/style.bbbb.css")]
+
+    candidates = referencing_html(site, moved, collector)
+
+    assert candidates == sorted(
+        [output_dir / "404.html", styled.output_path, untracked.output_path]
+    )
+    assert referencing_html(site, moved, None) is None
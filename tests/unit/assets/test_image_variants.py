@@ -0,0 +1,193 @@
+"""Tests for build-time responsive image variants."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from bengal.assets.image_variants import (
+    ImageVariantPipeline,
+    ResponsiveImagesConfig,
+    load_variant_index,
+    parse_responsive_images_config,
+)
+from bengal.cache.paths import BengalPaths
+from bengal.core.output import BuildOutputCollector
+from bengal.rendering.template_functions.images import responsive_image
+
+
+def _make_site(root: Path) -> SimpleNamespace:
+    return SimpleNamespace(
+        root_path=root,
+        output_dir=root / "public",
+        baseurl="",
+        config_service=SimpleNamespace(paths=BengalPaths(root)),
+    )
+
+
+def _make_asset(site: SimpleNamespace, name: str, size: tuple[int, int]) -> SimpleNamespace:
+    source = site.root_path / "assets" / "images" / name
+    source.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, (200, 80, 40)).save(source)
+    # Mirrors Asset after processing: output_path is the fingerprinted output file
+    stem, suffix = name.rsplit(".", 1)
+    output = site.output_dir / "assets" / "images" / f"{stem}.deadbeef.{suffix}"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(source.read_bytes())
+    return SimpleNamespace(
+        source_path=source,
+        output_path=output,
+        logical_path=Path("images") / name,
+    )
+
+
+@pytest.fixture
+def site(tmp_path: Path) -> SimpleNamespace:
+    return _make_site(tmp_path)
+
+
+def test_config_parsing():
+    """Shorthand booleans enable defaults; widths and formats are normalized."""
+    assert not parse_responsive_images_config({}).enabled
+    assert parse_responsive_images_config({"responsive_images": True}).enabled
+
+    config = parse_responsive_images_config(
+        {"responsive_images": {"widths": [800, 400, 800], "formats": ["JPG", "webp", "tiff"]}}
+    )
+    assert config.enabled
+    assert config.widths == (400, 800)
+    assert config.formats == ("jpeg", "webp")
+
+
+def test_generates_real_variants_without_upscaling(site):
+    """Variants exist on disk with correct dimensions; widths above the original are skipped."""
+    asset = _make_asset(site, "hero.jpg", (1000, 500))
+    config = ResponsiveImagesConfig(enabled=True, widths=(400, 800, 1200), formats=("webp",))
+
+    stats = ImageVariantPipeline(site, config).run([asset])
+
+    assert stats.failed == 0
+    image = load_variant_index(site.config_service.paths.image_variants_dir)["images/hero.jpg"]
+    assert (image.width, image.height) == (1000, 500)
+    assert image.src == "/assets/images/hero.deadbeef.jpg"
+    assert sorted((v.format, v.width) for v in image.variants) == [
+        ("jpeg", 400),
+        ("jpeg", 800),
+        ("webp", 400),
+        ("webp", 800),
+    ]
+    for variant in image.variants:
+        with Image.open(site.output_dir / variant.url.lstrip("/")) as img:
+            assert img.size == (variant.width, variant.height)
+            assert img.format.lower() == variant.format
+
+    srcset = image.srcset()
+    assert srcset.endswith("/assets/images/hero.deadbeef.jpg 1000w")
+    assert "800w" in srcset
+    assert image.sources()[0]["type"] == "image/webp"
+
+
+def test_second_run_hits_content_addressed_cache(site):
+    """Unchanged sources are not re-encoded, even after the output dir is cleaned."""
+    asset = _make_asset(site, "hero.png", (900, 600))
+    config = ResponsiveImagesConfig(enabled=True, widths=(300, 600), formats=())
+    first = ImageVariantPipeline(site, config).run([asset])
+    assert first.encoded == 2
+
+    for path in asset.output_path.parent.glob("hero.*.*w.png"):
+        path.unlink()
+    second = ImageVariantPipeline(site, config).run([asset])
+
+    assert second.encoded == 0
+    assert second.cache_hits == 2
+    assert len(list(asset.output_path.parent.glob("hero.*.*w.png"))) == 2
+
+
+def test_variants_are_reported_to_collector(site):
+    """Linked variants are recorded as written, existing ones as unchanged."""
+    asset = _make_asset(site, "hero.jpg", (800, 400))
+    config = ResponsiveImagesConfig(enabled=True, widths=(200, 400), formats=())
+    first = BuildOutputCollector(output_dir=site.output_dir)
+    ImageVariantPipeline(site, config).run([asset], collector=first)
+
+    second = BuildOutputCollector(output_dir=site.output_dir)
+    ImageVariantPipeline(site, config).run([asset], collector=second)
+
+    names = sorted(o.path.name for o in first.get_outputs())
+    assert len(names) == 2
+    assert all(name.startswith("hero.") for name in names)
+    assert second.get_outputs() == []
+    assert sorted(o.path.name for o in second.get_unchanged()) == names
+
+
+def test_exif_orientation_is_applied_before_resizing(site):
+    """A photo stored sideways with an EXIF rotation gets upright variants."""
+    asset = _make_asset(site, "portrait.jpg", (400, 200))
+    stored = Image.new("RGB", (400, 200), (200, 80, 40))
+    stored.paste((0, 0, 255), (0, 0, 200, 200))  # left half blue: the top once upright
+    exif = Image.Exif()
+    exif[0x0112] = 6  # rotate 90 degrees clockwise for display
+    stored.save(asset.source_path, exif=exif)
+    config = ResponsiveImagesConfig(enabled=True, widths=(100,), formats=())
+
+    ImageVariantPipeline(site, config).run([asset])
+
+    image = load_variant_index(site.config_service.paths.image_variants_dir)["images/portrait.jpg"]
+    assert (image.width, image.height) == (200, 400)
+    (variant,) = image.variants
+    with Image.open(site.output_dir / variant.url.lstrip("/")) as img:
+        assert img.size == (100, 200)
+        red, _green, blue = img.convert("RGB").getpixel((50, 20))
+        assert blue > red
+
+
+def test_incremental_run_keeps_other_index_entries(site):
+    """Incremental runs merge into the previous index instead of replacing it."""
+    config = ResponsiveImagesConfig(enabled=True, widths=(200,), formats=())
+    a = _make_asset(site, "a.jpg", (400, 400))
+    b = _make_asset(site, "b.jpg", (400, 400))
+    ImageVariantPipeline(site, config).run([a, b])
+
+    ImageVariantPipeline(site, config).run([a], full=False)
+
+    index = load_variant_index(site.config_service.paths.image_variants_dir)
+    assert set(index) == {"images/a.jpg", "images/b.jpg"}
+
+
+def test_stale_variants_are_pruned(site):
+    """Variants of removed widths and removed sources are deleted from the output."""
+    a = _make_asset(site, "a.jpg", (800, 400))
+    b = _make_asset(site, "b.jpg", (800, 400))
+    config = ResponsiveImagesConfig(enabled=True, widths=(200, 400), formats=())
+    ImageVariantPipeline(site, config).run([a, b])
+    images_dir = a.output_path.parent
+
+    narrowed = ResponsiveImagesConfig(enabled=True, widths=(400,), formats=())
+    stats = ImageVariantPipeline(site, narrowed).run([a, b])
+
+    assert stats.pruned == 2
+    assert sorted(p.name.split(".")[-2] for p in images_dir.glob("*.*.*w.jpg")) == ["400w", "400w"]
+
+    site.assets = [a]
+    stats = ImageVariantPipeline(site, narrowed).run([], full=False)
+
+    assert stats.pruned == 1
+    assert [p.name.split(".")[0] for p in images_dir.glob("*.*.*w.jpg")] == ["a"]
+    assert set(load_variant_index(site.config_service.paths.image_variants_dir)) == {"images/a.jpg"}
+
+
+def test_template_lookup_resolves_variants(site):
+    """Template helpers find variants by asset-relative or /assets/ URLs."""
+    asset = _make_asset(site, "hero.jpg", (800, 400))
+    config = ResponsiveImagesConfig(enabled=True, widths=(400,), formats=())
+    ImageVariantPipeline(site, config).run([asset])
+
+    for path in ("images/hero.jpg", "/assets/images/hero.jpg"):
+        image = responsive_image(path, site)
+        assert image is not None
+        assert image.url_for_width(300).endswith(".400w.jpg")
+        assert image.url_for_width(600) == image.src
+    assert responsive_image("images/missing.jpg", site) is None
@@ -0,0 +1,206 @@
+"""Scoped rebuilds for created and deleted content pages."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from bengal.build.contracts.keys import content_key
+from bengal.build.provenance.filter import ProvenanceFilterResult
+from bengal.build.provenance.lookups import (
+    FALLBACK_STRUCTURAL_MENU,
+    FALLBACK_STRUCTURAL_MULTI_TREE,
+    FALLBACK_STRUCTURAL_NON_CONTENT,
+    FALLBACK_STRUCTURAL_ROOT_PAGE,
+    FALLBACK_STRUCTURAL_SECTION,
+    FALLBACK_STRUCTURAL_TERM_REMOVED,
+)
+from bengal.build.provenance.structural import (
+    apply_structural_cascade,
+    structural_fallback_reason,
+)
+from bengal.cache.build_cache.taxonomy_index_mixin import BuildTaxonomyIndex
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _Section:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.parent = None
+        self.pages: list[Any] = []
+
+    def walk(self) -> list[_Section]:
+        return [self]
+
+
+class _Provenance:
+    def __init__(self, stored: set[str]) -> None:
+        self.stored = stored
+
+    def get_stored_hash(self, key: str) -> str | None:
+        return "hash" if key in self.stored else None
+
+
+def _page(path: Path, section: _Section | None, **metadata: Any) -> SimpleNamespace:
+    page = SimpleNamespace(
+        source_path=path,
+        metadata=metadata,
+        tags=metadata.get("tags"),
+        virtual=False,
+        _section=section,
+    )
+    if section is not None:
+        section.pages.append(page)
+    return page
+
+
+def _site(tmp_path: Path) -> tuple[SimpleNamespace, list[SimpleNamespace]]:
+    content = tmp_path / "content"
+    blog, docs, zoo = (_Section(content / name) for name in ("blog", "docs", "zoo"))
+    pages = [
+        _page(content / "about.md", None),
+        _page(content / "blog" / "a.md", blog),
+        _page(content / "blog" / "b.md", blog),
+        _page(content / "docs" / "x.md", docs),
+        _page(content / "zoo" / "y.md", zoo),
+    ]
+    site = SimpleNamespace(
+        root_path=tmp_path,
+        sections=[blog, docs, zoo],
+        config={},
+        versioning_enabled=False,
+    )
+    return site, pages
+
+
+def _result(to_build: list[Any], pages: list[Any]) -> ProvenanceFilterResult:
+    return ProvenanceFilterResult(
+        pages_to_build=to_build,
+        assets_to_process=[],
+        pages_skipped=[page for page in pages if page not in to_build],
+        total_pages=len(pages),
+    )
+
+
+def _cascade(
+    tmp_path: Path,
+    site: SimpleNamespace,
+    pages: list[Any],
+    result: ProvenanceFilterResult,
+    *,
+    deleted: dict[str, set[str]] | None = None,
+    taxonomy: BuildTaxonomyIndex | None = None,
+    stored: list[Any] | None = None,
+) -> tuple[ProvenanceFilterResult, str | None]:
+    built = stored if stored is not None else [p for p in pages if p not in result.pages_to_build]
+    provenance = _Provenance({content_key(p.source_path, tmp_path) for p in built})
+    cache = SimpleNamespace(taxonomy_index=taxonomy or BuildTaxonomyIndex())
+    return apply_structural_cascade(result, site, pages, provenance, cache, deleted or {}, {})  # type: ignore[arg-type]
+
+
+def test_fallback_reason_from_paths(tmp_path: Path) -> None:
+    content = tmp_path / "content"
+
+    assert structural_fallback_reason([content / "blog" / "a.md"], content) is None
+    assert (
+        structural_fallback_reason([content / "about.md"], content) == FALLBACK_STRUCTURAL_ROOT_PAGE
+    )
+    assert (
+        structural_fallback_reason([content / "blog" / "_index.md"], content)
+        == FALLBACK_STRUCTURAL_SECTION
+    )
+    assert (
+        structural_fallback_reason([content / "blog"], content) == FALLBACK_STRUCTURAL_NON_CONTENT
+    )
+    assert (
+        structural_fallback_reason([tmp_path / "templates" / "x.md"], content)
+        == FALLBACK_STRUCTURAL_NON_CONTENT
+    )
+    assert (
+        structural_fallback_reason([content / "blog" / "a.md"], content, multi_tree=True)
+        == FALLBACK_STRUCTURAL_MULTI_TREE
+    )
+
+
+def test_created_page_rebuilds_its_section_root_pages_and_neighbours(tmp_path: Path) -> None:
+    site, pages = _site(tmp_path)
+    blog = site.sections[0]
+    created = _page(tmp_path / "content" / "blog" / "c.md", blog)
+    pages.insert(3, created)
+
+    result, reason = _cascade(tmp_path, site, pages, _result([created], pages))
+
+    assert reason is None
+    built = {page.source_path.relative_to(tmp_path).as_posix() for page in result.pages_to_build}
+    # docs/x.md follows the blog span in site.pages; zoo is out of scope
+    assert built == {
+        "content/about.md",
+        "content/blog/a.md",
+        "content/blog/b.md",
+        "content/blog/c.md",
+        "content/docs/x.md",
+    }
+    assert str(blog.path) in result.affected_sections
+    assert result.cache_hits == len(result.pages_skipped) == 1
+
+
+def test_untouched_build_is_unchanged(tmp_path: Path) -> None:
+    site, pages = _site(tmp_path)
+    original = _result([pages[1]], pages)
+
+    result, reason = _cascade(tmp_path, site, pages, original, stored=pages)
+
+    assert reason is None
+    assert result is original
+
+
+def test_created_page_fallbacks(tmp_path: Path) -> None:
+    site, pages = _site(tmp_path)
+    blog = site.sections[0]
+
+    with_menu = _page(tmp_path / "content" / "blog" / "m.md", blog, menu={"main": {}})
+    assert (
+        _cascade(tmp_path, site, [*pages, with_menu], _result([with_menu], pages))[1]
+        == FALLBACK_STRUCTURAL_MENU
+    )
+
+    fresh = _Section(tmp_path / "content" / "news")
+    site.sections.append(fresh)
+    first = _page(tmp_path / "content" / "news" / "n.md", fresh)
+    assert (
+        _cascade(tmp_path, site, [*pages, first], _result([first], pages))[1]
+        == FALLBACK_STRUCTURAL_SECTION
+    )
+
+
+def test_deleted_page_keeps_term_or_falls_back(tmp_path: Path) -> None:
+    site, pages = _site(tmp_path)
+    taxonomy = BuildTaxonomyIndex()
+    taxonomy.update_page_tags("content/blog/a.md", {"python"})
+    taxonomy.update_page_tags("content/blog/gone.md", {"python", "rare"})
+    # Deleted-file cleanup has already dropped the page from the index
+    taxonomy.update_page_tags("content/blog/gone.md", set())
+
+    result, reason = _cascade(
+        tmp_path,
+        site,
+        pages,
+        _result([], pages),
+        deleted={"content/blog/gone.md": {"python"}},
+        taxonomy=taxonomy,
+    )
+    assert reason is None
+    assert "python" in result.affected_tags
+    assert pages[1] in result.pages_to_build
+
+    _, reason = _cascade(
+        tmp_path,
+        site,
+        pages,
+        _result([], pages),
+        deleted={"content/blog/gone.md": {"python", "rare"}},
+        taxonomy=taxonomy,
+    )
+    assert reason == FALLBACK_STRUCTURAL_TERM_REMOVED
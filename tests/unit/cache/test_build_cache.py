@@ -354,7 +354,7 @@ class TestBuildCache:
             "validation_results",
             "synthetic_pages",
         }
-        assert (cache_file.parent / "stores" / "parsed_content.json").exists()
+        assert (cache_file.parent / "stores" / "parsed_content" / "index.json").exists()
 
         loaded_cache = BuildCache.load(cache_file)
 
@@ -0,0 +1,103 @@
+"""Tests for the persistent tier of the directive render cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from bengal.cache.directive_cache import DirectiveCache
+from bengal.cache.shared_artifacts import SharedArtifactCache
+from bengal.parsing.backends.patitas.renderers.directives import directive_cache_policy
+from bengal.utils.xref import xref_fingerprint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _store(root: Path) -> SharedArtifactCache:
+    return SharedArtifactCache(root, max_bytes=1 << 20)
+
+
+def test_rendered_html_survives_a_new_process(tmp_path: Path) -> None:
+    DirectiveCache(persistent=_store(tmp_path), context="ctx").put(
+        "directive_html", "tabs:key", "<div>tabs</div>"
+    )
+
+    cold = DirectiveCache(persistent=_store(tmp_path), context="ctx")
+
+    assert cold.get("directive_html", "tabs:key") == "<div>tabs</div>"
+    assert cold.stats()["persistent"] is True
+    # Promoted to memory: no second disk read
+    cold.persistent = None
+    assert cold.get("directive_html", "tabs:key") == "<div>tabs</div>"
+
+
+def test_context_change_misses(tmp_path: Path) -> None:
+    DirectiveCache(persistent=_store(tmp_path), context="v1").put(
+        "directive_html", "note:key", "<p>old</p>"
+    )
+
+    assert (
+        DirectiveCache(persistent=_store(tmp_path), context="v2").get("directive_html", "note:key")
+        is None
+    )
+
+
+def test_disabled_cache_skips_disk(tmp_path: Path) -> None:
+    cache = DirectiveCache(persistent=_store(tmp_path))
+    cache.disable()
+    cache.put("directive_html", "k", "<p/>")
+
+    assert not any(tmp_path.rglob("*"))
+
+
+def test_xref_fingerprint_tracks_pulled_fields() -> None:
+    page = SimpleNamespace(href="/docs/a/", title="A", metadata={"description": "first"})
+    index: dict[str, Any] = {"by_path": {"docs/a": page}, "by_id": {}, "by_slug": {}}
+    before = xref_fingerprint(index)
+
+    renamed = {**index, "by_path": {"docs/a": SimpleNamespace(**{**vars(page), "title": "B"})}}
+
+    assert xref_fingerprint(index) == before
+    assert xref_fingerprint(renamed) != before
+    assert xref_fingerprint(None) == ""
+
+
+class _Plain:
+    def render(self, node: Any, rendered_children: str, sb: Any) -> None: ...
+
+
+class _UsesSite:
+    def render(self, node: Any, rendered_children: str, sb: Any, *, site: Any = None) -> None: ...
+
+
+class _DeclaresXref:
+    cache_dependencies: ClassVar[frozenset[str]] = frozenset({"xref_index"})
+
+    def render(
+        self,
+        node: Any,
+        rendered_children: str,
+        sb: Any,
+        *,
+        xref_index: Any = None,
+        current_page_dir: str | None = None,
+    ) -> None: ...
+
+
+class _PageAware:
+    cache_dependencies: ClassVar[frozenset[str]] = frozenset({"xref_index"})
+
+    def render(self, node: Any, rendered_children: str, sb: Any, *, page_context: Any) -> None: ...
+
+
+def test_cache_policy_follows_declared_dependencies() -> None:
+    assert directive_cache_policy(_Plain).cacheable
+    assert directive_cache_policy(_Plain).dependencies == frozenset()
+    assert not directive_cache_policy(_UsesSite).cacheable
+    assert not directive_cache_policy(_PageAware).cacheable
+
+    declared = directive_cache_policy(_DeclaresXref)
+    assert declared.cacheable
+    assert declared.dependencies == {"xref_index", "current_page_dir"}
+    assert "_DeclaresXref" in declared.version
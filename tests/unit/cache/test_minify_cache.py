@@ -0,0 +1,113 @@
+"""Tests for the persistent CSS/JS minification cache."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from bengal.cache import minify_cache
+from bengal.cache.minify_cache import MinifyCache, cached_minify, get_minify_cache
+from bengal.css import minify_css
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+CSS = "a  {  color :  red ;  }\n/* comment */\n.b { margin: 0px }"
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("BENGAL_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("BENGAL_NO_MINIFY_CACHE", raising=False)
+    return tmp_path
+
+
+def _counting(calls: list[str]):
+    def compute(text: str) -> str:
+        calls.append(text)
+        return minify_css(text)
+
+    return compute
+
+
+def test_second_call_is_served_from_disk(cache_dir: Path) -> None:
+    calls: list[str] = []
+
+    first = cached_minify("css", CSS, _counting(calls), options="level=safe")
+    second = cached_minify("css", CSS, _counting(calls), options="level=safe")
+
+    assert first == second == minify_css(CSS)
+    assert calls == [CSS]
+    assert len(list((cache_dir / "minify").rglob("*.css"))) == 1
+
+
+def test_cache_is_shared_between_instances(cache_dir: Path) -> None:
+    root = cache_dir / "minify"
+    MinifyCache(root).get_or_compute("css", CSS, minify_css)
+    calls: list[str] = []
+
+    other = MinifyCache(root)
+    other.get_or_compute("css", CSS, _counting(calls))
+
+    assert calls == []
+    assert (other.hits, other.misses) == (1, 0)
+
+
+def test_key_covers_kind_options_and_engine_version(
+    cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cache = MinifyCache(cache_dir)
+    base = cache.key("css", CSS, "level=safe")
+
+    assert cache.key("js", CSS, "level=safe") != base
+    assert cache.key("css", CSS, "level=optimize") != base
+    assert cache.key("css", CSS + " ", "level=safe") != base
+
+    monkeypatch.setattr(minify_cache, "_css_engine_version", lambda: "next")
+    assert cache.key("css", CSS, "level=safe") != base
+
+
+def test_unreadable_entry_falls_back_to_minifying(cache_dir: Path) -> None:
+    cache = MinifyCache(cache_dir / "minify")
+    path = cache._entry_path(cache.key("css", CSS), "css")
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"\xff\xfe not utf-8")
+
+    assert cache.get_or_compute("css", CSS, minify_css) == minify_css(CSS)
+    assert path.read_text(encoding="utf-8") == minify_css(CSS)
+
+
+def test_disabled_by_environment(cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BENGAL_NO_MINIFY_CACHE", "1")
+
+    assert get_minify_cache() is None
+    assert cached_minify("css", CSS, minify_css) == minify_css(CSS)
+    assert not (cache_dir / "minify").exists()
+
+
+def test_writes_evict_least_recently_used_entries(cache_dir: Path) -> None:
+    cache = MinifyCache(cache_dir / "minify", max_bytes=1 << 20)
+    sources = [f".c{i} {{ margin: 0px }}" for i in range(4)]
+    paths = []
+    for age, source in enumerate(sources):
+        cache.get_or_compute("css", source, lambda _text: "x" * 100)
+        path = cache._entry_path(cache.key("css", source), "css")
+        os.utime(path, (1000 + age, 1000 + age))
+        paths.append(path)
+    cache.max_bytes = 450
+
+    # The fifth write exceeds the limit: evict oldest down to 80% (360 bytes)
+    cache.get_or_compute("css", CSS, lambda _text: "x" * 100)
+
+    assert [path.exists() for path in paths] == [False, False, True, True]
+
+
+def test_size_limit_from_environment(cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BENGAL_MINIFY_CACHE_MAX_MB", "2")
+
+    cache = get_minify_cache()
+
+    assert cache is not None
+    assert cache.max_bytes == 2 * 1024 * 1024
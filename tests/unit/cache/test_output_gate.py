@@ -0,0 +1,124 @@
+"""Tests for skip-unchanged output writes."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from bengal.cache.output_gate import (
+    OutputWriteGate,
+    content_hash,
+    file_stamp,
+    get_output_gate,
+    record_write,
+    skip_unchanged_enabled,
+    write_streamed,
+)
+from bengal.cache.paths import BengalPaths
+from bengal.core.output import BuildOutputCollector
+from bengal.orchestration.build_state import BuildState
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _gate(root: Path) -> OutputWriteGate:
+    return OutputWriteGate.load(BengalPaths(root).content_hash_registry)
+
+
+def test_identical_write_keeps_file_and_mtime(tmp_path: Path) -> None:
+    out = tmp_path / "public" / "feed.xml"
+    gate = _gate(tmp_path)
+    assert gate.write_text(out, "<feed/>") is True
+    gate.save()
+    before = out.stat().st_mtime_ns
+
+    second = _gate(tmp_path)
+
+    assert second.write_text(out, "<feed/>") is False
+    assert second.unchanged == 1
+    assert second.bytes_saved == len(b"<feed/>")
+    assert out.stat().st_mtime_ns == before
+    assert second.write_text(out, "<feed>x</feed>") is True
+    assert out.read_text(encoding="utf-8") == "<feed>x</feed>"
+
+
+def test_registry_keeps_bare_hash_and_separate_stamp(tmp_path: Path) -> None:
+    out = tmp_path / "public" / "sitemap.xml"
+    gate = _gate(tmp_path)
+    gate.write_text(out, "<urlset/>")
+    gate.save()
+
+    registry = _gate(tmp_path).registry
+
+    assert registry.get_output_hash(out) == content_hash(b"<urlset/>")
+    assert registry.get_output_stamp(out) == file_stamp(out.stat())
+    registry.update_output(out, "other", "XML")
+    assert registry.get_output_stamp(out) is None
+
+
+def test_external_edit_invalidates_stamp(tmp_path: Path) -> None:
+    out = tmp_path / "public" / "index.json"
+    gate = _gate(tmp_path)
+    gate.write_text(out, "{}")
+    out.write_text("[]", encoding="utf-8")
+
+    assert gate.current_hash(out) is None
+    assert gate.write_text(out, "{}") is True
+    assert out.read_text(encoding="utf-8") == "{}"
+
+
+def test_existing_identical_file_is_adopted(tmp_path: Path) -> None:
+    out = tmp_path / "public" / "page.txt"
+    out.parent.mkdir()
+    out.write_text("same", encoding="utf-8")
+    before = out.stat().st_mtime_ns
+    gate = _gate(tmp_path)
+
+    assert gate.write_text(out, "same") is False
+    assert out.stat().st_mtime_ns == before
+    assert gate.current_hash(out) is not None
+
+
+def test_streamed_write_uses_gate_stamp(tmp_path: Path) -> None:
+    out = tmp_path / "public" / "llm-full.txt"
+    gate = _gate(tmp_path)
+    written, digest = write_streamed(out, iter([b"big ", b"text"]), gate)
+    before = out.stat().st_mtime_ns
+
+    assert written is True
+    assert gate.current_hash(out) == digest
+    assert write_streamed(out, iter([b"big text"]), gate) == (False, digest)
+    assert out.stat().st_mtime_ns == before
+    assert (gate.written, gate.unchanged, gate.bytes_saved) == (1, 1, 8)
+
+
+def test_record_write_reports_unchanged(tmp_path: Path) -> None:
+    collector = BuildOutputCollector(output_dir=tmp_path)
+
+    record_write(collector, tmp_path / "a.xml", True)
+    record_write(collector, tmp_path / "b.xml", False)
+
+    assert [str(o.path) for o in collector.get_outputs()] == ["a.xml"]
+    assert [str(o.path) for o in collector.get_unchanged()] == ["b.xml"]
+    collector.clear()
+    assert collector.get_unchanged() == []
+
+
+def test_get_output_gate_is_per_build(tmp_path: Path) -> None:
+    paths = BengalPaths(tmp_path)
+    site = SimpleNamespace(
+        build_state=BuildState(),
+        config={"build": {"skip_unchanged_outputs": True}},
+        config_service=SimpleNamespace(paths=paths),
+    )
+
+    gate = get_output_gate(site)
+
+    assert gate is not None
+    assert get_output_gate(site) is gate
+    assert get_output_gate(SimpleNamespace(build_state=None)) is None
+    site.build_state = BuildState()
+    site.config = {"build": {"skip_unchanged_outputs": False}}
+    assert get_output_gate(site) is None
+    assert skip_unchanged_enabled({}) is False
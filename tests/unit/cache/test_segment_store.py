@@ -0,0 +1,257 @@
+"""Tests for log-structured hot cache store persistence."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from bengal.cache import segment_store
+from bengal.cache.build_cache import BuildCache
+from bengal.cache.segment_store import SegmentStore, TrackedStore
+
+
+def test_segment_store_round_trips_records(tmp_path):
+    """A full save writes one segment and loads back every record."""
+    store = SegmentStore(tmp_path / "parsed_content")
+    records = {"content/a.md": {"html": "<p>a</p>"}, "content/b.md": {"html": "<p>b</p>"}}
+
+    generation = store.save(records)
+
+    loaded, loaded_generation = store.load()
+    assert loaded == records
+    assert loaded_generation == generation
+    assert len(list(store.root.glob("seg-*.log"))) == 1
+
+
+def test_segment_store_appends_only_dirty_entries(tmp_path):
+    """Dirty saves append to the active segment instead of rewriting it."""
+    store = SegmentStore(tmp_path / "parsed_content")
+    records = {"content/a.md": {"html": "a"}, "content/b.md": {"html": "b"}}
+    generation = store.save(records)
+    segment = next(store.root.glob("seg-*.log"))
+    size_before = segment.stat().st_size
+    head_before = segment.read_bytes()
+
+    records["content/a.md"] = {"html": "a2"}
+    store.save(records, dirty_keys={"content/a.md"}, deleted_keys=set(), generation=generation)
+
+    assert segment.read_bytes().startswith(head_before)
+    assert segment.stat().st_size > size_before
+    assert store.load()[0] == records
+    assert store.dead_bytes() > 0
+
+
+def test_segment_store_deletes_keys_without_touching_segments(tmp_path):
+    """Deleted keys are dropped from the index only."""
+    store = SegmentStore(tmp_path / "parsed_content")
+    generation = store.save({"content/a.md": {"html": "a"}, "content/b.md": {"html": "b"}})
+    segment = next(store.root.glob("seg-*.log"))
+    size_before = segment.stat().st_size
+
+    store.save(
+        {"content/b.md": {"html": "b"}},
+        dirty_keys=set(),
+        deleted_keys={"content/a.md"},
+        generation=generation,
+    )
+
+    assert segment.stat().st_size == size_before
+    assert store.load()[0] == {"content/b.md": {"html": "b"}}
+
+
+def test_segment_store_generation_mismatch_forces_full_rewrite(tmp_path):
+    """Stores not loaded from the current generation cannot resurrect old keys."""
+    store = SegmentStore(tmp_path / "parsed_content")
+    store.save({"content/stale.md": {"html": "old"}})
+
+    store.save({"content/new.md": {"html": "new"}}, dirty_keys=set(), generation=None)
+
+    assert store.load()[0] == {"content/new.md": {"html": "new"}}
+
+
+def test_segment_store_load_selected_keys(tmp_path):
+    """Selective loads only return requested keys."""
+    store = SegmentStore(tmp_path / "parsed_content")
+    store.save({"content/a.md": {"html": "a"}, "content/b.md": {"html": "b"}})
+
+    loaded, _ = store.load(keys={"content/b.md", "content/missing.md"})
+
+    assert loaded == {"content/b.md": {"html": "b"}}
+
+
+def test_segment_store_compaction_reclaims_dead_bytes(tmp_path, monkeypatch):
+    """Compaction keeps live records and the generation, dropping dead bytes."""
+    monkeypatch.setattr(segment_store, "COMPACT_MIN_DEAD_BYTES", 1)
+    store = SegmentStore(tmp_path / "parsed_content")
+    records = {"content/a.md": {"html": "a" * 100}}
+    generation = store.save(records)
+    for i in range(3):
+        records["content/a.md"] = {"html": str(i) * 100}
+        store.save(records, dirty_keys={"content/a.md"}, generation=generation)
+    assert store.needs_compaction()
+
+    store.compact()
+
+    assert store.dead_bytes() == 0
+    assert store.load() == (records, generation)
+    assert len(list(store.root.glob("seg-*.log"))) == 1
+
+
+def test_segment_store_rewrite_closes_lazy_reader_and_keeps_busy_segments(tmp_path, monkeypatch):
+    """A rewrite unmaps the old segments; ones that cannot be deleted wait for compaction."""
+    monkeypatch.setattr(segment_store, "COMPACT_MIN_DEAD_BYTES", 1)
+    store = SegmentStore(tmp_path / "parsed_content")
+    store.save({"content/a.md": {"html": "a" * 100}})
+    lazy = store.open()
+    old_segments = set(store.root.glob("seg-*.log"))
+    real_unlink = Path.unlink
+
+    def unlink(path, missing_ok=False):
+        if path in old_segments:
+            raise PermissionError("segment is mapped")
+        return real_unlink(path, missing_ok=missing_ok)
+
+    monkeypatch.setattr(Path, "unlink", unlink)
+    generation = store.save(lazy, dirty_keys=set(), generation=None)
+
+    assert not lazy._reader._maps
+    assert old_segments <= set(store.root.glob("seg-*.log"))
+    assert store.needs_compaction()
+
+    monkeypatch.setattr(Path, "unlink", real_unlink)
+    store.compact()
+
+    assert not old_segments & set(store.root.glob("seg-*.log"))
+    assert store.load() == ({"content/a.md": {"html": "a" * 100}}, generation)
+
+
+def test_tracked_store_records_changes():
+    """Top-level writes and deletes are tracked until marked clean."""
+    store = TrackedStore({"a": 1, "b": 2}, generation="g1")
+    store["c"] = 3
+    del store["a"]
+    store.pop("b")
+    store.update({"d": 4})
+
+    assert store.pending_changes() == ({"c", "d"}, {"a", "b"})
+
+    store.mark_clean("g2")
+
+    assert store.pending_changes() == (set(), set())
+    assert store.generation == "g2"
+
+
+def test_build_cache_incremental_save_appends_dirty_entry(tmp_path):
+    """A second save of a loaded cache only appends the changed entry."""
+    cache_file = tmp_path / ".bengal" / "cache.json"
+    cache = BuildCache()
+    for i in range(20):
+        cache.parsed_content[f"content/p{i}.md"] = {"html": f"<p>{i}</p>"}
+    cache.save(cache_file, use_lock=False)
+
+    loaded = BuildCache.load(cache_file)
+    loaded.parsed_content["content/p3.md"] = {"html": "<p>changed</p>"}
+    loaded.parsed_content.pop("content/p4.md")
+    loaded.save(cache_file, use_lock=False)
+
+    store = SegmentStore(cache_file.parent / "stores" / "parsed_content")
+    index = store._load_index()
+    assert index is not None
+    assert index["keys"]["content/p3.md"][1] > index["keys"]["content/p19.md"][1]
+
+    reloaded = BuildCache.load(cache_file)
+    assert reloaded.parsed_content["content/p3.md"] == {"html": "<p>changed</p>"}
+    assert "content/p4.md" not in reloaded.parsed_content
+    assert len(reloaded.parsed_content) == 19
+
+
+def test_build_cache_clear_rewrites_hot_stores(tmp_path):
+    """Clearing a loaded cache drops persisted hot-store entries on save."""
+    cache_file = tmp_path / ".bengal" / "cache.json"
+    cache = BuildCache()
+    cache.rendered_output["content/a.md"] = {"html": "a"}
+    cache.save(cache_file, use_lock=False)
+
+    loaded = BuildCache.load(cache_file)
+    loaded.clear()
+    loaded.save(cache_file, use_lock=False)
+
+    assert BuildCache.load(cache_file).rendered_output == {}
+
+
+def test_build_cache_loads_legacy_json_stores(tmp_path):
+    """Single-file JSON stores from older caches still load and are migrated."""
+    from bengal.cache.compression import load_compressed, save_compressed
+
+    cache_file = tmp_path / ".bengal" / "cache.json"
+    BuildCache().save(cache_file, use_lock=False)
+    payload = load_compressed(cache_file.with_suffix(".json.zst"))
+    legacy = cache_file.parent / "stores" / "parsed_content.json"
+    legacy.write_text('{"content/a.md": {"html": "legacy"}}', encoding="utf-8")
+    payload["external_stores"]["parsed_content"] = "stores/parsed_content.json"
+    save_compressed(payload, cache_file.with_suffix(".json.zst"))
+
+    loaded = BuildCache.load(cache_file)
+    assert loaded.parsed_content["content/a.md"] == {"html": "legacy"}
+
+    loaded.save(cache_file, use_lock=False)
+
+    assert not legacy.exists()
+    assert BuildCache.load(cache_file).parsed_content["content/a.md"] == {"html": "legacy"}
+
+
+def test_segment_store_open_decodes_values_on_access(tmp_path):
+    """Opened stores expose every key but decode values only when read."""
+    store = SegmentStore(tmp_path / "parsed_content")
+    records = {f"content/p{i}.md": {"html": f"<p>{i}</p>"} for i in range(10)}
+    generation = store.save(records)
+
+    lazy = store.open()
+
+    assert lazy is not None
+    assert lazy.generation == generation
+    assert len(lazy) == 10
+    assert "content/p3.md" in lazy
+    assert lazy.unloaded_count() == 10
+    assert lazy["content/p3.md"] == {"html": "<p>3</p>"}
+    assert lazy.get("content/missing.md", "default") == "default"
+    assert lazy.unloaded_count() == 9
+    assert lazy.pending_changes() == (set(), set())
+    assert dict(lazy.items()) == records
+    assert lazy == records
+
+
+def test_segment_store_reads_version_1_json_records(tmp_path):
+    """Plain-JSON stores from the previous format load and are rewritten on save."""
+    root = tmp_path / "parsed_content"
+    root.mkdir()
+    record = b'{"html":"legacy"}'
+    (root / "seg-000001.log").write_bytes(record + b"\n")
+    (root / "index.json").write_text(
+        '{"version": 1, "generation": "g1", "active": 1, "next_id": 2, '
+        f'"segments": {{"1": {len(record)}}}, '
+        f'"keys": {{"content/a.md": [1, 0, {len(record)}]}}}}',
+        encoding="utf-8",
+    )
+    store = SegmentStore(root)
+
+    assert store.load() == ({"content/a.md": {"html": "legacy"}}, "g1")
+
+    store.save({"content/a.md": {"html": "legacy"}}, dirty_keys=set(), generation="g1")
+
+    assert store._load_index()["version"] == segment_store.SEGMENT_STORE_VERSION
+    assert store.load()[0] == {"content/a.md": {"html": "legacy"}}
+
+
+def test_build_cache_load_is_lazy(tmp_path):
+    """Loading a cache leaves hot-store values on disk until they are looked up."""
+    cache_file = tmp_path / ".bengal" / "cache.json"
+    cache = BuildCache()
+    for i in range(20):
+        cache.rendered_output[f"content/p{i}.md"] = {"html": f"<p>{i}</p>"}
+    cache.save(cache_file, use_lock=False)
+
+    loaded = BuildCache.load(cache_file)
+
+    assert loaded.rendered_output.unloaded_count() == 20
+    assert loaded.rendered_output.get("content/p7.md") == {"html": "<p>7</p>"}
+    assert loaded.rendered_output.unloaded_count() == 19
@@ -0,0 +1,87 @@
+"""Tests for the machine-level shared artifact cache."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from bengal.cache.shared_artifacts import (
+    SharedArtifactCache,
+    artifact_key,
+    shared_cache_settings,
+)
+from bengal.parsing.backends.patitas import include_cache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_artifact_key_separates_parts() -> None:
+    assert artifact_key("ab", "c") != artifact_key("a", "bc")
+    assert artifact_key("x", b"y") == artifact_key("x", "y")
+
+
+def test_put_get_and_objects(tmp_path: Path) -> None:
+    cache = SharedArtifactCache(tmp_path, max_bytes=1 << 20)
+    key = artifact_key("snippet")
+
+    assert cache.get("ns", key) is None
+    cache.put("ns", key, b"data")
+    cache.put_object("obj", key, ("a", 1))
+
+    assert cache.get("ns", key) == b"data"
+    assert cache.get_object("obj", key) == ("a", 1)
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    (tmp_path / "obj" / key[:2] / key).write_bytes(b"not a pickle")
+    assert cache.get_object("obj", key) is None
+
+
+def test_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = SharedArtifactCache(tmp_path, max_bytes=1 << 20)
+    keys = [artifact_key(str(i)) for i in range(4)]
+    for age, key in enumerate(keys):
+        cache.put("ns", key, b"x" * 100)
+        path = tmp_path / "ns" / key[:2] / key
+        os.utime(path, (1000 + age, 1000 + age))
+    cache.max_bytes = 250
+
+    # 400 bytes over a 250 limit: evict oldest down to 80% (200 bytes)
+    assert cache.prune() == 2
+    assert cache.get("ns", keys[1]) is None
+    assert cache.get("ns", keys[2]) is not None
+
+
+def test_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("BENGAL_SHARED_CACHE", raising=False)
+    assert shared_cache_settings({}) == (False, 1024 * 1024 * 1024)
+    assert shared_cache_settings({"build": {"shared_cache": True, "shared_cache_max_mb": 2}}) == (
+        True,
+        2 * 1024 * 1024,
+    )
+    monkeypatch.setenv("BENGAL_SHARED_CACHE", "1")
+    assert shared_cache_settings({})[0] is True
+
+
+class _Engine:
+    def __init__(self) -> None:
+        self.parses = 0
+
+    def parse_cache_identity(self) -> str:
+        return "test-parser"
+
+    def parse_to_ast(self, content: str) -> list[str]:
+        self.parses += 1
+        return content.split()
+
+
+def test_include_ast_is_shared(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = SharedArtifactCache(tmp_path, max_bytes=1 << 20)
+    monkeypatch.setattr("bengal.cache.shared_artifacts._current", cache)
+    first, second = _Engine(), _Engine()
+
+    assert include_cache.parse_include_ast(first, "a b") == ("a", "b")
+    assert include_cache.parse_include_ast(second, "a b") == ("a", "b")
+    assert (first.parses, second.parses) == (1, 0)
@@ -341,6 +341,32 @@ class TestCopyToOutput:
         output_content = output_path.read_text()
         assert output_content == asset._minified_content
 
+    def test_gated_copy_leaves_unchanged_output_alone(self, temp_asset_dir):
+        """Test that a gated copy of identical bytes keeps the existing file."""
+        from bengal.cache.output_gate import OutputWriteGate
+
+        js_file = temp_asset_dir / "app.js"
+        js_file.write_text("run();")
+        output_dir = temp_asset_dir / "output"
+        gate = OutputWriteGate.load(temp_asset_dir / "content_hashes.json")
+
+        first = Asset(source_path=js_file)
+        output_path = first.copy_to_output(output_dir, use_fingerprint=False, gate=gate)
+        assert first._output_written
+        mtime = output_path.stat().st_mtime_ns
+
+        again = Asset(source_path=js_file)
+        again.copy_to_output(output_dir, use_fingerprint=False, gate=gate)
+        assert not again._output_written
+        assert output_path.stat().st_mtime_ns == mtime
+        assert gate.unchanged == 1
+
+        minified = Asset(source_path=js_file)
+        minified._minified_content = "run()"
+        minified.copy_to_output(output_dir, use_fingerprint=False, gate=gate)
+        assert minified._output_written
+        assert output_path.read_text() == "run()"
+
     def test_preserves_directory_structure(self, temp_asset_dir):
         """Test that directory structure is preserved."""
         css_dir = temp_asset_dir / "css" / "components"
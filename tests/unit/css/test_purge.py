@@ -0,0 +1,131 @@
+"""Tests for the opt-in HTML-aware unused-selector purge."""
+
+import pytest
+
+from bengal.css import SelectorInventory, minify_css
+from bengal.css.cascade import selector_sig
+from bengal.css.parser import parse_stylesheet
+from bengal.css.purge import (
+    has_unmatched_selectors,
+    purge_guard_ok,
+    purge_unused_tree,
+    selector_may_match,
+)
+from bengal.css.tokenizer import tokenize
+
+INVENTORY = SelectorInventory(
+    classes=frozenset({"card", "nav", "active"}),
+    ids=frozenset({"main"}),
+    elements=frozenset({"a", "p", "div", "nav", "svg"}),
+    attributes=frozenset({"href", "data-theme"}),
+    prefixes=("is-",),
+)
+
+
+def _may_match(selector: str) -> bool:
+    return selector_may_match(selector_sig(tuple(tokenize(selector))), INVENTORY)
+
+
+class TestSelectorMayMatch:
+    @pytest.mark.parametrize(
+        "selector",
+        [
+            ".card",
+            "div.card > a:hover",
+            "#main p",
+            "a[href^='/docs']",
+            "[data-theme=dark] .nav",
+            ".is-open",
+            "*",
+            "body",
+            "div > tbody",
+            ":root",
+            "a::before",
+            ".card:not(.missing)",
+            ":is(.missing, .card)",
+            ".\\31 0",
+            "svg|circle",
+            "[xlink|href]",
+            "& .missing",
+            "a[href|='en']",
+        ],
+    )
+    def test_possible_matches_are_kept(self, selector: str) -> None:
+        assert _may_match(selector)
+
+    @pytest.mark.parametrize(
+        "selector",
+        [
+            ".missing",
+            "div .missing:hover",
+            "#sidebar",
+            "table",
+            "a[target]",
+            ".card + .missing",
+            ".nav.missing",
+            "section > p",
+        ],
+    )
+    def test_provably_unmatched(self, selector: str) -> None:
+        assert not _may_match(selector)
+
+    def test_matching_ignores_case(self) -> None:
+        assert _may_match(".CARD")
+        assert _may_match("DIV")
+
+
+class TestPurge:
+    def test_drops_unmatched_rules(self) -> None:
+        source = ".card{color:red}.missing{color:blue}"
+        assert minify_css(source, used_selectors=INVENTORY) == ".card{color:red}"
+
+    def test_trims_selector_lists(self) -> None:
+        source = ".missing,.card{color:red}"
+        assert minify_css(source, used_selectors=INVENTORY) == ".card{color:red}"
+
+    def test_recurses_into_grouping_at_rules(self) -> None:
+        source = "@media (min-width:1px){.missing{color:red}.card{color:blue}}"
+        expected = "@media (min-width:1px){.card{color:blue}}"
+        assert minify_css(source, used_selectors=INVENTORY) == expected
+
+    def test_drops_emptied_at_rules_but_keeps_layers(self) -> None:
+        source = "@layer base{.missing{color:red}}@media print{.missing{color:red}}a{color:red}"
+        assert minify_css(source, used_selectors=INVENTORY) == "@layer base{}a{color:red}"
+
+    def test_leaves_keyframes_and_font_face(self) -> None:
+        source = "@keyframes spin{from{opacity:0}to{opacity:1}}@font-face{font-family:x}"
+        assert minify_css(source, used_selectors=INVENTORY) == source
+
+    def test_purge_then_dead_code(self) -> None:
+        source = "@keyframes spin{to{opacity:1}}.missing{animation:spin 1s}.card{color:red}"
+        result = minify_css(source, used_selectors=INVENTORY, remove_dead_code=True)
+        assert result == ".card{color:red}"
+
+    def test_nested_rules(self) -> None:
+        source = ".card{color:red;.missing{color:blue}&:hover{color:green}}"
+        expected = ".card{color:red;&:hover{color:green}}"
+        assert minify_css(source, used_selectors=INVENTORY) == expected
+
+    def test_disabled_by_default(self) -> None:
+        source = ".missing{color:red}"
+        assert minify_css(source) == source
+
+    def test_has_unmatched_selectors(self) -> None:
+        assert has_unmatched_selectors(parse_stylesheet(tokenize(".x{}")), INVENTORY)
+        assert not has_unmatched_selectors(parse_stylesheet(tokenize(".card{}")), INVENTORY)
+
+
+class TestPurgeGuard:
+    def test_accepts_purged_tree(self) -> None:
+        tree = parse_stylesheet(tokenize(".missing,.card{color:red}@media print{#x{top:0}}"))
+        assert purge_guard_ok(tree, purge_unused_tree(tree, INVENTORY), INVENTORY)
+
+    def test_rejects_dropping_a_possible_match(self) -> None:
+        tree = parse_stylesheet(tokenize(".card{color:red}.missing{color:blue}"))
+        dropped = parse_stylesheet(tokenize(".missing{color:blue}"))
+        assert not purge_guard_ok(tree, dropped, INVENTORY)
+
+    def test_rejects_changed_declarations(self) -> None:
+        tree = parse_stylesheet(tokenize(".card{color:red}"))
+        changed = parse_stylesheet(tokenize(".card{color:blue}"))
+        assert not purge_guard_ok(tree, changed, INVENTORY)
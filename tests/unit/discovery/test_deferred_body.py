@@ -0,0 +1,96 @@
+"""Tests for frontmatter-only discovery with deferred page bodies."""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from bengal.content.discovery.content_discovery import ContentDiscovery
+from bengal.content.discovery.deferred_body import (
+    clear_body_cache,
+    read_frontmatter,
+    release_page_body,
+)
+from bengal.utils.primitives.hashing import hash_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_SOURCE = "---\ntitle: Deferred\ntags: [a]\n---\n# Heading\n\nBody text.\n"
+
+
+def test_read_frontmatter_stops_at_delimiter_and_hashes_body(tmp_path: Path) -> None:
+    path = tmp_path / "page.md"
+    path.write_bytes(_SOURCE.encode())
+
+    head = read_frontmatter(path)
+
+    assert head is not None
+    assert head.text == "---\ntitle: Deferred\ntags: [a]\n---\n"
+    assert head.body_offset == len(head.text)
+    assert head.content_hash == hashlib.sha256(b"# Heading\n\nBody text.\n").hexdigest()
+    assert head.file_hash == hash_file(path)
+
+
+def test_files_without_closed_frontmatter_are_not_deferred(tmp_path: Path) -> None:
+    plain = tmp_path / "plain.md"
+    plain.write_text("# No frontmatter\n")
+    unclosed = tmp_path / "unclosed.md"
+    unclosed.write_text("---\ntitle: x\n")
+
+    assert read_frontmatter(plain) is None
+    assert read_frontmatter(unclosed) is None
+
+
+def test_non_utf8_files_are_not_deferred(tmp_path: Path) -> None:
+    """Head and body must share one encoding, so latin-1 files read eagerly."""
+    path = tmp_path / "latin.md"
+    path.write_bytes("---\ntitle: Caf\u00e9\n---\nBody \u00e9t\u00e9\n".encode("latin-1"))
+    body_only = tmp_path / "body.md"
+    body_only.write_bytes("---\ntitle: x\n---\n\u00e9\n".encode("latin-1"))
+
+    assert read_frontmatter(path) is None
+    assert read_frontmatter(body_only) is None
+
+
+def test_discovery_defers_body_until_access_and_release(tmp_path: Path) -> None:
+    content = tmp_path / "content"
+    content.mkdir()
+    path = content / "page.md"
+    path.write_text(_SOURCE)
+    discovery = ContentDiscovery(content)
+    discovery._parser.defer_bodies = True
+
+    _, pages = discovery.discover()
+    page = pages[0]
+
+    assert page.title == "Deferred"
+    assert page._body is None
+    assert page._raw_content == "# Heading\n\nBody text.\n"
+    assert page._body is None  # loaded into the bounded cache, not the page
+
+    path.write_text(_SOURCE.replace("Body text.", "Edited."))
+    assert "Body text." in page._raw_content  # still cached
+    release_page_body(page)
+    assert "Edited." in page._raw_content
+    clear_body_cache()
+
+
+def test_snapshot_keeps_deferred_body_on_disk(tmp_path: Path) -> None:
+    from bengal.core.site import Site
+    from bengal.snapshots.content import _snapshot_page_initial
+
+    content = tmp_path / "content"
+    content.mkdir()
+    (content / "page.md").write_text(_SOURCE)
+    discovery = ContentDiscovery(content)
+    discovery._parser.defer_bodies = True
+    _, pages = discovery.discover()
+    site = Site(root_path=tmp_path, config={"title": "Test"})
+
+    snapshot = _snapshot_page_initial(pages[0], site)
+
+    assert snapshot.content == ""
+    assert snapshot.body_offset == pages[0]._body_offset
+    assert snapshot.load_content() == "# Heading\n\nBody text.\n"
+    clear_body_cache()
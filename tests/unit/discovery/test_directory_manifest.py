@@ -0,0 +1,83 @@
+"""Tests for the persisted content directory manifest."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+from bengal.content.discovery.content_discovery import ContentDiscovery
+from bengal.content.discovery.directory_manifest import DirectoryManifest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_OLD_NS = 1_000_000_000_000_000_000
+
+
+def _tree(tmp_path: Path) -> Path:
+    content = tmp_path / "content"
+    (content / "docs" / "guides").mkdir(parents=True)
+    (content / "docs" / "intro.md").write_text("# Intro")
+    (content / "docs" / "guides" / "setup.md").write_text("# Setup")
+    (content / "index.md").write_text("# Home")
+    # Older than the racy window, so listings are recorded
+    for directory in (content, content / "docs", content / "docs" / "guides"):
+        os.utime(directory, ns=(_OLD_NS, _OLD_NS))
+    return content
+
+
+def _pass(manifest: DirectoryManifest, *directories: Path) -> dict[Path, list[tuple[str, bool]]]:
+    manifest.begin()
+    listings = {}
+    for directory in directories:
+        scanned = manifest.scan(directory)
+        assert scanned is not None
+        listings[directory] = [(path.name, is_dir) for path, is_dir in scanned[1]]
+    manifest.finish()
+    return listings
+
+
+def test_unchanged_directories_are_not_listed_again(tmp_path: Path) -> None:
+    content = _tree(tmp_path)
+    store = tmp_path / ".bengal" / "directory_manifest.json"
+    docs = content / "docs"
+
+    first = _pass(DirectoryManifest(content, store), content, docs)
+    assert first[docs] == [("guides", True), ("intro.md", False)]
+
+    reloaded = DirectoryManifest(content, store)
+    assert _pass(reloaded, content, docs) == first
+    assert (reloaded.listed, reloaded.reused) == (0, 2)
+
+    (docs / "new.md").write_text("# New")
+    listings = _pass(reloaded, content, docs)
+    assert ("new.md", False) in listings[docs]
+    assert (reloaded.listed, reloaded.reused) == (1, 1)
+
+
+def test_ignored_directory_names_are_always_statted(tmp_path: Path) -> None:
+    # The dev-server watcher ignores names like build/ and dist/; a directory
+    # created under one of them must still be found on the next pass
+    content = _tree(tmp_path)
+    docs = content / "docs"
+    manifest = DirectoryManifest(content)
+    _pass(manifest, content, docs)
+
+    (docs / "build").mkdir()
+    (docs / "build" / "page.md").write_text("# Page")
+
+    listings = _pass(manifest, content, docs, docs / "build")
+
+    assert ("build", True) in listings[docs]
+    assert listings[docs / "build"] == [("page.md", False)]
+
+
+def test_discovery_results_match_with_manifest_reuse(tmp_path: Path) -> None:
+    content = _tree(tmp_path)
+
+    def discovered() -> list[str]:
+        _, pages = ContentDiscovery(content).discover()
+        return sorted(str(page.source_path.relative_to(content)) for page in pages)
+
+    first = discovered()
+    assert discovered() == first == ["docs/guides/setup.md", "docs/intro.md", "index.md"]
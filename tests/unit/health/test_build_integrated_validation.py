@@ -120,6 +120,22 @@ class TestBuildContextContentCache:
         assert not errors, f"Thread errors: {errors}"
         assert ctx.content_cache_size == 500  # 5 threads * 100 items
 
+    def test_cache_evicts_oldest_past_budget_and_rereads_from_disk(self, tmp_path: Path) -> None:
+        """Test evicted content is re-read from disk and unknown paths stay None."""
+        ctx = BuildContext(content_cache_max_bytes=10)
+        first, second = tmp_path / "a.md", tmp_path / "b.md"
+        first.write_text("aaaaaa")
+        second.write_text("bbbbbb")
+
+        ctx.cache_content(first, "aaaaaa")
+        ctx.cache_content(second, "bbbbbb")
+
+        assert ctx.content_cache_size == 1
+        assert ctx.get_all_cached_contents() == {str(second): "bbbbbb"}
+        assert ctx.get_content(first) == "aaaaaa"
+        assert ctx.content_cache_size == 1  # reads do not re-cache
+        assert ctx.get_content(tmp_path / "other.md") is None
+
 
 class TestContentDiscoveryIntegration:
     """Tests for ContentDiscovery integration with BuildContext."""
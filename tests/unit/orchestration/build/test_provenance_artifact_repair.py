@@ -151,3 +151,15 @@ def test_search_index_excluded_when_index_json_not_configured(tmp_path: Path) ->
 
     assert _search_index_repairable(site) is False
     assert output_dir / "search-index.json" not in _missing_postprocess_artifacts(site)
+
+
+def test_native_search_manifest_included_without_lunr(tmp_path: Path) -> None:
+    """The native backend has no optional dependency, so its manifest is always repairable."""
+    output_dir = tmp_path / "public"
+    output_dir.mkdir()
+    site = _search_site(output_dir, search={"enabled": True, "backend": "native"})
+
+    assert _search_index_repairable(site) is True
+    missing = _missing_postprocess_artifacts(site)
+    assert output_dir / "search" / "manifest.json" in missing
+    assert output_dir / "search-index.json" not in missing
@@ -100,3 +100,57 @@ def test_leftover_when_plan_pages_empty(tmp_path: Path) -> None:
     spy.assert_called_once()
     assert spy.call_args.kwargs["build_plan"] is empty_plan
     assert leftover == determine_template(page, build_plan=None)
+
+
+class _ChainEngine:
+    def __init__(self) -> None:
+        self.lookups: list[str] = []
+
+    def _get_referenced_template_names(self, template_name: str) -> tuple[str, ...]:
+        self.lookups.append(template_name)
+        return ("base.html", "partials/header.html", "partials/nav.html")
+
+
+def test_records_transitive_template_chain(tmp_path: Path) -> None:
+    """A partial included by a partial of the base template maps back to the page."""
+    pages = [_page(), _page("content/blog/other.md")]
+    manager = _manager(tmp_path)
+    engine = _ChainEngine()
+
+    with patch("bengal.rendering.engines.create_engine", return_value=engine) as create:
+        manager._record_page_template_deps(pages, None)
+
+    create.assert_called_once()
+    assert engine.lookups == ["single.html"]
+    assert manager.cache.get_pages_for_template("partials/nav.html") == {
+        str(page.source_path) for page in pages
+    }
+
+
+def test_reuses_render_phase_engine(tmp_path: Path) -> None:
+    """The render pipeline's engine is queried; no second engine is created."""
+    manager = _manager(tmp_path)
+    engine = _ChainEngine()
+    context = SimpleNamespace(build_plan=None, render_template_engine=engine)
+
+    with patch("bengal.rendering.engines.create_engine") as create:
+        manager._record_page_template_deps([_page()], context)
+
+    create.assert_not_called()
+    assert engine.lookups == ["single.html"]
+
+
+def test_fallback_engine_keeps_site_directive_renderer(tmp_path: Path) -> None:
+    """A fallback engine must not replace the render phase's directive renderer."""
+    manager = _manager(tmp_path)
+    render_phase = object()
+    manager.site._directive_template_renderer = render_phase
+
+    def create_engine(site: SimpleNamespace) -> _ChainEngine:
+        site._directive_template_renderer = object()
+        return _ChainEngine()
+
+    with patch("bengal.rendering.engines.create_engine", side_effect=create_engine):
+        manager._record_page_template_deps([_page()], None)
+
+    assert manager.site._directive_template_renderer is render_phase
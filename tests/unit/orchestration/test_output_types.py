@@ -40,6 +40,11 @@ class TestClassifyOutput:
         path = Path("public/sitemap.xml")
         assert classify_output(path) == OutputType.AGGREGATE_FEED
 
+    def test_sitemap_index_and_shards_are_aggregate_feed(self) -> None:
+        """sitemap_index.xml and sitemap-<section>-N.xml shards are AGGREGATE_FEED."""
+        assert classify_output(Path("public/sitemap_index.xml")) == OutputType.AGGREGATE_FEED
+        assert classify_output(Path("public/sitemap-docs-2.xml")) == OutputType.AGGREGATE_FEED
+
     def test_rss_is_aggregate_feed(self) -> None:
         """rss.xml is classified as AGGREGATE_FEED."""
         path = Path("public/rss.xml")
@@ -0,0 +1,159 @@
+"""Tests for the deploy manifest, delta and local directory sync."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
+
+from bengal.cache.output_gate import OutputWriteGate
+from bengal.cache.paths import BengalPaths
+from bengal.postprocess.deploy_manifest import (
+    CACHE_DOCUMENT,
+    CACHE_IMMUTABLE,
+    CACHE_STATIC,
+    TARGET_MANIFEST_NAME,
+    DeployDelta,
+    DeployEntry,
+    DeployManifest,
+    build_deploy_manifest,
+    emit_deploy_manifest,
+    mark_deployed,
+    sync_directory,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_manifest_classifies_and_reuses_known_hashes(tmp_path: Path) -> None:
+    public = tmp_path / "public"
+    gate = OutputWriteGate.load(BengalPaths(tmp_path).content_hash_registry)
+    gate.write_text(public / "index.html", "<p>home</p>")
+    _write(public / "assets" / "app.1234abcd.js", "run()")
+    _write(public / "img" / "logo.png", "png")
+    (public / "asset-manifest.json").write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "assets": {
+                    "app.js": {"output_path": "assets/app.1234abcd.js", "fingerprint": "1234abcd"}
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    manifest, hashed = build_deploy_manifest(public, gate.registry)
+
+    files = manifest.files
+    assert files["index.html"].cache == CACHE_DOCUMENT
+    assert files["index.html"].content_type == "text/html"
+    assert files["assets/app.1234abcd.js"].cache == CACHE_IMMUTABLE
+    assert files["img/logo.png"].cache == CACHE_STATIC
+    # index.html came from the registry; the other three were hashed
+    assert hashed == 3
+
+    _, rehashed = build_deploy_manifest(public, gate.registry, previous=manifest)
+    assert rehashed == 0
+
+
+def test_delta_and_upload_plan() -> None:
+    before = DeployManifest(
+        files={
+            "a.html": _entry("h1"),
+            "b.html": _entry("h2"),
+            "gone.html": _entry("h3"),
+        }
+    )
+    after = DeployManifest(
+        files={
+            "a.html": _entry("h1"),
+            "b.html": _entry("h4"),
+            "c.html": _entry("h4"),
+            "moved.html": _entry("h3"),
+        }
+    )
+
+    delta = DeployDelta.between(before, after)
+
+    assert delta.added == ("c.html", "moved.html")
+    assert delta.changed == ("b.html",)
+    assert delta.removed == ("gone.html",)
+    # h4 is uploaded once; h3 is already deployed
+    assert delta.upload == ("b.html",)
+
+
+def test_sync_directory_links_changes_and_removes(tmp_path: Path) -> None:
+    public = tmp_path / "public"
+    target = tmp_path / "www"
+    _write(public / "a.html", "a")
+    _write(public / "docs" / "b.html", "b")
+    first, _ = build_deploy_manifest(public)
+
+    report = sync_directory(public, target, first)
+
+    assert report.linked + report.copied == 2
+    assert (target / "docs" / "b.html").read_text(encoding="utf-8") == "b"
+    assert (target / TARGET_MANIFEST_NAME).exists()
+
+    (public / "docs" / "b.html").unlink()
+    # Outputs are replaced (new inode), never rewritten in place
+    (public / "a.html").unlink()
+    _write(public / "a.html", "A")
+    second, _ = build_deploy_manifest(public, previous=first)
+
+    report = sync_directory(public, target, second)
+
+    assert report.removed == 1
+    assert report.linked + report.copied == 1
+    assert (target / "a.html").read_text(encoding="utf-8") == "A"
+    assert not (target / "docs").exists()
+
+
+def test_delta_is_against_last_deploy_not_last_emit(tmp_path: Path) -> None:
+    public = tmp_path / "public"
+    site = SimpleNamespace(
+        config_service=SimpleNamespace(paths=BengalPaths(tmp_path)), output_dir=public
+    )
+    _write(public / "a.html", "a")
+    deployed = emit_deploy_manifest(site)
+    assert deployed.delta.added == ("a.html",)
+    mark_deployed(site, deployed.manifest)
+
+    _write(public / "b.html", "b")
+    emit_deploy_manifest(site)
+    _write(public / "c.html", "c")
+
+    # Two builds since the deploy: both new files are still in the delta
+    result = emit_deploy_manifest(site)
+    assert result.delta.added == ("b.html", "c.html")
+
+    base = tmp_path / "base.json"
+    result.manifest.write(base)
+    assert emit_deploy_manifest(site, previous_path=base).delta.empty
+
+
+def test_sync_directory_target_manifest_location(tmp_path: Path) -> None:
+    public = tmp_path / "public"
+    target = tmp_path / "www"
+    state = tmp_path / "state" / "www.json"
+    _write(public / "a.html", "a")
+    manifest, _ = build_deploy_manifest(public)
+
+    sync_directory(public, target, manifest, target_manifest=state)
+
+    assert state.exists()
+    assert not (target / TARGET_MANIFEST_NAME).exists()
+    assert sync_directory(public, target, manifest, target_manifest=state).linked == 0
+
+
+def _entry(digest: str) -> DeployEntry:
+    return DeployEntry(
+        hash=digest, size=1, content_type="text/html", cache=CACHE_DOCUMENT, mtime_ns=0
+    )
@@ -0,0 +1,162 @@
+"""Tests for the native sharded search index backend."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from bengal.postprocess.output_formats import native_search_index
+from bengal.postprocess.output_formats.native_search_index import (
+    NativeSearchIndexGenerator,
+    term_shard_name,
+    tokenize,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _page(uri: str, title: str, section: str, content: str = "", **extra: Any) -> dict[str, Any]:
+    return {
+        "objectID": uri,
+        "uri": uri,
+        "url": uri,
+        "title": title,
+        "section": section,
+        "content": content,
+        "excerpt": content[:20],
+        "tags": extra.pop("tags", []),
+        **extra,
+    }
+
+
+def _site_data(*pages: dict[str, Any]) -> dict[str, Any]:
+    return {"pages": list(pages), "sections": [], "tags": []}
+
+
+def _read(search_dir: Path, rel: str) -> Any:
+    return json.loads((search_dir / rel).read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def writes(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Names of files written through atomic_write_text."""
+    written: list[str] = []
+    original = native_search_index.atomic_write_text
+
+    def recording(path: Path, content: str, *args: Any, **kwargs: Any) -> None:
+        written.append(f"{path.parent.name}/{path.name}")
+        original(path, content, *args, **kwargs)
+
+    monkeypatch.setattr(native_search_index, "atomic_write_text", recording)
+    return written
+
+
+def _generate(tmp_path: Path, site_data: dict[str, Any], **kwargs: Any) -> Path:
+    generator = NativeSearchIndexGenerator(
+        SimpleNamespace(), doc_ids_path=tmp_path / ".bengal" / "search_doc_ids.json"
+    )
+    manifest = generator.generate(tmp_path / "public" / "index.json", site_data, **kwargs)
+    generator.save_doc_ids()
+    assert manifest is not None
+    return manifest
+
+
+def test_tokenize_drops_stopwords_and_single_characters() -> None:
+    assert tokenize("The Quick, quick fox is a 2nd x") == ["quick", "quick", "fox", "2nd"]
+
+
+def test_non_ascii_prefixes_are_hex_encoded() -> None:
+    assert term_shard_name("kubernetes", 2) == "ku"
+    assert term_shard_name("élan", 2) == "_" + "él".encode().hex()
+    assert term_shard_name("_private", 2) == "_" + b"_p".hex()
+
+
+def test_index_is_sharded_by_term_prefix_and_section(tmp_path: Path) -> None:
+    manifest_path = _generate(
+        tmp_path,
+        _site_data(
+            _page("/docs/deploy/", "Deploying", "docs", "Kubernetes clusters and kubectl"),
+            _page("/blog/hello/", "Hello", "blog", "Kubernetes release notes", draft=True),
+            _page("/blog/news/", "News", "blog", "Release notes", tags=["kubernetes"]),
+        ),
+    )
+    search_dir = manifest_path.parent
+    manifest = _read(search_dir, "manifest.json")
+
+    assert manifest["documents"] == 2
+    assert [s["name"] for s in manifest["sections"]] == ["blog", "docs"]
+    assert {"ku", "cl", "de", "re"} <= set(manifest["terms"])
+
+    postings = _read(search_dir, "terms/ku.json")
+    docs, sections = _read(search_dir, "docs/docs.json"), _read(search_dir, "docs/blog.json")
+    deploy_id, news_id = docs["pages"][0]["id"], sections["pages"][0]["id"]
+    # [doc, section index, weight]: body text x1, tags x3; draft pages are not indexed
+    expected = sorted([(deploy_id, 1, 1), (news_id, 0, 3)])
+    assert postings["kubernetes"] == [value for posting in expected for value in posting]
+    assert postings["kubectl"] == [deploy_id, 1, 1]
+    # Records ship without the indexed content
+    assert "content" not in docs["pages"][0]
+    assert docs["pages"][0]["objectID"] == "/docs/deploy/"
+
+
+def test_accumulated_plain_text_is_indexed(tmp_path: Path) -> None:
+    """Full render text replaces the truncated summary content."""
+    accumulated = [SimpleNamespace(uri="/docs/a/", plain_text="Intro ... observability appendix")]
+
+    manifest_path = _generate(
+        tmp_path,
+        _site_data(_page("/docs/a/", "A", "docs", "Intro ...")),
+        accumulated_data=accumulated,
+    )
+
+    assert "observability" in _read(manifest_path.parent, "terms/ob.json")
+
+
+def test_unchanged_shards_are_not_rewritten(tmp_path: Path, writes: list[str]) -> None:
+    pages = [
+        _page("/docs/a/", "Alpha", "docs", "install guide"),
+        _page("/blog/b/", "Beta", "blog", "release notes"),
+    ]
+    _generate(tmp_path, _site_data(*pages))
+    first_ids = _read(tmp_path / ".bengal", "search_doc_ids.json")["ids"]
+    writes.clear()
+
+    pages[1] = _page("/blog/b/", "Beta", "blog", "release notes zebra")
+    _generate(tmp_path, _site_data(*pages))
+
+    assert sorted(writes) == ["docs/blog.json", "search/manifest.json", "terms/ze.json"]
+    assert _read(tmp_path / ".bengal", "search_doc_ids.json")["ids"] == first_ids
+
+    writes.clear()
+    _generate(tmp_path, _site_data(*pages))
+    assert writes == []
+
+
+def test_doc_ids_are_stable_and_stale_shards_removed(tmp_path: Path) -> None:
+    _generate(
+        tmp_path,
+        _site_data(
+            _page("/docs/a/", "Alpha", "docs", "install"),
+            _page("/blog/b/", "Beta", "blog", "quokka"),
+        ),
+    )
+    search_dir = tmp_path / "public" / "search"
+    alpha_id = _read(search_dir, "docs/docs.json")["pages"][0]["id"]
+
+    _generate(
+        tmp_path,
+        _site_data(
+            _page("/docs/0/", "Zero", "docs", "install"),
+            _page("/docs/a/", "Alpha", "docs", "install"),
+        ),
+    )
+
+    docs = {p["objectID"]: p["id"] for p in _read(search_dir, "docs/docs.json")["pages"]}
+    assert docs["/docs/a/"] == alpha_id
+    assert docs["/docs/0/"] != alpha_id
+    assert not (search_dir / "docs" / "blog.json").exists()
+    assert not (search_dir / "terms" / "qu.json").exists()
@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock
 
 from bengal.postprocess.output_formats.utils import (
     get_i18n_output_path,
+    iter_json_chunks,
     parallel_write_files,
     write_if_content_changed,
+    write_stream_if_changed,
     write_text_if_changed,
 )
 
@@ -418,3 +422,47 @@ class TestWriteIfContentChanged:
             hash2 = (path2.parent / "file2.json.hash").read_text().strip()
 
             assert hash1 == hash2
+
+
+_STREAM_DATA = {
+    "site": {"title": "Café", "baseurl": ""},
+    "pages": [{"url": "/b/", "tags": ["x", "y"], "n": 1.5}, {"url": "/a/", "draft": None}],
+    "sections": [],
+    "tags": {},
+    "headings": [{"anchor": "#a", "title": '\u2603 "quoted"'}],
+}
+
+
+class TestStreamingWrites:
+    """Test iter_json_chunks and write_stream_if_changed."""
+
+    def test_json_chunks_match_dumps(self) -> None:
+        """Streamed JSON is byte-identical to json.dumps (compact and indented)."""
+        for indent in (None, 2):
+            expected = json.dumps(_STREAM_DATA, indent=indent, ensure_ascii=False, sort_keys=True)
+            assert "".join(iter_json_chunks(_STREAM_DATA, indent)) == expected
+        assert "".join(iter_json_chunks({})) == "{}"
+
+    def test_stream_skips_unchanged_and_keeps_sidecar(self, tmp_path: Path) -> None:
+        """Unchanged streams leave the file alone; the sidecar holds the streamed hash."""
+        import os
+
+        path = tmp_path / "index.json"
+        chunks = ["{", '"a": 1', "}"]
+
+        assert write_stream_if_changed(path, iter(chunks), hash_suffix=".hash") is True
+        os.utime(path, ns=(1, 1))
+
+        assert write_stream_if_changed(path, iter(chunks), hash_suffix=".hash") is False
+        assert path.stat().st_mtime_ns == 1
+        assert (tmp_path / "index.json.hash").read_text() == hashlib.sha256(b'{"a": 1}').hexdigest()
+        assert write_stream_if_changed(path, iter(["{}"]), hash_suffix=".hash") is True
+        assert path.read_text() == "{}"
+
+    def test_stream_without_sidecar_compares_existing_file(self, tmp_path: Path) -> None:
+        """Without a gate or sidecar, the existing file is hashed in blocks."""
+        path = tmp_path / "llm-full.txt"
+        path.write_text("same text", encoding="utf-8")
+
+        assert write_stream_if_changed(path, iter(["same ", "text"])) is False
+        assert not list(tmp_path.glob(".*.tmp"))
@@ -0,0 +1,110 @@
+"""Tests for precompressed output sidecars."""
+
+from __future__ import annotations
+
+import gzip
+from compression import zstd
+from pathlib import Path
+
+from bengal.cache.content_hash_registry import ContentHashRegistry
+from bengal.core.output import BuildOutputCollector
+from bengal.postprocess.precompress import (
+    OutputCompressor,
+    PrecompressConfig,
+    parse_precompress_config,
+)
+
+CONFIG = PrecompressConfig(enabled=True, formats=("gzip", "zstd"), min_bytes=64)
+HTML = "<html><body>" + "<p>hello world</p>" * 200 + "</body></html>"
+
+
+def _site(tmp_path: Path) -> Path:
+    output = tmp_path / "public"
+    (output / "assets").mkdir(parents=True)
+    (output / "index.html").write_text(HTML)
+    (output / "assets" / "style.css").write_text("body { color: red; }\n" * 100)
+    (output / "assets" / "logo.png").write_bytes(b"\x89PNG" * 100)
+    (output / "tiny.json").write_text("{}")
+    return output
+
+
+def test_parse_config_shorthand_and_aliases():
+    """Boolean shorthand enables defaults; format aliases normalize."""
+    assert not parse_precompress_config({}).enabled
+    config = parse_precompress_config({"precompress": {"formats": ["gz", "zst", "lzma"]}})
+    assert config.enabled
+    assert config.formats == ("gzip", "zstd")
+
+
+def test_writes_sidecars_that_round_trip(tmp_path: Path):
+    """Text outputs get sidecars that decompress to the original bytes."""
+    output = _site(tmp_path)
+
+    report = OutputCompressor(CONFIG, ContentHashRegistry()).run(output, max_workers=2)
+
+    assert gzip.decompress((output / "index.html.gz").read_bytes()).decode() == HTML
+    assert zstd.decompress((output / "index.html.zst").read_bytes()).decode() == HTML
+    assert (output / "assets" / "style.css.gz").exists()
+    assert not (output / "assets" / "logo.png.gz").exists()  # not a text output
+    assert not (output / "tiny.json.gz").exists()  # below min_bytes
+    assert report.compressed == 3
+    assert report.bytes_saved("html", "gzip") > 0
+    assert set(report.by_type) == {"html", "css", "json"}
+
+
+def test_unchanged_outputs_are_skipped(tmp_path: Path):
+    """A second run only recompresses files whose content hash changed."""
+    output = _site(tmp_path)
+    registry = ContentHashRegistry()
+    OutputCompressor(CONFIG, registry).run(output)
+    css_sidecar = (output / "assets" / "style.css.gz").stat().st_mtime_ns
+
+    (output / "index.html").write_text(HTML.replace("hello", "goodbye"))
+    report = OutputCompressor(CONFIG, registry).run(output)
+
+    assert report.compressed == 1
+    assert report.unchanged == 2
+    assert (output / "assets" / "style.css.gz").stat().st_mtime_ns == css_sidecar
+    assert b"goodbye" in gzip.decompress((output / "index.html.gz").read_bytes())
+
+
+def test_missing_sidecar_and_deleted_output(tmp_path: Path):
+    """Deleted sidecars are rewritten; sidecars of deleted outputs are removed."""
+    output = _site(tmp_path)
+    registry = ContentHashRegistry()
+    OutputCompressor(CONFIG, registry).run(output)
+
+    (output / "index.html.zst").unlink()
+    (output / "assets" / "style.css").unlink()
+    report = OutputCompressor(CONFIG, registry).run(output)
+
+    assert (output / "index.html.zst").exists()
+    assert not (output / "assets" / "style.css.gz").exists()
+    assert report.removed == 2
+    assert registry.get_output_hash("assets/style.css") is None
+
+
+def test_collector_limits_work_to_reported_and_registered_files(tmp_path: Path, monkeypatch):
+    """With a collector, unchanged files are stat-checked and unreported files left alone."""
+    output = _site(tmp_path)
+    registry = ContentHashRegistry()
+    OutputCompressor(CONFIG, registry).run(output)
+    (output / "orphan.html").write_text(HTML)
+    (output / "page.html").write_text(HTML)
+    collector = BuildOutputCollector(output_dir=output)
+    collector.record(output / "page.html")
+
+    reads: list[str] = []
+    read_bytes = Path.read_bytes
+
+    def counting_read(path: Path) -> bytes:
+        reads.append(path.name)
+        return read_bytes(path)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read)
+    report = OutputCompressor(CONFIG, registry).run(output, collector=collector)
+
+    assert reads == ["page.html"]
+    assert (report.compressed, report.unchanged) == (1, 3)
+    assert (output / "page.html.gz").exists()
+    assert not (output / "orphan.html.gz").exists()
@@ -41,3 +41,20 @@ def test_unknown_search_backend_is_a_config_error() -> None:
 def test_invalid_lunr_config_is_a_config_error() -> None:
     with pytest.raises(BengalConfigError, match=r"Invalid search\.lunr configuration"):
         resolve_search_backend_config({"backend": "lunr", "lunr": True})
+
+
+def test_native_backend_is_always_prebuilt() -> None:
+    config = resolve_search_backend_config({"backend": "native", "native": {"prefix_length": 3}})
+
+    assert config.backend == "native"
+    assert config.prebuilt_enabled is True
+    assert config.native == {"prefix_length": 3}
+    assert config.artifact_name == "search/manifest.json"
+
+
+@pytest.mark.parametrize("prefix_length", [0, "2", True])
+def test_invalid_native_prefix_length_is_a_config_error(prefix_length: object) -> None:
+    with pytest.raises(BengalConfigError, match=r"search\.native\.prefix_length"):
+        resolve_search_backend_config(
+            {"backend": "native", "native": {"prefix_length": prefix_length}}
+        )
@@ -810,3 +810,131 @@ class TestSitemapGeneratorStatsCounting:
 
         skipped = [p for p in pages if not p.in_sitemap]
         assert len(skipped) == 2
+
+
+class TestSitemapGeneratorSharding:
+    """Streaming output, section-stable shards and unchanged-file skipping."""
+
+    SM = "{http://www.sitemaps.org/schemas/sitemap/0.9}"
+
+    def _page(self, output_dir: Path, rel: str, **attrs: Any) -> MagicMock:
+        page = MagicMock()
+        page.in_sitemap = True
+        page.output_path = output_dir / rel
+        page.date = datetime(2024, 1, 15)
+        page.translation_key = attrs.pop("translation_key", None)
+        page.lang = attrs.pop("lang", None)
+        page.metadata = {}
+        page.source_path = None
+        return page
+
+    def _site(self, output_dir: Path, rels: list[str]) -> MagicMock:
+        site = MagicMock()
+        site.pages = [self._page(output_dir, rel) for rel in rels]
+        site.config = {"i18n": {"default_language": "en"}}
+        site.baseurl = "https://example.com"
+        site.output_dir = output_dir
+        site.versioning_enabled = False
+        site.git_lastmod_by_source = None
+        return site
+
+    def _locs(self, path: Path) -> list[str]:
+        root = ET.parse(path).getroot()
+        return [loc.text or "" for loc in root.iter(f"{self.SM}loc")]
+
+    def test_small_site_writes_single_urlset(self, tmp_path: Path) -> None:
+        from bengal.postprocess.sitemap import SitemapGenerator
+
+        site = self._site(tmp_path, ["index.html", "docs/a/index.html", "blog/q&a/index.html"])
+        SitemapGenerator(site).generate()
+
+        root = ET.parse(tmp_path / "sitemap.xml").getroot()
+        assert root.tag == f"{self.SM}urlset"
+        assert self._locs(tmp_path / "sitemap.xml") == [
+            "https://example.com/blog/q&a/",
+            "https://example.com/docs/a/",
+            "https://example.com/",
+        ]
+        assert not (tmp_path / "sitemap_index.xml").exists()
+
+    def test_hreflang_alternates_use_xhtml_namespace(self, tmp_path: Path) -> None:
+        from bengal.postprocess.sitemap import SitemapGenerator
+
+        site = self._site(tmp_path, [])
+        site.pages = [
+            self._page(tmp_path, "en/post/index.html", translation_key="p", lang="en"),
+            self._page(tmp_path, "fr/post/index.html", translation_key="p", lang="fr"),
+        ]
+        SitemapGenerator(site).generate()
+
+        root = ET.parse(tmp_path / "sitemap.xml").getroot()
+        links = root[0].findall("{http://www.w3.org/1999/xhtml}link")
+        assert [link.get("hreflang") for link in links] == ["en", "fr", "x-default"]
+        assert links[-1].get("href") == "https://example.com/en/post/"
+
+    def test_large_site_shards_by_section_under_index(self, tmp_path: Path) -> None:
+        from bengal.postprocess.sitemap import SitemapGenerator
+
+        rels = [f"docs/p{i}/index.html" for i in range(3)] + ["blog/one/index.html"]
+        SitemapGenerator(self._site(tmp_path, rels), max_urls=2).generate()
+
+        index = tmp_path / "sitemap_index.xml"
+        assert self._locs(index) == [
+            "https://example.com/sitemap-blog-1.xml",
+            "https://example.com/sitemap-docs-1.xml",
+            "https://example.com/sitemap-docs-2.xml",
+        ]
+        assert (tmp_path / "sitemap.xml").read_bytes() == index.read_bytes()
+        assert len(self._locs(tmp_path / "sitemap-docs-1.xml")) == 2
+        assert self._locs(tmp_path / "sitemap-docs-2.xml") == ["https://example.com/docs/p2/"]
+
+    def test_incremental_run_rewrites_only_changed_shards(self, tmp_path: Path) -> None:
+        from bengal.postprocess.sitemap import SitemapGenerator
+
+        rels = [f"docs/p{i}/index.html" for i in range(3)] + ["blog/one/index.html"]
+        SitemapGenerator(self._site(tmp_path, rels), max_urls=2).generate()
+
+        collector = MagicMock()
+        site = self._site(tmp_path, [*rels, "blog/two/index.html"])
+        SitemapGenerator(site, collector, max_urls=2).generate()
+
+        recorded = {call.args[0].name for call in collector.record.call_args_list}
+        assert recorded == {"sitemap-blog-1.xml"}
+        assert len(self._locs(tmp_path / "sitemap-blog-1.xml")) == 2
+
+    def test_shrinking_below_limits_removes_shards(self, tmp_path: Path) -> None:
+        from bengal.postprocess.sitemap import SitemapGenerator
+
+        rels = [f"docs/p{i}/index.html" for i in range(3)]
+        SitemapGenerator(self._site(tmp_path, rels), max_urls=2).generate()
+        assert (tmp_path / "sitemap-docs-2.xml").exists()
+
+        SitemapGenerator(self._site(tmp_path, rels[:2]), max_urls=2).generate()
+
+        assert not list(tmp_path.glob("sitemap-*.xml"))
+        assert not (tmp_path / "sitemap_index.xml").exists()
+        assert len(self._locs(tmp_path / "sitemap.xml")) == 2
+
+    def test_section_shards_are_contiguous(self, tmp_path: Path) -> None:
+        from bengal.postprocess.sitemap import SitemapGenerator
+
+        # Root files sort on both sides of about/; Docs/ and docs/ share a slug
+        rels = [
+            "404.html",
+            "about/index.html",
+            "index.html",
+            "Docs/a/index.html",
+            "docs/b/index.html",
+        ]
+        SitemapGenerator(self._site(tmp_path, rels), max_urls=2).generate()
+
+        shards = [loc.rsplit("/", 1)[-1] for loc in self._locs(tmp_path / "sitemap_index.xml")]
+        assert len(shards) == len(set(shards))
+        locs = [loc for shard in shards for loc in self._locs(tmp_path / shard)]
+        assert sorted(locs) == sorted(
+            f"https://example.com/{rel}".replace("/index.html", "/") for rel in rels
+        )
+        assert self._locs(tmp_path / "sitemap-root-1.xml") == [
+            "https://example.com/404.html",
+            "https://example.com/",
+        ]
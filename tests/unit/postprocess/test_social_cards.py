@@ -12,6 +12,7 @@ Covers:
 - Frontmatter override (image: takes precedence)
 - Per-page disable (social_card: false)
 - Parallel generation threshold
+- On-disk card cache and worker rendering
 - get_social_card_path helper
 """
 
@@ -652,6 +653,103 @@ class TestSocialCardGeneratorGenerateAll:
         assert cached == 0
 
 
+def _find_system_font() -> Path | None:
+    """Locate any TrueType font on the machine for rendering tests."""
+    for root in (Path("/usr/share/fonts"), Path("/Library/Fonts"), Path("C:/Windows/Fonts")):
+        if root.is_dir():
+            for font in root.rglob("*.ttf"):
+                return font
+    return None
+
+
+class TestSocialCardGeneratorCardCache:
+    """Test the on-disk card cache and the worker render path."""
+
+    CONFIG = SocialCardConfig(enabled=True)
+
+    @pytest.fixture
+    def site(self, tmp_path: Path) -> MagicMock:
+        font = _find_system_font()
+        if font is None:
+            pytest.skip("No TrueType font available for social card rendering")
+        fonts_dir = tmp_path / "site" / "assets" / "fonts"
+        fonts_dir.mkdir(parents=True)
+        for name in ("Inter-Bold.ttf", "Inter-Regular.ttf"):
+            (fonts_dir / name).write_bytes(font.read_bytes())
+        site = MagicMock()
+        site.root_path = tmp_path / "site"
+        site.title = "Test Site"
+        site.baseurl = "https://example.com"
+        return site
+
+    def _create_mock_page(self, title: str, slug: str) -> MagicMock:
+        page = MagicMock()
+        page.title = title
+        page.description = "Description"
+        page.source_path = Path(f"content/{slug}.md")
+        page.metadata = {}
+        page._path = slug
+        return page
+
+    def test_clean_output_relinks_cached_cards(self, site: MagicMock, tmp_path: Path) -> None:
+        """Cards survive an output clean via the card cache instead of re-rendering."""
+        card_cache = tmp_path / "card-cache"
+        output_dir = tmp_path / "public" / "assets" / "social"
+        pages = [self._create_mock_page(f"Page {i}", f"page{i}") for i in range(3)]
+        fingerprints: dict[str, str] = {}
+
+        first = SocialCardGenerator(
+            site, self.CONFIG, fingerprint_cache=fingerprints, card_cache_dir=card_cache
+        )
+        assert first.generate_all(pages, output_dir) == (3, 0)
+
+        for card in output_dir.iterdir():
+            card.unlink()
+        second = SocialCardGenerator(
+            site, self.CONFIG, fingerprint_cache=fingerprints, card_cache_dir=card_cache
+        )
+
+        assert second.generate_all(pages, output_dir) == (0, 3)
+        assert sorted(p.name for p in output_dir.iterdir()) == [
+            "page0.png",
+            "page1.png",
+            "page2.png",
+        ]
+
+    def test_cache_prunes_cards_no_page_uses(self, site: MagicMock, tmp_path: Path) -> None:
+        """Renamed titles drop their stale cached renders on the next full run."""
+        card_cache = tmp_path / "card-cache"
+        output_dir = tmp_path / "public"
+        page = self._create_mock_page("Old title", "page")
+        SocialCardGenerator(site, self.CONFIG, card_cache_dir=card_cache).generate_all(
+            [page], output_dir
+        )
+
+        page.title = "New title"
+        SocialCardGenerator(site, self.CONFIG, card_cache_dir=card_cache).generate_all(
+            [page], output_dir
+        )
+
+        assert len(list(card_cache.glob("*/*.png"))) == 1
+
+    def test_render_card_job_in_worker_context(self, site: MagicMock, tmp_path: Path) -> None:
+        """Worker-side rendering needs only the picklable job, not the site."""
+        import pickle
+
+        from PIL import Image
+
+        from bengal.postprocess.social_cards import render_card_job
+
+        generator = SocialCardGenerator(site, SocialCardConfig(template="minimal"))
+        assert generator._load_fonts()
+        page = self._create_mock_page("Worker", "worker")
+        job = generator._build_job(page, generator._compute_card_hash(page), tmp_path / "w.png")
+
+        assert render_card_job(pickle.loads(pickle.dumps(job))) is None
+        with Image.open(tmp_path / "w.png") as img:
+            assert img.size == (CARD_WIDTH, CARD_HEIGHT)
+
+
 class TestGetSocialCardPath:
     """Test get_social_card_path helper function."""
 
@@ -24,3 +24,57 @@ class TestHighlightCache:
         cache = HighlightCache(enabled=False)
         cache.set("key1", "<pre>html</pre>")
         assert cache.get("key1") is None
+
+
+class TestPersistentHighlightCache:
+    """Test HighlightCache persistence across builds."""
+
+    def test_saved_entries_load_in_next_build(self, tmp_path) -> None:
+        """Entries saved by one build are served by the next."""
+        cache = HighlightCache(store_dir=tmp_path, namespace="ns")
+        cache.set("key1", "<pre>html</pre>")
+        cache.save()
+
+        next_build = HighlightCache(store_dir=tmp_path, namespace="ns")
+
+        assert next_build.get("key1") == "<pre>html</pre>"
+
+    def test_namespace_change_discards_entries(self, tmp_path) -> None:
+        """A different Rosettes/theme namespace starts from an empty store."""
+        cache = HighlightCache(store_dir=tmp_path, namespace="rosettes-1")
+        cache.set("key1", "<pre>old</pre>")
+        cache.save()
+
+        upgraded = HighlightCache(store_dir=tmp_path, namespace="rosettes-2")
+        assert upgraded.get("key1") is None
+        upgraded.set("key2", "<pre>new</pre>")
+        upgraded.save()
+
+        reloaded = HighlightCache(store_dir=tmp_path, namespace="rosettes-2")
+        assert reloaded.get("key1") is None
+        assert reloaded.get("key2") == "<pre>new</pre>"
+
+    def test_evicts_least_recently_used_over_budget(self, tmp_path) -> None:
+        """Entries not read for the most builds are evicted first."""
+        cache = HighlightCache(store_dir=tmp_path, namespace="ns", max_bytes=25)
+        cache.set("old", "x" * 10)
+        cache.set("kept", "y" * 10)
+        cache.save()
+
+        second = HighlightCache(store_dir=tmp_path, namespace="ns", max_bytes=25)
+        assert second.get("kept") == "y" * 10
+        second.set("new", "z" * 10)
+        second.save()
+
+        third = HighlightCache(store_dir=tmp_path, namespace="ns", max_bytes=25)
+        assert third.get("old") is None
+        assert third.get("kept") == "y" * 10
+        assert third.get("new") == "z" * 10
+
+    def test_disabled_cache_does_not_persist(self, tmp_path) -> None:
+        """A disabled cache never writes a store."""
+        cache = HighlightCache(enabled=False, store_dir=tmp_path, namespace="ns")
+        cache.set("key1", "<pre>html</pre>")
+        cache.save()
+
+        assert not any(tmp_path.iterdir())
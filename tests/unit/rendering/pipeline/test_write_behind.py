@@ -0,0 +1,71 @@
+"""Tests for the write-behind output collector."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from bengal.cache.content_hash_registry import ContentHashRegistry
+from bengal.cache.output_gate import OutputWriteGate
+from bengal.cache.paths import BengalPaths
+from bengal.rendering.pipeline.write_behind import WriteBehindCollector
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _build(root: Path, pages: dict[str, str | bytes]) -> WriteBehindCollector:
+    gate = OutputWriteGate.load(BengalPaths(root).content_hash_registry)
+    collector = WriteBehindCollector(num_writers=2, gate=gate)
+    for name, content in pages.items():
+        collector.enqueue(root / "public" / name, content)
+    collector.flush_and_close()
+    gate.save()
+    return collector
+
+
+def test_writes_text_and_bytes(tmp_path: Path) -> None:
+    collector = WriteBehindCollector(num_writers=2)
+    collector.enqueue(tmp_path / "a" / "index.html", "<p>café</p>")
+    collector.enqueue(tmp_path / "b.html", b"<p>b</p>")
+
+    assert collector.flush_and_close() == 2
+    assert (tmp_path / "a" / "index.html").read_text(encoding="utf-8") == "<p>café</p>"
+    assert (tmp_path / "b.html").read_bytes() == b"<p>b</p>"
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_unchanged_outputs_are_not_rewritten(tmp_path: Path) -> None:
+    _build(tmp_path, {"a.html": "<p>a</p>", "b.html": "<p>b</p>"})
+    before = (tmp_path / "public" / "a.html").stat().st_mtime_ns
+
+    second = _build(tmp_path, {"a.html": "<p>a</p>", "b.html": "<p>B</p>"})
+
+    assert second.completed_count == 1
+    assert second.skipped_count == 1
+    assert second.bytes_saved == len(b"<p>a</p>")
+    assert (tmp_path / "public" / "a.html").stat().st_mtime_ns == before
+    assert (tmp_path / "public" / "b.html").read_text(encoding="utf-8") == "<p>B</p>"
+
+    registry = ContentHashRegistry.load(BengalPaths(tmp_path).content_hash_registry)
+    assert registry.get_output_hash(tmp_path / "public" / "b.html") is not None
+
+
+def test_externally_modified_output_is_rewritten(tmp_path: Path) -> None:
+    _build(tmp_path, {"a.html": "<p>a</p>"})
+    page = tmp_path / "public" / "a.html"
+    page.write_text("<p>x</p>", encoding="utf-8")
+
+    second = _build(tmp_path, {"a.html": "<p>a</p>"})
+
+    assert second.skipped_count == 0
+    assert page.read_text(encoding="utf-8") == "<p>a</p>"
+
+
+def test_deleted_output_is_rewritten(tmp_path: Path) -> None:
+    _build(tmp_path, {"a.html": "<p>a</p>"})
+    (tmp_path / "public" / "a.html").unlink()
+
+    second = _build(tmp_path, {"a.html": "<p>a</p>"})
+
+    assert second.completed_count == 1
+    assert (tmp_path / "public" / "a.html").exists()
@@ -0,0 +1,176 @@
+"""
+Tests for the build-scoped query planner behind the collection filters.
+
+Planned filters must return exactly what the plain scans return, so most
+tests run a filter with and without an active build context and compare.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import threading
+from datetime import date, datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from bengal.core.page_cache import PageCacheManager
+from bengal.rendering.template_functions import collections
+from bengal.rendering.template_functions.collections import (
+    archive_years,
+    group_by,
+    group_by_year,
+    sort_by,
+    where,
+    where_not,
+)
+from bengal.rendering.template_functions.memo import set_build_context
+from bengal.rendering.template_functions.query_planner import QueryResult
+
+
+class FakeBuildContext:
+    """The slice of BuildContext the planner uses."""
+
+    def __init__(self, site: Any, snapshot: Any = "frozen") -> None:
+        self.site = site
+        self.snapshot = snapshot
+        self._cache: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def get_cached(self, key: str, factory: Any) -> Any:
+        with self._lock:
+            if key not in self._cache:
+                self._cache[key] = factory()
+            return self._cache[key]
+
+
+def _pages(n: int = 60, seed: int = 3) -> list[SimpleNamespace]:
+    rng = random.Random(seed)
+    return [
+        SimpleNamespace(
+            title=f"Page {i:02d}",
+            section=rng.choice(["blog", "docs", "news", None]),
+            weight=rng.choice([1, 1.0, True, 2, None]),
+            date=rng.choice([datetime(2024, 1, i % 28 + 1), date(2023, 5, 1), None]),
+            tags=rng.sample(["python", "web", "rust", "go"], rng.randint(0, 3)),
+            metadata={"featured": rng.choice([True, False]), "track": rng.choice("ab")},
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def site():
+    pages = _pages()
+    site = SimpleNamespace(pages=pages, page_cache=PageCacheManager(lambda: pages))
+    ctx = FakeBuildContext(site)
+    set_build_context(ctx)
+    yield site
+    set_build_context(None)
+
+
+def _unplanned(fn: Any, *args: Any) -> Any:
+    set_build_context(None)
+    return fn(*args)
+
+
+CASES = [
+    (where, ("section", "blog")),
+    (where, ("section", None)),
+    (where, ("weight", 1)),
+    (where, ("weight", 1, "ne")),
+    (where, ("metadata.featured", True)),
+    (where, ("tags", "python", "in")),
+    (where, ("tags", "python", "not in")),
+    (where, ("section", ["blog", "news"], "in")),
+    (where, ("date", datetime(2024, 1, 10), "gt")),
+    (where_not, ("metadata.track", "a")),
+    (sort_by, ("title", True)),
+    (sort_by, ("date",)),
+    (group_by, ("section",)),
+    (group_by_year, ()),
+    (archive_years, ()),
+]
+
+
+@pytest.mark.parametrize(("fn", "args"), CASES)
+def test_planned_results_match_scan(site, fn, args) -> None:
+    ctx_planned = [fn(site.pages, *args) for _ in range(2)]
+
+    expected = _unplanned(fn, list(site.pages), *args)
+
+    assert ctx_planned[0] == expected
+    assert ctx_planned[1] == expected
+
+
+def test_equality_is_answered_from_an_index(site, monkeypatch) -> None:
+    first = where(site.pages, "section", "blog")
+    calls = []
+    monkeypatch.setattr(collections, "_where_scan", lambda *a: calls.append(a) or [])
+
+    assert where(site.pages, "section", "docs") == [p for p in site.pages if p.section == "docs"]
+    assert where(site.pages, "section", "blog", "ne") == [p for p in site.pages if p not in first]
+    assert calls == []
+
+
+def test_chained_pipeline_is_memoized(site, monkeypatch) -> None:
+    expected = sort_by(where(site.pages, "section", "blog"), "date", True)
+    monkeypatch.setattr(collections, "_sort_by_scan", lambda *a: pytest.fail("not memoized"))
+
+    result = sort_by(where(site.pages, "section", "blog"), "date", True)
+
+    assert result == expected
+    assert isinstance(result, QueryResult)
+
+
+def test_results_are_copies(site) -> None:
+    blog = where(site.pages, "section", "blog")
+    blog.clear()
+    groups = group_by(site.pages, "section")
+    groups["blog"].clear()
+
+    assert where(site.pages, "section", "blog")
+    assert group_by(site.pages, "section")["blog"]
+
+
+def test_mutated_result_is_not_chained(site) -> None:
+    blog = where(site.pages, "section", "blog")
+    blog.append(site.pages[0])
+
+    assert sort_by(blog, "title") == _unplanned(sort_by, list(blog), "title")
+
+
+def test_unplannable_values_fall_back_to_scan(site) -> None:
+    section = object()
+    site.pages[0].section = section
+    site.pages[1].weight = math.nan
+
+    assert where(site.pages, "section", section) == [site.pages[0]]
+    assert where(site.pages, "weight", 2) == [p for p in site.pages if p.weight == 2]
+    assert where(site.pages, "weight", math.nan) == []
+
+
+def test_unhashable_values_fall_back_to_scan(site) -> None:
+    site.pages[0].tags = ["a"]
+    expected = [p for p in site.pages if p.tags != ["a"]]
+
+    assert where(site.pages, "tags", ["a"]) == [site.pages[0]]
+    assert where(site.pages, "tags", ["a"], "ne") == expected
+    assert where_not(site.pages, "tags", ["a"]) == expected
+    assert where_not(site.pages, "tags", {"a"}) == list(site.pages)
+
+
+def test_other_lists_and_unfrozen_builds_are_not_planned(site) -> None:
+    copy = list(site.pages)
+    assert not isinstance(where(copy, "section", "blog"), QueryResult)
+
+    set_build_context(FakeBuildContext(site, snapshot=None))
+    assert not isinstance(where(site.pages, "section", "blog"), QueryResult)
+
+
+def test_cached_page_views_are_planned(site) -> None:
+    regular = site.page_cache.regular_pages
+
+    assert isinstance(where(regular, "section", "blog"), QueryResult)
@@ -166,6 +166,23 @@ class TestBufferManager:
 
         assert not (staging / "stale.html").exists()
 
+    def test_prepare_delta_staging_carries_precompressed_sidecars(self, mgr: BufferManager) -> None:
+        """Sidecars of a changed file follow it; sidecars gone from active are removed."""
+        active = mgr.active_dir
+        staging = mgr.staging_dir
+        (active / "index.html").write_text("<html>v2</html>")
+        (active / "index.html.gz").write_bytes(b"gz-v2")
+        staging.mkdir(parents=True, exist_ok=True)
+        (staging / "index.html").write_text("<html>v1</html>")
+        (staging / "index.html.gz").write_bytes(b"gz-v1")
+        (staging / "index.html.br").write_bytes(b"br-v1")
+
+        mgr.prepare_delta_staging([Path("index.html")])
+
+        assert (staging / "index.html.gz").read_bytes() == b"gz-v2"
+        assert (active / "index.html.gz").stat().st_ino == (staging / "index.html.gz").stat().st_ino
+        assert not (staging / "index.html.br").exists()
+
     def test_prepare_delta_staging_falls_back_when_staging_empty(self, mgr: BufferManager) -> None:
         active = mgr.active_dir
         (active / "index.html").write_text("<html>seeded</html>")
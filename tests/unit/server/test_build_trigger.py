@@ -597,6 +597,30 @@ class TestReloadDecisionFlow:
         mock_controller.decide_from_outputs.assert_not_called()
         mock_controller.decide_from_changed_paths.assert_not_called()
 
+    @patch("bengal.server.build_trigger.default_reload_controller")
+    def test_decision_latency_is_recorded_in_reload_stats(
+        self,
+        mock_controller: MagicMock,
+        mock_site: MagicMock,
+        mock_executor: MagicMock,
+    ) -> None:
+        """Every decision, suppressed ones included, adds a decision_ms sample."""
+        from bengal.server.live_reload import get_reload_stats, reset_for_testing
+
+        reset_for_testing()
+        trigger = BuildTrigger(site=mock_site, executor=mock_executor)
+
+        for _ in range(3):
+            trigger._handle_reload(
+                BuildReloadInfo(changed_files=(), changed_outputs=(), reload_hint=None)
+            )
+
+        stats = get_reload_stats()
+        assert stats["reload_decisions"] == 3
+        assert stats["decision_ms_max"] >= stats["decision_ms_p95"] >= 0.0
+        assert stats["decision_ms_mean"] <= stats["decision_ms_max"]
+        reset_for_testing()
+
     @patch("bengal.server.build_trigger.default_reload_controller")
     @patch("bengal.server.live_reload.notification.send_reload_payload")
     def test_reload_hint_none_with_empty_outputs_still_triggers_fallback_reload(
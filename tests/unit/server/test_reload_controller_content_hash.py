@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from bengal.server.reload_controller import (
+    CONSISTENCY_SCAN_INTERVAL,
     EnhancedReloadDecision,
     ReloadController,
 )
@@ -236,6 +237,36 @@ class TestReloadControllerDecideWithContentHashes:
         assert decision.action == "reload"
         assert "new.html" in decision.content_changes
 
+    def test_changed_paths_hash_only_written_outputs(self, tmp_path: Path) -> None:
+        """Only collector-reported outputs are compared until the periodic rescan."""
+        controller = ReloadController(use_content_hashes=True, min_notify_interval_ms=0)
+        output_dir = tmp_path / "public"
+        output_dir.mkdir()
+
+        def page(name: str, digest: str) -> None:
+            (output_dir / name).write_text(
+                f'<html><head><meta name="bengal:content-hash" content="{digest}"></head></html>'
+            )
+
+        page("a.html", "a1")
+        page("b.html", "b1")
+        controller.capture_content_hash_baseline(output_dir)
+
+        page("a.html", "a2")
+        page("b.html", "b2")  # written outside the build's records
+        page("c.html", "c1")
+        decision = controller.decide_with_content_hashes(
+            output_dir, changed_paths=["a.html", "c.html", "sitemap.xml"]
+        )
+        assert decision.content_changes == ("a.html", "c.html")
+
+        for _ in range(CONSISTENCY_SCAN_INTERVAL - 1):
+            decision = controller.decide_with_content_hashes(output_dir, changed_paths=[])
+            assert decision.action == "none"
+
+        decision = controller.decide_with_content_hashes(output_dir, changed_paths=[])
+        assert decision.content_changes == ("b.html",)
+
     def test_throttled_returns_none(self, tmp_path: Path) -> None:
         """Throttled requests return none action."""
         controller = ReloadController(use_content_hashes=True, min_notify_interval_ms=10000)
@@ -0,0 +1,114 @@
+"""Tests for the persisted, incrementally updated git last-modified index."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from bengal.utils.scm.git_dates import GitLastModifiedIndex, batch_git_last_modified
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+def _git(repo: Path, *args: str, date: str | None = None) -> str:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "Test",
+        "GIT_AUTHOR_EMAIL": "test@example.com",
+        "GIT_COMMITTER_NAME": "Test",
+        "GIT_COMMITTER_EMAIL": "test@example.com",
+    }
+    if date:
+        env["GIT_AUTHOR_DATE"] = env["GIT_COMMITTER_DATE"] = date
+    return subprocess.run(
+        ["git", "-C", str(repo), *args], check=True, capture_output=True, text=True, env=env
+    ).stdout
+
+
+def _commit(repo: Path, files: dict[str, str], date: str, *extra: str) -> None:
+    for rel, text in files.items():
+        path = repo / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", date, *extra, date=date)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "site"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _commit(root, {"content/a.md": "a", "content/b.md": "b"}, "2024-01-01T10:00:00Z")
+    _commit(root, {"content/b.md": "b2"}, "2024-02-01T10:00:00Z")
+    return root
+
+
+def _pages(repo: Path) -> list[Path]:
+    return [repo / "content/a.md", repo / "content/b.md"]
+
+
+def test_index_matches_full_scan(repo: Path, tmp_path: Path) -> None:
+    """The persisted index returns the same dates as the uncached lookup."""
+    index_path = tmp_path / "git_lastmod.json"
+
+    indexed = batch_git_last_modified(_pages(repo), index_path=index_path)
+
+    assert indexed == batch_git_last_modified(_pages(repo))
+    assert indexed[(repo / "content/b.md").resolve()] == datetime(2024, 2, 1, 10, 0)
+    assert index_path.exists()
+
+
+def test_new_commits_are_applied_incrementally(repo: Path, tmp_path: Path) -> None:
+    """Only commits after the recorded HEAD are read on the next lookup."""
+    index = GitLastModifiedIndex(repo, tmp_path / "git_lastmod.json")
+    index.lookup(["content/a.md", "content/b.md"])
+    # Paths recorded at the previous HEAD survive without being re-read
+    state = index._load()
+    assert state is not None
+    state["dates"]["content/b.md"] = "2000-01-01T00:00:00+00:00"
+    index._save({k: v for k, v in state.items() if k != "version"})
+
+    _commit(repo, {"content/a.md": "a2"}, "2024-03-01T10:00:00Z")
+    dates = index.lookup(["content/a.md", "content/b.md"])
+
+    assert dates["content/a.md"] == datetime(2024, 3, 1, 10, 0)
+    assert dates["content/b.md"] == datetime(2000, 1, 1, 0, 0)
+
+
+def test_history_rewrite_triggers_full_scan(repo: Path, tmp_path: Path) -> None:
+    """A recorded HEAD that is no longer an ancestor is discarded."""
+    index = GitLastModifiedIndex(repo, tmp_path / "git_lastmod.json")
+    index.lookup(["content/a.md", "content/b.md"])
+
+    _git(repo, "reset", "-q", "--hard", "HEAD~1")
+    _commit(repo, {"content/b.md": "rewritten"}, "2024-05-01T10:00:00Z")
+    dates = index.lookup(["content/a.md", "content/b.md"])
+
+    assert dates["content/b.md"] == datetime(2024, 5, 1, 10, 0)
+    assert dates["content/a.md"] == datetime(2024, 1, 1, 10, 0)
+
+
+def test_dirty_and_untracked_files_use_mtime(repo: Path, tmp_path: Path) -> None:
+    """Uncommitted edits are reported with their mtime and are not persisted."""
+    (repo / "content/a.md").write_text("edited")
+    (repo / "content/new.md").write_text("new")
+    stamp = datetime(2030, 6, 1, 12, 0).timestamp()
+    os.utime(repo / "content/a.md", (stamp, stamp))
+
+    index = GitLastModifiedIndex(repo, tmp_path / "git_lastmod.json")
+    dates = index.lookup(["content/a.md", "content/b.md", "content/new.md"])
+
+    assert dates["content/a.md"].year == 2030
+    assert "content/new.md" in dates
+    state = index._load()
+    assert state is not None
+    assert state["dates"]["content/a.md"].startswith("2024-01-01")
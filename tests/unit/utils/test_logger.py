@@ -353,3 +353,129 @@ def test_multiple_phases_same_name(logger):
     timings = logger.get_phase_timings()
     # Should have timing for the last occurrence
     assert "repeated" in timings
+
+
+def test_event_buffer_is_bounded_but_keeps_phase_timings():
+    """Old events are evicted from memory; phase timings are not."""
+    logger = BengalLogger(name="test", max_events=5)
+
+    with logger.phase("early"):
+        pass
+    for i in range(20):
+        logger.info("filler", i=i)
+
+    events = logger.get_events()
+    assert len(events) == 5
+    assert [e.context["i"] for e in events] == [15, 16, 17, 18, 19]
+    assert "early" in logger.get_phase_timings()
+
+
+def test_filtered_events_are_not_built(monkeypatch):
+    """Calls below the active level return before an event is created."""
+    logger = BengalLogger(name="test", level=LogLevel.WARNING)
+    monkeypatch.setattr(logger, "_emit", lambda *args, **kwargs: pytest.fail("emitted"))
+
+    logger.debug("skipped", payload=object())
+    logger.info("skipped")
+
+    assert not logger.is_enabled_for(LogLevel.INFO)
+    assert logger.is_enabled_for(LogLevel.ERROR)
+
+
+def test_log_file_writer_is_shared_and_flushable(tmp_path):
+    """Loggers writing the same file share one ordered writer."""
+    log_file = tmp_path / "shared.log"
+    first = BengalLogger(name="first", log_file=log_file)
+    second = BengalLogger(name="second", log_file=log_file)
+    assert first._file_handle is second._file_handle
+
+    first.info("one")
+    second.info("two")
+    first.flush()
+
+    messages = [json.loads(line)["message"] for line in log_file.read_text().splitlines()]
+    assert messages == ["one", "two"]
+    first.close()
+    second.close()
+
+
+def test_zst_log_file_is_zstd_framed(tmp_path):
+    """A .zst log file holds NDJSON in zstd frames."""
+    zstd = pytest.importorskip("compression.zstd")
+    log_file = tmp_path / "build.log.zst"
+
+    with BengalLogger(name="test", log_file=log_file) as logger:
+        logger.info("first")
+        logger.flush()
+        logger.info("second")
+
+    lines = zstd.decompress(log_file.read_bytes()).decode("utf-8").splitlines()
+    assert [json.loads(line)["message"] for line in lines] == ["first", "second"]
+
+
+def test_phase_events_are_bounded_and_drops_counted(monkeypatch):
+    """Only the most recent phase_complete events are kept; the rest are counted."""
+    monkeypatch.setattr("bengal.utils.observability.logger.DEFAULT_MAX_PHASE_EVENTS", 2)
+    logger = BengalLogger(name="test")
+
+    for name in ("one", "two", "three"):
+        with logger.phase(name):
+            pass
+
+    assert list(logger.get_phase_timings()) == ["two", "three"]
+    assert logger.phase_events_dropped == 1
+
+
+def test_log_file_queue_drops_oldest_events(tmp_path, monkeypatch):
+    """A stalled writer drops the oldest queued events and reports the count."""
+    from bengal.utils.observability import logger as logger_module
+
+    monkeypatch.setattr(logger_module, "_MAX_QUEUED_EVENTS", 3)
+    start = logger_module._LogFileSink._start
+    monkeypatch.setattr(logger_module._LogFileSink, "_start", lambda self: None)
+    sink = logger_module._LogFileSink(tmp_path / "stalled.log")
+    logger = BengalLogger(name="test")
+
+    for i in range(5):
+        logger.info("queued", i=i)
+        sink.submit(logger.get_events()[-1])
+    assert sink.dropped == 2
+
+    start(sink)
+    sink.close()
+
+    lines = [json.loads(line) for line in (tmp_path / "stalled.log").read_text().splitlines()]
+    assert [line["context"]["i"] for line in lines[:3]] == [2, 3, 4]
+    assert lines[3]["event_type"] == "log_events_dropped"
+    assert lines[3]["context"]["dropped"] == 2
+
+
+def test_release_sink_flushes_outside_logger_lock(tmp_path, monkeypatch):
+    """Releasing a shared writer drains it without holding the registry lock."""
+    import threading
+
+    from bengal.utils.observability import logger as logger_module
+
+    log_file = tmp_path / "shared.log"
+    first = BengalLogger(name="first", log_file=log_file)
+    second = BengalLogger(name="second", log_file=log_file)
+    sink = first._file_handle
+    lock_free = []
+
+    def probe():
+        acquired = logger_module._logger_lock.acquire(blocking=False)
+        if acquired:
+            logger_module._logger_lock.release()
+        lock_free.append(acquired)
+
+    def flush():
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+
+    monkeypatch.setattr(sink, "flush", flush)
+    first.close()
+
+    assert lock_free == [True]
+    monkeypatch.undo()
+    second.close()